@@ -112,7 +112,8 @@ class EventEmitter:
             "cores": result.cores,
             "duration": result.duration,
             "tests_run": result.tests_run,
-            "stable": result.stable
+            "stable": result.stable,
+            "confidence": result.confidence
         }
         logger.info(f"Tuning complete: {result_data}")
         await self._emit_event("tuning_complete", result_data)
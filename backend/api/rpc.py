@@ -22,12 +22,15 @@ if TYPE_CHECKING:
     from ..core.fan_control import FanControlService
     from ..core.settings_manager import SettingsManager
     from ..core.game_state_monitor import GameStateMonitor
+    from ..core.power import PowerMonitor
     from ..platform.detect import PlatformInfo
+    from ..platform.sensors import SensorHub
     from ..tuning.autotune import AutotuneEngine, AutotuneConfig
     from ..tuning.runner import TestRunner
     from ..tuning.binning import BinningEngine
     from ..tuning.benchmark import BenchmarkRunner
     from ..tuning.iron_seeker import IronSeekerEngine
+    from ..tuning.knowledge_base import StabilityKnowledgeBase
     from ..dynamic.profile_manager import ProfileManager
     from ..platform.appwatcher import AppWatcher
     from .events import EventEmitter
@@ -95,6 +98,9 @@ class DeckTuneRPC:
         self.iron_seeker_engine = iron_seeker_engine
         self.blackbox = blackbox
         self.fan_control_service = None  # Will be set via set_fan_control_service()
+        self.sensor_hub = None  # Will be set via set_sensor_hub()
+        self.power_monitor = None  # Will be set via set_power_monitor()
+        self.knowledge_base = None  # Will be set via set_knowledge_base()
         self._update_manager = None  # Will be set via set_update_manager()
         
         self._delay_task: Optional[asyncio.Task] = None
@@ -175,6 +181,30 @@ class DeckTuneRPC:
         """
         self.fan_control_service = service
     
+    def set_sensor_hub(self, hub: "SensorHub") -> None:
+        """Set the shared sensor hub.
+        
+        Args:
+            hub: SensorHub instance
+        """
+        self.sensor_hub = hub
+    
+    def set_power_monitor(self, monitor: "PowerMonitor") -> None:
+        """Set the power monitor.
+        
+        Args:
+            monitor: PowerMonitor instance
+        """
+        self.power_monitor = monitor
+    
+    def set_knowledge_base(self, knowledge_base: "StabilityKnowledgeBase") -> None:
+        """Set the stability knowledge base shared by the tuning engines.
+        
+        Args:
+            knowledge_base: StabilityKnowledgeBase instance
+        """
+        self.knowledge_base = knowledge_base
+    
     # ==================== Platform Info ====================
     
     async def get_platform_info(self) -> Dict[str, Any]:
@@ -212,6 +242,10 @@ class DeckTuneRPC:
         # Update internal reference
         self.platform = new_platform
         
+        # Observations from a different platform or BIOS are invalid
+        if self.knowledge_base is not None:
+            self.knowledge_base.set_platform(new_platform)
+        
         logger.info(f"Platform re-detected: {new_platform.model} ({new_platform.variant})")
         
         return {
@@ -418,11 +452,28 @@ class DeckTuneRPC:
     
     # ==================== Autotune ====================
     
-    async def start_autotune(self, mode: str = "quick") -> Dict[str, Any]:
+    async def start_autotune(
+        self,
+        mode: str = "quick",
+        strategy: str = "linear",
+        adaptive_duration: bool = False,
+        false_pass_rate: float = 0.01,
+        thermal_pacing: bool = False,
+        temperature_margin: bool = False
+    ) -> Dict[str, Any]:
         """Start autotune process.
         
         Args:
             mode: "quick" or "thorough"
+            strategy: "linear", "galloping" or "bayesian" coarse search
+            adaptive_duration: Choose test durations with a sequential
+                probability ratio test (thorough mode only)
+            false_pass_rate: Accepted probability that a passed value is
+                unstable (0-0.5, adaptive_duration only)
+            thermal_pacing: Cool down before each test so it starts in the
+                target temperature band
+            temperature_margin: Back final values off by a margin for the
+                hottest temperature in the session history
             
         Returns:
             Dictionary with success status or error if already running
@@ -433,12 +484,25 @@ class DeckTuneRPC:
         if self.autotune_engine.is_running():
             return {"success": False, "error": "Autotune already running"}
         
-        logger.info(f"Starting autotune in {mode} mode")
+        logger.info(f"Starting autotune in {mode} mode ({strategy} search)")
         
         # Import here to avoid circular imports
-        from ..tuning.autotune import AutotuneConfig
-        
-        config = AutotuneConfig(mode=mode)
+        from ..tuning.autotune import AUTOTUNE_STRATEGIES, AutotuneConfig
+        
+        if strategy not in AUTOTUNE_STRATEGIES:
+            return {"success": False, "error": f"Unknown autotune strategy: {strategy}"}
+        if not (0.0 < false_pass_rate < 0.5):
+            return {"success": False, "error": f"false_pass_rate must be between 0 and 0.5, got {false_pass_rate}"}
+        
+        config = AutotuneConfig(
+            mode=mode,
+            strategy=strategy,
+            adaptive_duration=adaptive_duration,
+            false_pass_rate=false_pass_rate,
+            thermal_pacing=thermal_pacing,
+            temperature_margin=temperature_margin,
+            design_temperature=self._design_temperature() if temperature_margin else None
+        )
         
         # Run autotune in background task
         self._autotune_task = asyncio.create_task(
@@ -498,6 +562,10 @@ class DeckTuneRPC:
                    - test_duration: Test duration in seconds (30-300)
                    - step_size: Step size in mV (1-10)
                    - start_value: Starting value in mV (-20 to 0)
+                   - adaptive_duration: Sequential stopping rule for test durations
+                   - false_pass_rate: Accepted P(unstable | passed) (0-0.5)
+                   - thermal_pacing: Cool down so each test starts in the target band
+                   - strategy: "linear" or "bayesian" search
                    
         Returns:
             Dictionary with success status or error if already running
@@ -511,7 +579,7 @@ class DeckTuneRPC:
             return {"success": False, "error": "Binning already running"}
         
         # Import here to avoid circular imports
-        from ..tuning.binning import BinningConfig
+        from ..tuning.binning import BINNING_STRATEGIES, BinningConfig
         
         # Validate and extract config parameters
         try:
@@ -529,13 +597,25 @@ class DeckTuneRPC:
             if not (-20 <= start_value <= 0):
                 return {"success": False, "error": f"start_value must be between -20 and 0, got {start_value}"}
             
+            false_pass_rate = float(config.get("false_pass_rate", 0.01))
+            if not (0.0 < false_pass_rate < 0.5):
+                return {"success": False, "error": f"false_pass_rate must be between 0 and 0.5, got {false_pass_rate}"}
+            
+            strategy = config.get("strategy", "linear")
+            if strategy not in BINNING_STRATEGIES:
+                return {"success": False, "error": f"Unknown binning strategy: {strategy}"}
+            
             # Create BinningConfig
             binning_config = BinningConfig(
                 start_value=start_value,
                 step_size=step_size,
                 test_duration=test_duration,
                 max_iterations=config.get("max_iterations", 20),
-                consecutive_fail_limit=config.get("consecutive_fail_limit", 3)
+                consecutive_fail_limit=config.get("consecutive_fail_limit", 3),
+                adaptive_duration=bool(config.get("adaptive_duration", False)),
+                false_pass_rate=false_pass_rate,
+                thermal_pacing=bool(config.get("thermal_pacing", False)),
+                strategy=strategy
             )
             
         except (ValueError, TypeError) as e:
@@ -650,6 +730,9 @@ class DeckTuneRPC:
                    - test_duration: Test duration in seconds (30-300)
                    - step_size: Step size in mV (1-10)
                    - start_value: Starting value in mV (-20 to 0)
+                   - adaptive_duration: Sequential stopping rule for test durations
+                   - false_pass_rate: Accepted P(unstable | passed) (0-0.5)
+                   - thermal_pacing: Cool down so each test starts in the target band
                    
         Returns:
             Dictionary with success status and updated config
@@ -690,6 +773,18 @@ class DeckTuneRPC:
         if "consecutive_fail_limit" in config:
             current_config["consecutive_fail_limit"] = config["consecutive_fail_limit"]
         
+        if "adaptive_duration" in config:
+            current_config["adaptive_duration"] = bool(config["adaptive_duration"])
+        
+        if "false_pass_rate" in config:
+            false_pass_rate = config["false_pass_rate"]
+            if not (0.0 < false_pass_rate < 0.5):
+                return {"success": False, "error": f"false_pass_rate must be between 0 and 0.5, got {false_pass_rate}"}
+            current_config["false_pass_rate"] = false_pass_rate
+        
+        if "thermal_pacing" in config:
+            current_config["thermal_pacing"] = bool(config["thermal_pacing"])
+        
         # Persist config
         self.settings.save_setting("binning_config", current_config)
         
@@ -1005,11 +1100,13 @@ class DeckTuneRPC:
             "all_available": len(missing) == 0
         }
     
-    async def run_test(self, test_name: str) -> Dict[str, Any]:
+    async def run_test(self, test_name: str, verify: Optional[bool] = None) -> Dict[str, Any]:
         """Run a specific stress test.
         
         Args:
             test_name: Name of test from TestRunner.TESTS
+            verify: Run the known-answer verification workload alongside
+                (default: the sdc_verification setting)
             
         Returns:
             Dictionary with test result
@@ -1019,7 +1116,7 @@ class DeckTuneRPC:
         
         logger.info(f"Running test: {test_name}")
         
-        result = await self.test_runner.run_test(test_name)
+        result = await self.test_runner.run_test(test_name, verify)
         
         # Add to test history
         self._add_to_test_history(test_name, result)
@@ -1032,7 +1129,8 @@ class DeckTuneRPC:
             "passed": result.passed,
             "duration": result.duration,
             "logs": result.logs,
-            "error": result.error
+            "error": result.error,
+            "time_to_failure": result.time_to_failure
         }
     
     def _add_to_test_history(self, test_name: str, result) -> None:
@@ -1583,6 +1681,71 @@ class DeckTuneRPC:
         
         self.settings.save_setting("benchmark_history", history)
     
+    async def run_benchmark_suite(
+        self,
+        workloads: Optional[List[str]] = None,
+        trials: int = 5
+    ) -> Dict[str, Any]:
+        """Run the multi-workload benchmark suite.
+        
+        Each workload class runs a warm-up plus trials times. Stores the
+        result in benchmark_suite_history (keeps last 20) and compares it
+        with the previous suite run per workload.
+        
+        Args:
+            workloads: Workload classes to run (default: all)
+            trials: Measured runs per workload (2-20)
+            
+        Returns:
+            Dictionary with per-workload statistics and comparison
+        """
+        if self.benchmark_runner is None:
+            return {"success": False, "error": "Benchmark runner not configured"}
+        
+        if self._is_operation_running():
+            return {
+                "success": False,
+                "error": "Another operation is running. Please wait for it to complete."
+            }
+        
+        if not (2 <= trials <= 20):
+            return {"success": False, "error": f"trials must be between 2 and 20, got {trials}"}
+        
+        from ..tuning.benchmark import BenchmarkSuiteResult
+        
+        logger.info(f"Starting benchmark suite ({trials} trials per workload)")
+        cores_used = self.settings.get_setting("cores") or [0, 0, 0, 0]
+        
+        self._benchmark_task = asyncio.create_task(
+            self.benchmark_runner.run_suite(cores_used, workloads, trials)
+        )
+        
+        try:
+            result = await self._benchmark_task
+        except asyncio.CancelledError:
+            logger.info("Benchmark suite cancelled")
+            return {"success": False, "error": "Benchmark cancelled"}
+        except (RuntimeError, ValueError) as e:
+            logger.error(f"Benchmark suite failed: {e}")
+            return {"success": False, "error": str(e)}
+        finally:
+            self._benchmark_task = None
+        
+        history = self.settings.get_setting("benchmark_suite_history") or []
+        comparison = None
+        if history:
+            previous = BenchmarkSuiteResult.from_dict(history[-1])
+            comparison = self.benchmark_runner.compare_suites(previous, result)
+        
+        history.append(result.to_dict())
+        self.settings.save_setting("benchmark_suite_history", history[-20:])
+        
+        return {
+            "success": True,
+            "result": result.to_dict(),
+            "comparison": comparison
+        }
+    
     async def get_benchmark_history(self) -> Dict[str, Any]:
         """Get last 20 benchmark results.
         
@@ -2023,6 +2186,69 @@ class DeckTuneRPC:
             "success": True,
             **status
         }
+    
+    async def fan_set_control_mode(
+        self,
+        mode: str,
+        settings: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Select curve-only or predictive fan control.
+        
+        Args:
+            mode: "curve" or "predictive"
+            settings: Optional PredictiveConfig fields (e.g. target_temp,
+                max_slew) for predictive mode
+            
+        Returns:
+            Dictionary with success status and the selected mode
+        """
+        from ..core.fan_predictive import PredictiveConfig
+        
+        if not hasattr(self, 'fan_control_service') or self.fan_control_service is None:
+            return {"success": False, "error": "Fan control service not initialized"}
+        
+        config = None
+        if mode == "predictive" and settings:
+            try:
+                config = PredictiveConfig.from_dict(settings)
+            except (ValueError, TypeError) as e:
+                return {"success": False, "error": f"Invalid predictive settings: {e}"}
+        
+        logger.info(f"Setting fan control mode: {mode}")
+        if not self.fan_control_service.set_control_mode(mode, config):
+            return {"success": False, "error": f"Unknown or unsaved control mode: {mode}"}
+        
+        return {"success": True, "mode": mode}
+    
+    async def get_sensor_status(self) -> Dict[str, Any]:
+        """Get shared sensor sampling status.
+        
+        Returns:
+            Dictionary with subscribers, per-channel sampling intervals,
+            sysfs reads per second and the latest snapshot
+        """
+        if self.sensor_hub is None:
+            return {"success": False, "error": "Sensor hub not initialized"}
+        
+        return {
+            "success": True,
+            **self.sensor_hub.get_status()
+        }
+    
+    async def get_power_status(self) -> Dict[str, Any]:
+        """Get current power draw and integrated energy.
+        
+        Returns:
+            Dictionary with the latest power reading, battery capacity, and
+            battery and APU energy in total, per profile and per game
+        """
+        if self.power_monitor is None:
+            return {"success": False, "error": "Power monitor not initialized"}
+        
+        return {
+            "success": True,
+            **self.power_monitor.get_status()
+        }
 
     # ==================== Iron Seeker ====================
     # Requirements: 1.1, 3.5, 5.1, 5.2, 5.3, 3.4
@@ -2039,6 +2265,10 @@ class DeckTuneRPC:
                 - test_duration: Test duration per iteration in seconds (10-300, default 60)
                 - safety_margin: Safety margin to add to results in mV (0-20, default 5)
                 - vdroop_pulse_ms: Pulse duration for Vdroop test in ms (default 100)
+                - vdroop_sweep: Sweep pulse frequency 1 Hz-1 kHz (default False)
+                - vdroop_phase_aligned: Load steps on all cores at once (default True)
+                - temperature_margin: Size margins for the hottest temperature
+                  in the session history instead of safety_margin (default False)
                 
         Returns:
             Dictionary with success status or error if already running
@@ -2068,7 +2298,10 @@ class DeckTuneRPC:
                     step_size=config.get("step_size", 5),
                     test_duration=config.get("test_duration", 60),
                     safety_margin=config.get("safety_margin", 5),
-                    vdroop_pulse_ms=config.get("vdroop_pulse_ms", 100)
+                    vdroop_pulse_ms=config.get("vdroop_pulse_ms", 100),
+                    vdroop_sweep=bool(config.get("vdroop_sweep", False)),
+                    vdroop_phase_aligned=bool(config.get("vdroop_phase_aligned", True)),
+                    temperature_margin=bool(config.get("temperature_margin", False))
                 )
             else:
                 iron_seeker_config = IronSeekerConfig()
@@ -2076,6 +2309,9 @@ class DeckTuneRPC:
             logger.error(f"Invalid Iron Seeker config: {e}")
             return {"success": False, "error": f"Invalid config: {e}"}
         
+        if iron_seeker_config.temperature_margin:
+            iron_seeker_config.design_temperature = self._design_temperature()
+        
         logger.info(f"Starting Iron Seeker with config: step_size={iron_seeker_config.step_size}, "
                    f"test_duration={iron_seeker_config.test_duration}, "
                    f"safety_margin={iron_seeker_config.safety_margin}")
@@ -2094,7 +2330,11 @@ class DeckTuneRPC:
                 "step_size": iron_seeker_config.step_size,
                 "test_duration": iron_seeker_config.test_duration,
                 "safety_margin": iron_seeker_config.safety_margin,
-                "vdroop_pulse_ms": iron_seeker_config.vdroop_pulse_ms
+                "vdroop_pulse_ms": iron_seeker_config.vdroop_pulse_ms,
+                "vdroop_sweep": iron_seeker_config.vdroop_sweep,
+                "vdroop_phase_aligned": iron_seeker_config.vdroop_phase_aligned,
+                "temperature_margin": iron_seeker_config.temperature_margin,
+                "design_temperature": iron_seeker_config.design_temperature
             }
         }
     
@@ -2231,6 +2471,10 @@ class DeckTuneRPC:
                 - voltage_step: Voltage step size in mV (1-10, default: 2)
                 - safety_margin: Safety margin to add in mV (0-20, default: 5)
                 - adaptive_step: Enable adaptive stepping (default: True)
+                - adaptive_duration: Sequential stopping rule for test durations (default: False)
+                - false_pass_rate: Accepted P(unstable | passed) (0-0.5, default: 0.01)
+                - thermal_pacing: Cool down so each test starts in the target band (default: False)
+                - voltage_search: "binary" or "bayesian" per-frequency search (default: "binary")
                 - preset: Optional preset name ("quick", "balanced", "thorough")
                 
         Returns:
@@ -2315,10 +2559,26 @@ class DeckTuneRPC:
                     voltage_start=config.get("voltage_start", -30),
                     voltage_step=config.get("voltage_step", 2),
                     safety_margin=config.get("safety_margin", 5),
-                    adaptive_step=config.get("adaptive_step", True)
+                    adaptive_step=config.get("adaptive_step", True),
+                    parallel_cores=config.get("parallel_cores", False),
+                    warm_start=config.get("warm_start", True),
+                    sparse_sampling=config.get("sparse_sampling", False),
+                    sparse_tolerance=config.get("sparse_tolerance", 4)
                 )
                 logger.info(f"Custom config created: {wizard_config}")
             
+            # Parallel testing, adaptive durations and pacing combine with any preset
+            if "parallel_cores" in config:
+                wizard_config.parallel_cores = bool(config["parallel_cores"])
+            if "adaptive_duration" in config:
+                wizard_config.adaptive_duration = bool(config["adaptive_duration"])
+            if "false_pass_rate" in config:
+                wizard_config.false_pass_rate = float(config["false_pass_rate"])
+            if "thermal_pacing" in config:
+                wizard_config.thermal_pacing = bool(config["thermal_pacing"])
+            if "voltage_search" in config:
+                wizard_config.voltage_search = str(config["voltage_search"])
+            
             # Validate configuration
             logger.info("Validating wizard configuration...")
             try:
@@ -2354,6 +2614,8 @@ class DeckTuneRPC:
                     progress_callback=self._frequency_wizard_progress_callback,
                     save_path=save_path
                 )
+                if self.knowledge_base is not None:
+                    wizard.set_knowledge_base(self.knowledge_base)
                 logger.info("Wizard instance created successfully")
             except Exception as wizard_error:
                 logger.error(f"Failed to create wizard instance: {wizard_error}")
@@ -2480,9 +2742,15 @@ class DeckTuneRPC:
         
         all_curves = {}
         per_core_stats = []
+        parallel_curves = None
         
         try:
-            # Test all 4 cores sequentially
+            # In parallel mode all cores are swept together up front
+            if wizard.config.parallel_cores:
+                logger.info("Calling wizard.run_parallel() for cores 0-3...")
+                parallel_curves = await wizard.run_parallel([0, 1, 2, 3])
+            
+            # Collect results for all 4 cores (testing sequentially if not parallel)
             for current_core in range(4):
                 logger.info("=" * 80)
                 logger.info(f"TESTING CORE {current_core}")
@@ -2492,8 +2760,11 @@ class DeckTuneRPC:
                 if hasattr(wizard, 'progress'):
                     wizard.progress.current_stage = f"Testing core {current_core}"
                 
-                logger.info(f"Calling wizard.run() for core {current_core}...")
-                curve = await wizard.run(current_core)
+                if parallel_curves is not None:
+                    curve = parallel_curves[current_core]
+                else:
+                    logger.info(f"Calling wizard.run() for core {current_core}...")
+                    curve = await wizard.run(current_core)
                 logger.info(f"Core {current_core} completed successfully")
                 logger.info(f"Generated curve: {len(curve.points)} points, {sum(1 for p in curve.points if p.stable)} stable")
                 
@@ -3728,6 +3999,23 @@ class DeckTuneRPC:
             logger.error(f"Failed to compare sessions: {e}")
             return {"success": False, "error": str(e)}
     
+    def _design_temperature(self) -> Optional[float]:
+        """Hottest temperature in the session history, for stability margins.
+        
+        Returns:
+            Temperature in °C, or None without session temperatures
+        """
+        try:
+            from ..core.session_manager import SessionManager
+            
+            if not hasattr(self, '_session_manager'):
+                self._session_manager = SessionManager(self.settings)
+            
+            return self._session_manager.hottest_temperature()
+        except Exception as e:
+            logger.warning(f"Failed to read session temperatures: {e}")
+            return None
+    
     def set_session_manager(self, manager) -> None:
         """Set the session manager.
         
@@ -3864,6 +4152,8 @@ class DeckTuneRPC:
             
             if success:
                 logger.debug(f"Saved setting: {key}")
+                if key == "sdc_verification" and self.test_runner is not None:
+                    self.test_runner.verify_sdc = bool(value)
                 return {"success": True}
             else:
                 return {"success": False, "error": "Failed to save setting"}
@@ -32,6 +32,7 @@ class MetricSample:
     undervolt_values: List[int]  # Per-core undervolt values in mV
     fan_speed_rpm: int  # Fan speed in RPM
     fan_pwm: int  # Fan PWM value (0-255)
+    power_w: float = 0.0  # Power draw in Watts (see backend.core.power)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -46,7 +47,8 @@ class MetricSample:
             cpu_load_percent=data["cpu_load_percent"],
             undervolt_values=data["undervolt_values"],
             fan_speed_rpm=data["fan_speed_rpm"],
-            fan_pwm=data["fan_pwm"]
+            fan_pwm=data["fan_pwm"],
+            power_w=data.get("power_w", 0.0)
         )
 
 
@@ -0,0 +1,239 @@
+"""Compiled piecewise-linear curves.
+
+Fan curves (temperature -> speed), frequency curves (MHz -> mV) and
+dynamic load curves (load -> mV) are all piecewise-linear functions
+clamped to their end points. PiecewiseLinearCurve validates and sorts
+the breakpoints once, keeps them in flat tuples with the per-segment
+deltas and slopes, and evaluates with bisect.
+
+# Edge Handling
+
+- Below the first breakpoint: the first value
+- At or above the last breakpoint: the last value
+- Repeated x values form a vertical step; at the step the later point
+  applies (as calculate_fan_speed always did)
+
+# Integer Results
+
+The existing callers round differently, and each keeps its behaviour:
+
+- ``"nearest"``: round half to even (fan speed, dynamic load curves)
+- ``"floor"``: exact integer floor division for integer breakpoints and
+  inputs (FrequencyCurve)
+- ``"trunc"``: integer division truncating toward zero (gymdeck3's
+  FanCurve::calculate_speed)
+
+# Usage Example
+
+```python
+curve = PiecewiseLinearCurve([(40, 0), (60, 40), (75, 70), (85, 100)])
+curve.evaluate(67.5)                   # 55.0
+curve.evaluate_int(67.5)               # 55
+curve.lut(0, 100)                      # 101 speeds for 0..100 °C
+curve.to_compact()                     # "40:0,60:40,75:70,85:100"
+```
+
+The compact form is a comma-separated list of the ``x:y`` points that
+gymdeck3's ``--fan-curve`` argument parses.
+"""
+
+import bisect
+import functools
+import math
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+Number = Union[int, float]
+
+ROUNDING_MODES = ("nearest", "floor", "trunc")
+
+
+class PiecewiseLinearCurve:
+    """Piecewise-linear function compiled from (x, y) breakpoints.
+
+    Attributes:
+        xs: Breakpoint x values in ascending order
+        ys: Breakpoint y values
+        slopes: Slope of each segment (0.0 for vertical steps)
+    """
+
+    __slots__ = ("xs", "ys", "slopes", "_dx", "_dy", "_integral")
+
+    def __init__(self, points: Iterable[Tuple[Number, Number]]):
+        """Validate and compile the breakpoints.
+
+        Args:
+            points: (x, y) pairs in any order
+
+        Raises:
+            ValueError: If there are no points or a coordinate is not finite
+        """
+        pairs = sorted(((x, y) for x, y in points), key=lambda p: p[0])
+        if not pairs:
+            raise ValueError("Curve must have at least 1 point")
+        for x, y in pairs:
+            if not (math.isfinite(x) and math.isfinite(y)):
+                raise ValueError(f"Curve point ({x}, {y}) is not finite")
+
+        self.xs: Tuple[Number, ...] = tuple(x for x, _ in pairs)
+        self.ys: Tuple[Number, ...] = tuple(y for _, y in pairs)
+        self._dx = tuple(b - a for a, b in zip(self.xs, self.xs[1:]))
+        self._dy = tuple(b - a for a, b in zip(self.ys, self.ys[1:]))
+        self.slopes: Tuple[float, ...] = tuple(
+            dy / dx if dx else 0.0 for dx, dy in zip(self._dx, self._dy)
+        )
+        self._integral = all(isinstance(v, int) for v in self.xs + self.ys)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PiecewiseLinearCurve):
+            return NotImplemented
+        return self.xs == other.xs and self.ys == other.ys
+
+    def __hash__(self) -> int:
+        return hash((self.xs, self.ys))
+
+    def __repr__(self) -> str:
+        return f"PiecewiseLinearCurve({list(zip(self.xs, self.ys))!r})"
+
+    def points(self) -> List[Tuple[Number, Number]]:
+        """Breakpoints as (x, y) pairs in ascending x order."""
+        return list(zip(self.xs, self.ys))
+
+    def _segment(self, x: Number) -> Optional[int]:
+        """Index of the segment containing x, or None when x is clamped."""
+        xs = self.xs
+        if x <= xs[0] or x >= xs[-1]:
+            return None
+        # Last breakpoint at or below x; the next one is strictly above it
+        return bisect.bisect_right(xs, x) - 1
+
+    def evaluate(self, x: Number) -> float:
+        """Value of the curve at x.
+
+        Args:
+            x: Input value
+
+        Returns:
+            Interpolated value, clamped to the end points
+        """
+        i = self._segment(x)
+        if i is None:
+            return self.ys[0] if x <= self.xs[0] else self.ys[-1]
+        # Same operation order as the original fan interpolation, so the
+        # result rounds identically
+        return self.ys[i] + self._dy[i] * ((x - self.xs[i]) / self._dx[i])
+
+    __call__ = evaluate
+
+    def evaluate_int(self, x: Number, rounding: str = "nearest") -> int:
+        """Value of the curve at x as an integer.
+
+        Args:
+            x: Input value
+            rounding: "nearest", "floor" or "trunc" (see module docstring)
+
+        Returns:
+            Rounded value
+
+        Raises:
+            ValueError: If the rounding mode is unknown
+        """
+        i = self._segment(x)
+        if i is None:
+            return int(self.ys[0] if x <= self.xs[0] else self.ys[-1])
+
+        if rounding == "nearest":
+            return int(round(self.ys[i] + self._dy[i] * ((x - self.xs[i]) / self._dx[i])))
+        if rounding not in ROUNDING_MODES:
+            raise ValueError(f"Unknown rounding mode '{rounding}'")
+
+        if self._integral and isinstance(x, int):
+            numerator = self._dy[i] * (x - self.xs[i])
+            if rounding == "floor":
+                step = numerator // self._dx[i]
+            else:
+                step = abs(numerator) // self._dx[i] * (1 if numerator >= 0 else -1)
+            return self.ys[i] + step
+
+        offset = self._dy[i] * (x - self.xs[i]) / self._dx[i]
+        step = math.floor(offset) if rounding == "floor" else math.trunc(offset)
+        return int(self.ys[i] + step)
+
+    def lut(
+        self,
+        start: Number,
+        stop: Number,
+        step: Number = 1,
+        rounding: Optional[str] = "nearest"
+    ) -> tuple:
+        """Dense lookup table over a fixed domain.
+
+        Args:
+            start: First input value
+            stop: Last input value (inclusive)
+            step: Input spacing
+            rounding: Integer rounding mode, or None for float values
+
+        Returns:
+            Values at start, start + step, ..., stop
+        """
+        if step <= 0:
+            raise ValueError("step must be positive")
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        inputs = [start + k * step for k in range(count)]
+        if rounding is None:
+            return tuple(self.evaluate(x) for x in inputs)
+        return tuple(self.evaluate_int(x, rounding) for x in inputs)
+
+    def to_compact(self) -> str:
+        """Serialize as "x:y,x:y,..." (gymdeck3 --fan-curve points)."""
+        return ",".join(f"{_format(x)}:{_format(y)}" for x, y in zip(self.xs, self.ys))
+
+    @classmethod
+    def from_compact(cls, text: str) -> "PiecewiseLinearCurve":
+        """Parse the form written by to_compact().
+
+        Raises:
+            ValueError: If a point is malformed
+        """
+        points = []
+        for token in text.split(","):
+            try:
+                x, y = token.split(":")
+                points.append((_parse(x), _parse(y)))
+            except ValueError:
+                raise ValueError(f"Invalid curve point '{token}'")
+        return cls(points)
+
+
+def _format(value: Number) -> str:
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _parse(text: str) -> Number:
+    text = text.strip()
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def compile_curve(points: Sequence[Tuple[Number, Number]]) -> PiecewiseLinearCurve:
+    """Compile breakpoints, reusing the result for identical inputs.
+
+    Args:
+        points: Sequence of hashable (x, y) pairs
+
+    Returns:
+        Compiled curve
+    """
+    return _compile(tuple(points))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile(points: tuple) -> PiecewiseLinearCurve:
+    return PiecewiseLinearCurve(points)
@@ -3,18 +3,42 @@
 This module provides fan control functionality through predefined presets
 and custom curves, using linear interpolation for smooth temperature-based
 fan speed adjustments.
+
+The control loop runs as a task on the plugin's event loop. hwmon files
+stay open and are read with os.pread; PWM writes that would not change
+the PWM byte are skipped. The tick interval adapts: FAST_INTERVAL while
+the temperature is moving or near a curve breakpoint, SLOW_INTERVAL once
+it has been flat inside a segment for FLAT_SECONDS.
+
+In "predictive" control mode the curve speed is refined by
+PredictiveFanController (temperature-rate and CPU load feedforward plus
+a bounded PI correction, slew limited).
+
+gymdeck3 has its own fan controller for the same PWM node. A lock file
+(FanOwnerLock) names the current owner: the service yields while
+gymdeck3 drives the fan and resumes when it stops or exits, and flags
+PWM readbacks that differ from its own last write as foreign writes.
+
+With a SensorHub attached (set_sensor_hub) the temperature comes from the
+hub's shared snapshot instead of a read of its own.
 """
 
-import bisect
+import asyncio
+import collections
+import functools
 import os
 import glob
 import json
-import threading
+import stat
 import time
 from datetime import datetime, timezone
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from .curve import PiecewiseLinearCurve
+from .fan_predictive import PredictiveConfig, PredictiveFanController
+from ..platform.sensors import TEMPERATURE, SensorHub
 
 
 @dataclass(frozen=True)
@@ -60,6 +84,22 @@ class FanCurve:
         object.__setattr__(self, 'points', sorted(self.points, key=lambda p: p.temp))
 
 
+@functools.lru_cache(maxsize=32)
+def compile_fan_points(points: Tuple[FanPoint, ...]) -> PiecewiseLinearCurve:
+    """Compile fan curve points into a PiecewiseLinearCurve.
+    
+    Results are cached, so the active curve is sorted and compiled once
+    rather than on every control loop tick.
+    
+    Args:
+        points: FanPoint objects in any order
+    
+    Returns:
+        Compiled temperature -> speed curve
+    """
+    return PiecewiseLinearCurve((p.temp, p.speed) for p in points)
+
+
 def calculate_fan_speed(current_temp: float, curve_points: list[FanPoint]) -> int:
     """Calculate fan speed using linear interpolation.
     
@@ -69,7 +109,7 @@ def calculate_fan_speed(current_temp: float, curve_points: list[FanPoint]) -> in
     
     Args:
         current_temp: Current temperature in Celsius
-        curve_points: List of FanPoint objects (will be sorted by temperature)
+        curve_points: List of FanPoint objects (in any order)
     
     Returns:
         Fan speed percentage (0-100) as an integer
@@ -83,34 +123,7 @@ def calculate_fan_speed(current_temp: float, curve_points: list[FanPoint]) -> in
         >>> calculate_fan_speed(90.0, points)  # Above maximum
         100
     """
-    # Ensure points are sorted by temperature
-    sorted_points = sorted(curve_points, key=lambda p: p.temp)
-    temps = [p.temp for p in sorted_points]
-    
-    # Edge case: temperature below minimum point
-    if current_temp <= temps[0]:
-        return sorted_points[0].speed
-    
-    # Edge case: temperature above maximum point
-    if current_temp >= temps[-1]:
-        return sorted_points[-1].speed
-    
-    # Edge case: temperature exactly on a point
-    # bisect_right will give us the index after the exact match
-    idx = bisect.bisect_right(temps, current_temp)
-    
-    # Check if we're exactly on a point (within floating point precision)
-    if idx > 0 and abs(temps[idx - 1] - current_temp) < 1e-9:
-        return sorted_points[idx - 1].speed
-    
-    # Linear interpolation between two points
-    p1, p2 = sorted_points[idx - 1], sorted_points[idx]
-    
-    # Linear interpolation formula: y = y1 + (x - x1) * (y2 - y1) / (x2 - x1)
-    ratio = (current_temp - p1.temp) / (p2.temp - p1.temp)
-    speed = p1.speed + (p2.speed - p1.speed) * ratio
-    
-    return int(round(speed))
+    return compile_fan_points(tuple(curve_points)).evaluate_int(current_temp)
 
 
 
@@ -152,6 +165,34 @@ def apply_safety_override(temp: float, calculated_speed: int) -> int:
     return calculated_speed
 
 
+def apply_zero_rpm(temp: float, speed: int, allow: bool) -> int:
+    """Keep the fan spinning where zero RPM is not allowed.
+    
+    Mirrors gymdeck3's --fan-zero-rpm: a 0% speed stops the fan only if
+    zero RPM is allowed and the temperature is at most ZERO_RPM_MAX_TEMP;
+    otherwise the fan runs at ZERO_RPM_MIN_SPEED.
+    
+    Args:
+        temp: Current temperature in Celsius
+        speed: Speed after safety overrides (0-100)
+        allow: Whether zero RPM is allowed
+    
+    Returns:
+        Final speed (0-100)
+    
+    Examples:
+        >>> apply_zero_rpm(40.0, 0, allow=True)
+        0
+        >>> apply_zero_rpm(50.0, 0, allow=True)
+        12
+        >>> apply_zero_rpm(40.0, 0, allow=False)
+        12
+    """
+    if speed == 0 and not (allow and temp <= ZERO_RPM_MAX_TEMP):
+        return ZERO_RPM_MIN_SPEED
+    return speed
+
+
 
 # Preset fan curve definitions
 PRESET_STOCK = FanCurve(
@@ -193,6 +234,80 @@ PRESETS = {
     "turbo": PRESET_TURBO
 }
 
+# Control loop tick intervals in seconds
+FAST_INTERVAL = 1.0
+SLOW_INTERVAL = 5.0
+
+# A temperature change of at least this much per tick counts as moving (°C)
+MOVING_DELTA = 0.5
+
+# Temperatures within this distance of a breakpoint poll fast (°C)
+BREAKPOINT_MARGIN = 2.0
+
+# Seconds the temperature must stay flat before slowing down
+FLAT_SECONDS = 10.0
+
+# Temperatures at which apply_safety_override changes behaviour (°C)
+SAFETY_BREAKPOINTS = (90.0, 95.0)
+
+# Zero RPM as in gymdeck3: the fan may stop only up to this temperature (°C),
+# elsewhere a 0% speed runs it at the minimum (PWM 30 of 255, in %)
+ZERO_RPM_MAX_TEMP = 45.0
+ZERO_RPM_MIN_SPEED = 12
+
+# Fan owners named in the owner lock file
+OWNER_PYTHON = "python"
+OWNER_GYMDECK3 = "gymdeck3"
+
+# Owner lock file name, next to the fan control configuration
+OWNER_LOCK_FILE = "fan_owner.json"
+
+# PWM readback may differ from the written byte by this much (driver rounding)
+PWM_READBACK_TOLERANCE = 2
+
+# Control modes: the static curve alone, or curve + feedforward + PI
+# (see fan_predictive)
+CONTROL_MODES = ("curve", "predictive")
+
+# SensorHub subscriber name and staleness tolerance of a tick's
+# temperature in seconds
+SENSOR_SUBSCRIBER = "fan_control"
+SENSOR_MAX_AGE = 0.5
+
+
+def speed_to_pwm(speed_percent: int) -> int:
+    """Convert a fan speed percentage (0-100) to a PWM byte (0-255)."""
+    return int(round(speed_percent * 255 / 100))
+
+
+def poll_interval(
+    temp: float,
+    previous_temp: Optional[float],
+    flat_since: Optional[float],
+    now: float,
+    curve_points: list[FanPoint]
+) -> float:
+    """Seconds until the next control loop tick.
+    
+    Args:
+        temp: Current temperature in Celsius
+        previous_temp: Temperature at the previous tick (None on the first)
+        flat_since: Time the temperature stopped moving (None if moving)
+        now: Current time in seconds, same clock as flat_since
+        curve_points: Active curve points
+    
+    Returns:
+        FAST_INTERVAL or SLOW_INTERVAL
+    """
+    if previous_temp is None or abs(temp - previous_temp) >= MOVING_DELTA:
+        return FAST_INTERVAL
+    breakpoints = [p.temp for p in curve_points] + list(SAFETY_BREAKPOINTS)
+    if any(abs(temp - b) < BREAKPOINT_MARGIN for b in breakpoints):
+        return FAST_INTERVAL
+    if flat_since is None or now - flat_since < FLAT_SECONDS:
+        return FAST_INTERVAL
+    return SLOW_INTERVAL
+
 
 class HwmonInterface:
     """Abstraction for hwmon hardware access.
@@ -215,8 +330,40 @@ class HwmonInterface:
         self.hwmon_path = hwmon_path
         self.temp_sensor_path: Optional[str] = None
         self.pwm_control_path: Optional[str] = None
+        # Persistent file descriptors keyed by (path, flags)
+        self._fds: Dict[Tuple[str, int], int] = {}
+        # Last PWM byte written, as (path, value)
+        self._last_pwm: Optional[Tuple[str, int]] = None
+        self.pwm_writes = 0
+        self.pwm_writes_skipped = 0
         self._discover_devices()
     
+    def __del__(self):
+        self.close()
+    
+    def _fd(self, path: str, flags: int) -> int:
+        """Return an open descriptor for path, opening it on first use."""
+        key = (path, flags)
+        fd = self._fds.get(key)
+        if fd is None:
+            fd = os.open(path, flags | getattr(os, "O_CLOEXEC", 0))
+            self._fds[key] = fd
+        return fd
+    
+    def _drop_fd(self, path: str, flags: int) -> None:
+        """Close a descriptor after an error so the next call reopens it."""
+        fd = self._fds.pop((path, flags), None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def close(self) -> None:
+        """Close all persistent hwmon file descriptors."""
+        for path, flags in list(getattr(self, "_fds", {})):
+            self._drop_fd(path, flags)
+    
     def _discover_devices(self) -> None:
         """Discover temperature sensor and PWM control paths.
         
@@ -319,12 +466,17 @@ class HwmonInterface:
         if self.temp_sensor_path is None:
             return None
         
+        path = self.temp_sensor_path
         try:
-            with open(self.temp_sensor_path, 'r') as f:
-                # hwmon reports temperature in millidegrees Celsius
-                millidegrees = int(f.read().strip())
-                return millidegrees / 1000.0
-        except (OSError, PermissionError, ValueError, FileNotFoundError):
+            data = os.pread(self._fd(path, os.O_RDONLY), 32, 0)
+            # hwmon reports temperature in millidegrees Celsius
+            millidegrees = int(data.strip())
+            return millidegrees / 1000.0
+        except OSError:
+            # Device may have gone away; reopen on the next read
+            self._drop_fd(path, os.O_RDONLY)
+            return None
+        except ValueError:
             return None
     
     def write_pwm(self, speed_percent: int) -> bool:
@@ -346,34 +498,77 @@ class HwmonInterface:
             return False
         
         # Convert percentage (0-100) to PWM value (0-255)
-        pwm_value = int(round(speed_percent * 255 / 100))
+        pwm_value = speed_to_pwm(speed_percent)
+        path = self.pwm_control_path
+        if self._last_pwm == (path, pwm_value):
+            self.pwm_writes_skipped += 1
+            return True
         
+        data = str(pwm_value).encode()
         try:
-            with open(self.pwm_control_path, 'w') as f:
-                f.write(str(pwm_value))
-            return True
-        except (OSError, PermissionError):
+            fd = self._fd(path, os.O_WRONLY)
+            os.pwrite(fd, data, 0)
+            if stat.S_ISREG(os.fstat(fd).st_mode):
+                # Plain files (fake hwmon trees) keep stale trailing bytes
+                try:
+                    os.ftruncate(fd, len(data))
+                except OSError:
+                    pass
+        except OSError:
+            self._drop_fd(path, os.O_WRONLY)
+            self._last_pwm = None
             return False
+        
+        self._last_pwm = (path, pwm_value)
+        self.pwm_writes += 1
+        return True
     
-    def read_current_pwm(self) -> Optional[int]:
-        """Read current PWM value from hwmon.
+    def invalidate_pwm(self) -> None:
+        """Forget the last written PWM byte so the next write goes through.
         
-        Reads the current PWM value and converts it to percentage.
+        Call when something else may have changed the PWM value.
+        """
+        self._last_pwm = None
+    
+    @property
+    def last_written_pwm(self) -> Optional[int]:
+        """PWM byte (0-255) this interface last wrote, or None."""
+        if self._last_pwm is None or self._last_pwm[0] != self.pwm_control_path:
+            return None
+        return self._last_pwm[1]
+    
+    def read_pwm_value(self) -> Optional[int]:
+        """Read the raw PWM byte (0-255) from hwmon.
         
         Returns:
-            Current fan speed percentage (0-100), or None on failure
+            Current PWM value, or None on failure
         """
         if self.pwm_control_path is None:
             return None
         
+        path = self.pwm_control_path
         try:
-            with open(self.pwm_control_path, 'r') as f:
-                pwm_value = int(f.read().strip())
-                # Convert PWM value (0-255) to percentage (0-100)
-                return int(round(pwm_value * 100 / 255))
-        except (OSError, PermissionError, ValueError, FileNotFoundError):
+            return int(os.pread(self._fd(path, os.O_RDONLY), 16, 0).strip())
+        except OSError:
+            self._drop_fd(path, os.O_RDONLY)
+            return None
+        except ValueError:
             return None
     
+    def read_current_pwm(self) -> Optional[int]:
+        """Read current PWM value from hwmon.
+        
+        Reads the current PWM value and converts it to percentage.
+        
+        Returns:
+            Current fan speed percentage (0-100), or None on failure
+        """
+        pwm_value = self.read_pwm_value()
+        if pwm_value is None:
+            return None
+        # Convert PWM value (0-255) to percentage (0-100)
+        return int(round(pwm_value * 100 / 255))
+    
     def is_available(self) -> bool:
         """Check if hardware interface is available.
         
@@ -383,6 +578,100 @@ class HwmonInterface:
         return self.temp_sensor_path is not None and self.pwm_control_path is not None
 
 
+class FanOwnerLock:
+    """Lock file naming the process that currently drives the fan.
+    
+    The Python control loop and gymdeck3's fan controller both write the
+    same hwmon PWM node. The lock file records which of them owns it:
+    
+        {"owner": "gymdeck3", "pid": 4242, "since": "2026-01-15T10:00:00Z"}
+    
+    Without a lock file, or when the recorded owner process no longer
+    exists, the Python service owns the fan. Reads are cached on the
+    file's mtime and size, so checking the owner every tick costs a stat.
+    """
+    
+    def __init__(self, path: str):
+        """Initialize the lock.
+        
+        Args:
+            path: Path of the lock file
+        """
+        self.path = path
+        self._cache_key: Optional[Tuple[int, int]] = None
+        self._cached: Optional[dict] = None
+    
+    def read(self) -> Optional[dict]:
+        """Read the lock record.
+        
+        Returns:
+            Record with owner, pid and since, or None without a valid lock
+        """
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            self._cache_key = None
+            self._cached = None
+            return None
+        
+        key = (st.st_mtime_ns, st.st_size)
+        if key != self._cache_key:
+            try:
+                with open(self.path, 'r') as f:
+                    record = json.load(f)
+                self._cached = record if isinstance(record, dict) and "owner" in record else None
+            except (OSError, json.JSONDecodeError):
+                self._cached = None
+            self._cache_key = key
+        return self._cached
+    
+    def owner(self) -> str:
+        """Name of the current fan owner.
+        
+        Returns:
+            Owner recorded in the lock, or OWNER_PYTHON if there is no lock
+            or the owning process has exited
+        """
+        record = self.read()
+        if record is None:
+            return OWNER_PYTHON
+        pid = record.get("pid")
+        if isinstance(pid, int) and not _pid_alive(pid):
+            return OWNER_PYTHON
+        return str(record["owner"])
+    
+    def claim(self, owner: str, pid: Optional[int] = None) -> None:
+        """Record a new fan owner, replacing the lock atomically.
+        
+        Args:
+            owner: Owner name (OWNER_PYTHON or OWNER_GYMDECK3)
+            pid: Process ID of the owner (None if not yet known)
+        """
+        record = {
+            "owner": owner,
+            "pid": pid,
+            "since": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+        }
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(record, f)
+        os.replace(temp_path, self.path)
+        self._cache_key = None
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
 
 class FanControlService:
     """Core fan control service with configuration persistence.
@@ -400,14 +689,26 @@ class FanControlService:
     # Configuration file schema version
     CONFIG_VERSION = 1
     
-    def __init__(self, hwmon_interface: HwmonInterface, config_path: Optional[str] = None):
+    def __init__(
+        self,
+        hwmon_interface: HwmonInterface,
+        config_path: Optional[str] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic,
+        owner_lock: Optional[FanOwnerLock] = None
+    ):
         """Initialize fan control service.
         
         Args:
             hwmon_interface: Hardware interface for fan control
             config_path: Path to configuration file (default: ~/.config/decktune/fan_control.json)
+            sleep: Coroutine the control loop waits with
+            clock: Monotonic clock in seconds
+            owner_lock: Fan owner lock (default: OWNER_LOCK_FILE next to config_path)
         """
         self.hwmon = hwmon_interface
+        self._sleep = sleep
+        self._clock = clock
         
         # Set default config path if not provided
         if config_path is None:
@@ -416,19 +717,40 @@ class FanControlService:
         else:
             self.config_path = config_path
         
+        if owner_lock is None:
+            owner_lock = FanOwnerLock(str(Path(self.config_path).parent / OWNER_LOCK_FILE))
+        self.owner_lock = owner_lock
+        self._owner = OWNER_PYTHON
+        # PWM changes made by another writer while this service owned the fan
+        self.foreign_writes = 0
+        self._last_foreign_pwm: Optional[int] = None
+        
         self.active_curve: Optional[FanCurve] = None
         self.active_curve_type: str = "preset"  # "preset" or "custom"
         self.custom_curves: dict[str, FanCurve] = {}
-        
-        # Monitoring thread attributes
-        self.monitoring_thread: Optional[threading.Thread] = None
-        self.stop_event = threading.Event()
+        self.control_mode: str = "curve"
+        self.predictive: Optional[PredictiveFanController] = None
+        # Average CPU load in % (e.g. from gymdeck3 status), or None
+        self._load_source: Optional[Callable[[], Optional[float]]] = None
+        # Shared sensor sampling (None: read hwmon directly)
+        self._sensor_hub: Optional[SensorHub] = None
+        
+        # Monitoring task attributes
+        self._monitor_task: Optional[asyncio.Task] = None
         self._monitoring_active = False
+        # Zero RPM (None: curve speeds apply as they are) and temperature
+        # hysteresis in °C, see set_fan_behavior()
+        self.zero_rpm: Optional[bool] = None
+        self.hysteresis_temp = 0.0
+        self._curve_temp: Optional[float] = None
         self._last_applied_speed: Optional[int] = None
         self._current_temp: Optional[float] = None
         self._target_speed: Optional[int] = None
         self._consecutive_failures = 0
         self._last_update: Optional[datetime] = None
+        self._poll_interval = FAST_INTERVAL
+        # Control loop wakeup times within the last minute
+        self._wakeups: collections.deque = collections.deque()
         
         # Load configuration on initialization
         self._load_config()
@@ -452,9 +774,12 @@ class FanControlService:
                 "version": self.CONFIG_VERSION,
                 "active_curve": self.active_curve.name if self.active_curve else "stock",
                 "active_curve_type": self.active_curve_type,
+                "control_mode": self.control_mode,
                 "custom_curves": {},
                 "last_applied": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
             }
+            if self.predictive is not None:
+                config["predictive"] = self.predictive.config.to_dict()
             
             # Serialize custom curves
             for name, curve in self.custom_curves.items():
@@ -537,6 +862,16 @@ class FanControlService:
                         print(f"Skipping invalid custom curve '{curve_name}': {e}")
                         continue
             
+            # Load control mode (absent in older files: curve only)
+            if config.get("control_mode") == "predictive":
+                try:
+                    predictive_config = PredictiveConfig.from_dict(config.get("predictive") or {})
+                except (ValueError, TypeError) as e:
+                    print(f"Invalid predictive fan settings, using defaults: {e}")
+                    predictive_config = PredictiveConfig()
+                self.control_mode = "predictive"
+                self.predictive = PredictiveFanController(predictive_config)
+            
             # Load active curve
             active_curve_name = config["active_curve"]
             active_curve_type = config.get("active_curve_type", "preset")
@@ -684,74 +1019,234 @@ class FanControlService:
         """
         return list(self.custom_curves.keys())
     
+    # Control Mode Methods
+    
+    def set_control_mode(self, mode: str, config: Optional[PredictiveConfig] = None) -> bool:
+        """Select curve-only or predictive control.
+        
+        Args:
+            mode: "curve" or "predictive"
+            config: Predictive controller tuning (default: keep the current
+                tuning, or PredictiveConfig())
+        
+        Returns:
+            True if the mode was applied and saved, False otherwise
+        """
+        if mode not in CONTROL_MODES:
+            return False
+        
+        if mode == "predictive":
+            if config is None and self.predictive is not None:
+                config = self.predictive.config
+            self.predictive = PredictiveFanController(config)
+        else:
+            self.predictive = None
+        self.control_mode = mode
+        return self._save_config()
+    
+    def set_fan_behavior(self, zero_rpm: Optional[bool] = None, hysteresis_temp: float = 0.0) -> None:
+        """Set gymdeck3's zero RPM and hysteresis behaviour for the curve.
+        
+        Used for profile fan settings that gymdeck3 used to apply. The
+        defaults restore the service's own behaviour.
+        
+        Args:
+            zero_rpm: Whether the fan may stop (see apply_zero_rpm), or None
+                to apply 0% curve speeds as they are
+            hysteresis_temp: The curve follows the temperature only once it
+                moved this many °C from where the curve was last evaluated
+        """
+        self.zero_rpm = zero_rpm
+        self.hysteresis_temp = hysteresis_temp
+        self._curve_temp = None
+    
+    def _hysteresis(self, temp: float) -> float:
+        """Temperature to evaluate the curve at, after hysteresis."""
+        if self._curve_temp is None or abs(temp - self._curve_temp) >= self.hysteresis_temp:
+            self._curve_temp = temp
+        return self._curve_temp
+    
+    def set_load_source(self, source: Optional[Callable[[], Optional[float]]]) -> None:
+        """Set the CPU load feed for predictive control.
+        
+        Args:
+            source: Callable returning the average CPU load in %, or None
+                when unknown
+        """
+        self._load_source = source
+    
+    def set_sensor_hub(self, hub: Optional[SensorHub]) -> None:
+        """Read the temperature from a shared SensorHub.
+        
+        The service subscribes to the hub's temperature at its current
+        poll interval, updated as the interval adapts.
+        
+        Args:
+            hub: SensorHub instance, or None to read hwmon directly
+        """
+        if self._sensor_hub is not None:
+            self._sensor_hub.unsubscribe(SENSOR_SUBSCRIBER)
+        self._sensor_hub = hub
+        if hub is not None:
+            hub.subscribe(SENSOR_SUBSCRIBER, (TEMPERATURE,), self._poll_interval)
+    
+    def _read_temperature(self) -> Optional[float]:
+        """Current temperature from the sensor hub or hwmon."""
+        if self._sensor_hub is None:
+            return self.hwmon.read_temperature()
+        return self._sensor_hub.latest((TEMPERATURE,), max_age=SENSOR_MAX_AGE).temperature_c
+    
+    def _read_load(self) -> Optional[float]:
+        """Current CPU load from the load source, or None."""
+        if self._load_source is None:
+            return None
+        try:
+            return self._load_source()
+        except Exception:
+            return None
+    
+    # Fan Ownership Methods
+    
+    def owner(self) -> str:
+        """Name of the process that currently drives the fan."""
+        return self.owner_lock.owner()
+    
+    def yield_to(self, owner: str, pid: Optional[int] = None) -> None:
+        """Hand the fan to another controller.
+        
+        The control loop keeps reading the temperature but stops writing
+        PWM until resume() is called or the new owner's process exits.
+        
+        Args:
+            owner: New owner name (e.g. OWNER_GYMDECK3)
+            pid: Process ID of the new owner, used to detect its exit
+        """
+        self.owner_lock.claim(owner, pid)
+        self._set_owner(owner)
+    
+    def resume(self) -> None:
+        """Take the fan back after another controller released it."""
+        self.owner_lock.claim(OWNER_PYTHON, os.getpid())
+        self._set_owner(OWNER_PYTHON)
+    
+    def _set_owner(self, owner: str) -> None:
+        """Track an ownership change seen by this service."""
+        if owner == self._owner:
+            return
+        print(f"Fan owner changed: {self._owner} -> {owner}")
+        self._owner = owner
+        if owner == OWNER_PYTHON:
+            # The other controller left the PWM at its own value
+            self.hwmon.invalidate_pwm()
+            self._last_applied_speed = None
+            if self.predictive is not None:
+                self.predictive.reset()
+    
+    def _check_foreign_write(self) -> bool:
+        """Compare the PWM readback to the last value this service wrote.
+        
+        A readback further than PWM_READBACK_TOLERANCE from the written
+        byte means another process wrote the PWM node. The next tick then
+        writes the target speed again.
+        
+        Returns:
+            True if a foreign write was detected
+        """
+        expected = getattr(self.hwmon, "last_written_pwm", None)
+        if not isinstance(expected, int):
+            return False
+        actual = self.hwmon.read_pwm_value()
+        if actual is None or abs(actual - expected) <= PWM_READBACK_TOLERANCE:
+            return False
+        
+        self.foreign_writes += 1
+        self._last_foreign_pwm = actual
+        print(f"Foreign PWM write detected: wrote {expected}, read back {actual}")
+        self.hwmon.invalidate_pwm()
+        self._last_applied_speed = None
+        return True
+    
     # Monitoring and Control Methods
     
     def start_monitoring(self) -> None:
-        """Start the background monitoring thread.
+        """Start the control loop as a task on the running event loop.
+        
+        The loop continuously monitors temperature and adjusts fan speed
+        according to the active curve.
         
-        Starts a daemon thread that continuously monitors temperature
-        and adjusts fan speed according to the active curve.
+        Raises:
+            RuntimeError: If called outside a running event loop
         """
         if self._monitoring_active:
             return
         
-        self.stop_event.clear()
+        loop = asyncio.get_running_loop()
         self._monitoring_active = True
-        self.monitoring_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
-        self.monitoring_thread.start()
+        self._monitor_task = loop.create_task(self._monitoring_loop())
     
     def stop_monitoring(self) -> None:
-        """Stop the background monitoring thread gracefully.
-        
-        Signals the monitoring thread to stop and waits for it to finish.
-        """
+        """Stop the control loop and close the hwmon file descriptors."""
         if not self._monitoring_active:
             return
         
         self._monitoring_active = False
-        self.stop_event.set()
         
-        if self.monitoring_thread and self.monitoring_thread.is_alive():
-            self.monitoring_thread.join(timeout=5.0)
+        if self._monitor_task is not None and not self._monitor_task.done():
+            self._monitor_task.cancel()
+        self._monitor_task = None
+        close = getattr(self.hwmon, "close", None)
+        if callable(close):
+            close()
     
-    def _monitoring_loop(self) -> None:
-        """Background monitoring loop that adjusts fan speed based on temperature.
+    async def _monitoring_loop(self) -> None:
+        """Control loop that adjusts fan speed based on temperature.
         
-        Runs continuously until stop_event is set. Reads temperature every second,
-        calculates target speed, applies safety overrides, and updates fan speed
-        if it changed by 2% or more.
+        Runs until monitoring is stopped. Reads the temperature, calculates
+        the target speed, applies safety overrides, and updates fan speed
+        if it changed by 2% or more. Waits FAST_INTERVAL or SLOW_INTERVAL
+        between ticks (see poll_interval()).
         
         Implements exponential backoff on exceptions to prevent tight error loops.
         """
         backoff_delay = 1.0  # Start with 1 second
         max_backoff = 30.0   # Maximum 30 seconds
+        previous_temp: Optional[float] = None
+        flat_since: Optional[float] = None
         
-        while not self.stop_event.is_set():
+        while self._monitoring_active:
             try:
+                now = self._clock()
+                self._record_wakeup(now)
+                
                 # Read current temperature
-                temp = self.hwmon.read_temperature()
+                temp = self._read_temperature()
                 
-                if temp is None:
-                    # Temperature read failed, wait and retry
-                    time.sleep(1.0)
+                if temp is None or self.active_curve is None:
+                    # Temperature read failed or no active curve, wait and retry
+                    await self._sleep(FAST_INTERVAL)
                     continue
                 
                 self._current_temp = temp
                 
-                # Calculate target speed using active curve
-                if self.active_curve is None:
-                    # No active curve, wait and retry
-                    time.sleep(1.0)
-                    continue
-                
-                calculated_speed = calculate_fan_speed(temp, self.active_curve.points)
+                calculated_speed = calculate_fan_speed(self._hysteresis(temp), self.active_curve.points)
+                if self.predictive is not None:
+                    calculated_speed = self.predictive.update(temp, calculated_speed, now, self._read_load())
                 
                 # Apply safety overrides
                 target_speed = apply_safety_override(temp, calculated_speed)
+                if self.zero_rpm is not None:
+                    target_speed = apply_zero_rpm(temp, target_speed, self.zero_rpm)
                 self._target_speed = target_speed
                 
+                # Only the fan owner writes PWM
+                self._set_owner(self.owner_lock.owner())
+                owned = self._owner == OWNER_PYTHON
+                if owned:
+                    self._check_foreign_write()
+                
                 # Apply fan speed if changed by >= 2% or first application
-                if self._last_applied_speed is None or abs(target_speed - self._last_applied_speed) >= 2:
+                changed = self._last_applied_speed is None or abs(target_speed - self._last_applied_speed) >= 2
+                if owned and changed:
                     success = self._apply_fan_speed(target_speed)
                     
                     if success:
@@ -764,17 +1259,36 @@ class FanControlService:
                 # Update timestamp
                 self._last_update = datetime.now(timezone.utc)
                 
-                # Wait 1 second before next iteration
-                self.stop_event.wait(1.0)
+                moving = previous_temp is None or abs(temp - previous_temp) >= MOVING_DELTA
+                flat_since = None if moving else (now if flat_since is None else flat_since)
+                self._poll_interval = poll_interval(
+                    temp, previous_temp, flat_since, now, self.active_curve.points
+                )
+                if self.predictive is not None and not self.predictive.settled:
+                    # Still slewing toward the predictive target
+                    self._poll_interval = FAST_INTERVAL
+                if self._sensor_hub is not None:
+                    self._sensor_hub.subscribe(SENSOR_SUBSCRIBER, (TEMPERATURE,), self._poll_interval)
+                previous_temp = temp
                 
+                await self._sleep(self._poll_interval)
+                
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                # Catch any unexpected exceptions to prevent thread crash
+                # Catch any unexpected exceptions to prevent the loop from dying
                 print(f"Error in fan control monitoring loop: {e}")
                 
                 # Exponential backoff
-                self.stop_event.wait(backoff_delay)
+                await self._sleep(backoff_delay)
                 backoff_delay = min(backoff_delay * 2, max_backoff)
     
+    def _record_wakeup(self, now: float) -> None:
+        """Remember a loop wakeup, forgetting those older than a minute."""
+        self._wakeups.append(now)
+        while self._wakeups and now - self._wakeups[0] > 60.0:
+            self._wakeups.popleft()
+    
     def _apply_fan_speed(self, speed: int) -> bool:
         """Apply fan speed to hardware.
         
@@ -800,7 +1314,6 @@ class FanControlService:
             if self._consecutive_failures >= 3:
                 print(f"Fan control disabled after {self._consecutive_failures} consecutive failures")
                 self._monitoring_active = False
-                self.stop_event.set()
             
             return False
     
@@ -820,6 +1333,15 @@ class FanControlService:
                 - monitoring_active: Whether monitoring is running
                 - hwmon_available: Whether hardware interface is available
                 - last_update: ISO timestamp of last update (or None)
+                - poll_interval: Current control loop interval in seconds
+                - wakeups_per_minute: Control loop wakeups in the last minute
+                - pwm_writes: PWM writes issued to hwmon
+                - pwm_writes_skipped: Writes skipped as the PWM byte was unchanged
+                - owner: Process driving the fan ("python" or "gymdeck3")
+                - foreign_writes: PWM changes by another writer while owned
+                - last_foreign_pwm: PWM byte of the last foreign write (or None)
+                - control_mode: "curve" or "predictive"
+                - predictive: Predictive controller terms (or None)
         """
         # Read current PWM speed
         current_speed = self.hwmon.read_current_pwm()
@@ -832,5 +1354,14 @@ class FanControlService:
             "curve_type": self.active_curve_type,
             "monitoring_active": self._monitoring_active,
             "hwmon_available": self.hwmon.is_available(),
-            "last_update": self._last_update.isoformat().replace('+00:00', 'Z') if self._last_update else None
+            "last_update": self._last_update.isoformat().replace('+00:00', 'Z') if self._last_update else None,
+            "poll_interval": self._poll_interval,
+            "wakeups_per_minute": sum(1 for t in self._wakeups if self._clock() - t <= 60.0),
+            "pwm_writes": getattr(self.hwmon, "pwm_writes", None),
+            "pwm_writes_skipped": getattr(self.hwmon, "pwm_writes_skipped", None),
+            "owner": self.owner(),
+            "foreign_writes": self.foreign_writes,
+            "last_foreign_pwm": self._last_foreign_pwm,
+            "control_mode": self.control_mode,
+            "predictive": self.predictive.state() if self.predictive is not None else None
         }
@@ -0,0 +1,199 @@
+"""Predictive fan control with temperature-rate and load feedforward.
+
+Feature: fan-control-curves, Fan Control Service
+Validates: Requirements 5.1
+
+The curve-only mode maps the current temperature to a speed. A sudden
+load step (loading screen, shader compilation) heats the die faster than
+the heatsink can follow, so the fan reacts late, the temperature
+overshoots, and the fan then over-spins on the way back down.
+
+PredictiveFanController keeps the static curve as its base and adds:
+
+- **Rate feedforward**: a filtered rising temperature derivative (°C/s)
+  times rate_gain, so a fast rise spins the fan up before the
+  temperature arrives. Falling rates are ignored: the die cools within
+  seconds of a load drop while the heatsink is still hot.
+- **Load feedforward**: the CPU load's step from its slow moving
+  average times load_gain. It reacts as soon as gymdeck3 reports the
+  load, before the temperature moves, and decays as the average catches
+  up. A load drop gives a negative step, so the fan spins down early
+  instead of over-spinning while the temperature falls. At or above
+  target_temp the output is floored at the curve, so a load drop only
+  takes the fan below the curve once the temperature is under target.
+- **PI correction** toward target_temp, bounded to [0, correction_limit]:
+  it only adds speed above the target, never removes any.
+  Anti-windup: the integral is clamped to the same bound, unwinds below
+  the target, and does not grow while the output is saturated at 100%.
+- **Slew limit**: the output moves at most max_slew % per second and
+  per control tick, for acoustics; the service polls fast until the
+  output has caught up. Safety overrides (apply_safety_override) are applied by the
+  service after the slew limit and are never delayed.
+
+# Usage Example
+
+```python
+controller = PredictiveFanController(PredictiveConfig(target_temp=75.0))
+base = calculate_fan_speed(temp, curve.points)
+speed = controller.update(temp, base, now=time.monotonic(), load=42.0)
+```
+"""
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass
+class PredictiveConfig:
+    """Tuning of the predictive fan controller.
+
+    Attributes:
+        target_temp: Temperature the PI correction steers toward in °C
+        rate_gain: Feedforward per temperature rate in % per °C/s
+        load_gain: Feedforward per load step in % per % load
+        feedforward_limit: Bound on the combined feedforward in %
+        kp: Proportional gain in % per °C
+        ki: Integral gain in % per °C·s
+        correction_limit: Bound on the PI correction in %
+        max_slew: Largest output change in % per second
+        rate_tau: Time constant of the derivative filter in seconds
+        load_tau: Time constant of the load moving average in seconds
+    """
+    target_temp: float = 75.0
+    rate_gain: float = 6.0
+    load_gain: float = 0.3
+    feedforward_limit: float = 30.0
+    kp: float = 1.5
+    ki: float = 0.15
+    correction_limit: float = 20.0
+    max_slew: float = 4.0
+    rate_tau: float = 4.0
+    load_tau: float = 30.0
+
+    def __post_init__(self):
+        """Validate ranges."""
+        if not 40.0 <= self.target_temp <= 95.0:
+            raise ValueError(f"target_temp {self.target_temp} out of range [40, 95]")
+        for name in ("rate_gain", "load_gain", "feedforward_limit", "kp", "ki", "correction_limit"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must not be negative")
+        for name in ("max_slew", "rate_tau", "load_tau"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be positive")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PredictiveConfig":
+        """Create from a dictionary, ignoring unknown keys."""
+        known = cls.__dataclass_fields__
+        return cls(**{k: float(v) for k, v in data.items() if k in known})
+
+
+class PredictiveFanController:
+    """Curve + feedforward + bounded PI fan controller with a slew limit."""
+
+    def __init__(self, config: Optional[PredictiveConfig] = None):
+        """Initialize the controller.
+
+        Args:
+            config: Controller tuning (default: PredictiveConfig())
+        """
+        self.config = config or PredictiveConfig()
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all state; the next update starts from the curve."""
+        self._last_temp: Optional[float] = None
+        self._last_time: Optional[float] = None
+        self._rate = 0.0
+        self._load_average: Optional[float] = None
+        self._integral = 0.0
+        self._output: Optional[float] = None
+        self._unlimited = 0.0
+        self._feedforward = 0.0
+        self._correction = 0.0
+
+    @property
+    def settled(self) -> bool:
+        """True when the output is not being held back by the slew limit."""
+        return self._output is None or abs(self._output - self._unlimited) < 1.0
+
+    def update(self, temp: float, base_speed: float, now: float, load: Optional[float] = None) -> int:
+        """Compute the fan speed for one control tick.
+
+        Args:
+            temp: Current temperature in °C
+            base_speed: Speed of the static curve at temp in %
+            now: Monotonic time in seconds
+            load: Average CPU load in % (None if unknown)
+
+        Returns:
+            Fan speed in % (0-100)
+        """
+        cfg = self.config
+        dt = 0.0 if self._last_time is None else max(0.0, now - self._last_time)
+
+        # Filtered temperature derivative
+        if dt > 0:
+            raw_rate = (temp - self._last_temp) / dt
+            self._rate += (raw_rate - self._rate) * (1.0 - math.exp(-dt / cfg.rate_tau))
+
+        # Load step above its moving average
+        load_step = 0.0
+        if load is not None:
+            if self._load_average is None:
+                self._load_average = load
+            else:
+                self._load_average += (load - self._load_average) * (1.0 - math.exp(-dt / cfg.load_tau))
+            load_step = load - self._load_average
+
+        feedforward = cfg.rate_gain * max(0.0, self._rate) + cfg.load_gain * load_step
+        feedforward = _clamp(feedforward, -cfg.feedforward_limit, cfg.feedforward_limit)
+
+        # Bounded PI with conditional integration (anti-windup)
+        error = temp - cfg.target_temp
+        proportional = cfg.kp * error
+        before_integral = base_speed + feedforward + proportional + self._integral
+        saturated = before_integral >= 100.0 and error > 0
+        if dt > 0 and not saturated:
+            self._integral = _clamp(self._integral + cfg.ki * error * dt, 0.0, cfg.correction_limit)
+        correction = _clamp(proportional + self._integral, 0.0, cfg.correction_limit)
+
+        unlimited = base_speed + feedforward + correction
+        if error >= 0:
+            unlimited = max(unlimited, base_speed)  # Never below the curve above target
+        unlimited = _clamp(unlimited, 0.0, 100.0)
+        if self._output is None:
+            output = unlimited
+        else:
+            # At most one second's worth per tick: after a slow (5 s) tick the
+            # output keeps ramping on fast ticks instead of jumping
+            step = cfg.max_slew * min(dt, 1.0)
+            output = _clamp(unlimited, self._output - step, self._output + step)
+
+        self._last_temp = temp
+        self._last_time = now
+        self._output = output
+        self._unlimited = unlimited
+        self._feedforward = feedforward
+        self._correction = correction
+        return int(round(output))
+
+    def state(self) -> Dict[str, Any]:
+        """Controller terms of the last update, for status display."""
+        return {
+            "target_temp": self.config.target_temp,
+            "temperature_rate": round(self._rate, 3),
+            "feedforward": round(self._feedforward, 2),
+            "correction": round(self._correction, 2),
+            "integral": round(self._integral, 2),
+            "settled": self.settled,
+        }
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
@@ -0,0 +1,354 @@
+"""Power telemetry with energy integration.
+
+gymdeck3 reports no power, so telemetry, BlackBox and session samples
+used to record 0 W. PowerMonitor reads power from the SensorHub at a
+steady rate and integrates it into energy, attributed to the active
+profile and game.
+
+Feature: decktune-3.1-reliability-ux
+Validates: Requirements 2.1, 8.3
+
+# Sources
+
+- **battery**: battery power while discharging (``power_now``, else
+  ``current_now`` × ``voltage_now``). This is the whole device's draw
+  and the basis of battery life estimates.
+- **apu**: the hwmon power input (APU PPT on the Steam Deck), available
+  on AC as well but covering only the APU.
+
+A reading's power_w is the battery draw when discharging, else the APU
+power. Each source is integrated separately, so a plug-in or unplug
+never mixes the two in one interval.
+
+# Integration
+
+Energy is integrated with the trapezoidal rule between consecutive
+readings of a source, so missed samples (a stalled event loop, a slow
+pass) are bridged by a straight line. Gaps longer than max_gap are not
+integrated and are counted as unaccounted time instead. An interval is
+attributed to the profile and game active at its start.
+
+# Usage Example
+
+```python
+monitor = PowerMonitor(hub)
+monitor.set_attribution_source(profile_manager.get_energy_attribution)
+monitor.start()
+
+print(monitor.latest().power_w, monitor.get_status()["battery"]["profiles"])
+```
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from ..platform.sensors import BATTERY_FULL, POWER_CHANNELS, SensorHub, SensorSnapshot
+
+logger = logging.getLogger(__name__)
+
+SOURCE_BATTERY = "battery"
+SOURCE_APU = "apu"
+
+# SensorHub subscriber name and sampling interval (seconds)
+SENSOR_SUBSCRIBER = "power"
+SAMPLE_INTERVAL = 1.0
+
+# Longest gap between readings bridged by the trapezoidal rule (seconds)
+MAX_GAP = 60.0
+
+# (profile name, game) an interval is attributed to
+Attribution = Tuple[Optional[str], Optional[str]]
+
+
+def estimate_battery_life_h(capacity_wh: Optional[float], wh_per_hour: float) -> Optional[float]:
+    """Hours a full battery lasts at an average draw.
+
+    Args:
+        capacity_wh: Full battery energy in Wh (None if unknown)
+        wh_per_hour: Average draw in Wh per hour (= W)
+
+    Returns:
+        Battery life in hours, or None without a capacity or a draw
+    """
+    if not capacity_wh or wh_per_hour <= 0:
+        return None
+    return capacity_wh / wh_per_hour
+
+
+@dataclass
+class EnergyAccount:
+    """Energy drawn over integrated time.
+
+    Attributes:
+        energy_wh: Integrated energy in Wh
+        seconds: Integrated time in seconds
+    """
+    energy_wh: float = 0.0
+    seconds: float = 0.0
+
+    @property
+    def wh_per_hour(self) -> float:
+        """Average draw in Wh per hour (0.0 before any integrated time)."""
+        return self.energy_wh / (self.seconds / 3600.0) if self.seconds > 0 else 0.0
+
+    def add(self, energy_wh: float, seconds: float) -> None:
+        """Add one integrated interval."""
+        self.energy_wh += energy_wh
+        self.seconds += seconds
+
+    def to_dict(self, capacity_wh: Optional[float] = None) -> Dict[str, Any]:
+        """Convert to dictionary, with a battery life estimate if capacity_wh is given."""
+        return {
+            "energy_wh": round(self.energy_wh, 4),
+            "hours": round(self.seconds / 3600.0, 4),
+            "wh_per_hour": round(self.wh_per_hour, 3),
+            "estimated_battery_life_h": estimate_battery_life_h(capacity_wh, self.wh_per_hour),
+        }
+
+
+def integrate_energy(samples: Iterable[Tuple[float, Optional[float]]], max_gap: float = MAX_GAP) -> EnergyAccount:
+    """Trapezoidal energy of (timestamp, power_w) samples.
+
+    Args:
+        samples: Samples in time order (seconds, W); intervals next to a
+            sample without power (None) are not integrated
+        max_gap: Longest gap between samples that is integrated (seconds)
+
+    Returns:
+        EnergyAccount of the integrated intervals
+    """
+    account = EnergyAccount()
+    previous = None
+    for timestamp, power_w in samples:
+        if previous is not None:
+            dt = timestamp - previous[0]
+            if 0 < dt <= max_gap and previous[1] is not None and power_w is not None:
+                account.add((previous[1] + power_w) / 2.0 * dt / 3600.0, dt)
+        previous = (timestamp, power_w)
+    return account
+
+
+class EnergyIntegrator:
+    """Trapezoidal integration of one power source with attribution.
+
+    Attributes:
+        total: Energy of all integrated intervals
+        profiles: Energy per profile name
+        games: Energy per game
+        unaccounted_sec: Time in gaps longer than max_gap
+    """
+
+    def __init__(self, max_gap: float = MAX_GAP):
+        """Initialize the integrator.
+
+        Args:
+            max_gap: Longest gap between readings that is integrated (seconds)
+        """
+        self.max_gap = max_gap
+        self.total = EnergyAccount()
+        self.profiles: Dict[str, EnergyAccount] = {}
+        self.games: Dict[str, EnergyAccount] = {}
+        self.unaccounted_sec = 0.0
+        self._last: Optional[Tuple[float, float, Attribution]] = None
+
+    def add(self, timestamp: float, power_w: Optional[float], attribution: Attribution = (None, None)) -> float:
+        """Integrate up to a new reading.
+
+        Args:
+            timestamp: Reading time in seconds
+            power_w: Power in W, None while the source is unavailable
+                (the interval up to it is not integrated)
+            attribution: (profile, game) active from this reading on
+
+        Returns:
+            Energy added in Wh
+        """
+        last = self._last
+        if last is not None and timestamp <= last[0]:
+            return 0.0  # Same snapshot recorded twice
+        self._last = (timestamp, power_w, attribution) if power_w is not None else None
+        if last is None or power_w is None:
+            return 0.0
+
+        dt = timestamp - last[0]
+        if dt > self.max_gap:
+            self.unaccounted_sec += dt
+            return 0.0
+        energy = (last[1] + power_w) / 2.0 * dt / 3600.0
+        self.total.add(energy, dt)
+        profile, game = last[2]
+        if profile is not None:
+            self.profiles.setdefault(profile, EnergyAccount()).add(energy, dt)
+        if game is not None:
+            self.games.setdefault(game, EnergyAccount()).add(energy, dt)
+        return energy
+
+    def to_dict(self, capacity_wh: Optional[float] = None) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "total": self.total.to_dict(capacity_wh),
+            "profiles": {name: a.to_dict(capacity_wh) for name, a in self.profiles.items()},
+            "games": {name: a.to_dict(capacity_wh) for name, a in self.games.items()},
+            "unaccounted_sec": round(self.unaccounted_sec, 1),
+        }
+
+
+@dataclass(frozen=True)
+class PowerReading:
+    """Power at one instant.
+
+    Attributes:
+        timestamp: Hub clock time of the reading
+        power_w: Battery draw while discharging, else APU power (None if
+            neither is available)
+        source: SOURCE_BATTERY or SOURCE_APU (None with no power_w)
+        battery_power_w: Battery charge or discharge power in W
+        battery_discharging: Whether the battery is discharging
+        apu_power_w: APU power in W
+    """
+    timestamp: float
+    power_w: Optional[float] = None
+    source: Optional[str] = None
+    battery_power_w: Optional[float] = None
+    battery_discharging: Optional[bool] = None
+    apu_power_w: Optional[float] = None
+
+    @classmethod
+    def from_snapshot(cls, snapshot: SensorSnapshot) -> "PowerReading":
+        """Build a reading from the power channels of a snapshot."""
+        battery_draw = snapshot.battery_power_w if snapshot.battery_discharging else None
+        if battery_draw is not None:
+            power_w, source = battery_draw, SOURCE_BATTERY
+        elif snapshot.apu_power_w is not None:
+            power_w, source = snapshot.apu_power_w, SOURCE_APU
+        else:
+            power_w, source = None, None
+        return cls(
+            timestamp=snapshot.timestamp,
+            power_w=power_w,
+            source=source,
+            battery_power_w=snapshot.battery_power_w,
+            battery_discharging=snapshot.battery_discharging,
+            apu_power_w=snapshot.apu_power_w,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "timestamp": self.timestamp,
+            "power_w": self.power_w,
+            "source": self.source,
+            "battery_power_w": self.battery_power_w,
+            "battery_discharging": self.battery_discharging,
+            "apu_power_w": self.apu_power_w,
+        }
+
+
+class PowerMonitor:
+    """Samples power through a SensorHub and integrates it into energy.
+
+    Attributes:
+        hub: SensorHub supplying the power channels
+        battery: Integrator of the battery discharge power
+        apu: Integrator of the APU power
+    """
+
+    def __init__(self, hub: SensorHub, interval: float = SAMPLE_INTERVAL, max_gap: float = MAX_GAP):
+        """Initialize the monitor.
+
+        Args:
+            hub: SensorHub to sample through
+            interval: Sampling interval in seconds
+            max_gap: Longest gap between readings that is integrated (seconds)
+        """
+        self.hub = hub
+        self.interval = interval
+        self.battery = EnergyIntegrator(max_gap)
+        self.apu = EnergyIntegrator(max_gap)
+        self._attribution_source: Optional[Callable[[], Attribution]] = None
+        self._reading: Optional[PowerReading] = None
+
+    def set_attribution_source(self, source: Optional[Callable[[], Attribution]]) -> None:
+        """Set the callable returning the active (profile, game).
+
+        Args:
+            source: Callable returning (profile name, game), e.g.
+                ProfileManager.get_energy_attribution
+        """
+        self._attribution_source = source
+
+    def attribution(self) -> Attribution:
+        """The (profile, game) energy drawn now is attributed to."""
+        if self._attribution_source is None:
+            return (None, None)
+        try:
+            return self._attribution_source()
+        except Exception as e:
+            logger.debug(f"Power attribution unavailable: {e}")
+            return (None, None)
+
+    # ==================== Sampling ====================
+
+    def start(self) -> None:
+        """Sample the power channels at the monitor's interval."""
+        self.hub.subscribe(SENSOR_SUBSCRIBER, POWER_CHANNELS, self.interval, callback=self.record)
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        self.hub.unsubscribe(SENSOR_SUBSCRIBER)
+
+    def record(self, snapshot: SensorSnapshot) -> PowerReading:
+        """Integrate a snapshot's power readings (SensorHub callback).
+
+        Args:
+            snapshot: Snapshot with fresh power channels
+
+        Returns:
+            The new reading
+        """
+        reading = PowerReading.from_snapshot(snapshot)
+        attribution = self.attribution()
+        battery_draw = reading.battery_power_w if reading.battery_discharging else None
+        self.battery.add(reading.timestamp, battery_draw, attribution)
+        self.apu.add(reading.timestamp, reading.apu_power_w, attribution)
+        self._reading = reading
+        return reading
+
+    def latest(self, max_age: Optional[float] = None) -> PowerReading:
+        """Latest reading, sampling first if it is older than max_age.
+
+        Args:
+            max_age: Staleness tolerance in seconds (None: any age)
+
+        Returns:
+            The latest reading
+        """
+        if self._reading is None or max_age is not None:
+            snapshot = self.hub.latest(POWER_CHANNELS, max_age=max_age)
+            if self._reading is None or snapshot.timestamp > self._reading.timestamp:
+                return self.record(snapshot)
+        return self._reading
+
+    def battery_capacity_wh(self) -> Optional[float]:
+        """Full battery energy in Wh (read once), None if unknown."""
+        return self.hub.latest((BATTERY_FULL,)).battery_full_wh
+
+    # ==================== Status ====================
+
+    def get_status(self) -> Dict[str, Any]:
+        """Current power and energy totals.
+
+        Returns:
+            Dictionary with the latest reading, the battery capacity, and
+            battery and APU energy in total, per profile and per game
+            (battery life estimates use the battery draw)
+        """
+        capacity = self.battery_capacity_wh()
+        return {
+            "reading": self.latest().to_dict(),
+            "battery_capacity_wh": capacity,
+            "attribution": list(self.attribution()),
+            SOURCE_BATTERY: self.battery.to_dict(capacity),
+            SOURCE_APU: self.apu.to_dict(),
+        }
@@ -44,6 +44,7 @@ class RyzenadjWrapper:
         self.event_emitter = event_emitter
         self._last_commands: List[str] = []  # Track commands for testing
         self._last_error: Optional[str] = None  # Track last error for testing
+        self._applied_cores: Optional[Tuple[int, ...]] = None  # Values known to be in effect
     
     def set_event_emitter(self, event_emitter: "EventEmitter") -> None:
         """Set the event emitter for status updates.
@@ -288,6 +289,7 @@ class RyzenadjWrapper:
         
         self._last_commands = []  # Reset command tracking
         self._last_error = None  # Reset error tracking
+        self._applied_cores = None  # Unknown until every core succeeds
         
         for core_idx, value in enumerate(cores):
             hex_value = self.calculate_hex(core_idx, value)
@@ -338,6 +340,7 @@ class RyzenadjWrapper:
                 return False, error_msg
         
         logger.info(f"Successfully applied undervolt values: {cores}")
+        self._applied_cores = tuple(cores)
         return True, None
 
     async def apply_values_async(self, cores: List[int]) -> Tuple[bool, Optional[str]]:
@@ -401,6 +404,7 @@ class RyzenadjWrapper:
         
         self._last_commands = []  # Reset command tracking
         self._last_error = None  # Reset error tracking
+        self._applied_cores = None  # Unknown until every core succeeds
         
         for core_idx, value in enumerate(cores):
             hex_value = self.calculate_hex(core_idx, value)
@@ -482,6 +486,7 @@ class RyzenadjWrapper:
                 return False, error_msg
         
         logger.info(f"Successfully applied undervolt values to all 4 cores: {cores}")
+        self._applied_cores = tuple(cores)
         return True, None
     
     def disable(self) -> Tuple[bool, Optional[str]]:
@@ -518,6 +523,18 @@ class RyzenadjWrapper:
         """
         return self._last_commands.copy()
     
+    def get_applied_values(self) -> Optional[Tuple[int, ...]]:
+        """Get the values applied by the last successful call.
+        
+        Only tracks values written through this wrapper; gymdeck3 runs its
+        own ryzenadj and is not reflected here.
+        
+        Returns:
+            Tuple of 4 core values, or None if unknown (never applied or
+            the last apply failed part-way)
+        """
+        return self._applied_cores
+    
     def get_last_error(self) -> Optional[str]:
         """Get the last error message (for testing purposes).
         
@@ -16,6 +16,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
+from .power import MAX_GAP, SOURCE_BATTERY, estimate_battery_life_h, integrate_energy
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +35,9 @@ class SessionMetrics:
     avg_power_w: float  # Average power consumption
     estimated_battery_saved_wh: float  # Estimated battery savings
     undervolt_values: List[int]  # Undervolt values used during session
+    energy_wh: Optional[float] = None  # Trapezoidal energy of battery samples
+    wh_per_hour: Optional[float] = None  # Average battery draw over the integrated time
+    estimated_battery_life_h: Optional[float] = None  # Full battery at wh_per_hour
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -48,7 +53,10 @@ class SessionMetrics:
             max_temperature_c=data["max_temperature_c"],
             avg_power_w=data["avg_power_w"],
             estimated_battery_saved_wh=data["estimated_battery_saved_wh"],
-            undervolt_values=data["undervolt_values"]
+            undervolt_values=data["undervolt_values"],
+            energy_wh=data.get("energy_wh"),
+            wh_per_hour=data.get("wh_per_hour"),
+            estimated_battery_life_h=data.get("estimated_battery_life_h")
         )
 
 
@@ -60,7 +68,8 @@ class TelemetrySampleData:
     """
     timestamp: float  # Unix timestamp
     temperature_c: float  # CPU temperature
-    power_w: float  # Power consumption
+    power_w: Optional[float]  # Power consumption (None if unknown)
+    source: Optional[str] = None  # "battery" or "apu" (see backend.core.power)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -72,7 +81,8 @@ class TelemetrySampleData:
         return cls(
             timestamp=data["timestamp"],
             temperature_c=data["temperature_c"],
-            power_w=data["power_w"]
+            power_w=data["power_w"],
+            source=data.get("source")
         )
 
 
@@ -152,6 +162,10 @@ class SessionManager:
     # Baseline power for battery savings calculation (typical Steam Deck idle)
     BASELINE_POWER_W = 25.0
     
+    # Battery energy for life estimates until set_battery_capacity()
+    # (Steam Deck LCD)
+    DEFAULT_BATTERY_CAPACITY_WH = 40.0
+    
     def __init__(self, settings_manager, data_dir: Optional[Path] = None):
         """Initialize the session manager.
         
@@ -163,6 +177,16 @@ class SessionManager:
         self._data_dir = data_dir or Path.home() / ".config" / "decktune"
         self._sessions: List[Session] = self._load_from_settings()
         self._active_session: Optional[Session] = None
+        self.battery_capacity_wh = self.DEFAULT_BATTERY_CAPACITY_WH
+    
+    def set_battery_capacity(self, capacity_wh: Optional[float]) -> None:
+        """Set the full battery energy used for battery life estimates.
+        
+        Args:
+            capacity_wh: Full battery energy in Wh (None keeps the current value)
+        """
+        if capacity_wh:
+            self.battery_capacity_wh = capacity_wh
     
     def _load_from_settings(self) -> List[Session]:
         """Load sessions from settings.
@@ -226,15 +250,18 @@ class SessionManager:
     def add_sample(
         self,
         temperature_c: float,
-        power_w: float,
-        timestamp: Optional[float] = None
+        power_w: Optional[float],
+        timestamp: Optional[float] = None,
+        source: Optional[str] = None
     ) -> None:
         """Add a telemetry sample to the active session.
         
         Args:
             temperature_c: CPU temperature in Celsius
-            power_w: Power consumption in Watts
+            power_w: Power consumption in Watts (None if unknown)
             timestamp: Unix timestamp (defaults to current time)
+            source: Power source; only "battery" samples (whole-device
+                draw) count towards energy and battery life
         """
         if self._active_session is None:
             return
@@ -243,7 +270,8 @@ class SessionManager:
         sample = TelemetrySampleData(
             timestamp=timestamp or time.time(),
             temperature_c=temperature_c,
-            power_w=power_w
+            power_w=power_w,
+            source=source
         )
         self._active_session.samples.append(sample)
     
@@ -319,9 +347,9 @@ class SessionManager:
         min_temp = min(temps)
         max_temp = max(temps)
         
-        # Calculate power stats
-        powers = [s.power_w for s in session.samples]
-        avg_power = sum(powers) / len(powers)
+        # Calculate power stats over the samples with a reading
+        powers = [s.power_w for s in session.samples if s.power_w is not None]
+        avg_power = sum(powers) / len(powers) if powers else 0.0
         
         # Estimate battery savings (baseline - actual) * duration in hours
         # Assumes undervolting reduces power consumption
@@ -329,6 +357,15 @@ class SessionManager:
         power_saved_w = max(0, self.BASELINE_POWER_W - avg_power)
         battery_saved_wh = power_saved_w * duration_hours
         
+        # Energy of the battery draw only: APU power on AC covers part of
+        # the device. Intervals touching a non-battery sample, and gaps
+        # longer than MAX_GAP (e.g. gymdeck3 stalled), are left out
+        energy = integrate_energy(
+            ((s.timestamp, s.power_w if s.source == SOURCE_BATTERY else None) for s in session.samples),
+            MAX_GAP
+        )
+        wh_per_hour = energy.wh_per_hour if energy.seconds > 0 else None
+        
         return SessionMetrics(
             duration_sec=duration_sec,
             avg_temperature_c=avg_temp,
@@ -336,7 +373,12 @@ class SessionManager:
             max_temperature_c=max_temp,
             avg_power_w=avg_power,
             estimated_battery_saved_wh=battery_saved_wh,
-            undervolt_values=[0, 0, 0, 0]  # Will be set by caller if available
+            undervolt_values=[0, 0, 0, 0],  # Will be set by caller if available
+            energy_wh=energy.energy_wh if wh_per_hour is not None else None,
+            wh_per_hour=wh_per_hour,
+            estimated_battery_life_h=(
+                estimate_battery_life_h(self.battery_capacity_wh, wh_per_hour) if wh_per_hour is not None else None
+            )
         )
     
     def get_history(self, limit: int = 30) -> List[Session]:
@@ -354,6 +396,22 @@ class SessionManager:
         # Return most recent sessions first
         return list(reversed(self._sessions[-limit:]))
     
+    def hottest_temperature(self, limit: int = 30) -> Optional[float]:
+        """Highest temperature reached in recent sessions.
+        
+        Args:
+            limit: Number of recent sessions to consider (default 30)
+            
+        Returns:
+            Maximum temperature in °C, or None if no ended session
+            recorded a temperature
+        """
+        temperatures = [
+            s.metrics.max_temperature_c for s in self.get_history(limit)
+            if s.metrics is not None and s.metrics.max_temperature_c > 0
+        ]
+        return max(temperatures) if temperatures else None
+    
     def get_session(self, session_id: str) -> Optional[Session]:
         """Get a specific session by ID.
         
@@ -408,17 +466,24 @@ class SessionManager:
         m1 = session1.metrics
         m2 = session2.metrics
         
+        diff = {
+            "duration_sec": m1.duration_sec - m2.duration_sec,
+            "avg_temperature_c": m1.avg_temperature_c - m2.avg_temperature_c,
+            "min_temperature_c": m1.min_temperature_c - m2.min_temperature_c,
+            "max_temperature_c": m1.max_temperature_c - m2.max_temperature_c,
+            "avg_power_w": m1.avg_power_w - m2.avg_power_w,
+            "estimated_battery_saved_wh": m1.estimated_battery_saved_wh - m2.estimated_battery_saved_wh,
+        }
+        # Energy only where both sessions had battery samples
+        for key in ("energy_wh", "wh_per_hour"):
+            v1, v2 = getattr(m1, key), getattr(m2, key)
+            if v1 is not None and v2 is not None:
+                diff[key] = v1 - v2
+        
         return {
             "session1": session1.to_dict(),
             "session2": session2.to_dict(),
-            "diff": {
-                "duration_sec": m1.duration_sec - m2.duration_sec,
-                "avg_temperature_c": m1.avg_temperature_c - m2.avg_temperature_c,
-                "min_temperature_c": m1.min_temperature_c - m2.min_temperature_c,
-                "max_temperature_c": m1.max_temperature_c - m2.max_temperature_c,
-                "avg_power_w": m1.avg_power_w - m2.avg_power_w,
-                "estimated_battery_saved_wh": m1.estimated_battery_saved_wh - m2.estimated_battery_saved_wh,
-            }
+            "diff": diff
         }
     
     def archive_old_sessions(self) -> int:
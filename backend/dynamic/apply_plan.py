@@ -0,0 +1,270 @@
+"""Precompiled apply plans for per-game profiles.
+
+This module turns a profile's settings into an immutable ApplyPlan once,
+when the profile is saved, so that switching profiles does not rebuild
+configurations from scratch. A switch diffs the target plan against the
+plan that is currently active and only performs the steps that differ.
+
+Feature: decktune-3.0-automation
+Validates: Requirements 4.2, 4.4, 8.2
+
+# Plan Components
+
+Each plan is split into independently comparable components:
+
+- **cores**: static undervolt vector applied through ryzenadj
+- **dynamic**: gymdeck3 configuration without fan settings (hashed)
+- **fan**: fan settings from the dynamic config (hashed)
+- **frequency curves**: per-core frequency curves (hashed)
+
+Fan settings are kept apart from the gymdeck3 configuration so that two
+profiles differing only in their fan curve can be switched without
+restarting gymdeck3, as long as fan settings are applied elsewhere (see
+ProfileManager.set_fan_control_service).
+
+# Usage Example
+
+```python
+from backend.dynamic.apply_plan import ApplyPlan
+
+plan = ApplyPlan.from_profile(profile)
+diff = plan.diff(active_plan)
+if diff.cores:
+    await ryzenadj.apply_values_async(list(plan.cores))
+```
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import DynamicConfig, FanConfig
+
+
+def _canonical_json(data: Any) -> str:
+    """Serialize data deterministically for hashing and storage."""
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _digest(text: Optional[str]) -> Optional[str]:
+    """Short content hash of a canonical JSON string (None stays None)."""
+    if text is None:
+        return None
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class PlanDiff:
+    """Steps needed to go from the active plan to a target plan.
+
+    Attributes:
+        cores: Undervolt values differ
+        dynamic: gymdeck3 configuration (or its enabled state) differs
+        fan: Fan settings differ
+        frequency_curves: Frequency curves differ
+    """
+    cores: bool = False
+    dynamic: bool = False
+    fan: bool = False
+    frequency_curves: bool = False
+
+    def is_empty(self) -> bool:
+        """Check if the target plan is identical to the active plan."""
+        return not (self.cores or self.dynamic or self.fan or self.frequency_curves)
+
+    def steps(self) -> List[str]:
+        """Names of the steps to perform, for logging."""
+        return [
+            name for name in ("cores", "dynamic", "fan", "frequency_curves")
+            if getattr(self, name)
+        ]
+
+
+@dataclass(frozen=True)
+class ApplyPlan:
+    """Immutable, precompiled settings of a profile.
+
+    Mutable inputs are stored as canonical JSON so the plan can never be
+    changed through a reference shared with the profile it came from.
+
+    Attributes:
+        name: Profile name (for logging)
+        app_id: Steam AppID (None for global default)
+        cores: Undervolt values for each core
+        dynamic_enabled: Whether gymdeck3 should run for this plan
+        dynamic_config_json: gymdeck3 configuration without fan settings
+        dynamic_hash: Hash of dynamic_config_json (None if dynamic is disabled)
+        fan_config_json: Enabled fan settings (None if fan control is off)
+        fan_hash: Hash of fan_config_json
+        frequency_curves_json: Serialized frequency curves (None if absent)
+        frequency_curves_hash: Hash of frequency_curves_json
+
+    Requirements: 4.2, 4.4, 8.2
+    """
+    name: str
+    app_id: Optional[int]
+    cores: Tuple[int, ...]
+    dynamic_enabled: bool = False
+    dynamic_config_json: Optional[str] = None
+    dynamic_hash: Optional[str] = None
+    fan_config_json: Optional[str] = None
+    fan_hash: Optional[str] = None
+    frequency_curves_json: Optional[str] = None
+    frequency_curves_hash: Optional[str] = None
+
+    @classmethod
+    def compile(
+        cls,
+        name: str,
+        app_id: Optional[int],
+        cores: List[int],
+        dynamic_enabled: bool = False,
+        dynamic_config: Optional[Dict[str, Any]] = None,
+        frequency_curves: Optional[Dict[Any, Dict[str, Any]]] = None,
+    ) -> "ApplyPlan":
+        """Compile profile settings into a plan.
+
+        Args:
+            name: Profile name
+            app_id: Steam AppID (None for global default)
+            cores: Undervolt values for each core
+            dynamic_enabled: Whether dynamic mode is enabled
+            dynamic_config: Dynamic mode configuration dictionary
+            frequency_curves: Serialized frequency curves keyed by core
+
+        Returns:
+            Compiled ApplyPlan
+        """
+        dynamic_json = None
+        fan_json = None
+        enabled = bool(dynamic_enabled and dynamic_config)
+
+        if enabled:
+            config = dict(dynamic_config)
+            fan_data = config.pop("fan_config", None)
+            dynamic_json = _canonical_json(config)
+            if fan_data and fan_data.get("enabled", False):
+                fan_json = _canonical_json(fan_data)
+
+        curves_json = None
+        if frequency_curves:
+            curves_json = _canonical_json({str(k): v for k, v in frequency_curves.items()})
+
+        return cls(
+            name=name,
+            app_id=app_id,
+            cores=tuple(cores),
+            dynamic_enabled=enabled,
+            dynamic_config_json=dynamic_json,
+            dynamic_hash=_digest(dynamic_json),
+            fan_config_json=fan_json,
+            fan_hash=_digest(fan_json),
+            frequency_curves_json=curves_json,
+            frequency_curves_hash=_digest(curves_json),
+        )
+
+    @classmethod
+    def from_profile(cls, profile: Any) -> "ApplyPlan":
+        """Compile a GameProfile, ContextualGameProfile or ContextualProfile.
+
+        Args:
+            profile: Profile object with cores and dynamic settings
+
+        Returns:
+            Compiled ApplyPlan
+        """
+        return cls.compile(
+            name=profile.name,
+            app_id=profile.app_id,
+            cores=profile.cores,
+            dynamic_enabled=profile.dynamic_enabled,
+            dynamic_config=profile.dynamic_config,
+            frequency_curves=getattr(profile, "frequency_curves", None),
+        )
+
+    @classmethod
+    def from_global_default(cls, global_default: Dict[str, Any]) -> "ApplyPlan":
+        """Compile the stored global default settings.
+
+        Args:
+            global_default: Global default dictionary from ProfileManager
+
+        Returns:
+            Compiled ApplyPlan
+        """
+        return cls.compile(
+            name="Global Default",
+            app_id=None,
+            cores=global_default.get("cores", [0, 0, 0, 0]),
+            dynamic_enabled=global_default.get("dynamic_enabled", False),
+            dynamic_config=global_default.get("dynamic_config"),
+        )
+
+    def diff(self, active: Optional["ApplyPlan"]) -> PlanDiff:
+        """Compute the steps needed to switch from the active plan to this one.
+
+        Args:
+            active: Currently active plan (None if unknown)
+
+        Returns:
+            PlanDiff; every step is needed when the active plan is unknown
+        """
+        if active is None:
+            return PlanDiff(
+                cores=True,
+                dynamic=True,
+                fan=True,
+                frequency_curves=self.frequency_curves_hash is not None,
+            )
+
+        return PlanDiff(
+            cores=self.cores != active.cores,
+            dynamic=(
+                self.dynamic_enabled != active.dynamic_enabled
+                or self.dynamic_hash != active.dynamic_hash
+            ),
+            fan=self.fan_hash != active.fan_hash,
+            frequency_curves=(
+                self.frequency_curves_hash is not None
+                and self.frequency_curves_hash != active.frequency_curves_hash
+            ),
+        )
+
+    def get_dynamic_config(self, include_fan: bool = True) -> Optional[DynamicConfig]:
+        """Build the DynamicConfig for starting gymdeck3.
+
+        Args:
+            include_fan: Pass fan settings to gymdeck3 (False when fan
+                settings are applied by the fan control service instead)
+
+        Returns:
+            DynamicConfig, or None if dynamic mode is disabled
+        """
+        if self.dynamic_config_json is None:
+            return None
+
+        data = json.loads(self.dynamic_config_json)
+        if include_fan and self.fan_config_json is not None:
+            data["fan_config"] = json.loads(self.fan_config_json)
+        return DynamicConfig.from_dict(data)
+
+    def get_fan_config(self) -> Optional[FanConfig]:
+        """Build the enabled fan settings of this plan.
+
+        Returns:
+            FanConfig, or None if the plan does not control the fan
+        """
+        if self.fan_config_json is None:
+            return None
+        return FanConfig.from_dict(json.loads(self.fan_config_json))
+
+    def get_frequency_curves(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Get the serialized frequency curves of this plan.
+
+        Returns:
+            Fresh dictionary mapping core_id to curve data, or None
+        """
+        if self.frequency_curves_json is None:
+            return None
+        return json.loads(self.frequency_curves_json)
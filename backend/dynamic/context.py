@@ -27,6 +27,21 @@ If no profile matches all conditions:
 1. Try profiles matching only AppID
 2. Fall back to global default
 
+# Matcher Index
+
+ContextMatcher.rebuild_index() compiles a profile set once into per-app
+buckets pre-sorted by (priority, created_at), with app-only fallbacks
+precomputed. Lookups then scan only the candidate bucket and allocate
+nothing; the index is rebuilt only when profiles change.
+
+# Context Breakpoints
+
+The battery and temperature thresholds used by all conditions are compiled
+into sorted breakpoint arrays (ContextBreakpoints). A context maps to a
+region by bisecting its battery level and temperature into those arrays;
+profile selection can only change when the region changes, so context
+updates inside a region never trigger re-evaluation.
+
 # Usage Example
 
 ```python
@@ -49,15 +64,21 @@ if condition.matches(context):
 # Find best matching profile
 matcher = ContextMatcher()
 best_profile = matcher.find_best_match(app_id=1091500, context=context, profiles=profiles)
+
+# Or build the index once and look up without passing profiles
+matcher.rebuild_index(profiles, global_default)
+best_profile = matcher.find_best_match(app_id=1091500, context=context)
 ```
 """
 
 import logging
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .profile_manager import GameProfile
+    from ..platform.sensors import SensorHub, SensorSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -238,6 +259,26 @@ class SystemContext:
             temperature_c=temperature_c,
         )
     
+    @classmethod
+    def from_snapshot(cls, snapshot: "SensorSnapshot") -> "SystemContext":
+        """Build the context from a SensorHub snapshot.
+        
+        Missing values get the same defaults as a failed sysfs read.
+        
+        Args:
+            snapshot: Snapshot with the CONTEXT_CHANNELS read
+            
+        Returns:
+            SystemContext instance
+        """
+        battery = snapshot.battery_percent
+        temperature = snapshot.temperature_c
+        return cls(
+            battery_percent=battery if battery is not None else 100,
+            power_mode="ac" if snapshot.ac_online else "battery",
+            temperature_c=max(0, min(150, int(temperature))) if temperature is not None else 50,
+        )
+    
     @classmethod
     async def _read_battery_percent(cls) -> int:
         """Read battery percentage from system.
@@ -470,102 +511,250 @@ class ContextualProfile:
         )
 
 
-class ContextMatcher:
-    """Selects the best matching profile for current context.
+class ContextBreakpoints:
+    """Battery and temperature breakpoints compiled from context conditions.
     
-    Implements the profile selection algorithm with priority ordering
-    and fallback chain.
+    Every ContextCondition is a step function of the context: battery
+    conditions flip where battery_percent crosses battery_threshold, and
+    temperature conditions flip where temperature_c reaches temp_threshold.
+    Two contexts in the same region therefore satisfy exactly the same
+    conditions, and no profile selection can differ between them.
+    
+    Requirements: 1.3, 1.4
+    """
+    
+    def __init__(self, conditions: Iterable[ContextCondition]):
+        """Compile breakpoints from conditions.
+        
+        Args:
+            conditions: Conditions of all profiles that take part in matching
+        """
+        battery = set()
+        temperature = set()
+        uses_power_mode = False
+        
+        for condition in conditions:
+            if condition.battery_threshold is not None:
+                battery.add(condition.battery_threshold)
+            if condition.temp_threshold is not None:
+                temperature.add(condition.temp_threshold)
+            if condition.power_mode is not None:
+                uses_power_mode = True
+        
+        self.battery: Tuple[int, ...] = tuple(sorted(battery))
+        self.temperature: Tuple[int, ...] = tuple(sorted(temperature))
+        self.uses_power_mode = uses_power_mode
+    
+    def battery_interval(self, battery_percent: int) -> int:
+        """Locate the battery interval of a battery level.
+        
+        Battery conditions hold while battery <= threshold, so the interval
+        is the number of thresholds strictly below the level.
+        
+        Args:
+            battery_percent: Battery level (0-100)
+            
+        Returns:
+            Interval index (0..len(battery))
+        """
+        return bisect_left(self.battery, battery_percent)
+    
+    def temperature_interval(self, temperature_c: int) -> int:
+        """Locate the temperature interval of a temperature.
+        
+        Temperature conditions hold while temp >= threshold, so the interval
+        is the number of thresholds at or below the temperature.
+        
+        Args:
+            temperature_c: Temperature in Celsius
+            
+        Returns:
+            Interval index (0..len(temperature))
+        """
+        return bisect_right(self.temperature, temperature_c)
+    
+    def region(self, context: SystemContext) -> Tuple[int, Optional[str], int]:
+        """Map a context to its region.
+        
+        Power mode only contributes when some condition references it.
+        
+        Args:
+            context: System context to locate
+            
+        Returns:
+            Tuple of (battery interval, power mode or None, temperature interval)
+        """
+        return (
+            self.battery_interval(context.battery_percent),
+            context.power_mode if self.uses_power_mode else None,
+            self.temperature_interval(context.temperature_c),
+        )
+
+
+class ContextIndex:
+    """Precompiled lookup structure for context-aware profile selection.
+    
+    Profiles are bucketed by app_id and each bucket is sorted by
+    (priority, created_at) descending, so the first profile in a bucket whose
+    conditions match is the best match. Profiles with app_id None apply to
+    every app and are kept in their own bucket; their priority is always
+    below any app-specific profile, so they are scanned last. The newest
+    condition-less profile per app is precomputed for the fallback chain.
+    
+    Profiles only need app_id, conditions, created_at and priority(), so
+    both ContextualProfile and ContextualGameProfile can be indexed.
     
     Requirements: 1.2, 1.5
     """
     
+    def __init__(
+        self,
+        profiles: Sequence[ContextualProfile],
+        global_default: Optional[ContextualProfile] = None,
+    ):
+        """Build the index.
+        
+        Args:
+            profiles: Contextual profiles to index
+            global_default: Optional global default profile (final fallback)
+        """
+        buckets: Dict[Optional[int], List[ContextualProfile]] = {}
+        for profile in profiles:
+            buckets.setdefault(profile.app_id, []).append(profile)
+        
+        # Stable sort keeps input order for exact ties, as the linear matcher did
+        self._buckets: Dict[Optional[int], Tuple[ContextualProfile, ...]] = {
+            app_id: tuple(sorted(bucket, key=lambda p: (p.priority(), p.created_at), reverse=True))
+            for app_id, bucket in buckets.items()
+        }
+        self._any_app: Tuple[ContextualProfile, ...] = self._buckets.get(None, ())
+        
+        # Newest profile without conditions per app (fallback chain step 1)
+        self._app_only: Dict[int, ContextualProfile] = {}
+        for app_id, bucket in buckets.items():
+            if app_id is None:
+                continue
+            app_only = [p for p in bucket if p.conditions.specificity() == 0]
+            if app_only:
+                app_only.sort(key=lambda p: p.created_at, reverse=True)
+                self._app_only[app_id] = app_only[0]
+        
+        self.global_default = global_default
+        self.size = len(profiles)
+        self.breakpoints = ContextBreakpoints(p.conditions for p in profiles)
+    
     def find_best_match(
         self,
         app_id: Optional[int],
         context: SystemContext,
-        profiles: List[ContextualProfile],
-        global_default: Optional[ContextualProfile] = None,
     ) -> Optional[ContextualProfile]:
         """Find the most specific matching profile.
         
-        Priority order:
-        1. Profiles matching app_id + all context conditions (most specific first)
-        2. Profiles matching only app_id (no context conditions)
-        3. Global default
-        
-        When multiple profiles have the same specificity, the one with the
-        newer created_at timestamp wins.
-        
         Args:
             app_id: Steam AppID of the current game (None if no game running)
             context: Current system context
-            profiles: List of contextual profiles to search
-            global_default: Optional global default profile
             
         Returns:
-            Best matching ContextualProfile, or None if no match found
+            Best matching profile, or None if no match found
             
         Requirements: 1.2, 1.5
         """
-        # Find all matching profiles
-        matching_profiles: List[ContextualProfile] = []
+        if app_id is not None:
+            for profile in self._buckets.get(app_id, ()):
+                if profile.conditions.matches(context):
+                    return profile
+        
+        for profile in self._any_app:
+            if profile.conditions.matches(context):
+                return profile
+        
+        # Fallback chain: app_id only match, then global default
+        if app_id is not None:
+            app_only_match = self._app_only.get(app_id)
+            if app_only_match is not None:
+                return app_only_match
         
-        for profile in profiles:
-            if profile.matches_context(app_id, context):
-                matching_profiles.append(profile)
+        return self.global_default
+
+
+class ContextMatcher:
+    """Selects the best matching profile for current context.
+    
+    Implements the profile selection algorithm with priority ordering
+    and fallback chain. Callers that evaluate the same profile set
+    repeatedly should build an index with rebuild_index() and omit
+    profiles from find_best_match().
+    
+    Requirements: 1.2, 1.5
+    """
+    
+    def __init__(self):
+        """Initialize the matcher without an index."""
+        self._index: Optional[ContextIndex] = None
+    
+    def rebuild_index(
+        self,
+        profiles: Sequence[ContextualProfile],
+        global_default: Optional[ContextualProfile] = None,
+    ) -> ContextIndex:
+        """Compile profiles into the matcher's lookup index.
         
-        if not matching_profiles:
-            # Fallback chain: try app_id only match (Requirements: 1.5)
-            app_only_match = self._find_app_only_match(app_id, profiles)
-            if app_only_match:
-                return app_only_match
+        Should be called whenever profiles or the global default change.
+        
+        Args:
+            profiles: Contextual profiles to index
+            global_default: Optional global default profile
             
-            # Final fallback: global default
-            return global_default
-        
-        # Sort by priority (descending) and created_at (descending for ties)
-        # Higher priority = more specific
-        # Newer created_at wins ties
-        matching_profiles.sort(
-            key=lambda p: (p.priority(), p.created_at),
-            reverse=True
-        )
+        Returns:
+            The new ContextIndex
+        """
+        self._index = ContextIndex(profiles, global_default)
+        return self._index
+    
+    def get_index(self) -> Optional[ContextIndex]:
+        """Get the current lookup index.
         
-        return matching_profiles[0]
+        Returns:
+            ContextIndex, or None if rebuild_index() has not been called
+        """
+        return self._index
     
-    def _find_app_only_match(
+    def find_best_match(
         self,
         app_id: Optional[int],
-        profiles: List[ContextualProfile],
+        context: SystemContext,
+        profiles: Optional[List[ContextualProfile]] = None,
+        global_default: Optional[ContextualProfile] = None,
     ) -> Optional[ContextualProfile]:
-        """Find a profile matching only app_id (ignoring context conditions).
+        """Find the most specific matching profile.
+        
+        Priority order:
+        1. Profiles matching app_id + all context conditions (most specific first)
+        2. Profiles matching only app_id (no context conditions)
+        3. Global default
         
-        This is part of the fallback chain when no profile matches all conditions.
+        When multiple profiles have the same specificity, the one with the
+        newer created_at timestamp wins.
         
         Args:
-            app_id: Steam AppID to match
-            profiles: List of profiles to search
+            app_id: Steam AppID of the current game (None if no game running)
+            context: Current system context
+            profiles: List of contextual profiles to search; if omitted, the
+                index built by rebuild_index() is used
+            global_default: Optional global default profile (ignored when
+                using the prebuilt index, which carries its own)
             
         Returns:
-            Profile matching app_id with no context conditions, or None
+            Best matching ContextualProfile, or None if no match found
             
-        Requirements: 1.5
+        Requirements: 1.2, 1.5
         """
-        if app_id is None:
-            return None
+        if profiles is None:
+            if self._index is None:
+                return global_default
+            return self._index.find_best_match(app_id, context)
         
-        # Find profiles that match app_id and have no context conditions
-        app_only_profiles = [
-            p for p in profiles
-            if p.app_id == app_id and p.conditions.specificity() == 0
-        ]
-        
-        if not app_only_profiles:
-            return None
-        
-        # Sort by created_at (newer wins)
-        app_only_profiles.sort(key=lambda p: p.created_at, reverse=True)
-        return app_only_profiles[0]
+        return ContextIndex(profiles, global_default).find_best_match(app_id, context)
 
 
 class ContextReader:
@@ -577,11 +766,15 @@ class ContextReader:
     Requirements: 1.3, 1.4
     """
     
+    # Staleness tolerance of SensorHub readings in seconds
+    SENSOR_MAX_AGE = 1.0
+    
     def __init__(
         self,
         on_battery_change: Optional[callable] = None,
         on_power_mode_change: Optional[callable] = None,
         on_temperature_change: Optional[callable] = None,
+        sensor_hub: Optional["SensorHub"] = None,
     ):
         """Initialize the context reader.
         
@@ -589,10 +782,13 @@ class ContextReader:
             on_battery_change: Callback for battery level changes (receives int)
             on_power_mode_change: Callback for power mode changes (receives str)
             on_temperature_change: Callback for temperature changes (receives int)
+            sensor_hub: Optional SensorHub to read the context from instead
+                of sysfs
         """
         self._on_battery_change = on_battery_change
         self._on_power_mode_change = on_power_mode_change
         self._on_temperature_change = on_temperature_change
+        self._sensor_hub = sensor_hub
         
         self._last_context: Optional[SystemContext] = None
         self._running = False
@@ -603,6 +799,11 @@ class ContextReader:
         Returns:
             Current SystemContext
         """
+        if self._sensor_hub is not None:
+            from ..platform.sensors import CONTEXT_CHANNELS
+            return SystemContext.from_snapshot(
+                self._sensor_hub.latest(CONTEXT_CHANNELS, max_age=self.SENSOR_MAX_AGE)
+            )
         return SystemContext.read_current_sync()
     
     async def read_current_async(self) -> SystemContext:
@@ -611,6 +812,8 @@ class ContextReader:
         Returns:
             Current SystemContext
         """
+        if self._sensor_hub is not None:
+            return self.read_current()
         return await SystemContext.read_current()
     
     def check_for_changes(self) -> Optional[SystemContext]:
@@ -0,0 +1,311 @@
+"""Event-driven system context source for contextual profile switching.
+
+This module keeps ProfileManager's SystemContext up to date. Power supply
+state (AC adapter online, battery capacity) is taken from kernel
+power_supply uevents where available, so plugging in the charger switches
+to the AC profile as soon as the kernel reports it, without reading sysfs
+on a timer. Temperature has no uevents and is sampled periodically.
+
+Feature: decktune-3.0-automation
+Validates: Requirements 1.3, 1.4
+
+# Sources
+
+- **Event-driven**: power_supply uevents update AC/battery state; the
+  thermal zone is read every temperature_interval seconds; a full sysfs
+  resync runs every RESYNC_INTERVAL seconds in case events were dropped
+- **Fallback**: when uevents are unavailable, the full context is read
+  from sysfs every poll_interval seconds
+- **SensorHub**: with a hub, sysfs reads go through its shared snapshot;
+  a temperature the fan loop read within temperature_interval is reused
+
+Every new context is passed to ProfileManager.update_context(), which only
+re-evaluates when the context moves into a different breakpoint region.
+
+# Usage Example
+
+```python
+from backend.dynamic.context_source import PowerSupplyContextSource
+
+source = PowerSupplyContextSource(profile_manager)
+await source.start()
+# ... later ...
+await source.stop()
+```
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from .context import SystemContext
+from ..platform.sensors import CONTEXT_CHANNELS, TEMPERATURE, SensorHub
+from ..platform.uevents import UeventListener
+
+if TYPE_CHECKING:
+    from .profile_manager import ProfileManager
+
+logger = logging.getLogger(__name__)
+
+
+class PowerSupplyContextSource:
+    """Feeds ProfileManager with system context from uevents and polling.
+
+    Requirements: 1.3, 1.4
+    """
+
+    # Full sysfs poll interval when uevents are unavailable (seconds)
+    DEFAULT_POLL_INTERVAL = 5.0
+
+    # Temperature sampling interval when event-driven (seconds)
+    DEFAULT_TEMPERATURE_INTERVAL = 5.0
+
+    # Full sysfs resync interval when event-driven (seconds)
+    RESYNC_INTERVAL = 60.0
+
+    # SensorHub subscriber name
+    SENSOR_SUBSCRIBER = "context_source"
+
+    def __init__(
+        self,
+        profile_manager: "ProfileManager",
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        temperature_interval: float = DEFAULT_TEMPERATURE_INTERVAL,
+        sensor_hub: Optional[SensorHub] = None,
+    ):
+        """Initialize the context source.
+
+        Args:
+            profile_manager: ProfileManager receiving context updates
+            poll_interval: Full sysfs poll interval without uevents (seconds)
+            temperature_interval: Temperature sampling interval with uevents (seconds)
+            sensor_hub: Optional SensorHub to read sysfs through
+        """
+        self.profile_manager = profile_manager
+        self.poll_interval = poll_interval
+        self.temperature_interval = temperature_interval
+        self.sensor_hub = sensor_hub
+
+        self._listener = UeventListener(subsystem="power_supply")
+        self._running = False
+        self._task: Optional[asyncio.Task] = None
+        self._changed: Optional[asyncio.Event] = None
+
+        # Current state
+        self._battery_percent = 100
+        self._power_mode = "battery"
+        self._temperature_c = 50
+        self._adapters_online: Dict[str, bool] = {}
+        self._last_published: Optional[SystemContext] = None
+        self._last_resync = 0.0
+
+        # Timestamp of the most recent power_supply uevent (monotonic)
+        self._last_event_time: Optional[float] = None
+
+    def is_running(self) -> bool:
+        """Check if the source is active.
+
+        Returns:
+            True if running, False otherwise
+        """
+        return self._running
+
+    def is_event_driven(self) -> bool:
+        """Check if power supply uevents are driving updates.
+
+        Returns:
+            True if the uevent socket is open, False if only polling
+        """
+        return self._listener.is_open()
+
+    def get_context(self) -> SystemContext:
+        """Get the current context as known to the source.
+
+        Returns:
+            SystemContext built from the latest events and samples
+        """
+        return SystemContext(
+            battery_percent=self._battery_percent,
+            power_mode=self._power_mode,
+            temperature_c=self._temperature_c,
+        )
+
+    # ==================== Uevent Handling ====================
+
+    def _on_uevent_readable(self) -> None:
+        """Handle readable uevent socket (event loop callback)."""
+        self.handle_uevents(self._listener.read_events())
+
+    def handle_uevents(self, events: List[Dict[str, str]]) -> bool:
+        """Apply power_supply uevents to the current state.
+
+        Adapter supplies (Mains, USB, ...) report POWER_SUPPLY_ONLINE and
+        batteries report POWER_SUPPLY_CAPACITY. Power mode is "ac" while any
+        adapter is online.
+
+        Args:
+            events: Uevent property dictionaries (see parse_uevent)
+
+        Returns:
+            True if the context changed and an update was scheduled
+        """
+        changed = False
+
+        for event in events:
+            if event.get("SUBSYSTEM") != "power_supply":
+                continue
+
+            name = event.get("POWER_SUPPLY_NAME") or event.get("DEVPATH", "").rsplit("/", 1)[-1]
+            supply_type = event.get("POWER_SUPPLY_TYPE")
+
+            if supply_type == "Battery" or (supply_type is None and "POWER_SUPPLY_CAPACITY" in event):
+                try:
+                    capacity = max(0, min(100, int(event["POWER_SUPPLY_CAPACITY"])))
+                except (KeyError, ValueError):
+                    continue
+                if capacity != self._battery_percent:
+                    self._battery_percent = capacity
+                    changed = True
+            elif "POWER_SUPPLY_ONLINE" in event:
+                self._adapters_online[name] = event["POWER_SUPPLY_ONLINE"].strip() == "1"
+                power_mode = "ac" if any(self._adapters_online.values()) else "battery"
+                if power_mode != self._power_mode:
+                    self._power_mode = power_mode
+                    changed = True
+
+        if changed:
+            self._last_event_time = time.monotonic()
+            if self._changed is not None:
+                self._changed.set()
+
+        return changed
+
+    # ==================== Sampling ====================
+
+    def _read_all(self) -> None:
+        """Read the full context from sysfs and reset adapter tracking."""
+        if self.sensor_hub is not None:
+            context = SystemContext.from_snapshot(self.sensor_hub.latest(CONTEXT_CHANNELS, max_age=0.0))
+        else:
+            context = SystemContext.read_current_sync()
+        self._battery_percent = context.battery_percent
+        self._power_mode = context.power_mode
+        self._temperature_c = context.temperature_c
+        self._adapters_online.clear()
+        self._last_resync = time.monotonic()
+
+    def _sample(self) -> None:
+        """Sample whatever is not covered by uevents."""
+        if not self._listener.is_open():
+            self._read_all()
+        elif time.monotonic() - self._last_resync >= self.RESYNC_INTERVAL:
+            self._read_all()
+        elif self.sensor_hub is not None:
+            snapshot = self.sensor_hub.latest((TEMPERATURE,), max_age=self.temperature_interval)
+            self._temperature_c = SystemContext.from_snapshot(snapshot).temperature_c
+        else:
+            self._temperature_c = SystemContext._read_temperature_sync()
+
+    async def _publish(self) -> None:
+        """Pass the current context to ProfileManager if it changed."""
+        context = self.get_context()
+        if context == self._last_published:
+            return
+
+        self._last_published = context
+        await self.profile_manager.update_context(context)
+
+        if self._last_event_time is not None:
+            latency = time.monotonic() - self._last_event_time
+            logger.debug(f"Context update applied {latency * 1000:.1f}ms after power supply event")
+            self._last_event_time = None
+
+    async def _run_loop(self) -> None:
+        """Publish on uevents and sample periodically."""
+        logger.info("Context source loop started")
+
+        interval = self.temperature_interval if self._listener.is_open() else self.poll_interval
+        next_sample = time.monotonic() + interval
+
+        while self._running:
+            try:
+                timeout = max(0.0, next_sample - time.monotonic())
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    pass
+                self._changed.clear()
+
+                if time.monotonic() >= next_sample:
+                    self._sample()
+                    next_sample = time.monotonic() + interval
+
+                await self._publish()
+
+            except asyncio.CancelledError:
+                logger.info("Context source loop cancelled")
+                break
+            except Exception as e:
+                logger.error(f"Error in context source loop: {e}")
+                await asyncio.sleep(interval)
+
+        logger.info("Context source loop stopped")
+
+    # ==================== Lifecycle Methods ====================
+
+    async def start(self) -> None:
+        """Start feeding context updates.
+
+        Reads the full context once, publishes it, subscribes to uevents
+        where available and starts the update loop.
+        """
+        if self._running:
+            logger.warning("Context source is already running")
+            return
+
+        self._running = True
+        self._changed = asyncio.Event()
+
+        self._read_all()
+        await self._publish()
+
+        if self._listener.open():
+            asyncio.get_running_loop().add_reader(
+                self._listener.fileno(), self._on_uevent_readable
+            )
+
+        if self.sensor_hub is not None:
+            if self._listener.is_open():
+                self.sensor_hub.subscribe(self.SENSOR_SUBSCRIBER, (TEMPERATURE,), self.temperature_interval)
+            else:
+                self.sensor_hub.subscribe(self.SENSOR_SUBSCRIBER, CONTEXT_CHANNELS, self.poll_interval)
+
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(f"Context source started (event-driven: {self.is_event_driven()})")
+
+    async def stop(self) -> None:
+        """Stop feeding context updates and release the uevent socket."""
+        if not self._running:
+            logger.warning("Context source is not running")
+            return
+
+        self._running = False
+
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self.sensor_hub is not None:
+            self.sensor_hub.unsubscribe(self.SENSOR_SUBSCRIBER)
+
+        if self._listener.is_open():
+            asyncio.get_running_loop().remove_reader(self._listener.fileno())
+            self._listener.close()
+        self._changed = None
+
+        logger.info("Context source stopped")
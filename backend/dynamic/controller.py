@@ -96,8 +96,9 @@ import os
 import signal
 import time
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Tuple, TYPE_CHECKING
 
+from ..core.curve import PiecewiseLinearCurve
 from .config import DynamicConfig, DynamicStatus
 
 if TYPE_CHECKING:
@@ -107,6 +108,9 @@ if TYPE_CHECKING:
     from ..core.blackbox import BlackBox, MetricSample
     from ..core.telemetry import TelemetryManager, TelemetrySample
     from ..core.session_manager import SessionManager, Session
+    from ..core.fan_control import FanControlService
+    from ..core.power import PowerMonitor
+    from ..platform.sensors import SensorHub
 
 logger = logging.getLogger(__name__)
 
@@ -160,11 +164,25 @@ class DynamicController:
         self._reader_task: Optional[asyncio.Task] = None
         self._running = False
         self._current_session_id: Optional[str] = None
+        self._fan_control_service: Optional["FanControlService"] = None
+        self._fan_yielded = False
+        self._sensor_hub: Optional["SensorHub"] = None
+        self._power_monitor: Optional["PowerMonitor"] = None
     
     def is_running(self) -> bool:
         """Check if gymdeck3 is currently running."""
         return self._running and self._process is not None
     
+    def current_load(self) -> Optional[float]:
+        """Average CPU load from the latest gymdeck3 status.
+        
+        Returns:
+            Mean per-core load in %, or None if gymdeck3 is not running
+        """
+        if not self.is_running() or not self._status.load:
+            return None
+        return sum(self._status.load) / len(self._status.load)
+    
     def set_blackbox(self, blackbox: "BlackBox") -> None:
         """Set the BlackBox instance for metrics recording.
         
@@ -209,6 +227,71 @@ class DynamicController:
         """
         self._status_stream_manager = status_stream_manager
     
+    def set_fan_control_service(self, service: "FanControlService") -> None:
+        """Set the fan control service to hand the fan to gymdeck3.
+        
+        When gymdeck3 is started with fan control enabled, the service
+        yields the fan to it for as long as the process runs.
+        
+        Args:
+            service: FanControlService instance
+        """
+        self._fan_control_service = service
+    
+    def set_sensor_hub(self, hub: Optional["SensorHub"]) -> None:
+        """Set the SensorHub supplying temperatures when gymdeck3 reports none.
+        
+        gymdeck3 only reports temperature with its fan control enabled;
+        otherwise BlackBox and telemetry samples take the hub's reading.
+        
+        Args:
+            hub: SensorHub instance
+        """
+        self._sensor_hub = hub
+    
+    def set_power_monitor(self, monitor: Optional["PowerMonitor"]) -> None:
+        """Set the PowerMonitor supplying power for samples.
+        
+        gymdeck3 reports no power; BlackBox, telemetry and session samples
+        take the monitor's latest reading.
+        
+        Args:
+            monitor: PowerMonitor instance
+        """
+        self._power_monitor = monitor
+    
+    def _sample_power(self) -> Tuple[Optional[float], Optional[str]]:
+        """Power for a sample and its source (None, None without a reading)."""
+        if self._power_monitor is None:
+            return None, None
+        reading = self._power_monitor.latest(max_age=1.0)
+        return reading.power_w, reading.source
+    
+    def _sample_temperature(self, default: float) -> float:
+        """Temperature for a sample: gymdeck3's fan data, else the sensor hub."""
+        if self._status.fan is not None:
+            return self._status.fan.temp_c
+        if self._sensor_hub is not None:
+            from ..platform.sensors import TEMPERATURE
+            temp = self._sensor_hub.latest((TEMPERATURE,), max_age=1.0).temperature_c
+            if temp is not None:
+                return temp
+        return default
+    
+    def _yield_fan(self, pid: Optional[int] = None) -> None:
+        """Hand the fan to gymdeck3 (before launch, then with its PID)."""
+        from ..core.fan_control import OWNER_GYMDECK3
+        
+        if self._fan_control_service is not None:
+            self._fan_control_service.yield_to(OWNER_GYMDECK3, pid)
+            self._fan_yielded = True
+    
+    def _resume_fan(self) -> None:
+        """Give the fan back to the fan control service."""
+        if self._fan_yielded and self._fan_control_service is not None:
+            self._fan_control_service.resume()
+        self._fan_yielded = False
+    
     async def start(self, config: DynamicConfig) -> bool:
         """Start gymdeck3 with the given configuration.
         
@@ -238,6 +321,10 @@ class DynamicController:
         # Build command line arguments
         args = self._build_args(config)
         
+        # Yield before launch so the two controllers never both write PWM
+        if "--fan-control" in args:
+            self._yield_fan()
+        
         try:
             logger.info(f"Starting gymdeck3: {self._gymdeck3_path} {' '.join(args)}")
             
@@ -252,6 +339,9 @@ class DynamicController:
             self._running = True
             self._status = DynamicStatus(running=True, strategy=config.strategy)
             
+            if self._fan_yielded:
+                self._yield_fan(self._process.pid)
+            
             # Update status stream manager running state
             # Feature: decktune-3.1-reliability-ux
             # Validates: Requirements 4.3
@@ -273,6 +363,7 @@ class DynamicController:
         except Exception as e:
             logger.error(f"Failed to start gymdeck3: {e}")
             self._running = False
+            self._resume_fan()
             await self._event_emitter.emit_status("error")
             return False
     
@@ -313,6 +404,7 @@ class DynamicController:
             self._process = None
             self._running = False
             self._status = DynamicStatus(running=False)
+            self._resume_fan()
             
             # Update status stream manager running state
             # Feature: decktune-3.1-reliability-ux
@@ -332,6 +424,7 @@ class DynamicController:
         except Exception as e:
             logger.error(f"Error stopping gymdeck3: {e}")
             self._running = False
+            self._resume_fan()
             return False
     
     async def get_status(self) -> DynamicStatus:
@@ -410,10 +503,11 @@ class DynamicController:
             if fan.zero_rpm_enabled:
                 args.append("--fan-zero-rpm")
             
-            # Add fan curve points for custom mode
+            # Add fan curve points for custom mode, sorted by temperature
             if fan.mode == "custom" and fan.curve:
-                for point in fan.curve:
-                    args.append(f"--fan-curve={point.temp_c}:{point.speed_percent}")
+                curve = PiecewiseLinearCurve((p.temp_c, p.speed_percent) for p in fan.curve)
+                for point in curve.to_compact().split(","):
+                    args.append(f"--fan-curve={point}")
         
         return args
     
@@ -449,6 +543,7 @@ class DynamicController:
                 running=False,
                 error=f"Process exited with code {returncode}"
             )
+            self._resume_fan()
             
             # Update status stream manager running state
             # Feature: decktune-3.1-reliability-ux
@@ -512,11 +607,10 @@ class DynamicController:
         # Get fan data if available
         fan_rpm = 0
         fan_pwm = 0
-        temp_c = 0
+        temp_c = self._sample_temperature(0)
         if self._status.fan is not None:
             fan_rpm = self._status.fan.rpm or 0
             fan_pwm = self._status.fan.pwm
-            temp_c = self._status.fan.temp_c
         
         # Calculate average CPU load
         avg_load = sum(self._status.load) / len(self._status.load) if self._status.load else 0.0
@@ -527,7 +621,8 @@ class DynamicController:
             cpu_load_percent=avg_load,
             undervolt_values=self._status.values.copy(),
             fan_speed_rpm=fan_rpm,
-            fan_pwm=fan_pwm
+            fan_pwm=fan_pwm,
+            power_w=self._sample_power()[0] or 0.0
         )
         
         self._blackbox.record_sample(sample)
@@ -542,17 +637,14 @@ class DynamicController:
         Feature: decktune-3.1-reliability-ux
         Validates: Requirements 2.1, 2.2, 8.1
         """
-        # Get temperature from fan data if available
-        temp_c = 0.0
-        if self._status.fan is not None:
-            temp_c = self._status.fan.temp_c
+        # Get temperature from fan data, else the sensor hub
+        temp_c = self._sample_temperature(0.0)
         
         # Calculate average CPU load
         avg_load = sum(self._status.load) / len(self._status.load) if self._status.load else 0.0
         
-        # Get power from status (if available, otherwise estimate)
-        # Note: Power data may come from ryzenadj or be estimated
-        power_w = getattr(self._status, 'power_w', 0.0)
+        # Get power from the power monitor (gymdeck3 reports none)
+        power_w, power_source = self._sample_power()
         
         # Record to TelemetryManager if available
         if self._telemetry_manager is not None:
@@ -562,7 +654,7 @@ class DynamicController:
             sample = TelemetrySample(
                 timestamp=time.time(),
                 temperature_c=temp_c,
-                power_w=power_w,
+                power_w=power_w or 0.0,
                 load_percent=avg_load
             )
             
@@ -574,7 +666,7 @@ class DynamicController:
         # Record to active session
         # Feature: decktune-3.1-reliability-ux
         # Validates: Requirements 8.1
-        self._record_session_sample(temp_c, power_w)
+        self._record_session_sample(temp_c, power_w, power_source)
     
     async def persist_blackbox(self, reason: str) -> Optional[str]:
         """Persist BlackBox buffer to disk.
@@ -671,12 +763,18 @@ class DynamicController:
         
         self._current_session_id = None
     
-    def _record_session_sample(self, temp_c: float, power_w: float) -> None:
+    def _record_session_sample(
+        self,
+        temp_c: float,
+        power_w: Optional[float],
+        power_source: Optional[str] = None
+    ) -> None:
         """Record a telemetry sample to the active session.
         
         Args:
             temp_c: Temperature in Celsius
-            power_w: Power in Watts
+            power_w: Power in Watts (None if unknown)
+            power_source: Source of power_w (see backend.core.power)
             
         Feature: decktune-3.1-reliability-ux
         Validates: Requirements 8.1
@@ -686,7 +784,8 @@ class DynamicController:
         
         self._session_manager.add_sample(
             temperature_c=temp_c,
-            power_w=power_w
+            power_w=power_w,
+            source=power_source
         )
     
     def get_session_diagnostics(self) -> dict:
@@ -8,13 +8,40 @@ Feature: manual-dynamic-mode
 Validates: Requirements 9.1, 9.2, 9.3, 9.4, 9.5
 """
 
+import functools
 import logging
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+from ..core.curve import PiecewiseLinearCurve
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=64)
+def load_voltage_curve(min_mv: int, max_mv: int, threshold: float) -> PiecewiseLinearCurve:
+    """Compile a core's load -> voltage curve.
+    
+    min_mv up to the threshold, then linear to max_mv at 100% load. A
+    threshold of 100% or more steps to max_mv above it.
+    
+    Args:
+        min_mv: Minimum undervolt value
+        max_mv: Maximum undervolt value
+        threshold: Load threshold percentage
+    
+    Returns:
+        Compiled curve
+    """
+    return PiecewiseLinearCurve([(threshold, min_mv), (max(threshold, 100.0), max_mv)])
+
+
+@functools.lru_cache(maxsize=64)
+def load_voltage_lut(min_mv: int, max_mv: int, threshold: float) -> Tuple[int, ...]:
+    """Voltages for integer loads 0-100 (see load_voltage_curve)."""
+    return load_voltage_curve(min_mv, max_mv, threshold).lut(0, 100)
+
+
 @dataclass
 class CoreConfig:
     """Configuration for a single CPU core.
@@ -240,7 +267,8 @@ class DynamicManager:
         """Calculate voltage curve points for visualization.
         
         Generates 101 curve points (load 0-100) based on the core's
-        configuration using piecewise linear interpolation.
+        configuration using piecewise linear interpolation. The voltages
+        are a lookup table cached per (min_mv, max_mv, threshold).
         
         Args:
             core_id: Core identifier (0-3)
@@ -255,19 +283,8 @@ class DynamicManager:
             return []
         
         core_config = self.config.cores[core_id]
-        curve_points = []
-        
-        # Generate 101 points (load 0 to 100)
-        for load in range(101):
-            voltage = self._calculate_voltage(
-                load,
-                core_config.min_mv,
-                core_config.max_mv,
-                core_config.threshold
-            )
-            curve_points.append(CurvePoint(load=float(load), voltage=voltage))
-        
-        return curve_points
+        voltages = load_voltage_lut(core_config.min_mv, core_config.max_mv, core_config.threshold)
+        return [CurvePoint(load=float(load), voltage=voltage) for load, voltage in enumerate(voltages)]
     
     def _calculate_voltage(
         self,
@@ -293,17 +310,7 @@ class DynamicManager:
             
         Validates: Requirements 2.4, 2.5
         """
-        if load <= threshold:
-            # Below threshold: use minimum value
-            return min_mv
-        else:
-            # Above threshold: linear interpolation
-            if threshold >= 100:
-                return max_mv
-            
-            progress = (load - threshold) / (100 - threshold)
-            voltage = min_mv + (max_mv - min_mv) * progress
-            return int(round(voltage))
+        return load_voltage_curve(min_mv, max_mv, threshold).evaluate_int(load)
     
     def start(self) -> bool:
         """Start dynamic voltage adjustment.
@@ -15,6 +15,8 @@ Game profiles allow users to save different undervolt settings for each game:
 - Automatic profile switching when games launch
 - Global default profile for games without specific profiles
 - Context conditions for environment-based profile selection (battery, power mode, temperature)
+- Profiles are compiled into immutable apply plans (see apply_plan.py); a
+  switch only performs the steps that differ from the active plan
 
 # Storage Format
 
@@ -78,15 +80,24 @@ import json
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 
-from .context import ContextCondition, SystemContext, ContextMatcher
+from .apply_plan import ApplyPlan
+from .context import (
+    ContextBreakpoints,
+    ContextCondition,
+    SystemContext,
+    ContextMatcher,
+    ContextualProfile,
+)
+from ..core.fan_control import FanCurve, FanPoint, PRESET_STOCK
+from ..core.ryzenadj import RyzenadjWrapper
 from ..tuning.frequency_curve import FrequencyCurve
 
 if TYPE_CHECKING:
-    from ..core.ryzenadj import RyzenadjWrapper
     from ..dynamic.controller import DynamicController
     from ..api.events import EventEmitter
+    from ..core.fan_control import FanControlService
 
 logger = logging.getLogger(__name__)
 
@@ -383,8 +394,21 @@ class ProfileManager:
         self._current_context: Optional[SystemContext] = None
         self._current_profile: Optional[ContextualGameProfile] = None
         
-        # Context matcher for profile selection
+        # Context matcher for profile selection; its index is rebuilt lazily
+        # after any change to contextual profiles or the global default
         self._context_matcher = ContextMatcher()
+        self._context_index_valid = False
+        self._context_index_source: Optional[Dict[str, Any]] = None
+        
+        # Compiled apply plans keyed by id() of the profile (or global
+        # default dict) they were compiled from, and the plan last applied
+        self._apply_plans: Dict[int, Any] = {}
+        self._active_plan: Optional[ApplyPlan] = None
+        
+        # Optional fan control service; when set, profile fan settings are
+        # applied through it instead of restarting gymdeck3
+        self._fan_control_service: Optional["FanControlService"] = None
+        self._fan_restore_curve = None
         
         # Load profiles from settings
         self._load_profiles()
@@ -422,6 +446,9 @@ class ProfileManager:
             # Initialize with empty profiles on error
             self._profiles = {}
             self._contextual_profiles = []
+        
+        self._invalidate_context_index()
+        self._apply_plans.clear()
     
     def _save_profiles(self) -> bool:
         """Save profiles to settings storage.
@@ -498,6 +525,7 @@ class ProfileManager:
         # Store profile
         self._profiles[app_id] = profile
         self._save_profiles()
+        self._compile_apply_plan(profile)
         
         logger.info(f"Created profile for '{name}' (app_id: {app_id})")
         return profile
@@ -595,7 +623,9 @@ class ProfileManager:
         
         # Store profile
         self._contextual_profiles.append(profile)
+        self._invalidate_context_index()
         self._save_profiles()
+        self._compile_apply_plan(profile)
         
         logger.info(f"Created contextual profile '{name}' (app_id: {app_id}, conditions: {conditions})")
         return profile
@@ -699,7 +729,9 @@ class ProfileManager:
             return False
         
         # Save changes
+        self._invalidate_context_index()
         self._save_profiles()
+        self._compile_apply_plan(profile)
         
         # If this is the currently active profile, re-evaluate
         if self._current_profile and self._current_profile.name == profile_name:
@@ -728,6 +760,8 @@ class ProfileManager:
                            self._current_profile.app_id == app_id)
                 
                 del self._contextual_profiles[i]
+                self._invalidate_context_index()
+                self._apply_plans.pop(id(p), None)
                 self._save_profiles()
                 
                 # If it was active, re-evaluate
@@ -781,6 +815,7 @@ class ProfileManager:
         
         # Save changes
         self._save_profiles()
+        self._compile_apply_plan(profile)
         
         # If this is the currently active profile, apply the changes
         if self._current_app_id == app_id:
@@ -810,6 +845,7 @@ class ProfileManager:
         is_active = (self._current_app_id == app_id)
         
         # Delete profile
+        self._apply_plans.pop(id(self._profiles[app_id]), None)
         del self._profiles[app_id]
         self._save_profiles()
         
@@ -847,30 +883,11 @@ class ProfileManager:
             profile.last_used = datetime.now(timezone.utc).isoformat()
             self._save_profiles()
             
-            # Apply undervolt values
-            success, error = await self.ryzenadj.apply_values_async(profile.cores)
-            if not success:
-                logger.error(f"Failed to apply undervolt values: {error}")
+            # Apply undervolt values, frequency curves and dynamic mode
+            # (only the steps that differ from the active plan)
+            if not await self._execute_plan(self._get_apply_plan(profile)):
                 return False
             
-            # Apply frequency curves if present
-            if profile.frequency_curves:
-                await self._apply_frequency_curves(profile.frequency_curves)
-            
-            # Handle dynamic mode
-            if self.dynamic_controller:
-                if profile.dynamic_enabled and profile.dynamic_config:
-                    # Start dynamic mode with profile's config
-                    # Note: This would need to be implemented in DynamicController
-                    # For now, we'll just log it
-                    logger.info(f"Dynamic mode enabled for profile '{profile.name}'")
-                    # TODO: await self.dynamic_controller.start(profile.dynamic_config)
-                else:
-                    # Stop dynamic mode if it's running
-                    if self.dynamic_controller.is_running():
-                        await self.dynamic_controller.stop()
-                        logger.info(f"Dynamic mode disabled for profile '{profile.name}'")
-            
             # Update current app_id
             self._current_app_id = app_id
             
@@ -907,28 +924,11 @@ class ProfileManager:
         Requirements: 4.3
         """
         try:
-            # Apply undervolt values from global default
-            cores = self._global_default.get("cores", [0, 0, 0, 0])
-            success, error = await self.ryzenadj.apply_values_async(cores)
-            if not success:
-                logger.error(f"Failed to apply global default values: {error}")
+            # Apply global default values and dynamic mode (only the steps
+            # that differ from the active plan)
+            if not await self._execute_plan(self._get_apply_plan(self._global_default)):
                 return False
             
-            # Handle dynamic mode
-            if self.dynamic_controller:
-                dynamic_enabled = self._global_default.get("dynamic_enabled", False)
-                dynamic_config = self._global_default.get("dynamic_config")
-                
-                if dynamic_enabled and dynamic_config:
-                    # Start dynamic mode with global config
-                    logger.info("Dynamic mode enabled for global default")
-                    # TODO: await self.dynamic_controller.start(dynamic_config)
-                else:
-                    # Stop dynamic mode if it's running
-                    if self.dynamic_controller.is_running():
-                        await self.dynamic_controller.stop()
-                        logger.info("Dynamic mode disabled for global default")
-            
             # Clear current app_id
             self._current_app_id = None
             
@@ -982,9 +982,11 @@ class ProfileManager:
             "dynamic_enabled": dynamic_enabled,
             "dynamic_config": dynamic_config
         }
+        self._invalidate_context_index()
         
         # Save to settings
         self._save_profiles()
+        self._compile_apply_plan(self._global_default)
         
         logger.info("Updated global default settings")
         return True
@@ -1078,7 +1080,10 @@ class ProfileManager:
             if old_mode != power_mode:
                 self._current_context.power_mode = power_mode
                 logger.info(f"Power mode changed: {old_mode} -> {power_mode}")
-                await self._reevaluate_profile()
+                
+                # Only matters if some profile conditions on power mode
+                if self.get_context_breakpoints().uses_power_mode:
+                    await self._reevaluate_profile()
     
     async def on_temperature_change(self, temperature_c: int) -> None:
         """Handle temperature change event.
@@ -1117,6 +1122,10 @@ class ProfileManager:
         old_context = self._current_context
         self._current_context = context
         
+        # Without contextual profiles, context cannot change the selection
+        if not self._contextual_profiles:
+            return
+        
         # Check if context changed in a way that requires re-evaluation
         if old_context is None or self._context_changed_significantly(old_context, context):
             await self._reevaluate_profile()
@@ -1137,6 +1146,35 @@ class ProfileManager:
         """
         return self._current_profile
     
+    def get_energy_attribution(self) -> Tuple[str, Optional[str]]:
+        """Get the profile and game that current power draw belongs to.
+        
+        Returns:
+            (profile name, game) where the profile is the active contextual
+            profile, else the current game's profile, else "Global Default",
+            and the game is the current Steam AppID as a string (None when
+            no game is running)
+        """
+        game = str(self._current_app_id) if self._current_app_id is not None else None
+        if self._current_profile is not None:
+            return self._current_profile.name, game
+        profile = self._profiles.get(self._current_app_id) if self._current_app_id is not None else None
+        return (profile.name if profile else "Global Default"), game
+    
+    def get_context_breakpoints(self) -> ContextBreakpoints:
+        """Get the breakpoints compiled from all contextual profile conditions.
+        
+        Context sources can use these to report only changes that move the
+        context into a different region.
+        
+        Returns:
+            ContextBreakpoints for the current profile set
+            
+        Requirements: 1.3, 1.4
+        """
+        self._ensure_context_index()
+        return self._context_matcher.get_index().breakpoints
+    
     def _has_crossed_battery_threshold(self, old_value: int, new_value: int) -> bool:
         """Check if battery change crossed any profile threshold.
         
@@ -1145,20 +1183,10 @@ class ProfileManager:
             new_value: New battery percentage
             
         Returns:
-            True if a threshold was crossed
+            True if the values fall in different breakpoint intervals
         """
-        # Get all battery thresholds from contextual profiles
-        thresholds = set()
-        for profile in self._contextual_profiles:
-            if profile.conditions.battery_threshold is not None:
-                thresholds.add(profile.conditions.battery_threshold)
-        
-        # Check if we crossed any threshold
-        for threshold in thresholds:
-            if (old_value > threshold >= new_value) or (old_value <= threshold < new_value):
-                return True
-        
-        return False
+        breakpoints = self.get_context_breakpoints()
+        return breakpoints.battery_interval(old_value) != breakpoints.battery_interval(new_value)
     
     def _has_crossed_temp_threshold(self, old_value: int, new_value: int) -> bool:
         """Check if temperature change crossed any profile threshold.
@@ -1168,20 +1196,10 @@ class ProfileManager:
             new_value: New temperature
             
         Returns:
-            True if a threshold was crossed
+            True if the values fall in different breakpoint intervals
         """
-        # Get all temperature thresholds from contextual profiles
-        thresholds = set()
-        for profile in self._contextual_profiles:
-            if profile.conditions.temp_threshold is not None:
-                thresholds.add(profile.conditions.temp_threshold)
-        
-        # Check if we crossed any threshold
-        for threshold in thresholds:
-            if (old_value < threshold <= new_value) or (old_value >= threshold > new_value):
-                return True
-        
-        return False
+        breakpoints = self.get_context_breakpoints()
+        return breakpoints.temperature_interval(old_value) != breakpoints.temperature_interval(new_value)
     
     def _context_changed_significantly(self, old: SystemContext, new: SystemContext) -> bool:
         """Check if context changed in a way that requires profile re-evaluation.
@@ -1191,21 +1209,47 @@ class ProfileManager:
             new: New context
             
         Returns:
-            True if re-evaluation is needed
+            True if the contexts fall in different breakpoint regions
         """
-        # Power mode change always triggers re-evaluation
-        if old.power_mode != new.power_mode:
-            return True
+        breakpoints = self.get_context_breakpoints()
+        return breakpoints.region(old) != breakpoints.region(new)
+    
+    def _invalidate_context_index(self) -> None:
+        """Mark the context matcher index as stale.
         
-        # Check battery threshold crossing
-        if self._has_crossed_battery_threshold(old.battery_percent, new.battery_percent):
-            return True
+        Must be called whenever contextual profiles or the global default
+        change; the index is rebuilt on the next re-evaluation.
+        """
+        self._context_index_valid = False
+    
+    def _ensure_context_index(self) -> None:
+        """Rebuild the context matcher index if it is stale.
         
-        # Check temperature threshold crossing
-        if self._has_crossed_temp_threshold(old.temperature_c, new.temperature_c):
-            return True
+        Contextual profiles are indexed directly (no per-lookup conversion).
+        The index is also rebuilt if the profile list length or the global
+        default dict no longer match what was indexed, which covers direct
+        mutation of the underlying containers.
+        """
+        index = self._context_matcher.get_index()
+        if (
+            self._context_index_valid
+            and index is not None
+            and index.size == len(self._contextual_profiles)
+            and self._context_index_source is self._global_default
+        ):
+            return
         
-        return False
+        global_default = ContextualProfile(
+            app_id=None,
+            name="Global Default",
+            cores=self._global_default.get("cores", [0, 0, 0, 0]),
+            dynamic_enabled=self._global_default.get("dynamic_enabled", False),
+            dynamic_config=self._global_default.get("dynamic_config"),
+            conditions=ContextCondition(),
+        )
+        self._context_matcher.rebuild_index(self._contextual_profiles, global_default)
+        self._context_index_source = self._global_default
+        self._context_index_valid = True
     
     async def _reevaluate_profile(self) -> None:
         """Re-evaluate and apply the best matching profile for current context.
@@ -1219,37 +1263,11 @@ class ProfileManager:
         if self._current_context is None:
             self._current_context = await SystemContext.read_current()
         
-        # Convert contextual profiles to the format expected by ContextMatcher
-        from .context import ContextualProfile as ContextMatcherProfile
-        
-        matcher_profiles = []
-        for p in self._contextual_profiles:
-            matcher_profiles.append(ContextMatcherProfile(
-                app_id=p.app_id,
-                name=p.name,
-                cores=p.cores,
-                dynamic_enabled=p.dynamic_enabled,
-                dynamic_config=p.dynamic_config,
-                conditions=p.conditions,
-                created_at=p.created_at,
-            ))
-        
-        # Create global default as a ContextualProfile for fallback
-        global_default = ContextMatcherProfile(
-            app_id=None,
-            name="Global Default",
-            cores=self._global_default.get("cores", [0, 0, 0, 0]),
-            dynamic_enabled=self._global_default.get("dynamic_enabled", False),
-            dynamic_config=self._global_default.get("dynamic_config"),
-            conditions=ContextCondition(),
-        )
-        
-        # Find best matching profile
+        # Find best matching profile using the prebuilt index
+        self._ensure_context_index()
         best_match = self._context_matcher.find_best_match(
             app_id=self._current_app_id,
             context=self._current_context,
-            profiles=matcher_profiles,
-            global_default=global_default,
         )
         
         if best_match is None:
@@ -1271,7 +1289,8 @@ class ProfileManager:
         """Apply a contextual profile's settings.
         
         Args:
-            profile: ContextualProfile (from context.py) to apply
+            profile: Matched profile (ContextualGameProfile or the global
+                default ContextualProfile) to apply
             
         Returns:
             True if applied successfully, False otherwise
@@ -1279,28 +1298,17 @@ class ProfileManager:
         Requirements: 1.1, 4.2, 4.4, 8.2
         """
         try:
-            # Apply undervolt values
-            success, error = await self.ryzenadj.apply_values_async(profile.cores)
-            if not success:
-                logger.error(f"Failed to apply undervolt values: {error}")
-                return False
-            
-            # Apply frequency curves if present (find the corresponding ContextualGameProfile)
-            for p in self._contextual_profiles:
-                if p.name == profile.name and p.app_id == profile.app_id:
-                    if p.frequency_curves:
-                        await self._apply_frequency_curves(p.frequency_curves)
-                    break
+            # Stored profiles have precompiled plans; the global default
+            # built for the context index is compiled on the fly
+            if isinstance(profile, GameProfile):
+                plan = self._get_apply_plan(profile)
+            else:
+                plan = ApplyPlan.from_profile(profile)
             
-            # Handle dynamic mode
-            if self.dynamic_controller:
-                if profile.dynamic_enabled and profile.dynamic_config:
-                    logger.info(f"Dynamic mode enabled for profile '{profile.name}'")
-                    # TODO: await self.dynamic_controller.start(profile.dynamic_config)
-                else:
-                    if self.dynamic_controller.is_running():
-                        await self.dynamic_controller.stop()
-                        logger.info(f"Dynamic mode disabled for profile '{profile.name}'")
+            # Apply undervolt values, frequency curves and dynamic mode
+            # (only the steps that differ from the active plan)
+            if not await self._execute_plan(plan):
+                return False
             
             # Update current profile tracking
             # Find the corresponding ContextualGameProfile
@@ -1329,6 +1337,243 @@ class ProfileManager:
             logger.error(f"Failed to apply contextual profile: {e}")
             return False
     
+    # ==================== Apply Plans ====================
+    
+    def set_fan_control_service(self, service: "FanControlService") -> None:
+        """Set the fan control service used for profile fan settings.
+        
+        With a fan control service, a profile's fan settings are applied
+        through it and gymdeck3 is started without fan arguments, so
+        switching between profiles that differ only in fan settings does
+        not restart gymdeck3. Fan curves the service cannot represent are
+        still passed to gymdeck3.
+        
+        Args:
+            service: FanControlService instance
+        """
+        self._fan_control_service = service
+        self._active_plan = None
+    
+    def get_active_plan(self) -> Optional[ApplyPlan]:
+        """Get the plan that was last applied successfully.
+        
+        Returns:
+            Active ApplyPlan, or None if nothing was applied yet or the
+            last apply failed
+        """
+        return self._active_plan
+    
+    def _compile_apply_plan(self, source: Any) -> ApplyPlan:
+        """Compile and cache the apply plan for a profile.
+        
+        Called whenever a profile (or the global default) is saved.
+        
+        Args:
+            source: GameProfile, ContextualGameProfile or global default dict
+            
+        Returns:
+            Compiled ApplyPlan
+        """
+        if isinstance(source, dict):
+            plan = ApplyPlan.from_global_default(source)
+        else:
+            plan = ApplyPlan.from_profile(source)
+        # Keep a reference to the source so its id() cannot be reused
+        self._apply_plans[id(source)] = (source, plan)
+        return plan
+    
+    def _get_apply_plan(self, source: Any) -> ApplyPlan:
+        """Get the cached apply plan for a profile, compiling it if needed.
+        
+        Args:
+            source: GameProfile, ContextualGameProfile or global default dict
+            
+        Returns:
+            ApplyPlan for the profile
+        """
+        cached = self._apply_plans.get(id(source))
+        if cached is not None and cached[0] is source:
+            return cached[1]
+        return self._compile_apply_plan(source)
+    
+    def _cores_in_effect(self, cores: tuple) -> bool:
+        """Check if the given undervolt values are known to be applied.
+        
+        Args:
+            cores: Undervolt values to check
+            
+        Returns:
+            True if ryzenadj last applied exactly these values
+        """
+        if isinstance(self.ryzenadj, RyzenadjWrapper):
+            applied = self.ryzenadj.get_applied_values()
+            if applied is None or isinstance(applied, tuple):
+                return applied == cores
+        # Values are not tracked by the wrapper; trust the active plan
+        return self._active_plan is not None and self._active_plan.cores == cores
+    
+    async def _execute_plan(self, plan: ApplyPlan) -> bool:
+        """Switch hardware state to the given plan with the fewest steps.
+        
+        Only the steps that differ from the active plan are performed:
+        ryzenadj when the undervolt values change, frequency curves when
+        their hash changes, and a gymdeck3 restart only when its own
+        configuration changes. Fan-only differences are applied through
+        the fan control service when one is set and can represent them
+        (see _fan_on_service); otherwise gymdeck3 gets the fan settings.
+        
+        Args:
+            plan: Plan to switch to
+            
+        Returns:
+            True if the plan is now active, False otherwise
+            
+        Requirements: 4.2, 4.4, 8.2
+        """
+        diff = plan.diff(self._active_plan)
+        controller = self.dynamic_controller
+        was_running = bool(controller and controller.is_running())
+        fan_via_service = self._fan_on_service(plan)
+        # Fan settings moving between gymdeck3 and the service
+        fan_moved = self._active_plan is not None and self._fan_on_service(self._active_plan) != fan_via_service
+        fan_changed = diff.fan or fan_moved
+        
+        # gymdeck3 receives fan settings at launch unless the service owns them
+        start_dynamic = bool(controller) and plan.dynamic_enabled and (
+            diff.dynamic or not was_running or (fan_changed and (not fan_via_service or fan_moved))
+        )
+        stop_dynamic = was_running and not plan.dynamic_enabled
+        
+        if stop_dynamic:
+            await controller.stop()
+            logger.info(f"Dynamic mode disabled for profile '{plan.name}'")
+        
+        # gymdeck3 resets values to 0 on exit, so re-apply after stopping it
+        if diff.cores or stop_dynamic or not self._cores_in_effect(plan.cores):
+            success, error = await self.ryzenadj.apply_values_async(list(plan.cores))
+            if not success:
+                logger.error(f"Failed to apply undervolt values: {error}")
+                self._active_plan = None
+                return False
+        
+        if diff.frequency_curves:
+            await self._apply_frequency_curves(plan.get_frequency_curves())
+        
+        if start_dynamic:
+            config = plan.get_dynamic_config(include_fan=not fan_via_service)
+            if not await controller.start(config):
+                logger.error(f"Failed to start dynamic mode for profile '{plan.name}'")
+                self._active_plan = None
+                return False
+            logger.info(f"Dynamic mode enabled for profile '{plan.name}'")
+        
+        if self._fan_control_service is not None and fan_changed:
+            if fan_via_service:
+                self._apply_fan_settings(plan)
+            else:
+                self._restore_fan_settings(plan)
+        
+        self._active_plan = plan
+        logger.debug(f"Plan '{plan.name}' applied (steps: {diff.steps() or 'none'})")
+        return True
+    
+    def _fan_on_service(self, plan: ApplyPlan) -> bool:
+        """Whether a plan's fan settings are applied by the fan service.
+        
+        Fan settings the service cannot represent stay on gymdeck3 when the
+        plan runs it; without gymdeck3 the service applies what it can.
+        
+        Args:
+            plan: Plan to check
+        """
+        if self._fan_control_service is None:
+            return False
+        if not plan.dynamic_enabled:
+            return True
+        try:
+            self._service_fan_curve(plan)
+        except ValueError:
+            return False
+        return True
+    
+    @staticmethod
+    def _service_fan_curve(plan: ApplyPlan) -> Optional[FanCurve]:
+        """Fan service curve equivalent to a plan's gymdeck3 fan mode.
+        
+        "custom" uses the plan's curve, "fixed" a flat curve at the speed
+        of its first point (as gymdeck3 does). "default" leaves the fan to
+        the firmware under gymdeck3, so the service keeps its own curve.
+        
+        Args:
+            plan: Plan whose fan settings to convert
+            
+        Returns:
+            FanCurve, or None when the service's own curve applies
+            
+        Raises:
+            ValueError: If the service cannot represent the curve
+        """
+        fan = plan.get_fan_config()
+        if fan is None or fan.mode not in ("custom", "fixed"):
+            return None
+        
+        if fan.mode == "fixed":
+            speed = fan.curve[0].speed_percent
+            points = [FanPoint(0, speed), FanPoint(60, speed), FanPoint(120, speed)]
+        else:
+            points = [FanPoint(p.temp_c, p.speed_percent) for p in fan.curve]
+            if len(points) == 2:
+                # Curves hold their end speeds, so a flat third point changes nothing
+                low, high = sorted(points, key=lambda p: p.temp)
+                points.append(
+                    FanPoint(high.temp + 1, high.speed) if high.temp < 120
+                    else FanPoint(low.temp - 1, low.speed)
+                )
+        return FanCurve(name=f"{plan.name} (profile)", points=points)
+    
+    def _apply_fan_settings(self, plan: ApplyPlan) -> None:
+        """Apply a plan's fan settings through the fan control service.
+        
+        The plan's curve (see _service_fan_curve) replaces the service's
+        active curve, with the plan's zero RPM and hysteresis settings. A
+        curve the service cannot represent falls back to the stock curve.
+        When the plan has no curve, the service's own settings are restored.
+        
+        Args:
+            plan: Plan whose fan settings to apply
+        """
+        service = self._fan_control_service
+        try:
+            curve = self._service_fan_curve(plan)
+        except ValueError as e:
+            logger.warning(f"Profile fan curve not applicable, using stock curve: {e}")
+            curve = PRESET_STOCK
+        
+        if curve is None:
+            self._restore_fan_settings(plan)
+            return
+        
+        fan = plan.get_fan_config()
+        if self._fan_restore_curve is None:
+            self._fan_restore_curve = service.active_curve
+        service.active_curve = curve
+        service.set_fan_behavior(fan.zero_rpm_enabled, fan.hysteresis_temp)
+        logger.info(f"Applied fan curve '{curve.name}' for profile '{plan.name}'")
+    
+    def _restore_fan_settings(self, plan: ApplyPlan) -> None:
+        """Restore the fan service settings active before any profile.
+        
+        Args:
+            plan: Plan being applied (for logging)
+        """
+        if self._fan_restore_curve is None:
+            return
+        service = self._fan_control_service
+        service.active_curve = self._fan_restore_curve
+        service.set_fan_behavior()
+        self._fan_restore_curve = None
+        logger.info(f"Restored fan curve for profile '{plan.name}'")
+    
     async def _apply_frequency_curves(self, frequency_curves: Dict[int, Dict[str, Any]]) -> None:
         """Apply frequency curves to the frequency controller.
         
@@ -1521,7 +1766,10 @@ class ProfileManager:
                         continue
                     
                     # Import the profile
+                    if existing_profile:
+                        self._apply_plans.pop(id(existing_profile), None)
                     self._profiles[app_id] = profile
+                    self._compile_apply_plan(profile)
                     result["imported_count"] += 1
                     logger.info(f"Imported profile '{profile.name}' (app_id: {app_id})")
                     
@@ -19,11 +19,18 @@ The watcher uses multiple methods to detect the active Steam AppID:
    - Look for processes with -applaunch <appid> argument
    - Parse command line from /proc/<pid>/cmdline
 
-# Polling and Debouncing
+# Event-Driven Detection and Confirmation
 
-- Polls every 2 seconds (configurable)
-- Debounces app changes: waits 5 seconds before applying profile
-- This prevents rapid switching when games are starting/stopping
+- Subscribes to the Linux proc connector (see procevents.py) where permitted,
+  so the exec of a Steam launch process wakes the watcher immediately
+- Falls back to polling every 2 seconds (configurable) when the connector
+  is unavailable; polling also keeps running as a safety net
+- An app change is committed as soon as the same app is observed on two
+  consecutive observations, spaced CONFIRM_INTERVAL apart
+- This filters transient states while games are starting/stopping without
+  a fixed multi-second debounce
+- Launch-to-apply latency of the last switch is available via
+  get_last_switch_latency()
 
 # Usage Example
 
@@ -46,10 +53,13 @@ import asyncio
 import logging
 import os
 import re
+import time
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import List, Optional, Set, TYPE_CHECKING
 from datetime import datetime, timezone
 
+from .procevents import PROC_EVENT_EXEC, PROC_EVENT_EXIT, ProcEventListener
+
 if TYPE_CHECKING:
     from ..dynamic.profile_manager import ProfileManager
 
@@ -59,7 +69,8 @@ logger = logging.getLogger(__name__)
 class AppWatcher:
     """Monitors Steam's active application for automatic profile switching.
     
-    Polls Steam's state files and process list to detect when the user
+    Listens for process exec/exit events (falling back to polling) and
+    inspects Steam's state files and process list to detect when the user
     launches or exits games, then triggers profile switches via ProfileManager.
     
     Requirements: 4.1, 4.6
@@ -68,8 +79,8 @@ class AppWatcher:
     # Default polling interval in seconds
     DEFAULT_POLL_INTERVAL = 2.0
     
-    # Debounce delay in seconds (wait before applying profile)
-    DEBOUNCE_DELAY = 5.0
+    # Spacing between the two observations that confirm an app change
+    CONFIRM_INTERVAL = 0.25
     
     # Steam paths
     STEAM_ROOT = Path.home() / ".steam" / "steam"
@@ -97,6 +108,15 @@ class AppWatcher:
         self._poll_task: Optional[asyncio.Task] = None
         self._last_change_time: Optional[datetime] = None
         
+        # Event-driven detection state
+        self._proc_listener = ProcEventListener()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._wake_time: Optional[float] = None
+        self._launch_pids: Set[int] = set()
+        
+        # Latency of the last committed app change (seconds)
+        self._last_switch_latency: Optional[float] = None
+        
         logger.info(f"AppWatcher initialized with poll_interval={poll_interval}s")
     
     def is_running(self) -> bool:
@@ -114,6 +134,26 @@ class AppWatcher:
             Current AppID if a game is running, None otherwise
         """
         return self._current_app_id
+    
+    def is_event_driven(self) -> bool:
+        """Check if process events are driving detection.
+        
+        Returns:
+            True if the proc connector is active, False if only polling
+        """
+        return self._proc_listener.is_open()
+    
+    def get_last_switch_latency(self) -> Optional[float]:
+        """Get the launch-to-apply latency of the last app change.
+        
+        Measured from the first sign of the change (process event or the
+        first observation that saw the new app) until ProfileManager
+        finished applying the profile.
+        
+        Returns:
+            Latency in seconds, or None if no change has been applied yet
+        """
+        return self._last_switch_latency
 
     
     # ==================== AppID Detection Methods ====================
@@ -227,21 +267,10 @@ class AppWatcher:
                     with open(cmdline_file, 'rb') as f:
                         cmdline_bytes = f.read()
                     
-                    # Command line arguments are null-separated
-                    cmdline = cmdline_bytes.decode('utf-8', errors='ignore')
-                    args = cmdline.split('\x00')
-                    
-                    # Look for steam process with -applaunch argument
-                    # Example: /path/to/steam -applaunch 1091500
-                    if 'steam' in args[0].lower():
-                        for i, arg in enumerate(args):
-                            if arg == '-applaunch' and i + 1 < len(args):
-                                try:
-                                    app_id = int(args[i + 1])
-                                    logger.debug(f"Detected running game from /proc: {app_id}")
-                                    return app_id
-                                except ValueError:
-                                    continue
+                    app_id = self._parse_applaunch(cmdline_bytes)
+                    if app_id is not None:
+                        logger.debug(f"Detected running game from /proc: {app_id}")
+                        return app_id
                 
                 except (PermissionError, FileNotFoundError):
                     # Skip processes we can't read
@@ -255,60 +284,155 @@ class AppWatcher:
         except Exception as e:
             logger.debug(f"Error detecting from /proc: {e}")
             return None
+    
+    @staticmethod
+    def _parse_applaunch(cmdline_bytes: bytes) -> Optional[int]:
+        """Extract the AppID from a steam -applaunch command line.
+        
+        Args:
+            cmdline_bytes: Raw contents of /proc/<pid>/cmdline
+            
+        Returns:
+            AppID if this is a steam process with -applaunch, None otherwise
+        """
+        # Command line arguments are null-separated
+        cmdline = cmdline_bytes.decode('utf-8', errors='ignore')
+        args = cmdline.split('\x00')
+        
+        # Look for steam process with -applaunch argument
+        # Example: /path/to/steam -applaunch 1091500
+        if 'steam' not in args[0].lower():
+            return None
+        
+        for i, arg in enumerate(args):
+            if arg == '-applaunch' and i + 1 < len(args):
+                try:
+                    return int(args[i + 1])
+                except ValueError:
+                    continue
+        
+        return None
+
+    
+    # ==================== Process Events ====================
+    
+    def _on_proc_readable(self) -> None:
+        """Handle readable proc connector socket (event loop callback).
+        
+        Wakes the polling loop when a steam -applaunch process starts or
+        when a previously seen launch process exits. Other processes are
+        ignored so that unrelated exec activity does not trigger /proc scans.
+        """
+        self._handle_proc_events(self._proc_listener.read_events())
+    
+    def _handle_proc_events(self, events: List[tuple]) -> None:
+        """Filter process events and wake the watcher on relevant ones.
+        
+        Args:
+            events: List of (what, tgid) tuples from ProcEventListener
+        """
+        relevant = False
+        
+        for what, pid in events:
+            if what == PROC_EVENT_EXEC:
+                try:
+                    with open(f"/proc/{pid}/cmdline", 'rb') as f:
+                        cmdline_bytes = f.read()
+                except OSError:
+                    continue
+                if self._parse_applaunch(cmdline_bytes) is not None:
+                    self._launch_pids.add(pid)
+                    relevant = True
+            elif what == PROC_EVENT_EXIT and pid in self._launch_pids:
+                self._launch_pids.discard(pid)
+                relevant = True
+        
+        if relevant:
+            self._wake()
+    
+    def _wake(self) -> None:
+        """Request an immediate observation from the polling loop."""
+        if self._wake_time is None:
+            self._wake_time = time.monotonic()
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def _wait_for_next_observation(self, pending: bool) -> None:
+        """Wait until the next observation is due.
+        
+        While a change awaits confirmation, waits CONFIRM_INTERVAL (capped
+        at poll_interval). Otherwise waits poll_interval, returning early
+        when a process event wakes the watcher.
+        
+        Args:
+            pending: Whether an unconfirmed app change is outstanding
+        """
+        if pending:
+            await asyncio.sleep(min(self.CONFIRM_INTERVAL, self.poll_interval))
+            return
+        
+        if self._wakeup is None:
+            await asyncio.sleep(self.poll_interval)
+            return
+        
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
 
     
     # ==================== Polling Loop ====================
     
     async def _poll_loop(self) -> None:
-        """Main polling loop that monitors for app changes.
+        """Main detection loop that monitors for app changes.
         
-        Polls every poll_interval seconds and detects app changes.
-        Implements debouncing to wait DEBOUNCE_DELAY seconds before
-        applying a profile after an app change is detected.
+        Observes the active app every poll_interval seconds, or immediately
+        when a process event wakes the watcher. A change is committed once
+        the same app is seen on two consecutive observations; a differing
+        second observation restarts confirmation.
         
         Requirements: 4.1
         """
         logger.info("AppWatcher polling loop started")
         
-        # Track pending app change for debouncing
+        # Unconfirmed app change (None is a valid target: game exited)
+        pending = False
         pending_app_id: Optional[int] = None
-        pending_since: Optional[datetime] = None
+        change_started_at: Optional[float] = None
         
         while self._running:
             try:
+                observed_at = self._wake_time or time.monotonic()
+                self._wake_time = None
+                
                 # Detect current app
                 detected_app_id = self._get_active_app_id()
                 
-                # Check if app has changed
-                if detected_app_id != self._current_app_id:
-                    # App change detected
+                if detected_app_id == self._current_app_id:
+                    # Back to the active app; drop any transient change
+                    pending = False
+                elif pending and detected_app_id == pending_app_id:
+                    # Stable across two consecutive observations, commit
+                    logger.info(f"App change confirmed, applying profile for app_id: {detected_app_id}")
+                    
+                    self._current_app_id = detected_app_id
+                    await self.profile_manager.on_app_change(detected_app_id)
+                    
+                    self._last_switch_latency = time.monotonic() - change_started_at
+                    logger.info(f"Profile switch latency: {self._last_switch_latency:.3f}s")
+                    
+                    pending = False
+                else:
+                    # New change detected, wait for confirmation
                     logger.info(f"App change detected: {self._current_app_id} -> {detected_app_id}")
                     
-                    # Start debounce timer
+                    pending = True
                     pending_app_id = detected_app_id
-                    pending_since = datetime.now(timezone.utc)
-                    self._last_change_time = pending_since
+                    change_started_at = observed_at
+                    self._last_change_time = datetime.now(timezone.utc)
                 
-                # Check if we have a pending change that's ready to apply
-                if pending_app_id is not None and pending_since is not None:
-                    elapsed = (datetime.now(timezone.utc) - pending_since).total_seconds()
-                    
-                    if elapsed >= self.DEBOUNCE_DELAY:
-                        # Debounce period has elapsed, apply the profile
-                        logger.info(f"Debounce period elapsed, applying profile for app_id: {pending_app_id}")
-                        
-                        # Update current app_id
-                        self._current_app_id = pending_app_id
-                        
-                        # Trigger profile change
-                        await self.profile_manager.on_app_change(pending_app_id)
-                        
-                        # Clear pending change
-                        pending_app_id = None
-                        pending_since = None
-                
-                # Sleep until next poll
-                await asyncio.sleep(self.poll_interval)
+                await self._wait_for_next_observation(pending)
                 
             except asyncio.CancelledError:
                 # Task was cancelled, exit gracefully
@@ -328,7 +452,8 @@ class AppWatcher:
         """Start monitoring Steam apps.
         
         Detects the currently running app and applies the appropriate profile,
-        then starts the polling loop.
+        subscribes to process events where permitted, then starts the
+        polling loop.
         
         Requirements: 4.6
         """
@@ -353,6 +478,13 @@ class AppWatcher:
         except Exception as e:
             logger.error(f"Error detecting app on startup: {e}")
         
+        # Subscribe to process events; polling alone is used if unavailable
+        self._wakeup = asyncio.Event()
+        if self._proc_listener.open():
+            asyncio.get_running_loop().add_reader(
+                self._proc_listener.fileno(), self._on_proc_readable
+            )
+        
         # Start polling loop
         self._poll_task = asyncio.create_task(self._poll_loop())
         logger.info("AppWatcher started successfully")
@@ -360,7 +492,8 @@ class AppWatcher:
     async def stop(self) -> None:
         """Stop monitoring Steam apps.
         
-        Cancels the polling loop and cleans up resources.
+        Cancels the polling loop, unsubscribes from process events and
+        cleans up resources.
         """
         if not self._running:
             logger.warning("AppWatcher is not running")
@@ -378,4 +511,11 @@ class AppWatcher:
                 pass
             self._poll_task = None
         
+        # Release proc connector socket
+        if self._proc_listener.is_open():
+            asyncio.get_running_loop().remove_reader(self._proc_listener.fileno())
+            self._proc_listener.close()
+        self._wakeup = None
+        self._launch_pids.clear()
+        
         logger.info("AppWatcher stopped successfully")
@@ -15,6 +15,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Dict
 
+from .sensors import SensorHub, cpu_freq_channel
+
 logger = logging.getLogger(__name__)
 
 # Sysfs paths for cpufreq control
@@ -73,6 +75,16 @@ class CPUFreqController:
         self.base_path = Path(base_path)
         self._frequency_cache: Dict[int, FrequencyCache] = {}
         self._original_governors: Dict[int, str] = {}
+        # Shared sensor sampling for current frequencies (None: read sysfs)
+        self._sensor_hub: Optional[SensorHub] = None
+    
+    def set_sensor_hub(self, hub: Optional[SensorHub]) -> None:
+        """Read current frequencies through a shared SensorHub.
+        
+        Args:
+            hub: SensorHub instance, or None to read sysfs directly
+        """
+        self._sensor_hub = hub
         
     def _get_cpufreq_path(self, core_id: int) -> Path:
         """Get cpufreq sysfs path for a specific core.
@@ -163,6 +175,14 @@ class CPUFreqController:
             if cache_entry.is_valid():
                 return cache_entry.frequency_mhz
         
+        if self._sensor_hub is not None:
+            # The hub's snapshot stands in for the cache; a read it cannot
+            # serve falls through to sysfs for the error
+            max_age = FrequencyCache.ttl_ms / 1000.0 if use_cache else 0.0
+            snapshot = self._sensor_hub.latest((cpu_freq_channel(core_id),), max_age=max_age)
+            if core_id < len(snapshot.cpu_freq_mhz) and snapshot.cpu_freq_mhz[core_id] is not None:
+                return int(snapshot.cpu_freq_mhz[core_id])
+        
         # Read from sysfs
         freq_path = self._get_cpufreq_path(core_id) / "scaling_cur_freq"
         freq_khz_str = self._read_sysfs_file(freq_path)
@@ -8,6 +8,7 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 DMI_PRODUCT_NAME_PATH = "/sys/devices/virtual/dmi/id/product_name"
+DMI_BIOS_VERSION_PATH = "/sys/devices/virtual/dmi/id/bios_version"
 
 # Module-level cache instance (initialized lazily)
 _platform_cache: Optional["PlatformCache"] = None
@@ -20,6 +21,7 @@ class PlatformInfo:
     variant: str         # "LCD", "OLED", or "UNKNOWN"
     safe_limit: int      # Maximum safe undervolt (-30, -35, or -25)
     detected: bool       # True if successfully detected
+    bios_version: str = ""  # Firmware version, "" if unknown
 
 
 def _read_dmi_product_name(path: str = DMI_PRODUCT_NAME_PATH) -> Optional[str]:
@@ -38,6 +40,25 @@ def _read_dmi_product_name(path: str = DMI_PRODUCT_NAME_PATH) -> Optional[str]:
         return None
 
 
+def _read_bios_version(path: str = DMI_BIOS_VERSION_PATH) -> str:
+    """Read BIOS version from DMI sysfs.
+    
+    The BIOS version is never cached so that firmware updates are noticed
+    on the next start.
+    
+    Args:
+        path: Path to DMI bios_version file
+        
+    Returns:
+        BIOS version string or "" if read fails
+    """
+    try:
+        return Path(path).read_text().strip()
+    except (OSError, IOError) as e:
+        logger.debug(f"Failed to read DMI BIOS version from {path}: {e}")
+        return ""
+
+
 def _map_product_name_to_platform(product_name: Optional[str]) -> PlatformInfo:
     """Map DMI product name to platform info.
     
@@ -86,23 +107,30 @@ def _map_product_name_to_platform(product_name: Optional[str]) -> PlatformInfo:
     )
 
 
-def _detect_platform_fresh(dmi_path: str = DMI_PRODUCT_NAME_PATH) -> PlatformInfo:
+def _detect_platform_fresh(
+    dmi_path: str = DMI_PRODUCT_NAME_PATH,
+    bios_path: str = DMI_BIOS_VERSION_PATH
+) -> PlatformInfo:
     """Perform fresh platform detection from DMI.
     
     Args:
         dmi_path: Path to DMI product_name file (for testing)
+        bios_path: Path to DMI bios_version file (for testing)
         
     Returns:
         PlatformInfo with detected platform details
     """
     product_name = _read_dmi_product_name(dmi_path)
-    return _map_product_name_to_platform(product_name)
+    platform = _map_product_name_to_platform(product_name)
+    platform.bios_version = _read_bios_version(bios_path)
+    return platform
 
 
 def detect_platform(
     dmi_path: str = DMI_PRODUCT_NAME_PATH,
     cache_dir: Optional[Path] = None,
-    use_cache: bool = True
+    use_cache: bool = True,
+    bios_path: str = DMI_BIOS_VERSION_PATH
 ) -> PlatformInfo:
     """Detect Steam Deck model from DMI info with caching.
     
@@ -118,6 +146,7 @@ def detect_platform(
         dmi_path: Path to DMI product_name file (for testing)
         cache_dir: Directory for cache file (for testing)
         use_cache: Whether to use caching (default True)
+        bios_path: Path to DMI bios_version file (for testing)
         
     Returns:
         PlatformInfo with detected platform details
@@ -142,10 +171,11 @@ def detect_platform(
         cached_platform = _platform_cache.load()
         if cached_platform is not None:
             logger.info(f"Using cached platform: {cached_platform.model} ({cached_platform.variant})")
+            cached_platform.bios_version = _read_bios_version(bios_path)
             return cached_platform
     
     # Perform fresh detection
-    platform = _detect_platform_fresh(dmi_path)
+    platform = _detect_platform_fresh(dmi_path, bios_path)
     
     # Save to cache if detection was successful and caching is enabled
     if use_cache and platform.detected and _platform_cache is not None:
@@ -156,7 +186,8 @@ def detect_platform(
 
 def redetect_platform(
     dmi_path: str = DMI_PRODUCT_NAME_PATH,
-    cache_dir: Optional[Path] = None
+    cache_dir: Optional[Path] = None,
+    bios_path: str = DMI_BIOS_VERSION_PATH
 ) -> PlatformInfo:
     """Force fresh platform detection, clearing any cached data.
     
@@ -165,6 +196,7 @@ def redetect_platform(
     Args:
         dmi_path: Path to DMI product_name file (for testing)
         cache_dir: Directory for cache file (for testing)
+        bios_path: Path to DMI bios_version file (for testing)
         
     Returns:
         PlatformInfo with freshly detected platform details
@@ -186,7 +218,7 @@ def redetect_platform(
     logger.info("Platform cache cleared, performing fresh detection")
     
     # Perform fresh detection
-    platform = _detect_platform_fresh(dmi_path)
+    platform = _detect_platform_fresh(dmi_path, bios_path)
     
     # Save to cache if detection was successful
     if platform.detected:
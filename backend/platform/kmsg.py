@@ -0,0 +1,284 @@
+"""Cursor-based kernel log reader for hardware error detection.
+
+This module reads kernel log records directly from /dev/kmsg instead of
+spawning dmesg and scanning the whole ring buffer. Every open file
+descriptor of /dev/kmsg has its own read position, so a reader opened
+and moved to the end when a test starts returns exactly the records
+logged after that point, even if the ring buffer wraps.
+
+Feature: decktune, Test Runner Module
+Validates: Requirements 3.6
+
+# Record Format
+
+Each read() of /dev/kmsg returns one record:
+
+    6,1234,5678901234,-;mce: [Hardware Error]: CPU 2: Machine Check
+     SUBSYSTEM=cpu
+
+The prefix holds the syslog priority (level in the low 3 bits), the
+sequence number, the timestamp in microseconds since boot and flags.
+Continuation lines starting with a space carry key/value properties and
+are ignored here. A read fails with EPIPE when records were overwritten
+before they could be read; the reader logs the gap and continues.
+
+Regular files and FIFOs containing records in the same format are
+accepted as well, which lets tests emit records at known times.
+
+# Error Classification
+
+classify_kernel_error() maps a message to an error category using
+KERNEL_ERROR_PATTERNS. The patterns are shared by every stability test.
+"""
+
+import errno
+import logging
+import os
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Kernel log device
+KMSG_PATH = "/dev/kmsg"
+
+# Largest record the kernel returns from one read (CONSOLE_EXT_LOG_MAX)
+_READ_SIZE = 8192
+
+# Error categories and the message patterns that identify them, checked
+# in order (case-insensitive)
+KERNEL_ERROR_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("mce", re.compile(r"\bmce\b.*(error|bank|event)|\[hardware error\]", re.IGNORECASE)),
+    ("machine_check", re.compile(r"machine check", re.IGNORECASE)),
+    ("hardware_error", re.compile(r"hardware error|uncorrected error|fatal error|\bwhea\b", re.IGNORECASE)),
+    ("segfault", re.compile(r"segfault at|general protection fault|traps:.*invalid opcode", re.IGNORECASE)),
+    ("gpu_hang", re.compile(
+        r"amdgpu.*(timeout|gpu reset|hang|page fault)|gpu hang|\[drm\].*ring .* timeout",
+        re.IGNORECASE
+    )),
+    ("watchdog", re.compile(
+        r"watchdog.*(lockup|stuck|timeout)|soft lockup|hard lockup|rcu.*(self-detected stall|detected stalls)",
+        re.IGNORECASE
+    )),
+)
+
+# Categories that indicate a CPU-level hardware error
+MCE_CATEGORIES = frozenset({"mce", "machine_check", "hardware_error"})
+
+
+def classify_kernel_error(message: str) -> Optional[str]:
+    """Get the error category of a kernel log message.
+
+    Args:
+        message: Kernel log message text
+
+    Returns:
+        Category name from KERNEL_ERROR_PATTERNS, or None if the message
+        is not an error
+    """
+    for category, pattern in KERNEL_ERROR_PATTERNS:
+        if pattern.search(message):
+            return category
+    return None
+
+
+@dataclass
+class KernelLogRecord:
+    """One kernel log record.
+
+    Attributes:
+        seq: Sequence number of the record
+        timestamp_us: Time since boot in microseconds
+        level: Syslog level (0 = emerg ... 7 = debug)
+        message: Message text
+    """
+    seq: int
+    timestamp_us: int
+    level: int
+    message: str
+
+    @property
+    def category(self) -> Optional[str]:
+        """Error category of the message (None if not an error)."""
+        return classify_kernel_error(self.message)
+
+    def format(self) -> str:
+        """Format the record like a dmesg line."""
+        return f"[{self.timestamp_us / 1_000_000:12.6f}] {self.message}"
+
+
+def parse_kmsg_record(line: str) -> Optional[KernelLogRecord]:
+    """Parse the first line of a /dev/kmsg record.
+
+    Args:
+        line: "priority,seq,timestamp,flags[,...];message"
+
+    Returns:
+        KernelLogRecord, or None if the line is malformed
+    """
+    prefix, sep, message = line.partition(";")
+    if not sep:
+        return None
+
+    fields = prefix.split(",")
+    if len(fields) < 3:
+        return None
+
+    try:
+        priority = int(fields[0])
+        seq = int(fields[1])
+        timestamp_us = int(fields[2])
+    except ValueError:
+        return None
+
+    return KernelLogRecord(
+        seq=seq,
+        timestamp_us=timestamp_us,
+        level=priority & 7,
+        message=message.rstrip("\n")
+    )
+
+
+class KmsgReader:
+    """Non-blocking reader of kernel log records after a cursor.
+
+    The reader exposes a file descriptor so it can be registered with
+    ``loop.add_reader``; read_records() then drains all pending records.
+    """
+
+    def __init__(self, path: str = KMSG_PATH):
+        """Initialize the reader without opening the log.
+
+        Args:
+            path: Kernel log device, or a file/FIFO with records in the
+                same format
+        """
+        self.path = path
+        self._fd: Optional[int] = None
+        self._buffer = ""
+        self._last_seq: Optional[int] = None
+
+    @property
+    def cursor(self) -> Optional[int]:
+        """Sequence number of the last record returned (None if none yet)."""
+        return self._last_seq
+
+    def is_open(self) -> bool:
+        """Check if the kernel log is open.
+
+        Returns:
+            True if records can be read, False otherwise
+        """
+        return self._fd is not None
+
+    def open(self) -> bool:
+        """Open the kernel log and move the cursor to its end.
+
+        Only records logged after this call are returned.
+
+        Returns:
+            True on success, False if the kernel log is unavailable
+        """
+        if self._fd is not None:
+            return True
+
+        try:
+            fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError as e:
+            logger.info(f"Kernel log {self.path} unavailable: {e}")
+            return False
+
+        try:
+            os.lseek(fd, 0, os.SEEK_END)
+        except OSError:
+            # FIFOs cannot seek; everything written from now on is new
+            pass
+
+        self._fd = fd
+        self._buffer = ""
+        self._last_seq = None
+        return True
+
+    def seek_end(self) -> bool:
+        """Move the cursor to the end of the log, opening it if needed.
+
+        Records logged before this call are skipped, so a reader kept
+        open across several tests only reports the current test's errors.
+
+        Returns:
+            True on success, False if the kernel log is unavailable
+        """
+        if self._fd is None:
+            return self.open()
+        # Drain instead of lseek: FIFOs cannot seek, and draining keeps the
+        # sequence cursor in step with what was skipped
+        self.read_records()
+        return True
+
+    def close(self) -> None:
+        """Close the kernel log."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def fileno(self) -> int:
+        """Get the file descriptor for event loop registration.
+
+        Returns:
+            File descriptor, or -1 if the reader is not open
+        """
+        return self._fd if self._fd is not None else -1
+
+    def read_records(self) -> List[KernelLogRecord]:
+        """Drain all records logged since the previous read without blocking.
+
+        Returns:
+            List of new records in sequence order
+        """
+        records: List[KernelLogRecord] = []
+        if self._fd is None:
+            return records
+
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                if e.errno == errno.EPIPE:
+                    # Records were overwritten before we read them
+                    logger.warning("Kernel log records were lost (ring buffer overrun)")
+                    continue
+                logger.debug(f"Kernel log read error: {e}")
+                break
+
+            if not data:
+                break
+            self._buffer += data.decode("utf-8", errors="replace")
+
+        # Keep a trailing partial line (files/FIFOs) for the next read
+        lines = self._buffer.split("\n")
+        self._buffer = lines.pop()
+
+        for line in lines:
+            if not line or line.startswith(" "):
+                continue  # Continuation properties
+            record = parse_kmsg_record(line)
+            if record is None:
+                continue
+            if self._last_seq is not None and record.seq <= self._last_seq:
+                continue
+            self._last_seq = record.seq
+            records.append(record)
+
+        return records
+
+    def read_errors(self) -> List[KernelLogRecord]:
+        """Drain new records and keep those classified as errors.
+
+        Returns:
+            List of new error records in sequence order
+        """
+        return [r for r in self.read_records() if r.category is not None]
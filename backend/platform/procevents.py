@@ -0,0 +1,198 @@
+"""Linux proc connector listener for event-driven process detection.
+
+This module subscribes to the kernel's process event connector
+(NETLINK_CONNECTOR / CN_IDX_PROC) so that process exec and exit events
+are delivered as soon as they happen, instead of being discovered by
+periodically scanning /proc.
+
+Feature: decktune-3.0-automation
+Validates: Requirements 4.1
+
+# Permissions
+
+Subscribing to the proc connector requires CAP_NET_ADMIN. Decky runs
+plugin backends as root, so this is normally available on the Steam Deck.
+When the socket cannot be opened (missing capability, non-Linux kernel,
+connector disabled), open() returns False and callers fall back to polling.
+
+# Wire Format
+
+Each datagram is a netlink message containing a connector message whose
+payload is a ``struct proc_event``:
+
+    nlmsghdr   (16 bytes): len, type, flags, seq, pid
+    cn_msg     (20 bytes): idx, val, seq, ack, len, flags
+    proc_event (16 bytes): what, cpu, timestamp_ns
+    event_data:            process_pid, process_tgid, ...
+"""
+
+import logging
+import os
+import socket
+import struct
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Netlink / connector constants (linux/netlink.h, linux/connector.h, linux/cn_proc.h)
+NETLINK_CONNECTOR = 11
+NLMSG_DONE = 3
+CN_IDX_PROC = 1
+CN_VAL_PROC = 1
+PROC_CN_MCAST_LISTEN = 1
+PROC_CN_MCAST_IGNORE = 2
+
+# proc_event.what values we care about
+PROC_EVENT_EXEC = 0x00000002
+PROC_EVENT_EXIT = 0x80000000
+
+_NLMSGHDR = struct.Struct("=IHHII")
+_CN_MSG = struct.Struct("=IIIIHH")
+_PROC_EVENT_HDR = struct.Struct("=IIQ")
+_PROC_EVENT_PIDS = struct.Struct("=II")
+
+# Receive buffer size; a single proc_event datagram is well below this
+_RECV_SIZE = 4096
+
+
+def build_mcast_message(op: int, pid: int) -> bytes:
+    """Build a netlink datagram that (un)subscribes from proc events.
+
+    Args:
+        op: PROC_CN_MCAST_LISTEN or PROC_CN_MCAST_IGNORE
+        pid: Netlink port id (normally the process PID)
+
+    Returns:
+        Encoded netlink message
+    """
+    payload = struct.pack("=I", op)
+    cn_msg = _CN_MSG.pack(CN_IDX_PROC, CN_VAL_PROC, 0, 0, len(payload), 0)
+    total_len = _NLMSGHDR.size + len(cn_msg) + len(payload)
+    nlmsghdr = _NLMSGHDR.pack(total_len, NLMSG_DONE, 0, 0, pid)
+    return nlmsghdr + cn_msg + payload
+
+
+def parse_proc_event(data: bytes) -> Optional[Tuple[int, int]]:
+    """Parse a proc connector datagram.
+
+    Args:
+        data: Raw datagram received from the connector socket
+
+    Returns:
+        Tuple of (what, tgid) for exec/exit events, None for any other
+        event type or for malformed/truncated messages
+    """
+    offset = _NLMSGHDR.size + _CN_MSG.size
+    if len(data) < offset + _PROC_EVENT_HDR.size + _PROC_EVENT_PIDS.size:
+        return None
+
+    idx, val = _CN_MSG.unpack_from(data, _NLMSGHDR.size)[:2]
+    if idx != CN_IDX_PROC or val != CN_VAL_PROC:
+        return None
+
+    what, _cpu, _timestamp = _PROC_EVENT_HDR.unpack_from(data, offset)
+    if what not in (PROC_EVENT_EXEC, PROC_EVENT_EXIT):
+        return None
+
+    _pid, tgid = _PROC_EVENT_PIDS.unpack_from(data, offset + _PROC_EVENT_HDR.size)
+    return what, tgid
+
+
+class ProcEventListener:
+    """Non-blocking subscriber to kernel process exec/exit events.
+
+    The listener exposes a file descriptor so it can be registered with
+    ``loop.add_reader``; read_events() then drains all pending datagrams.
+    """
+
+    def __init__(self):
+        """Initialize the listener without opening the socket."""
+        self._sock: Optional[socket.socket] = None
+
+    def is_open(self) -> bool:
+        """Check if the connector socket is open and subscribed.
+
+        Returns:
+            True if events are being received, False otherwise
+        """
+        return self._sock is not None
+
+    def open(self) -> bool:
+        """Open the connector socket and subscribe to proc events.
+
+        Returns:
+            True on success, False if the proc connector is unavailable
+        """
+        if self._sock is not None:
+            return True
+
+        af_netlink = getattr(socket, "AF_NETLINK", None)
+        if af_netlink is None:
+            logger.debug("AF_NETLINK not supported on this platform")
+            return False
+
+        sock = None
+        try:
+            sock = socket.socket(af_netlink, socket.SOCK_DGRAM, NETLINK_CONNECTOR)
+            sock.bind((os.getpid(), CN_IDX_PROC))
+            sock.send(build_mcast_message(PROC_CN_MCAST_LISTEN, os.getpid()))
+            sock.setblocking(False)
+        except OSError as e:
+            logger.info(f"Proc connector unavailable, falling back to polling: {e}")
+            if sock is not None:
+                sock.close()
+            return False
+
+        self._sock = sock
+        logger.info("Subscribed to proc connector events")
+        return True
+
+    def close(self) -> None:
+        """Unsubscribe and close the connector socket."""
+        if self._sock is None:
+            return
+
+        try:
+            self._sock.send(build_mcast_message(PROC_CN_MCAST_IGNORE, os.getpid()))
+        except OSError:
+            pass
+        self._sock.close()
+        self._sock = None
+
+    def fileno(self) -> int:
+        """Get the socket file descriptor for event loop registration.
+
+        Returns:
+            File descriptor, or -1 if the listener is not open
+        """
+        return self._sock.fileno() if self._sock is not None else -1
+
+    def read_events(self) -> List[Tuple[int, int]]:
+        """Drain all pending exec/exit events without blocking.
+
+        Returns:
+            List of (what, tgid) tuples in arrival order
+        """
+        events: List[Tuple[int, int]] = []
+        if self._sock is None:
+            return events
+
+        while True:
+            try:
+                data = self._sock.recv(_RECV_SIZE)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                # ENOBUFS means the kernel dropped events; keep what we have
+                logger.debug(f"Proc connector receive error: {e}")
+                break
+
+            if not data:
+                break
+
+            event = parse_proc_event(data)
+            if event is not None:
+                events.append(event)
+
+        return events
@@ -0,0 +1,652 @@
+"""Shared hardware sensor sampling.
+
+The fan loop, context source, test runner, frequency wizard, cpufreq
+controller and power monitor all read the same few sysfs files (APU
+temperature, battery, AC adapter, CPU frequency, power) on their own
+timers. SensorHub discovers the sensor paths once, keeps them open, and
+serves every consumer from one immutable snapshot.
+
+Feature: fan-control-curves, frequency-based-wizard, decktune-3.0-automation
+Validates: Requirements 1.3, 1.4, 3.6, 5.1, 9.1
+
+# Channels
+
+- ``temperature``: APU temperature in °C (hwmon CPU/package/Tctl sensor,
+  falling back to thermal_zone0)
+- ``battery_percent``: Battery capacity 0-100
+- ``ac_online``: True while any non-battery power supply is online
+- ``cpu<N>_freq``: Current frequency of core N in MHz (see
+  cpu_freq_channel())
+- ``battery_power_w``: Battery power in W from ``power_now``, else
+  ``current_now`` × ``voltage_now`` (charging or discharging)
+- ``battery_discharging``: True while the battery status is Discharging
+- ``battery_full_wh``: Full battery energy in Wh (``energy_full``, else
+  ``charge_full`` × ``voltage_now``)
+- ``apu_power_w``: hwmon power input in W (the amdgpu PPT sensor on the
+  Steam Deck)
+
+# Demand
+
+Consumers subscribe with the channels they need, how often they need them
+(interval) and how old a value may be when they read it (max_age). Each
+channel is sampled at the shortest interval among its subscribers; every
+pass reads all channels that are due, so channels with equal demand are
+read together. Channels nobody subscribes to are only read on demand.
+
+latest() returns the current snapshot, first re-reading any requested
+channel older than max_age. Consumers that poll on their own schedule use
+it directly; a read by one consumer serves all others within their
+staleness tolerance.
+
+# Usage Example
+
+```python
+hub = SensorHub.discover()
+hub.subscribe("fan_control", [TEMPERATURE], interval=1.0)
+hub.start()
+
+snapshot = hub.latest([TEMPERATURE], max_age=0.5)
+print(snapshot.temperature_c, hub.reads_per_second())
+```
+"""
+
+import asyncio
+import glob
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+TEMPERATURE = "temperature"
+BATTERY_PERCENT = "battery_percent"
+AC_ONLINE = "ac_online"
+BATTERY_POWER = "battery_power_w"
+BATTERY_DISCHARGING = "battery_discharging"
+BATTERY_FULL = "battery_full_wh"
+APU_POWER = "apu_power_w"
+
+# Channels of SystemContext (backend.dynamic.context)
+CONTEXT_CHANNELS = (BATTERY_PERCENT, AC_ONLINE, TEMPERATURE)
+
+# Channels of PowerReading (backend.core.power)
+POWER_CHANNELS = (BATTERY_POWER, BATTERY_DISCHARGING, APU_POWER)
+
+# Shortest sampling interval of the hub loop (seconds)
+MIN_INTERVAL = 0.1
+
+# Channels due within this fraction of their interval are read in the
+# same pass
+BATCH_FRACTION = 0.1
+
+
+def cpu_freq_channel(core_id: int) -> str:
+    """Channel name of a core's current frequency."""
+    return f"cpu{core_id}_freq"
+
+
+@dataclass(frozen=True)
+class SensorPaths:
+    """Sensor files discovered at startup.
+
+    Attributes:
+        temperature: APU temperature input (millidegrees Celsius)
+        battery_capacity: Battery capacity file (percent)
+        ac_online: Online files of all non-battery power supplies
+        cpu_freq: scaling_cur_freq files indexed by core number (kHz), None
+            for cores without cpufreq (e.g. offline)
+        battery_power: Battery power_now file (µW)
+        battery_current: Battery current_now file (µA)
+        battery_voltage: Battery voltage_now file (µV)
+        battery_status: Battery status file (Charging/Discharging/Full)
+        battery_energy_full: Battery energy_full (µWh) or charge_full (µAh) file
+        apu_power: hwmon power input (µW)
+    """
+    temperature: Optional[str] = None
+    battery_capacity: Optional[str] = None
+    ac_online: Tuple[str, ...] = ()
+    cpu_freq: Tuple[Optional[str], ...] = ()
+    battery_power: Optional[str] = None
+    battery_current: Optional[str] = None
+    battery_voltage: Optional[str] = None
+    battery_status: Optional[str] = None
+    battery_energy_full: Optional[str] = None
+    apu_power: Optional[str] = None
+
+    @classmethod
+    def discover(cls, sys_root: str = "/sys", temperature: Optional[str] = None) -> "SensorPaths":
+        """Locate sensor files under a sysfs root.
+
+        Args:
+            sys_root: sysfs mount point (a fake tree in tests)
+            temperature: Use this temperature input instead of searching,
+                e.g. the fan control sensor
+
+        Returns:
+            Discovered paths (None/empty where a sensor is missing)
+        """
+        battery = None
+        battery_files: Dict[str, Optional[str]] = {}
+        adapters = []
+        for supply in sorted(glob.glob(os.path.join(sys_root, "class", "power_supply", "*"))):
+            supply_type = _read_text(os.path.join(supply, "type"))
+            if supply_type == "Battery":
+                capacity = os.path.join(supply, "capacity")
+                if battery is None and os.path.exists(capacity):
+                    battery = capacity
+                    battery_files = _battery_files(supply)
+            elif os.path.exists(os.path.join(supply, "online")):
+                adapters.append(os.path.join(supply, "online"))
+
+        cores: Dict[int, str] = {}
+        cpu_root = os.path.join(sys_root, "devices", "system", "cpu")
+        for path in glob.glob(os.path.join(cpu_root, "cpu[0-9]*", "cpufreq", "scaling_cur_freq")):
+            match = re.search(r"cpu(\d+)", os.path.relpath(path, cpu_root))
+            cores[int(match.group(1))] = path
+        cpu_freq = tuple(cores.get(i) for i in range(max(cores) + 1)) if cores else ()
+
+        return cls(
+            temperature=temperature or _find_temperature(sys_root),
+            battery_capacity=battery,
+            ac_online=tuple(adapters),
+            cpu_freq=cpu_freq,
+            apu_power=_find_power(sys_root),
+            **battery_files,
+        )
+
+
+def _battery_files(supply: str) -> Dict[str, Optional[str]]:
+    """Power and energy files of a battery supply (None where missing)."""
+    def first(*names: str) -> Optional[str]:
+        for name in names:
+            path = os.path.join(supply, name)
+            if os.path.exists(path):
+                return path
+        return None
+
+    return {
+        "battery_power": first("power_now"),
+        "battery_current": first("current_now"),
+        "battery_voltage": first("voltage_now"),
+        "battery_status": first("status"),
+        "battery_energy_full": first("energy_full", "charge_full"),
+    }
+
+
+def _find_power(sys_root: str) -> Optional[str]:
+    """hwmon power input labelled PPT, else amdgpu's, else the first one."""
+    amdgpu = fallback = None
+    for device in sorted(glob.glob(os.path.join(sys_root, "class", "hwmon", "hwmon*"))):
+        name = _read_text(os.path.join(device, "name"))
+        inputs = sorted(glob.glob(os.path.join(device, "power*_average")) +
+                        glob.glob(os.path.join(device, "power*_input")))
+        for power_file in inputs:
+            label = _read_text(re.sub(r"_(average|input)$", "_label", power_file)) or ""
+            if "ppt" in label.lower():
+                return power_file
+            if amdgpu is None and name == "amdgpu":
+                amdgpu = power_file
+            if fallback is None:
+                fallback = power_file
+    return amdgpu or fallback
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except (OSError, ValueError):
+        return None
+
+
+def _find_temperature(sys_root: str) -> Optional[str]:
+    """hwmon CPU/package/Tctl input, else the first hwmon input, else thermal_zone0."""
+    fallback = None
+    for device in sorted(glob.glob(os.path.join(sys_root, "class", "hwmon", "hwmon*"))):
+        for temp_file in sorted(glob.glob(os.path.join(device, "temp*_input"))):
+            label = (_read_text(temp_file.replace("_input", "_label")) or "").lower()
+            if "cpu" in label or "package" in label or "tctl" in label:
+                return temp_file
+            if fallback is None and _read_text(temp_file) is not None:
+                fallback = temp_file
+    if fallback is not None:
+        return fallback
+    zone = os.path.join(sys_root, "class", "thermal", "thermal_zone0", "temp")
+    return zone if os.path.exists(zone) else None
+
+
+@dataclass(frozen=True)
+class SensorSnapshot:
+    """Immutable view of the latest sensor values.
+
+    Attributes:
+        timestamp: Hub clock time the snapshot was published
+        temperature_c: APU temperature in °C
+        battery_percent: Battery capacity 0-100
+        ac_online: Whether external power is connected
+        cpu_freq_mhz: Per-core frequency in MHz (None for unread cores)
+        battery_power_w: Battery charge or discharge power in W
+        battery_discharging: Whether the battery is discharging
+        battery_full_wh: Full battery energy in Wh
+        apu_power_w: APU power in W
+        sampled_at: (channel, hub clock time) of each channel's last read
+    """
+    timestamp: float
+    temperature_c: Optional[float] = None
+    battery_percent: Optional[int] = None
+    ac_online: Optional[bool] = None
+    cpu_freq_mhz: Tuple[Optional[float], ...] = ()
+    battery_power_w: Optional[float] = None
+    battery_discharging: Optional[bool] = None
+    battery_full_wh: Optional[float] = None
+    apu_power_w: Optional[float] = None
+    sampled_at: Tuple[Tuple[str, float], ...] = ()
+
+    def age(self, channel: str, now: float) -> float:
+        """Seconds since channel was read (infinite if never)."""
+        for name, read_at in self.sampled_at:
+            if name == channel:
+                return now - read_at
+        return float("inf")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "timestamp": self.timestamp,
+            "temperature_c": self.temperature_c,
+            "battery_percent": self.battery_percent,
+            "ac_online": self.ac_online,
+            "cpu_freq_mhz": list(self.cpu_freq_mhz),
+            "battery_power_w": self.battery_power_w,
+            "battery_discharging": self.battery_discharging,
+            "battery_full_wh": self.battery_full_wh,
+            "apu_power_w": self.apu_power_w,
+        }
+
+
+@dataclass
+class SensorSubscription:
+    """A consumer's demand on the hub.
+
+    Attributes:
+        name: Consumer name (one subscription per name)
+        channels: Channels the consumer reads
+        interval: How often the consumer wants fresh values (seconds)
+        callback: Called with each snapshot that has fresh values for the
+            subscription, at most once per interval
+    """
+    name: str
+    channels: FrozenSet[str]
+    interval: float
+    callback: Optional[Callable[[SensorSnapshot], None]] = None
+    next_due: float = field(default=0.0, compare=False)
+
+
+class SensorHub:
+    """Samples all subscribed sensors in shared passes.
+
+    Reads go through persistent descriptors with pread, so a pass costs
+    one read syscall per file.
+
+    Attributes:
+        paths: Discovered sensor files
+        reads: Sensor file reads since start or reset_stats()
+        passes: Sampling passes since start or reset_stats()
+    """
+
+    def __init__(
+        self,
+        paths: SensorPaths,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the hub.
+
+        Args:
+            paths: Sensor files to read
+            sleep: Coroutine used to wait between passes
+            clock: Monotonic clock in seconds
+        """
+        self.paths = paths
+        self._sleep = sleep
+        self._clock = clock
+        self._subscriptions: Dict[str, SensorSubscription] = {}
+        self._values: Dict[str, Any] = {}
+        self._read_at: Dict[str, float] = {}
+        self._snapshot = SensorSnapshot(timestamp=clock())
+        self._fds: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._changed: Optional[asyncio.Event] = None
+        self.reads = 0
+        self.passes = 0
+        self._stats_since = clock()
+
+    @classmethod
+    def discover(cls, sys_root: str = "/sys", temperature: Optional[str] = None, **kwargs) -> "SensorHub":
+        """Create a hub for the sensors found under sys_root (see SensorPaths.discover)."""
+        return cls(SensorPaths.discover(sys_root, temperature), **kwargs)
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def channels(self) -> Tuple[str, ...]:
+        """Channels with a sensor present."""
+        channels = []
+        if self.paths.temperature:
+            channels.append(TEMPERATURE)
+        if self.paths.battery_capacity:
+            channels.append(BATTERY_PERCENT)
+        if self.paths.ac_online:
+            channels.append(AC_ONLINE)
+        channels.extend(cpu_freq_channel(i) for i, path in enumerate(self.paths.cpu_freq) if path)
+        paths = self.paths
+        if paths.battery_power or (paths.battery_current and paths.battery_voltage):
+            channels.append(BATTERY_POWER)
+        if paths.battery_status:
+            channels.append(BATTERY_DISCHARGING)
+        if paths.battery_energy_full:
+            channels.append(BATTERY_FULL)
+        if paths.apu_power:
+            channels.append(APU_POWER)
+        return tuple(channels)
+
+    # ==================== Subscriptions ====================
+
+    def subscribe(
+        self,
+        name: str,
+        channels: Iterable[str],
+        interval: float,
+        callback: Optional[Callable[[SensorSnapshot], None]] = None
+    ) -> SensorSubscription:
+        """Register or replace a consumer's demand.
+
+        Args:
+            name: Consumer name; subscribing again replaces the demand
+            channels: Channels the consumer reads
+            interval: Desired sampling interval in seconds
+            callback: Optional push callback receiving snapshots
+
+        Returns:
+            The subscription
+
+        Raises:
+            ValueError: If interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        previous = self._subscriptions.get(name)
+        subscription = SensorSubscription(
+            name, frozenset(channels), max(MIN_INTERVAL, interval), callback,
+            next_due=previous.next_due if previous is not None else 0.0
+        )
+        self._subscriptions[name] = subscription
+        if previous is None or previous.interval != subscription.interval or previous.channels != subscription.channels:
+            self._wake()
+        return subscription
+
+    def unsubscribe(self, name: str) -> None:
+        """Remove a consumer's demand."""
+        if self._subscriptions.pop(name, None) is not None:
+            self._wake()
+
+    def channel_intervals(self) -> Dict[str, float]:
+        """Sampling interval of each subscribed channel (max of demands)."""
+        intervals: Dict[str, float] = {}
+        for subscription in self._subscriptions.values():
+            for channel in subscription.channels:
+                intervals[channel] = min(intervals.get(channel, subscription.interval), subscription.interval)
+        return intervals
+
+    def _wake(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+
+    # ==================== Sampling ====================
+
+    def latest(self, channels: Optional[Iterable[str]] = None, max_age: Optional[float] = None) -> SensorSnapshot:
+        """Current snapshot, re-reading requested channels older than max_age.
+
+        Args:
+            channels: Channels the caller needs (default: none re-read)
+            max_age: Staleness tolerance in seconds (None: any age, but
+                read channels that were never sampled)
+
+        Returns:
+            The latest snapshot
+        """
+        if channels is not None:
+            now = self._clock()
+            stale = [
+                c for c in channels
+                if c not in self._read_at or (max_age is not None and now - self._read_at[c] > max_age)
+            ]
+            if stale:
+                self.sample(stale)
+        return self._snapshot
+
+    def read_temperature(self) -> Optional[float]:
+        """Temperature in °C, read at most once per pass interval.
+
+        Lets the hub stand in for HwmonInterface as a ThermalPacer or
+        IronSeeker sensor.
+        """
+        return self.latest((TEMPERATURE,), max_age=MIN_INTERVAL).temperature_c
+
+    def sample(self, channels: Iterable[str]) -> SensorSnapshot:
+        """Read channels in one pass and publish a new snapshot.
+
+        Args:
+            channels: Channels to read
+
+        Returns:
+            The new snapshot
+        """
+        now = self._clock()
+        for channel in set(channels):
+            self._values[channel] = self._read_channel(channel)
+            self._read_at[channel] = now
+        self.passes += 1
+
+        cores = len(self.paths.cpu_freq)
+        self._snapshot = SensorSnapshot(
+            timestamp=now,
+            temperature_c=self._values.get(TEMPERATURE),
+            battery_percent=self._values.get(BATTERY_PERCENT),
+            ac_online=self._values.get(AC_ONLINE),
+            cpu_freq_mhz=tuple(self._values.get(cpu_freq_channel(i)) for i in range(cores)),
+            battery_power_w=self._values.get(BATTERY_POWER),
+            battery_discharging=self._values.get(BATTERY_DISCHARGING),
+            battery_full_wh=self._values.get(BATTERY_FULL),
+            apu_power_w=self._values.get(APU_POWER),
+            sampled_at=tuple(sorted(self._read_at.items())),
+        )
+        return self._snapshot
+
+    def _read_channel(self, channel: str) -> Any:
+        """Read and convert one channel, None when unavailable."""
+        paths = self.paths
+        if channel == TEMPERATURE:
+            value = self._read_int(paths.temperature)
+            return value / 1000.0 if value is not None else None
+        if channel == BATTERY_PERCENT:
+            value = self._read_int(paths.battery_capacity)
+            return max(0, min(100, value)) if value is not None else None
+        if channel == AC_ONLINE:
+            states = [self._read_int(path) for path in paths.ac_online]
+            if all(state is None for state in states):
+                return None
+            return any(state == 1 for state in states)
+        if channel == BATTERY_POWER:
+            value = self._read_int(paths.battery_power)
+            if value is not None:
+                return abs(value) / 1e6
+            current = self._read_int(paths.battery_current)
+            voltage = self._read_int(paths.battery_voltage) if current is not None else None
+            return abs(current) * voltage / 1e12 if voltage is not None else None
+        if channel == BATTERY_DISCHARGING:
+            status = self._read_str(paths.battery_status)
+            return status == "Discharging" if status is not None else None
+        if channel == BATTERY_FULL:
+            path = paths.battery_energy_full
+            value = self._read_int(path)
+            if value is None:
+                return None
+            if os.path.basename(path).startswith("charge_"):
+                voltage = self._read_int(paths.battery_voltage)  # µAh × µV
+                return value * voltage / 1e12 if voltage is not None else None
+            return value / 1e6
+        if channel == APU_POWER:
+            value = self._read_int(paths.apu_power)
+            return value / 1e6 if value is not None else None
+        match = re.fullmatch(r"cpu(\d+)_freq", channel)
+        if match and int(match.group(1)) < len(paths.cpu_freq):
+            value = self._read_int(paths.cpu_freq[int(match.group(1))])
+            return value / 1000.0 if value is not None else None
+        return None
+
+    def _read_int(self, path: Optional[str]) -> Optional[int]:
+        text = self._read_str(path)
+        try:
+            return int(text) if text is not None else None
+        except ValueError:
+            return None
+
+    def _read_str(self, path: Optional[str]) -> Optional[str]:
+        if path is None:
+            return None
+        self.reads += 1
+        try:
+            fd = self._fds.get(path)
+            if fd is None:
+                fd = os.open(path, os.O_RDONLY | getattr(os, "O_CLOEXEC", 0))
+                self._fds[path] = fd
+            return os.pread(fd, 32, 0).decode("ascii", "replace").strip()
+        except OSError:
+            # Device may have gone away; reopen on the next read
+            self._close_fd(path)
+            return None
+
+    def _close_fd(self, path: str) -> None:
+        fd = self._fds.pop(path, None)
+        if fd is not None:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Close all persistent sensor file descriptors."""
+        for path in list(getattr(self, "_fds", {})):
+            self._close_fd(path)
+
+    # ==================== Loop ====================
+
+    def start(self) -> None:
+        """Start sampling subscribed channels in the background."""
+        if self._task is not None and not self._task.done():
+            return
+        self._changed = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the background sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def is_running(self) -> bool:
+        """Check if the background sampling is active."""
+        return self._task is not None and not self._task.done()
+
+    def _due(self, now: float) -> Tuple[List[str], Optional[float]]:
+        """Channels due now, and the time the next channel falls due."""
+        due = []
+        next_time = None
+        for channel, interval in self.channel_intervals().items():
+            read_at = self._read_at.get(channel)
+            at = now if read_at is None else read_at + interval
+            if at - now <= interval * BATCH_FRACTION:
+                due.append(channel)
+                at = now + interval
+            next_time = at if next_time is None else min(next_time, at)
+        return due, next_time
+
+    def _notify(self, now: float) -> None:
+        """Push the snapshot to callbacks whose interval has elapsed."""
+        for subscription in list(self._subscriptions.values()):
+            if subscription.callback is None or now < subscription.next_due - subscription.interval * BATCH_FRACTION:
+                continue
+            subscription.next_due = now + subscription.interval
+            try:
+                subscription.callback(self._snapshot)
+            except Exception as e:
+                logger.error(f"Sensor subscriber {subscription.name} failed: {e}")
+
+    async def _run(self) -> None:
+        """Sample due channels, publish, and sleep until the next is due."""
+        while True:
+            try:
+                now = self._clock()
+                due, next_time = self._due(now)
+                if due:
+                    self.sample(due)
+                self._notify(now)
+
+                if next_time is None:
+                    # Nothing subscribed: wait for a subscription
+                    self._changed.clear()
+                    await self._changed.wait()
+                    continue
+
+                self._changed.clear()
+                sleep = asyncio.ensure_future(self._sleep(max(MIN_INTERVAL, next_time - self._clock())))
+                changed = asyncio.ensure_future(self._changed.wait())
+                try:
+                    await asyncio.wait({sleep, changed}, return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    sleep.cancel()
+                    changed.cancel()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Sensor hub error: {e}")
+                await self._sleep(1.0)
+
+    # ==================== Statistics ====================
+
+    def reset_stats(self) -> None:
+        """Restart the read and pass counters."""
+        self.reads = 0
+        self.passes = 0
+        self._stats_since = self._clock()
+
+    def reads_per_second(self) -> float:
+        """Sensor file reads per second since start or reset_stats()."""
+        elapsed = self._clock() - self._stats_since
+        return self.reads / elapsed if elapsed > 0 else 0.0
+
+    def get_status(self) -> Dict[str, Any]:
+        """Hub state for diagnostics.
+
+        Returns:
+            Dictionary with channels, per-channel intervals, subscribers,
+            read counters and the latest snapshot
+        """
+        return {
+            "running": self.is_running(),
+            "channels": list(self.channels),
+            "channel_intervals": self.channel_intervals(),
+            "subscribers": {
+                s.name: {"channels": sorted(s.channels), "interval": s.interval}
+                for s in self._subscriptions.values()
+            },
+            "reads": self.reads,
+            "passes": self.passes,
+            "reads_per_second": round(self.reads_per_second(), 3),
+            "snapshot": self._snapshot.to_dict(),
+        }
@@ -0,0 +1,178 @@
+"""Linux kernel uevent listener for event-driven device state changes.
+
+This module subscribes to kernel object uevents (NETLINK_KOBJECT_UEVENT)
+so that device changes such as AC adapter plug/unplug and battery capacity
+steps are delivered as they happen, instead of being discovered by
+periodically reading sysfs.
+
+Feature: decktune-3.0-automation
+Validates: Requirements 1.3, 1.4
+
+# Permissions
+
+Kernel uevents are multicast on netlink group 1 and can be received by
+any process on most kernels. When the socket cannot be opened (non-Linux,
+restricted sandbox), open() returns False and callers fall back to polling.
+
+# Wire Format
+
+Each kernel uevent datagram is a sequence of NUL-terminated strings:
+
+    change@/devices/.../power_supply/ADP1
+    ACTION=change
+    DEVPATH=/devices/.../power_supply/ADP1
+    SUBSYSTEM=power_supply
+    POWER_SUPPLY_NAME=ADP1
+    POWER_SUPPLY_ONLINE=1
+    SEQNUM=4242
+
+Messages re-broadcast by udev start with "libudev" and use a binary
+header; they are on a different multicast group and are ignored here.
+"""
+
+import logging
+import socket
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Netlink constants (linux/netlink.h)
+NETLINK_KOBJECT_UEVENT = 15
+UEVENT_GROUP_KERNEL = 1
+
+# Kernel uevents can carry a few KB of environment
+_RECV_SIZE = 16384
+
+
+def parse_uevent(data: bytes) -> Optional[Dict[str, str]]:
+    """Parse a kernel uevent datagram into its properties.
+
+    Args:
+        data: Raw datagram received from the uevent socket
+
+    Returns:
+        Dictionary of KEY=VALUE properties (ACTION, DEVPATH and SUBSYSTEM
+        are always present), or None for udev or malformed messages
+    """
+    if data.startswith(b"libudev"):
+        return None
+
+    parts = data.decode("utf-8", errors="replace").split("\x00")
+    header = parts[0]
+    if "@" not in header:
+        return None
+
+    action, devpath = header.split("@", 1)
+    properties: Dict[str, str] = {"ACTION": action, "DEVPATH": devpath}
+
+    for part in parts[1:]:
+        if "=" in part:
+            key, value = part.split("=", 1)
+            properties[key] = value
+
+    if "SUBSYSTEM" not in properties:
+        return None
+
+    return properties
+
+
+class UeventListener:
+    """Non-blocking subscriber to kernel uevents.
+
+    The listener exposes a file descriptor so it can be registered with
+    ``loop.add_reader``; read_events() then drains all pending uevents.
+    """
+
+    def __init__(self, subsystem: Optional[str] = None):
+        """Initialize the listener without opening the socket.
+
+        Args:
+            subsystem: Only return uevents of this subsystem (e.g.
+                "power_supply"); None returns all uevents
+        """
+        self.subsystem = subsystem
+        self._sock: Optional[socket.socket] = None
+
+    def is_open(self) -> bool:
+        """Check if the uevent socket is open.
+
+        Returns:
+            True if uevents are being received, False otherwise
+        """
+        return self._sock is not None
+
+    def open(self) -> bool:
+        """Open the uevent socket and join the kernel multicast group.
+
+        Returns:
+            True on success, False if uevents are unavailable
+        """
+        if self._sock is not None:
+            return True
+
+        af_netlink = getattr(socket, "AF_NETLINK", None)
+        if af_netlink is None:
+            logger.debug("AF_NETLINK not supported on this platform")
+            return False
+
+        sock = None
+        try:
+            sock = socket.socket(af_netlink, socket.SOCK_DGRAM, NETLINK_KOBJECT_UEVENT)
+            sock.bind((0, UEVENT_GROUP_KERNEL))
+            sock.setblocking(False)
+        except OSError as e:
+            logger.info(f"Kernel uevents unavailable, falling back to polling: {e}")
+            if sock is not None:
+                sock.close()
+            return False
+
+        self._sock = sock
+        logger.info("Subscribed to kernel uevents")
+        return True
+
+    def close(self) -> None:
+        """Close the uevent socket."""
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def fileno(self) -> int:
+        """Get the socket file descriptor for event loop registration.
+
+        Returns:
+            File descriptor, or -1 if the listener is not open
+        """
+        return self._sock.fileno() if self._sock is not None else -1
+
+    def read_events(self) -> List[Dict[str, str]]:
+        """Drain all pending uevents without blocking.
+
+        Returns:
+            List of uevent property dictionaries in arrival order
+        """
+        events: List[Dict[str, str]] = []
+        if self._sock is None:
+            return events
+
+        while True:
+            try:
+                data = self._sock.recv(_RECV_SIZE)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError as e:
+                # ENOBUFS means the kernel dropped events; keep what we have
+                logger.debug(f"Uevent receive error: {e}")
+                break
+
+            if not data:
+                break
+
+            event = parse_uevent(data)
+            if event is None:
+                continue
+            if self.subsystem is not None and event.get("SUBSYSTEM") != self.subsystem:
+                continue
+            events.append(event)
+
+        return events
@@ -3,22 +3,298 @@
 Feature: decktune-3.0-automation, Benchmark Module
 Validates: Requirements 7.1, 7.2, 7.3, 7.5
 
-Provides quick performance benchmarking using stress-ng matrix operations.
+Provides quick performance benchmarking using stress-ng matrix operations,
+and a benchmark suite that runs several workload classes repeatedly and
+reports each as a mean with a 95% confidence interval.
+
+# Suite Statistics
+
+Each workload runs warmup + trials times; warm-up runs (cold caches,
+frequency ramp-up) are discarded. From the n trial scores x:
+
+    mean = sum(x) / n
+    stdev = sqrt(sum((x - mean)^2) / (n - 1))
+    ci95 = mean +/- t(0.975, n - 1) * stdev / sqrt(n)
+
+Two suites are compared per workload with Welch's t-test, which does not
+assume equal variances; a difference is significant when |t| exceeds the
+two-sided 95% critical value at the Welch-Satterthwaite degrees of
+freedom.
+
+Scores are bogo ops/s (real time), read from the stress-ng --yaml metrics
+file, else from the --metrics-brief table.
 """
 
 import asyncio
+import math
+import os
 import re
+import statistics
+import tempfile
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence
 
-from backend.tuning.runner import TestRunner, _get_binary_path
+from backend.tuning.runner import TestRunner, get_binary_path
 
 
 # Benchmark duration in seconds
 BENCHMARK_DURATION = 10
 
+# Suite trial duration in seconds
+SUITE_TRIAL_DURATION = 5
+
+# Measured trials and discarded warm-up runs per suite workload
+DEFAULT_TRIALS = 5
+DEFAULT_WARMUP = 1
+
+# Suite workload classes: stress-ng stressor arguments
+WORKLOADS: Dict[str, List[str]] = {
+    "integer": ["--cpu", "0", "--cpu-method", "int64"],
+    "float": ["--matrix", "0"],
+    "memory": ["--stream", "0"],
+    "cache": ["--cache", "0"],
+    "mixed": ["--cpu", "0", "--cpu-method", "all"],
+}
+
+# Two-sided 95% critical values of Student's t for 1-30 degrees of freedom
+_T_CRITICAL_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+
+# YAML key of the score in the stress-ng metrics section
+_YAML_SCORE_KEY = "bogo-ops-per-second-real-time"
+
+
+def t_critical(df: float) -> float:
+    """Two-sided 95% critical value of Student's t.
+    
+    Fractional degrees of freedom are rounded down (conservative).
+    
+    Args:
+        df: Degrees of freedom (>= 1)
+        
+    Returns:
+        Critical value; the normal 1.96 beyond the table
+    """
+    index = int(math.floor(df))
+    if index < 1:
+        return math.inf
+    if index <= len(_T_CRITICAL_95):
+        return _T_CRITICAL_95[index - 1]
+    return 1.96
+
+
+def parse_yaml_metrics(text: str) -> Optional[float]:
+    """Total bogo ops/s (real time) from a stress-ng --yaml metrics file.
+    
+    Reads the entries of the top-level "metrics:" list, e.g.
+    
+        metrics:
+            - stressor: matrix
+              bogo-ops: 1234567
+              bogo-ops-per-second-real-time: 123456.7
+    
+    Args:
+        text: Contents of the YAML file
+        
+    Returns:
+        Sum over stressors, or None if no metrics were found
+    """
+    in_metrics = False
+    scores: List[float] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if not line[0].isspace():
+            # Top-level key or document marker
+            in_metrics = stripped == "metrics:"
+            continue
+        if not in_metrics:
+            continue
+        
+        key, sep, value = stripped.lstrip("- ").partition(":")
+        if sep and key.strip() == _YAML_SCORE_KEY:
+            try:
+                scores.append(float(value.strip()))
+            except ValueError:
+                return None
+    return sum(scores) if scores else None
+
+
+def parse_metrics_brief(output: str) -> Optional[float]:
+    """Total bogo ops/s (real time) from the stress-ng --metrics-brief table.
+    
+    Example row (after the "stressor bogo ops real time ..." header):
+    stress-ng: metrc: [12345] matrix  1234567  10.00  39.98  0.01  123456.70  30873.26
+    
+    Args:
+        output: stress-ng stdout/stderr output
+        
+    Returns:
+        Sum over stressors, or None if the table was not found
+    """
+    scores: List[float] = []
+    for line in output.splitlines():
+        if "]" not in line:
+            continue
+        fields = line.split("]", 1)[1].split()
+        if len(fields) != 7:
+            continue
+        try:
+            values = [float(f) for f in fields[1:]]
+        except ValueError:
+            continue
+        scores.append(values[4])
+    return sum(scores) if scores else None
+
+
+@dataclass
+class WorkloadStats:
+    """Repeated-trial statistics of one suite workload.
+    
+    Attributes:
+        workload: Workload class name (key of WORKLOADS)
+        scores: Trial scores in bogo ops/s, warm-up runs excluded
+        mean: Mean score
+        stdev: Sample standard deviation (0 for a single trial)
+        ci_low: Lower edge of the 95% confidence interval of the mean
+        ci_high: Upper edge of the 95% confidence interval of the mean
+    """
+    workload: str
+    scores: List[float]
+    mean: float
+    stdev: float
+    ci_low: float
+    ci_high: float
+    
+    @classmethod
+    def from_scores(cls, workload: str, scores: Sequence[float]) -> "WorkloadStats":
+        """Summarize trial scores.
+        
+        Raises:
+            ValueError: If scores is empty
+        """
+        if not scores:
+            raise ValueError(f"No scores for workload {workload}")
+        mean = statistics.fmean(scores)
+        stdev = statistics.stdev(scores) if len(scores) > 1 else 0.0
+        half_width = t_critical(len(scores) - 1) * stdev / math.sqrt(len(scores)) if stdev > 0 else 0.0
+        return cls(workload, list(scores), mean, stdev, mean - half_width, mean + half_width)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "workload": self.workload,
+            "scores": self.scores,
+            "mean": self.mean,
+            "stdev": self.stdev,
+            "ci_low": self.ci_low,
+            "ci_high": self.ci_high
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkloadStats":
+        """Create WorkloadStats from dictionary."""
+        return cls.from_scores(data["workload"], data["scores"])
+
+
+@dataclass
+class BenchmarkSuiteResult:
+    """Result of a benchmark suite run.
+    
+    Attributes:
+        workloads: Statistics per workload class
+        duration: Total suite duration in seconds
+        cores_used: Undervolt values during the suite (mV)
+        timestamp: ISO timestamp of suite execution
+        trials: Measured trials per workload
+        warmup: Discarded warm-up runs per workload
+    """
+    workloads: Dict[str, WorkloadStats] = field(default_factory=dict)
+    duration: float = 0.0
+    cores_used: List[int] = field(default_factory=lambda: [0, 0, 0, 0])
+    timestamp: str = ""
+    trials: int = DEFAULT_TRIALS
+    warmup: int = DEFAULT_WARMUP
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "workloads": {name: stats.to_dict() for name, stats in self.workloads.items()},
+            "duration": self.duration,
+            "cores_used": self.cores_used,
+            "timestamp": self.timestamp,
+            "trials": self.trials,
+            "warmup": self.warmup
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkSuiteResult":
+        """Create BenchmarkSuiteResult from dictionary."""
+        return cls(
+            workloads={name: WorkloadStats.from_dict(w) for name, w in data.get("workloads", {}).items()},
+            duration=data.get("duration", 0.0),
+            cores_used=data.get("cores_used", [0, 0, 0, 0]),
+            timestamp=data.get("timestamp", ""),
+            trials=data.get("trials", DEFAULT_TRIALS),
+            warmup=data.get("warmup", DEFAULT_WARMUP)
+        )
+
+
+def compare_workloads(baseline: WorkloadStats, current: WorkloadStats) -> Dict[str, Any]:
+    """Compare two workload results with Welch's t-test.
+    
+    Args:
+        baseline: Earlier result
+        current: More recent result
+        
+    Returns:
+        Dictionary with:
+            - mean_diff: current.mean - baseline.mean
+            - percent_change: Percentage change from the baseline mean
+            - ci_low, ci_high: 95% confidence interval of mean_diff
+            - t_statistic: Welch's t (None with zero variance in both)
+            - significant: True if the difference is significant at 95%
+            - improvement: True if significant and current is faster
+    """
+    mean_diff = current.mean - baseline.mean
+    percent_change = (mean_diff / baseline.mean) * 100 if baseline.mean else 0.0
+    
+    var_b = baseline.stdev ** 2 / len(baseline.scores)
+    var_c = current.stdev ** 2 / len(current.scores)
+    standard_error = math.sqrt(var_b + var_c)
+    
+    if standard_error > 0:
+        t_statistic = mean_diff / standard_error
+        # Welch-Satterthwaite degrees of freedom
+        df_terms = sum(
+            v ** 2 / (len(r.scores) - 1)
+            for v, r in ((var_b, baseline), (var_c, current)) if v > 0
+        )
+        df = (var_b + var_c) ** 2 / df_terms
+        half_width = t_critical(df) * standard_error
+        significant = abs(t_statistic) > t_critical(df)
+    else:
+        # Both without spread: any difference is systematic
+        t_statistic = None
+        half_width = 0.0
+        significant = mean_diff != 0
+    
+    return {
+        "mean_diff": mean_diff,
+        "percent_change": percent_change,
+        "ci_low": mean_diff - half_width,
+        "ci_high": mean_diff + half_width,
+        "t_statistic": t_statistic,
+        "significant": significant,
+        "improvement": significant and mean_diff > 0
+    }
+
 
 @dataclass
 class BenchmarkResult:
@@ -40,7 +316,8 @@ class BenchmarkRunner:
     """Quick performance benchmarking using stress-ng.
     
     Executes 10-second stress-ng matrix operations and parses
-    the bogo-ops metric for performance comparison.
+    the bogo-ops metric for performance comparison. run_suite() runs
+    every workload class repeatedly for a statistical comparison.
     """
     
     def __init__(self, test_runner: TestRunner):
@@ -70,21 +347,107 @@ class BenchmarkRunner:
         if cores_used is None:
             cores_used = [0, 0, 0, 0]
         
-        # Check if stress-ng is available
-        missing = self._test_runner.get_missing_binaries()
-        if "stress-ng" in missing:
-            raise RuntimeError("stress-ng binary not found")
+        self._check_stress_ng()
         
         start_time = time.time()
         timestamp = datetime.utcnow().isoformat() + "Z"
         
         # Execute stress-ng with matrix workload
-        stress_ng_path = _get_binary_path("stress-ng")
+        score = await self._run_stressor(["--matrix", "0"], BENCHMARK_DURATION)
+        duration = time.time() - start_time
+        
+        return BenchmarkResult(
+            score=score,
+            duration=duration,
+            cores_used=cores_used.copy(),
+            timestamp=timestamp
+        )
+    
+    async def run_suite(
+        self,
+        cores_used: Optional[List[int]] = None,
+        workloads: Optional[Sequence[str]] = None,
+        trials: int = DEFAULT_TRIALS,
+        warmup: int = DEFAULT_WARMUP,
+        trial_duration: int = SUITE_TRIAL_DURATION
+    ) -> BenchmarkSuiteResult:
+        """Run each workload class warmup + trials times.
+        
+        Args:
+            cores_used: Current undervolt values (for recording in result)
+            workloads: Workload classes to run (default: all of WORKLOADS)
+            trials: Measured runs per workload (>= 2 for a spread)
+            warmup: Discarded runs before the trials
+            trial_duration: Seconds per run
+            
+        Returns:
+            BenchmarkSuiteResult with statistics per workload
+            
+        Raises:
+            ValueError: If a workload is unknown or trials < 1
+            RuntimeError: If stress-ng is not available or execution fails
+        """
+        if cores_used is None:
+            cores_used = [0, 0, 0, 0]
+        workloads = list(workloads) if workloads is not None else list(WORKLOADS)
+        unknown = [w for w in workloads if w not in WORKLOADS]
+        if unknown:
+            raise ValueError(f"Unknown workloads: {unknown}")
+        if trials < 1 or warmup < 0:
+            raise ValueError(f"trials must be >= 1 and warmup >= 0, got {trials}, {warmup}")
+        
+        self._check_stress_ng()
+        
+        start_time = time.time()
+        timestamp = datetime.utcnow().isoformat() + "Z"
+        results: Dict[str, WorkloadStats] = {}
+        
+        for workload in workloads:
+            scores = []
+            for run in range(warmup + trials):
+                score = await self._run_stressor(WORKLOADS[workload], trial_duration)
+                if run >= warmup:
+                    scores.append(score)
+            results[workload] = WorkloadStats.from_scores(workload, scores)
+        
+        return BenchmarkSuiteResult(
+            workloads=results,
+            duration=time.time() - start_time,
+            cores_used=cores_used.copy(),
+            timestamp=timestamp,
+            trials=trials,
+            warmup=warmup
+        )
+    
+    def _check_stress_ng(self) -> None:
+        """Raise RuntimeError if stress-ng is not available."""
+        missing = self._test_runner.get_missing_binaries()
+        if "stress-ng" in missing:
+            raise RuntimeError("stress-ng binary not found")
+    
+    async def _run_stressor(self, stressor_args: List[str], duration: int) -> float:
+        """Run stress-ng once and return its bogo ops/s.
+        
+        Args:
+            stressor_args: Stressor arguments (e.g. ["--matrix", "0"])
+            duration: Run time in seconds
+            
+        Returns:
+            Bogo ops per second (real time), summed over stressors
+            
+        Raises:
+            RuntimeError: If execution fails or no score can be parsed
+        """
+        fd, yaml_path = tempfile.mkstemp(prefix="decktune-bench-", suffix=".yaml")
+        os.close(fd)
+        
+        stress_ng_path = get_binary_path("stress-ng")
         command = [
             stress_ng_path,
-            "--matrix", "0",  # Use all available CPUs
-            "--timeout", f"{BENCHMARK_DURATION}s",
-            "--metrics-brief"
+            *stressor_args,
+            "--timeout", f"{duration}s",
+            "--metrics-brief",
+            "--yaml", yaml_path
         ]
         
         try:
@@ -96,32 +459,37 @@ class BenchmarkRunner:
             
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(),
-                timeout=BENCHMARK_DURATION + 5  # Add buffer for startup/shutdown
+                timeout=duration + 5  # Add buffer for startup/shutdown
             )
             
             output = stdout.decode("utf-8", errors="replace")
             if stderr:
                 output += "\n" + stderr.decode("utf-8", errors="replace")
             
-            # Parse bogo ops from output
-            score = self._parse_bogo_ops(output)
+            with open(yaml_path, "r", encoding="utf-8", errors="replace") as f:
+                yaml_text = f.read()
             
+            # Structured output first; the text line for old stress-ng builds
+            score = parse_yaml_metrics(yaml_text)
             if score is None:
-                raise RuntimeError(f"Failed to parse benchmark score from output: {output[:500]}")
+                score = parse_metrics_brief(output)
+            if score is None:
+                score = self._parse_bogo_ops(output)
             
-            duration = time.time() - start_time
+            if score is None:
+                raise RuntimeError(f"Failed to parse benchmark score from output: {output[:500]}")
             
-            return BenchmarkResult(
-                score=score,
-                duration=duration,
-                cores_used=cores_used.copy(),
-                timestamp=timestamp
-            )
+            return score
             
         except asyncio.TimeoutError:
-            raise RuntimeError(f"Benchmark timed out after {BENCHMARK_DURATION + 5} seconds")
+            raise RuntimeError(f"Benchmark timed out after {duration + 5} seconds")
         except Exception as e:
             raise RuntimeError(f"Benchmark execution failed: {str(e)}")
+        finally:
+            try:
+                os.unlink(yaml_path)
+            except OSError:
+                pass
     
     def _parse_bogo_ops(self, output: str) -> Optional[float]:
         """Parse bogo ops/s from stress-ng output.
@@ -175,3 +543,24 @@ class BenchmarkRunner:
             "percent_change": percent_change,
             "improvement": improvement
         }
+    
+    def compare_suites(
+        self,
+        baseline: BenchmarkSuiteResult,
+        current: BenchmarkSuiteResult
+    ) -> Dict[str, Dict[str, Any]]:
+        """Compare two suite results per workload.
+        
+        Args:
+            baseline: Earlier suite result
+            current: More recent suite result
+            
+        Returns:
+            Mapping workload -> compare_workloads() result, for the
+            workloads present in both
+        """
+        return {
+            name: compare_workloads(baseline.workloads[name], stats)
+            for name, stats in current.workloads.items()
+            if name in baseline.workloads
+        }
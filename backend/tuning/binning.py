@@ -11,16 +11,25 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import List, Optional, TYPE_CHECKING
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+from .knowledge_base import ALL_CORES
+from .sequential_test import SequentialDurationPolicy
+from .stability_model import StabilityModel
+from .thermal_pacing import ThermalPacer
 
 if TYPE_CHECKING:
     from ..core.ryzenadj import RyzenadjWrapper
     from ..core.safety import SafetyManager
     from ..api.events import EventEmitter
+    from .knowledge_base import StabilityKnowledgeBase
     from .runner import TestRunner
 
 logger = logging.getLogger(__name__)
 
+# Search strategies accepted by BinningConfig.strategy
+BINNING_STRATEGIES = ("linear", "bayesian")
+
 
 @dataclass
 class BinningConfig:
@@ -32,12 +41,34 @@ class BinningConfig:
         test_duration: Test duration per iteration in seconds (typically 60)
         max_iterations: Safety limit for maximum iterations (typically 20)
         consecutive_fail_limit: Abort after N consecutive failures (typically 3)
+        adaptive_duration: Choose each test's duration with a sequential
+            probability ratio test, with test_duration as the base (see
+            SequentialDurationPolicy)
+        false_pass_rate: Accepted probability that a passed value is
+            unstable (adaptive_duration only)
+        thermal_pacing: Cool down before each test so it starts in the
+            target temperature band (see ThermalPacer)
+        strategy: "linear" (step down from start_value until the first
+            failure) or "bayesian" (probabilistic model over
+            [safe_limit, 0], see StabilityModel; start_value is not used)
+        risk_level: Acceptable failure probability ("bayesian" only)
+        confidence_target: Required confidence that the risk level is met
+            ("bayesian" only)
+        min_information: Stop once no offset is expected to yield this
+            many bits ("bayesian" only)
     """
     start_value: int = -10  # Starting undervolt (mV)
     step_size: int = 5      # Step increment (mV)
     test_duration: int = 60 # Test duration per iteration (seconds)
     max_iterations: int = 20 # Safety limit
     consecutive_fail_limit: int = 3  # Abort after N consecutive failures
+    adaptive_duration: bool = False  # Sequential stopping rule for test durations
+    false_pass_rate: float = 0.01  # Accepted P(unstable | passed)
+    thermal_pacing: bool = False  # Cool down between tests
+    strategy: str = "linear"  # "linear" or "bayesian"
+    risk_level: float = 0.05  # Accepted P(fail) of the result ("bayesian" only)
+    confidence_target: float = 0.9  # Required confidence in risk_level ("bayesian" only)
+    min_information: float = 0.05  # Bits a test must be worth ("bayesian" only)
 
 
 @dataclass
@@ -94,6 +125,9 @@ class BinningEngine:
     5. Aborts after max_iterations or consecutive_fail_limit
     6. Returns recommended value with 5mV safety margin
     
+    With strategy "bayesian", steps 1 and 3 are replaced by a model-guided
+    search (see _bayesian_search).
+    
     Requirements: 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 2.1, 2.2, 2.3, 2.4, 2.5, 2.6
     """
     
@@ -123,6 +157,25 @@ class BinningEngine:
         self._cancelled: bool = False
         self._config: Optional[BinningConfig] = None
         self._previous_values: Optional[List[int]] = None
+        self._knowledge_base: Optional["StabilityKnowledgeBase"] = None
+        self._duration_policy: Optional[SequentialDurationPolicy] = None
+        self._thermal_pacer: Optional[ThermalPacer] = None
+    
+    def set_knowledge_base(self, knowledge_base: "StabilityKnowledgeBase") -> None:
+        """Set the stability knowledge base consulted before each test.
+        
+        Args:
+            knowledge_base: Shared StabilityKnowledgeBase instance
+        """
+        self._knowledge_base = knowledge_base
+    
+    def set_thermal_pacer(self, pacer: ThermalPacer) -> None:
+        """Set the pacer used when thermal_pacing is enabled.
+        
+        Args:
+            pacer: ThermalPacer (default: one reading the hwmon CPU sensor)
+        """
+        self._thermal_pacer = pacer
     
     def is_running(self) -> bool:
         """Check if binning is active.
@@ -215,6 +268,21 @@ class BinningEngine:
         # Get platform safe limit
         safe_limit = self.safety.platform.safe_limit
         
+        if config.thermal_pacing and self._thermal_pacer is None:
+            self._thermal_pacer = ThermalPacer()
+        
+        self._duration_policy = None
+        if config.adaptive_duration:
+            self._duration_policy = SequentialDurationPolicy(
+                config.test_duration, config.false_pass_rate,
+                offset_min=safe_limit - config.step_size
+            )
+            self._duration_policy.seed(ALL_CORES, last_stable, None)
+            if self._knowledge_base is not None:
+                self._duration_policy.seed(
+                    ALL_CORES, *self._knowledge_base.bracket(ALL_CORES, "combo", config.test_duration)
+                )
+        
         logger.info(f"Starting binning: start={config.start_value}, step={config.step_size}, "
                    f"duration={config.test_duration}s, safe_limit={safe_limit}")
         
@@ -222,7 +290,10 @@ class BinningEngine:
             # Generate test sequence: start_value, start_value - step, start_value - 2*step, ...
             current_value = config.start_value
             
-            while iteration < config.max_iterations:
+            if config.strategy == "bayesian":
+                last_stable, iteration, aborted = await self._bayesian_search(config, safe_limit, failed_values)
+            
+            while config.strategy == "linear" and iteration < config.max_iterations:
                 # Check for cancellation
                 if self._cancelled:
                     logger.info("Binning cancelled by user")
@@ -287,7 +358,7 @@ class BinningEngine:
                     break
             
             # Check if we hit max iterations
-            if iteration >= config.max_iterations:
+            if config.strategy == "linear" and iteration >= config.max_iterations:
                 logger.warning(f"Binning reached max iterations: {config.max_iterations}")
                 aborted = True
             
@@ -322,7 +393,98 @@ class BinningEngine:
                 logger.info(f"Restoring previous values: {self._previous_values}")
                 await self.ryzenadj.apply_values_async(self._previous_values)
     
-    async def _run_iteration(self, value: int, config: BinningConfig) -> bool:
+    async def _bayesian_search(
+        self,
+        config: BinningConfig,
+        safe_limit: int,
+        failed_values: List[int]
+    ) -> Tuple[int, int, bool]:
+        """Model-guided search for the all-core limit (strategy "bayesian").
+        
+        A StabilityModel over [safe_limit, 0] picks the most informative
+        offset for each test, so one spurious pass or failure shifts the
+        result by a step instead of ending the search on the wrong value.
+        The result is the most aggressive offset that fails with at most
+        risk_level probability with confidence_target confidence. State is
+        persisted before each test as in the linear search. The search
+        aborts after consecutive_fail_limit failures before any pass.
+        
+        Args:
+            config: BinningConfig with test parameters
+            safe_limit: Platform safe limit in mV
+            failed_values: List of failed values, extended in place
+            
+        Returns:
+            Tuple of (max stable value, iterations run, aborted)
+        """
+        model = StabilityModel(safe_limit, 0)
+        if self._knowledge_base is not None:
+            # Seed the model with earlier evidence
+            passes, failures = self._knowledge_base.matching(ALL_CORES, "combo", config.test_duration)
+            for observation in passes + failures:
+                model.update(observation.offset, observation.passed)
+        
+        def recommended() -> int:
+            return model.recommend(config.risk_level, config.confidence_target, config.step_size).offset
+        
+        iteration = 0
+        # Failures past a passed value only bracket the limit; the abort
+        # counts failures before the first pass (None once one passed)
+        consecutive_failures: Optional[int] = 0
+        
+        while iteration < config.max_iterations:
+            if self._cancelled:
+                logger.info("Binning cancelled by user")
+                return recommended(), iteration, True
+            
+            value = model.next_offset(config.risk_level, config.step_size)
+            gain = model.information_gain(value, config.risk_level)
+            if gain < config.min_information:
+                logger.info(f"Binning converged ({gain:.3f} bits left at {value}mV)")
+                break
+            
+            iteration += 1
+            last_stable = recommended()
+            self.safety.update_binning_state(
+                current_value=value,
+                last_stable=last_stable,
+                iteration=iteration,
+                failed_values=failed_values
+            )
+            await self.event_emitter.emit_binning_progress(
+                current_value=value,
+                iteration=iteration,
+                last_stable=last_stable,
+                eta=(config.max_iterations - iteration) * config.test_duration,
+                max_iterations=config.max_iterations
+            )
+            
+            logger.info(f"Binning iteration {iteration}: testing value {value} ({gain:.3f} bits)")
+            # Repeated tests carry information here, so never skip them
+            passed = await self._run_iteration(
+                value, config, consult=False, p_unstable=model.predictive_p_fail(value)
+            )
+            model.update(value, passed)
+            
+            if passed:
+                consecutive_failures = None
+            else:
+                failed_values.append(value)
+                if consecutive_failures is not None:
+                    consecutive_failures += 1
+                    if consecutive_failures >= config.consecutive_fail_limit:
+                        logger.warning(f"Aborting: {consecutive_failures} failures without a pass")
+                        return recommended(), iteration, True
+        
+        return recommended(), iteration, False
+    
+    async def _run_iteration(
+        self,
+        value: int,
+        config: BinningConfig,
+        consult: bool = True,
+        p_unstable: Optional[float] = None
+    ) -> bool:
         """Run single test iteration with detailed diagnostics.
         
         Applies the test value to all cores and runs a stress test for the
@@ -331,6 +493,10 @@ class BinningEngine:
         Args:
             value: Undervolt value to test (in mV)
             config: BinningConfig with test parameters
+            consult: Whether a settled knowledge base result may replace
+                the test
+            p_unstable: Probability that the value is unstable, if the
+                caller has a better estimate than the duration policy
             
         Returns:
             True if test passed, False otherwise
@@ -342,6 +508,21 @@ class BinningEngine:
         """
         logger.info(f"Starting iteration for value {value}mV")
         
+        if self._knowledge_base is not None and consult:
+            known = self._knowledge_base.lookup(ALL_CORES, value, "combo", config.test_duration)
+            if known is not None:
+                logger.info(f"Skipping test of {value}mV: known {'stable' if known else 'unstable'}")
+                return known
+        
+        duration = config.test_duration
+        if self._duration_policy is not None:
+            duration = self._duration_policy.duration_for(ALL_CORES, value, p_unstable)
+        
+        # Cool down at the last tested value, before the new one is applied
+        paced_start = None
+        if config.thermal_pacing and self._thermal_pacer is not None:
+            paced_start = await self._thermal_pacer.wait_for_start(duration)
+        
         # Step 1: Apply value to all cores
         test_values = [value] * 4
         logger.debug(f"Applying undervolt values: {test_values}")
@@ -361,16 +542,37 @@ class BinningEngine:
         logger.debug("Undervolt applied, proceeding to stress test")
         
         # Step 3: Run stress test (combo test for CPU + memory)
-        logger.info(f"Starting stress test for value {value}mV (duration: {config.test_duration}s)")
+        logger.info(f"Starting stress test for value {value}mV (duration: {duration}s)")
         
         try:
-            test_result = await self.runner.run_test("combo")
+            if self._duration_policy is not None:
+                test = self.runner.run_test("combo", duration=duration)
+            else:
+                test = self.runner.run_test("combo")
+            
+            temperature = peak_temperature = None
+            if paced_start is not None:
+                test_result, paced_run = await self._thermal_pacer.track(duration, test, *paced_start)
+                temperature, peak_temperature = paced_run.start_temp, paced_run.peak_temp
+            else:
+                test_result = await test
             
             if test_result.passed:
                 logger.info(f"Stress test PASSED for value {value}mV")
             else:
                 logger.warning(f"Stress test FAILED for value {value}mV: {test_result.error or 'Unknown error'}")
             
+            if self._duration_policy is not None:
+                self._duration_policy.record(
+                    ALL_CORES, value, test_result.passed,
+                    getattr(test_result, "time_to_failure", None), duration
+                )
+            if self._knowledge_base is not None:
+                self._knowledge_base.record(
+                    ALL_CORES, value, "combo", duration, test_result.passed,
+                    temperature=temperature, peak_temperature=peak_temperature
+                )
+            
             return test_result.passed
             
         except Exception as e:
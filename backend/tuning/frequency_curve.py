@@ -10,6 +10,8 @@ from typing import List, Dict, Optional, Any
 import json
 from pathlib import Path
 
+from ..core.curve import PiecewiseLinearCurve
+
 
 @dataclass
 class FrequencyPoint:
@@ -50,7 +52,9 @@ class FrequencyCurve:
     
     Attributes:
         core_id: CPU core identifier
-        points: List of frequency-voltage points (must be sorted by frequency)
+        points: List of frequency-voltage points (must be sorted by frequency).
+            Assign a new list to change the curve; the compiled curve is
+            cached and only rebuilt when points is assigned.
         created_at: Unix timestamp when curve was created
         wizard_config: Configuration used to generate this curve
     """
@@ -59,11 +63,19 @@ class FrequencyCurve:
     created_at: float
     wizard_config: Dict[str, Any] = field(default_factory=dict)
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Drop the compiled curve when points is assigned."""
+        if name == 'points':
+            object.__setattr__(self, '_compiled', None)
+        object.__setattr__(self, name, value)
+    
     def get_voltage_for_frequency(self, freq_mhz: int) -> int:
         """Calculate voltage offset for given frequency using linear interpolation.
         
-        Uses linear interpolation between surrounding frequency points.
-        For frequencies outside the tested range, clamps to boundary values.
+        Uses linear interpolation between surrounding frequency points,
+        rounding down. For frequencies outside the tested range, clamps to
+        boundary values. The points are compiled on the first call after
+        points is assigned; later calls only bisect.
         
         Args:
             freq_mhz: Target frequency in MHz
@@ -74,41 +86,13 @@ class FrequencyCurve:
         Raises:
             ValueError: If curve has no points
         """
-        if not self.points:
-            raise ValueError("Cannot interpolate voltage from empty curve")
-        
-        # Handle single point case
-        if len(self.points) == 1:
-            return self.points[0].voltage_mv
-        
-        # Boundary clamping: frequency below minimum
-        if freq_mhz <= self.points[0].frequency_mhz:
-            return self.points[0].voltage_mv
-        
-        # Boundary clamping: frequency above maximum
-        if freq_mhz >= self.points[-1].frequency_mhz:
-            return self.points[-1].voltage_mv
-        
-        # Find surrounding points for interpolation
-        for i in range(len(self.points) - 1):
-            p1 = self.points[i]
-            p2 = self.points[i + 1]
-            
-            if p1.frequency_mhz <= freq_mhz <= p2.frequency_mhz:
-                # Linear interpolation: v = v1 + (v2 - v1) * (f - f1) / (f2 - f1)
-                freq_range = p2.frequency_mhz - p1.frequency_mhz
-                voltage_range = p2.voltage_mv - p1.voltage_mv
-                freq_offset = freq_mhz - p1.frequency_mhz
-                
-                # Handle case where two points have same frequency (shouldn't happen with validation)
-                if freq_range == 0:
-                    return p1.voltage_mv
-                
-                interpolated_voltage = p1.voltage_mv + (voltage_range * freq_offset) // freq_range
-                return interpolated_voltage
-        
-        # Should never reach here if points are sorted
-        raise ValueError(f"Failed to interpolate voltage for frequency {freq_mhz} MHz")
+        curve = self._compiled
+        if curve is None:
+            if not self.points:
+                raise ValueError("Cannot interpolate voltage from empty curve")
+            curve = PiecewiseLinearCurve((p.frequency_mhz, p.voltage_mv) for p in self.points)
+            self._compiled = curve
+        return curve.evaluate_int(freq_mhz, "floor")
     
     def validate(self) -> bool:
         """Validate curve integrity.
@@ -0,0 +1,299 @@
+"""Sparse frequency sampling with monotone curve fitting.
+
+This module implements the adaptive sampler used by the frequency wizard's
+sparse mode. Instead of running a full voltage search at every frequency of
+the configured grid, a few anchor frequencies are searched first. An
+isotonic (monotone non-decreasing) piecewise-linear model of stable offset
+vs. frequency is fitted to the results, and further searches are placed
+only where the interpolation error bound of a segment exceeds a tolerance.
+
+Feature: frequency-based-wizard
+Validates: Requirements 1.1, 1.4, 12.1
+
+# Error Bound
+
+Each search brackets the true stable limit: it lies in
+(voltage_low, voltage_mv], where voltage_low is the last failing (or
+lowest considered) offset. Half the bracket width, plus the distance the
+isotonic fit had to move the value, is the point's uncertainty u.
+
+A higher frequency never tolerates a more negative offset than a lower
+one, so between two samples a < b the true limit lies within
+[y_a - u_a, y_b + u_b]. Linear interpolation therefore deviates by at most
+
+    bound = (y_b - y_a) + max(u_a, u_b)
+
+A segment is refined at the grid frequency nearest its midpoint while its
+bound exceeds the tolerance. Segments next to an unstable sample are
+refined until no grid frequency lies between them.
+
+# Usage Example
+
+```python
+from backend.tuning.frequency_sampler import SparseFrequencySampler, SampledPoint
+
+sampler = SparseFrequencySampler(grid, tolerance_mv=4)
+while (freq := sampler.next_frequency()) is not None:
+    sampler.add(SampledPoint(freq, voltage_mv, voltage_low, stable=True))
+points = sampler.build_points(safety_margin=5, voltage_step=2, test_duration=30)
+```
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .frequency_curve import FrequencyPoint
+
+
+@dataclass
+class SampledPoint:
+    """Result of a voltage search at one frequency.
+
+    Attributes:
+        frequency_mhz: Tested frequency in MHz
+        voltage_mv: Most aggressive stable offset found in mV (no safety margin)
+        voltage_low: Exclusive lower bound of the search bracket in mV
+        stable: False if the frequency was skipped as unstable
+    """
+    frequency_mhz: int
+    voltage_mv: int
+    voltage_low: int
+    stable: bool = True
+
+    @property
+    def uncertainty(self) -> float:
+        """Half width of the bracket containing the true stable limit (mV)."""
+        return (self.voltage_mv - self.voltage_low) / 2
+
+    def to_frequency_point(self, safety_margin: int, test_duration: int) -> FrequencyPoint:
+        """Convert to a curve point.
+
+        Args:
+            safety_margin: Safety margin added to the stable voltage in mV
+            test_duration: Duration of the search's tests in seconds
+
+        Returns:
+            FrequencyPoint (voltage 0 and test_duration 0 if unstable)
+        """
+        if not self.stable:
+            return FrequencyPoint(
+                frequency_mhz=self.frequency_mhz,
+                voltage_mv=0,  # No undervolt for unstable frequency
+                stable=False,
+                test_duration=0,
+                timestamp=time.time()
+            )
+
+        return FrequencyPoint(
+            frequency_mhz=self.frequency_mhz,
+            voltage_mv=max(-100, min(0, self.voltage_mv + safety_margin)),
+            stable=True,
+            test_duration=test_duration,
+            timestamp=time.time()
+        )
+
+
+def isotonic_fit(values: Sequence[float], weights: Optional[Sequence[float]] = None) -> List[float]:
+    """Fit a non-decreasing sequence to values (pool adjacent violators).
+
+    Args:
+        values: Observations in order
+        weights: Positive weight per observation (default: all 1)
+
+    Returns:
+        Non-decreasing sequence minimizing the weighted squared error
+    """
+    if weights is None:
+        weights = [1.0] * len(values)
+
+    # Blocks of [mean, weight, count]
+    blocks: List[List[float]] = []
+    for value, weight in zip(values, weights):
+        blocks.append([float(value), float(weight), 1])
+        while len(blocks) > 1 and blocks[-2][0] > blocks[-1][0]:
+            mean2, weight2, count2 = blocks.pop()
+            mean1, weight1, count1 = blocks.pop()
+            total = weight1 + weight2
+            blocks.append([(mean1 * weight1 + mean2 * weight2) / total, total, count1 + count2])
+
+    fitted: List[float] = []
+    for mean, _, count in blocks:
+        fitted.extend([mean] * int(count))
+    return fitted
+
+
+class SparseFrequencySampler:
+    """Chooses which grid frequencies to search and interpolates the rest.
+
+    Feature: frequency-based-wizard
+    Validates: Requirements 1.1, 1.4, 12.1
+    """
+
+    # Anchor frequencies searched before any refinement
+    DEFAULT_ANCHOR_COUNT = 4
+
+    def __init__(
+        self,
+        frequencies: List[int],
+        tolerance_mv: float,
+        anchor_count: int = DEFAULT_ANCHOR_COUNT
+    ):
+        """Initialize sampler.
+
+        Args:
+            frequencies: Full frequency grid in MHz
+            tolerance_mv: Maximum interpolation error bound in mV
+            anchor_count: Number of evenly spaced anchor frequencies
+        """
+        self.frequencies = sorted(frequencies)
+        self.tolerance_mv = tolerance_mv
+        self.samples: Dict[int, SampledPoint] = {}
+        self._anchors = self._select_anchors(anchor_count)
+
+    def _select_anchors(self, anchor_count: int) -> List[int]:
+        """Evenly spaced grid frequencies including both ends."""
+        count = len(self.frequencies)
+        if count <= anchor_count:
+            return list(self.frequencies)
+
+        indices = sorted({
+            round(i * (count - 1) / (anchor_count - 1))
+            for i in range(anchor_count)
+        })
+        return [self.frequencies[i] for i in indices]
+
+    def add(self, sample: SampledPoint) -> None:
+        """Record a search result.
+
+        Args:
+            sample: Result of the search at a grid frequency
+        """
+        self.samples[sample.frequency_mhz] = sample
+
+    def fit(self) -> Dict[int, float]:
+        """Fit the monotone model to the stable samples.
+
+        Returns:
+            Mapping frequency -> fitted stable offset (mV, no safety margin)
+        """
+        stable = [self.samples[f] for f in sorted(self.samples) if self.samples[f].stable]
+        fitted = isotonic_fit(
+            [s.voltage_mv for s in stable],
+            [1.0 / max(s.uncertainty, 0.5) for s in stable]
+        )
+        return {s.frequency_mhz: value for s, value in zip(stable, fitted)}
+
+    def segment_bounds(self) -> List[Tuple[int, int, float]]:
+        """Interpolation error bound of every segment between samples.
+
+        Returns:
+            List of (freq_a, freq_b, bound_mv); bound is infinite next to
+            an unstable sample
+        """
+        fitted = self.fit()
+        sampled = sorted(self.samples)
+        bounds = []
+
+        for freq_a, freq_b in zip(sampled, sampled[1:]):
+            a, b = self.samples[freq_a], self.samples[freq_b]
+            if not (a.stable and b.stable):
+                bounds.append((freq_a, freq_b, math.inf))
+                continue
+
+            u_a = a.uncertainty + abs(fitted[freq_a] - a.voltage_mv)
+            u_b = b.uncertainty + abs(fitted[freq_b] - b.voltage_mv)
+            bounds.append((freq_a, freq_b, (fitted[freq_b] - fitted[freq_a]) + max(u_a, u_b)))
+
+        return bounds
+
+    def _interior(self, freq_a: int, freq_b: int) -> List[int]:
+        """Grid frequencies strictly between two samples."""
+        return [f for f in self.frequencies if freq_a < f < freq_b]
+
+    def max_error_bound(self) -> float:
+        """Largest error bound over segments containing interpolated points."""
+        return max(
+            (bound for freq_a, freq_b, bound in self.segment_bounds() if self._interior(freq_a, freq_b)),
+            default=0.0
+        )
+
+    def next_frequency(self) -> Optional[int]:
+        """Get the next grid frequency to search.
+
+        Returns:
+            Anchor frequencies first, then the midpoint of the segment with
+            the largest bound above tolerance; None when every segment is
+            within tolerance or fully sampled
+        """
+        for freq_mhz in self._anchors:
+            if freq_mhz not in self.samples:
+                return freq_mhz
+
+        worst: Optional[Tuple[float, int]] = None
+        for freq_a, freq_b, bound in self.segment_bounds():
+            interior = self._interior(freq_a, freq_b)
+            if bound <= self.tolerance_mv or not interior:
+                continue
+
+            midpoint = (freq_a + freq_b) / 2
+            freq_mhz = min(interior, key=lambda f: abs(f - midpoint))
+            if worst is None or bound > worst[0]:
+                worst = (bound, freq_mhz)
+
+        return worst[1] if worst else None
+
+    def build_points(
+        self,
+        safety_margin: int,
+        voltage_step: int,
+        test_duration: int
+    ) -> List[FrequencyPoint]:
+        """Build curve points for the full grid.
+
+        Sampled frequencies keep their measured result. Others are
+        interpolated from the fitted model, rounded towards 0 mV on the
+        voltage step grid, and recorded with test_duration 0. A frequency
+        between a stable and an unstable sample is recorded as unstable.
+
+        Args:
+            safety_margin: Safety margin added to stable voltages in mV
+            voltage_step: Voltage step size in mV
+            test_duration: Duration of each sampled test in seconds
+
+        Returns:
+            Points for every grid frequency, sorted ascending
+        """
+        fitted = self.fit()
+        sampled = sorted(self.samples)
+        timestamp = time.time()
+        points = []
+
+        for freq_mhz in self.frequencies:
+            sample = self.samples.get(freq_mhz)
+            if sample is not None:
+                points.append(sample.to_frequency_point(safety_margin, test_duration))
+                continue
+
+            lower = max((f for f in sampled if f < freq_mhz), default=None)
+            upper = min((f for f in sampled if f > freq_mhz), default=None)
+            if (
+                lower is None or upper is None
+                or not (self.samples[lower].stable and self.samples[upper].stable)
+            ):
+                points.append(SampledPoint(freq_mhz, 0, 0, stable=False).to_frequency_point(0, 0))
+                continue
+
+            t = (freq_mhz - lower) / (upper - lower)
+            value = fitted[lower] + t * (fitted[upper] - fitted[lower])
+            raw = math.ceil(value / voltage_step) * voltage_step
+            points.append(FrequencyPoint(
+                frequency_mhz=freq_mhz,
+                voltage_mv=max(-100, min(0, raw + safety_margin)),
+                stable=True,
+                test_duration=0,  # Interpolated, not tested
+                timestamp=timestamp
+            ))
+
+        return points
@@ -12,12 +12,18 @@ import asyncio
 import logging
 import time
 import random
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any, Callable
+from dataclasses import dataclass, field, asdict, replace
+from typing import List, Optional, Dict, Any, Callable, Iterable, Tuple, Union
 from pathlib import Path
 
 from .frequency_curve import FrequencyPoint, FrequencyCurve
+from .frequency_sampler import SampledPoint, SparseFrequencySampler
+from .knowledge_base import StabilityKnowledgeBase
+from .sequential_test import SequentialDurationPolicy
+from .stability_model import StabilityModel
+from .thermal_pacing import ThermalPacer
 from ..platform.cpufreq import CPUFreqController, CPUFreqError, PermissionError as CPUFreqPermissionError
+from ..platform.sensors import SensorHub
 from .runner import TestRunner
 
 logger = logging.getLogger(__name__)
@@ -28,6 +34,12 @@ TEST_TIMEOUT_MARGIN = 30  # seconds added to test duration
 CONSECUTIVE_FAILURE_THRESHOLD = 3  # Skip frequency after this many failures
 VERIFICATION_TEST_COUNT = 5  # Number of random frequencies to verify
 
+# Voltage search methods accepted by FrequencyWizardConfig.voltage_search
+VOLTAGE_SEARCHES = ("binary", "bayesian")
+
+# Stop a model-guided search once no voltage is expected to yield this many bits
+MIN_INFORMATION = 0.05
+
 
 class WizardError(Exception):
     """Base exception for wizard operations."""
@@ -66,6 +78,17 @@ class FrequencyWizardConfig:
     parallel_cores: bool = False  # Test cores in parallel
     adaptive_step: bool = True  # Increase step in stable regions
     save_interval: int = 1  # Save intermediate results every N points
+    warm_start: bool = True  # Seed each search from the previous point
+    monotone_noise_band: int = 4  # mV a higher frequency may undercut a lower one
+    sparse_sampling: bool = False  # Search only where interpolation is uncertain
+    sparse_tolerance: int = 4  # mV maximum interpolation error bound
+    adaptive_duration: bool = False  # Sequential stopping rule, test_duration as base
+    false_pass_rate: float = 0.01  # Accepted P(unstable | passed) for adaptive_duration
+    thermal_pacing: bool = False  # Cool down so each test starts in the target band
+    voltage_search: str = "binary"  # "binary" or "bayesian" (StabilityModel per frequency)
+    risk_level: float = 0.05  # Acceptable failure probability ("bayesian" only)
+    confidence_target: float = 0.9  # Required confidence in risk_level ("bayesian" only)
+    max_tests_per_point: int = 8  # Test budget per frequency ("bayesian" only)
     
     @classmethod
     def quick_preset(cls) -> 'FrequencyWizardConfig':
@@ -177,6 +200,42 @@ class FrequencyWizardConfig:
                 f"safety_margin must be between 0-20 mV, got {self.safety_margin}"
             )
         
+        # Validate monotone noise band
+        if not (0 <= self.monotone_noise_band <= 20):
+            errors.append(
+                f"monotone_noise_band must be between 0-20 mV, got {self.monotone_noise_band}"
+            )
+        
+        # Validate sparse sampling tolerance
+        if not (1 <= self.sparse_tolerance <= 20):
+            errors.append(
+                f"sparse_tolerance must be between 1-20 mV, got {self.sparse_tolerance}"
+            )
+        
+        # Validate false-pass rate
+        if not (0.0 < self.false_pass_rate < 0.5):
+            errors.append(
+                f"false_pass_rate must be between 0 and 0.5, got {self.false_pass_rate}"
+            )
+        
+        # Validate voltage search
+        if self.voltage_search not in VOLTAGE_SEARCHES:
+            errors.append(
+                f"voltage_search must be one of {', '.join(VOLTAGE_SEARCHES)}, got {self.voltage_search}"
+            )
+        if not (0.0 < self.risk_level < 0.5):
+            errors.append(
+                f"risk_level must be between 0 and 0.5, got {self.risk_level}"
+            )
+        if not (0.5 <= self.confidence_target < 1.0):
+            errors.append(
+                f"confidence_target must be between 0.5 and 1, got {self.confidence_target}"
+            )
+        if not (1 <= self.max_tests_per_point <= 30):
+            errors.append(
+                f"max_tests_per_point must be between 1-30, got {self.max_tests_per_point}"
+            )
+        
         if errors:
             raise ConfigurationError(
                 "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
@@ -241,6 +300,608 @@ class WizardProgress:
         }
 
 
+def _adaptive_frequency_step(
+    history: List[int],
+    voltage_mv: int,
+    freq_step: int,
+    similarity_threshold: int
+) -> int:
+    """Record a stable voltage and return the next frequency step.
+    
+    Appends the voltage to the history (keeping the last 5). If the last
+    three voltages lie within the similarity threshold, the curve is in a
+    flat region and the step is doubled.
+    
+    Args:
+        history: Voltage history, updated in place
+        voltage_mv: Voltage offset of the point just found in mV
+        freq_step: Base frequency step in MHz
+        similarity_threshold: Maximum voltage range of a flat region in mV
+        
+    Returns:
+        Step size in MHz (base step or increased step)
+        
+    Feature: frequency-based-wizard, Property 22: Adaptive step optimization
+    Validates: Requirements 12.1
+    """
+    history.append(voltage_mv)
+    
+    # Keep only recent voltages (last 5)
+    if len(history) > 5:
+        history.pop(0)
+    
+    # Check if we have enough history
+    if len(history) < 3:
+        return freq_step
+    
+    # Check if recent voltages are similar (stable region)
+    recent_voltages = history[-3:]
+    if max(recent_voltages) - min(recent_voltages) <= similarity_threshold:
+        # Increase step size (max 3x base step)
+        step_multiplier = min(2, 3)  # Start with 2x, max 3x
+        return freq_step * step_multiplier
+    
+    return freq_step
+
+
+class VoltageSearch:
+    """Search state for the most aggressive stable voltage at one frequency.
+    
+    Without a prediction this is the plain binary search over
+    [voltage_low, 0]. With a prediction (warm start) the predicted voltage
+    is tested first, then the neighbouring step below it. If either probe
+    lands outside the bracket, the search gallops away from it with
+    doubling steps until the answer is bracketed, then bisects.
+    
+    The lower bound is exclusive and never tested; the upper bound 0 is
+    assumed stable.
+    
+    Feature: frequency-based-wizard, Property 16: Consecutive failure skip
+    Validates: Requirements 1.3, 9.4
+    """
+    
+    def __init__(
+        self,
+        voltage_low: int,
+        voltage_step: int,
+        predicted: Optional[int] = None,
+        monotone_bounded: bool = False
+    ):
+        """Initialize search state.
+        
+        Args:
+            voltage_low: Most aggressive voltage offset to consider in mV
+            voltage_step: Voltage step size in mV
+            predicted: Predicted stable voltage in mV (None for binary search)
+            monotone_bounded: Whether voltage_low comes from the monotone
+                constraint rather than the configured range
+        """
+        self.voltage_step = voltage_step
+        self.voltage_low = voltage_low
+        self.voltage_high = 0
+        self.last_stable_voltage = 0  # Default to no undervolt if all tests fail
+        self.consecutive_failures = 0
+        self.test_count = 0
+        self.monotone_bounded = monotone_bounded
+        
+        self._low_tested = False
+        self._exhausted = False
+        self._predicted = predicted
+        self._phase = "bisect" if predicted is None else "predicted"
+        self._gallop = 1
+    
+    @property
+    def failed(self) -> bool:
+        """Check if the frequency has to be skipped as unstable.
+        
+        True once the consecutive failure threshold is reached, or when a
+        warm-started search galloped up to 0 mV without any passing test.
+        """
+        return self._exhausted or self.consecutive_failures >= CONSECUTIVE_FAILURE_THRESHOLD
+    
+    @property
+    def bracket_low(self) -> int:
+        """Exclusive lower end of the bracket around the stable limit in mV."""
+        return self.voltage_low
+    
+    def reached_floor(self) -> bool:
+        """Check if the result is bounded by voltage_low instead of a failed test."""
+        return self.test_count > 0 and not self._low_tested and not self.failed
+    
+    def violates_monotone(self) -> bool:
+        """Check if the result is pinned at the monotone constraint."""
+        return self.monotone_bounded and self.reached_floor()
+    
+    def _round(self, voltage_mv: int) -> int:
+        """Round to the voltage step grid (towards more aggressive)."""
+        return (voltage_mv // self.voltage_step) * self.voltage_step
+    
+    def next_voltage(self) -> Optional[int]:
+        """Get the next voltage to test.
+        
+        Returns:
+            Voltage offset in mV, or None if the search is complete
+        """
+        if self.failed:
+            return None
+        
+        while self._phase != "bisect":
+            unit = self.voltage_step * self._gallop
+            if self._phase == "predicted":
+                probe = self._predicted
+            elif self._phase == "below":
+                probe = self._round(self.voltage_high - unit)
+            else:
+                probe = self._round(self.voltage_low + unit)
+            
+            if self.voltage_low < probe < self.voltage_high:
+                return probe
+            self._phase = "bisect"
+        
+        if self.voltage_high - self.voltage_low > self.voltage_step:
+            return self._round((self.voltage_low + self.voltage_high) // 2)
+        
+        if self._predicted is not None and self._low_tested and self.voltage_high == 0:
+            # Galloped all the way up without a single passing test
+            self._exhausted = True
+        
+        return None
+    
+    def record(self, voltage_mv: int, stable: bool) -> None:
+        """Record the verdict of a test handed out by next_voltage().
+        
+        In a warm-started search, failures while galloping up from a failed
+        prediction only show the prediction was too aggressive, and failures
+        after a stable voltage was found only narrow the bracket; neither
+        counts as a consecutive failure.
+        
+        Args:
+            voltage_mv: Tested voltage offset in mV
+            stable: Whether the test passed
+        """
+        self.test_count += 1
+        
+        if stable:
+            # Voltage is stable, try more aggressive
+            self.last_stable_voltage = voltage_mv
+            self.voltage_high = voltage_mv
+            self.consecutive_failures = 0
+        else:
+            # Voltage is unstable, try more conservative
+            self.voltage_low = voltage_mv
+            self._low_tested = True
+            if self._predicted is None or (self._phase != "above" and self.voltage_high == 0):
+                self.consecutive_failures += 1
+        
+        if self._phase == "predicted":
+            self._phase = "below" if stable else "above"
+        elif self._phase == "below":
+            if stable:
+                self._gallop *= 2
+            else:
+                self._phase = "bisect"
+        elif self._phase == "above":
+            if stable:
+                self._phase = "bisect"
+            else:
+                self._gallop *= 2
+
+
+class BayesianVoltageSearch:
+    """Model-guided search for the most aggressive stable voltage at one frequency.
+    
+    Drop-in replacement for VoltageSearch driven by a StabilityModel over
+    (voltage_low, 0]. Each test goes to the voltage whose outcome is most
+    informative, and the result is the most aggressive voltage that fails
+    with probability at most risk with the required confidence. A single
+    spurious pass or failure shifts the result by a step instead of
+    closing the bracket on the wrong side, and repeated tests of one
+    voltage are evidence rather than waste.
+    
+    The search ends when no voltage is worth MIN_INFORMATION bits, after
+    max_tests tests, or after CONSECUTIVE_FAILURE_THRESHOLD consecutive
+    failures (the frequency is skipped, as with the binary search).
+    
+    Feature: frequency-based-wizard, Property 16: Consecutive failure skip
+    Validates: Requirements 1.3, 9.4
+    """
+    
+    def __init__(
+        self,
+        voltage_low: int,
+        voltage_step: int,
+        risk: float,
+        confidence: float,
+        max_tests: int,
+        monotone_bounded: bool = False
+    ):
+        """Initialize search state.
+        
+        Args:
+            voltage_low: Most aggressive voltage offset to consider in mV
+                (exclusive, as in VoltageSearch)
+            voltage_step: Voltage step size in mV
+            risk: Acceptable failure probability
+            confidence: Required confidence that risk is met
+            max_tests: Test budget
+            monotone_bounded: Whether voltage_low comes from the monotone
+                constraint rather than the configured range
+        """
+        self.voltage_step = voltage_step
+        self.voltage_low = voltage_low
+        self.voltage_high = 0
+        self.consecutive_failures = 0
+        self.test_count = 0
+        self.monotone_bounded = monotone_bounded
+        self.risk = risk
+        self.confidence = confidence
+        self.max_tests = max_tests
+        self.model = StabilityModel(min(voltage_low + voltage_step, 0), 0)
+    
+    @property
+    def failed(self) -> bool:
+        """Check if the frequency has to be skipped as unstable."""
+        return self.consecutive_failures >= CONSECUTIVE_FAILURE_THRESHOLD
+    
+    @property
+    def last_stable_voltage(self) -> int:
+        """Most aggressive voltage meeting the risk level (0 if none)."""
+        return self.model.recommend(self.risk, self.confidence, self.voltage_step).offset
+    
+    @property
+    def bracket_low(self) -> int:
+        """Exclusive lower end of the bracket around the stable limit in mV.
+        
+        The nearest voltage below the result whose predicted failure
+        probability exceeds the risk level, but no lower than the least
+        aggressive failure seen there (or voltage_low without one).
+        """
+        stable = self.last_stable_voltage
+        floor = max(
+            (offset for offset, passed in self.model.tests if not passed and offset < stable),
+            default=self.voltage_low
+        )
+        voltage_mv = stable - self.voltage_step
+        while voltage_mv > floor and self.model.predictive_p_fail(voltage_mv) <= self.risk:
+            voltage_mv -= self.voltage_step
+        return max(voltage_mv, floor)
+    
+    def reached_floor(self) -> bool:
+        """Check if the result is bounded by voltage_low instead of a failed test."""
+        stable = self.last_stable_voltage
+        return (
+            self.test_count > 0 and not self.failed
+            and not any(not passed and offset < stable for offset, passed in self.model.tests)
+        )
+    
+    def violates_monotone(self) -> bool:
+        """Check if the result is pinned at the monotone constraint."""
+        return self.monotone_bounded and self.reached_floor()
+    
+    def seed(self, passes: Iterable[int], failures: Iterable[int]) -> None:
+        """Add earlier results (e.g. from the knowledge base) as evidence.
+        
+        Args:
+            passes: Voltages known to pass in mV
+            failures: Voltages known to fail in mV
+        """
+        for voltage_mv in passes:
+            self.model.update(voltage_mv, True)
+        for voltage_mv in failures:
+            self.model.update(voltage_mv, False)
+    
+    def next_voltage(self) -> Optional[int]:
+        """Get the next voltage to test.
+        
+        Returns:
+            Voltage offset in mV, or None if the search is complete
+        """
+        if self.failed or self.test_count >= self.max_tests:
+            return None
+        
+        voltage_mv = self.model.next_offset(self.risk, self.voltage_step)
+        if self.model.information_gain(voltage_mv, self.risk) < MIN_INFORMATION:
+            return None
+        return voltage_mv
+    
+    def record(self, voltage_mv: int, stable: bool) -> None:
+        """Record the verdict of a test handed out by next_voltage().
+        
+        Args:
+            voltage_mv: Tested voltage offset in mV
+            stable: Whether the test passed
+        """
+        self.test_count += 1
+        self.model.update(voltage_mv, stable)
+        self.consecutive_failures = 0 if stable else self.consecutive_failures + 1
+
+
+def _create_voltage_search(
+    config: FrequencyWizardConfig,
+    freq_mhz: int,
+    previous_points: Optional[List[FrequencyPoint]] = None
+) -> Union[VoltageSearch, BayesianVoltageSearch]:
+    """Create the voltage search for a frequency, warm-started if possible.
+    
+    A higher frequency cannot tolerate a more negative offset than a lower
+    one, modulo monotone_noise_band. The search floor is therefore raised
+    to the most conservative stable voltage found at lower frequencies
+    minus the noise band, and the start is predicted by extrapolating the
+    last two stable points (or interpolating between the nearest stable
+    points around the frequency, when sampling out of order).
+    
+    With voltage_search "bayesian" the search is a BayesianVoltageSearch
+    over the full range. Its result sits a confidence margin above the
+    stable limit, so a floor derived from it would cut off the limit at
+    the next frequency; it picks its own first voltage, so the prediction
+    is not used either.
+    
+    Args:
+        config: Wizard configuration
+        freq_mhz: Frequency to search in MHz
+        previous_points: Completed points of this sweep (None for a cold search)
+        
+    Returns:
+        VoltageSearch or BayesianVoltageSearch for the frequency
+        
+    Feature: frequency-based-wizard
+    Validates: Requirements 1.3
+    """
+    step = config.voltage_step
+    if config.voltage_search == "bayesian":
+        return BayesianVoltageSearch(
+            config.voltage_start, step, config.risk_level, config.confidence_target,
+            config.max_tests_per_point
+        )
+    
+    lower = sorted(
+        (p for p in (previous_points or []) if p.stable and p.frequency_mhz < freq_mhz),
+        key=lambda p: p.frequency_mhz
+    )
+    if not config.warm_start or not lower:
+        return VoltageSearch(config.voltage_start, step)
+    
+    raw = [(p.frequency_mhz, p.voltage_mv - config.safety_margin) for p in lower]
+    floor = max(config.voltage_start, max(v for _, v in raw) - config.monotone_noise_band)
+    floor = max(config.voltage_start, (floor // step) * step)
+    
+    higher = [
+        p for p in (previous_points or [])
+        if p.stable and p.frequency_mhz > freq_mhz
+    ]
+    
+    last_freq, predicted = raw[-1]
+    if higher:
+        # Interpolate between the nearest stable neighbours
+        upper = min(higher, key=lambda p: p.frequency_mhz)
+        slope = (upper.voltage_mv - config.safety_margin - predicted) / (upper.frequency_mhz - last_freq)
+        if slope > 0:
+            predicted += int(slope * (freq_mhz - last_freq))
+    elif len(raw) >= 2:
+        prev_freq, prev_voltage = raw[-2]
+        slope = (predicted - prev_voltage) / (last_freq - prev_freq)
+        if slope > 0:
+            predicted += int(slope * (freq_mhz - last_freq))
+    predicted = min(max((predicted // step) * step, floor + step), -step)
+    
+    if not floor < predicted < 0:
+        return VoltageSearch(floor, step, monotone_bounded=floor > config.voltage_start)
+    
+    return VoltageSearch(floor, step, predicted, monotone_bounded=floor > config.voltage_start)
+
+
+def _monotone_retest_frequencies(points: List[FrequencyPoint], violations: List[int]) -> List[int]:
+    """Frequencies to re-test for monotone violations.
+    
+    A point pinned at the monotone floor disagrees with a lower frequency
+    by more than the noise band, so both it and its stable lower neighbour
+    are re-tested with a full-range search.
+    
+    Args:
+        points: Completed points of the sweep
+        violations: Frequencies whose search was pinned at the monotone floor
+        
+    Returns:
+        Sorted frequencies to re-test
+    """
+    stable_freqs = sorted(p.frequency_mhz for p in points if p.stable)
+    retest = set()
+    
+    for freq_mhz in violations:
+        retest.add(freq_mhz)
+        lower = [f for f in stable_freqs if f < freq_mhz]
+        if lower:
+            retest.add(lower[-1])
+    
+    return sorted(retest)
+
+
+def _enforce_monotone(points: List[FrequencyPoint], noise_band: int) -> List[FrequencyPoint]:
+    """Lift points that are more aggressive than a lower frequency allows.
+    
+    Each stable point's voltage is raised to at least the most conservative
+    voltage at any lower frequency minus the noise band. Lifting only ever
+    reduces the undervolt, so the result stays safe.
+    
+    Args:
+        points: Points sorted by frequency
+        noise_band: Tolerated non-monotonicity in mV
+        
+    Returns:
+        New list of points satisfying the monotone constraint
+    """
+    result = []
+    running_max: Optional[int] = None
+    
+    for point in points:
+        if point.stable:
+            if running_max is not None and point.voltage_mv < running_max - noise_band:
+                logger.warning(
+                    f"Monotone constraint: lifting {point.frequency_mhz} MHz from "
+                    f"{point.voltage_mv}mV to {running_max - noise_band}mV"
+                )
+                point = replace(point, voltage_mv=running_max - noise_band)
+            running_max = point.voltage_mv if running_max is None else max(running_max, point.voltage_mv)
+        result.append(point)
+    
+    return result
+
+
+class CoreSweepState:
+    """Search state machine for one core in a parallel sweep.
+    
+    Performs the same frequency sweep as FrequencyWizard.run() (warm-started
+    voltage search per frequency, consecutive failure skip, safety margin,
+    adaptive stepping and monotone re-tests), but instead of running tests
+    itself it hands out the next voltage to test and is told the verdict.
+    This lets a coordinator test all cores in the same round.
+    
+    Feature: frequency-based-wizard
+    Validates: Requirements 1.2, 1.3, 9.4, 12.1
+    """
+    
+    def __init__(self, core_id: int, frequencies: List[int], config: FrequencyWizardConfig):
+        """Initialize sweep state.
+        
+        Args:
+            core_id: CPU core ID
+            frequencies: Frequencies to sweep in MHz, sorted ascending
+            config: Wizard configuration
+        """
+        self.core_id = core_id
+        self.frequencies = frequencies
+        self.config = config
+        self.points: List[FrequencyPoint] = []
+        self.monotone_violations: List[int] = []
+        
+        self._index = 0
+        self._voltage_history: List[int] = []
+        self._retest: Optional[List[int]] = None
+        self._search: Optional[Union[VoltageSearch, BayesianVoltageSearch]] = None
+        
+        if not frequencies:
+            self._retest = []
+        self._start_search()
+    
+    @property
+    def current_frequency(self) -> Optional[int]:
+        """Frequency currently being searched (None when done)."""
+        if self._retest is not None:
+            return self._retest[0] if self._retest else None
+        return self.frequencies[self._index]
+    
+    def is_done(self) -> bool:
+        """Check if every frequency has been swept and re-tested."""
+        return self.current_frequency is None
+    
+    def _start_search(self) -> None:
+        """Create the search for the current frequency."""
+        freq_mhz = self.current_frequency
+        if freq_mhz is None:
+            self._search = None
+        elif self._retest is None:
+            self._search = _create_voltage_search(self.config, freq_mhz, self.points)
+        else:
+            self._search = _create_voltage_search(self.config, freq_mhz)
+    
+    def next_voltage(self) -> Optional[int]:
+        """Get the next voltage to test at the current frequency.
+        
+        Finishes frequencies whose search has converged and moves on until
+        a voltage needs testing.
+        
+        Returns:
+            Voltage offset in mV, or None if the sweep is complete
+        """
+        while self._search is not None:
+            voltage_mv = self._search.next_voltage()
+            if voltage_mv is not None:
+                return voltage_mv
+            self._finish_point(stable=not self._search.failed)
+        
+        return None
+    
+    def record(self, voltage_mv: int, stable: bool) -> None:
+        """Record the verdict of a test handed out by next_voltage().
+        
+        Args:
+            voltage_mv: Tested voltage offset in mV
+            stable: Whether the test passed
+        """
+        self._search.record(voltage_mv, stable)
+        
+        if self._search.failed:
+            logger.warning(
+                f"Core {self.core_id}: skipping frequency {self.current_frequency} MHz after "
+                f"{CONSECUTIVE_FAILURE_THRESHOLD} consecutive failures"
+            )
+            self._finish_point(stable=False)
+    
+    def _finish_point(self, stable: bool) -> None:
+        """Record the point for the current frequency and advance."""
+        freq_mhz = self.current_frequency
+        
+        if stable:
+            final_voltage = max(-100, min(0, self._search.last_stable_voltage + self.config.safety_margin))
+            point = FrequencyPoint(
+                frequency_mhz=freq_mhz,
+                voltage_mv=final_voltage,
+                stable=True,
+                test_duration=self.config.test_duration,
+                timestamp=time.time()
+            )
+        else:
+            point = FrequencyPoint(
+                frequency_mhz=freq_mhz,
+                voltage_mv=0,  # No undervolt for unstable frequency
+                stable=False,
+                test_duration=0,
+                timestamp=time.time()
+            )
+        
+        logger.info(
+            f"Core {self.core_id}: {freq_mhz} MHz -> {point.voltage_mv}mV "
+            f"({'stable' if point.stable else 'unstable'}, {self._search.test_count} tests)"
+        )
+        
+        if self._retest is not None:
+            # Replace the point being re-tested
+            self.points = [point if p.frequency_mhz == freq_mhz else p for p in self.points]
+            self._retest.pop(0)
+        else:
+            self.points.append(point)
+            if point.stable and self._search.violates_monotone():
+                logger.warning(f"Core {self.core_id}: {freq_mhz} MHz pinned at monotone floor, flagged for re-test")
+                self.monotone_violations.append(freq_mhz)
+            self._advance_frequency(point)
+        
+        if self._retest == []:
+            self.points = _enforce_monotone(self.points, self.config.monotone_noise_band)
+        
+        self._start_search()
+    
+    def _advance_frequency(self, point: FrequencyPoint) -> None:
+        """Move to the next frequency, skipping ahead in flat regions."""
+        if point.stable and self.config.adaptive_step:
+            adaptive_step = _adaptive_frequency_step(
+                self._voltage_history,
+                point.voltage_mv,
+                self.config.freq_step,
+                FrequencyWizard.VOLTAGE_SIMILARITY_THRESHOLD
+            )
+            if adaptive_step > self.config.freq_step:
+                next_freq = point.frequency_mhz + adaptive_step
+                while (
+                    self._index + 1 < len(self.frequencies)
+                    and self.frequencies[self._index + 1] < next_freq
+                ):
+                    self._index += 1
+        
+        self._index += 1
+        if self._index >= len(self.frequencies):
+            self._retest = _monotone_retest_frequencies(self.points, self.monotone_violations)
+
+
 class FrequencyWizard:
     """Automated frequency curve generation.
     
@@ -251,6 +912,9 @@ class FrequencyWizard:
     Validates: Requirements 1.1, 1.2, 1.4, 3.1-3.7, 4.1-4.4, 6.2, 6.4, 6.5
     """
     
+    # Voltage range (mV) within which consecutive points count as a flat region
+    VOLTAGE_SIMILARITY_THRESHOLD = 2
+    
     def __init__(
         self,
         config: FrequencyWizardConfig,
@@ -282,7 +946,41 @@ class FrequencyWizard:
         # Adaptive stepping state
         self._consecutive_stable_count = 0
         self._last_voltages: List[int] = []
-        self._voltage_similarity_threshold = 2  # mV
+        self._voltage_similarity_threshold = self.VOLTAGE_SIMILARITY_THRESHOLD  # mV
+        
+        # Search statistics
+        self.stress_test_count = 0
+        self.monotone_violations: List[int] = []
+        
+        # Parallel mode statistics
+        self.parallel_rounds = 0
+        self.isolation_retests = 0
+        
+        # Shared stability evidence
+        self._knowledge_base: Optional[StabilityKnowledgeBase] = None
+        self._consult_knowledge = True
+        
+        # Sequential test durations, keyed by (core_id, freq_mhz)
+        self._duration_policy: Optional[SequentialDurationPolicy] = None
+        
+        # Cool-down between tests, when thermal_pacing is enabled
+        self._thermal_pacer: Optional[ThermalPacer] = None
+    
+    def set_knowledge_base(self, knowledge_base: StabilityKnowledgeBase) -> None:
+        """Set the stability knowledge base consulted before each test.
+        
+        Args:
+            knowledge_base: Shared StabilityKnowledgeBase instance
+        """
+        self._knowledge_base = knowledge_base
+    
+    def set_thermal_pacer(self, pacer: ThermalPacer) -> None:
+        """Set the pacer used when thermal_pacing is enabled.
+        
+        Args:
+            pacer: ThermalPacer (default: one reading the hwmon CPU sensor)
+        """
+        self._thermal_pacer = pacer
     
     def cancel(self) -> None:
         """Cancel wizard execution.
@@ -330,6 +1028,10 @@ class FrequencyWizard:
         
         # Calculate frequency points to test
         frequencies = self._calculate_frequency_points()
+        self.monotone_violations = []
+        
+        if self.config.sparse_sampling:
+            return await self._run_sparse(core_id, frequencies)
         
         # Try to load intermediate results
         loaded_points = self._load_intermediate_results(core_id)
@@ -405,7 +1107,7 @@ class FrequencyWizard:
                 
                 # Test this frequency point
                 logger.info(f"Testing frequency point: {freq_mhz} MHz")
-                point = await self._test_frequency_point(core_id, freq_mhz)
+                point = await self._test_frequency_point(core_id, freq_mhz, points)
                 points.append(point)
                 
                 # Update progress
@@ -437,6 +1139,9 @@ class FrequencyWizard:
                             logger.debug(f"Skipping frequency {frequencies[freq_index]} MHz (adaptive step)")
                 
                 freq_index += 1
+            
+            # Re-test points that disagree with the monotone constraint
+            points = await self._resolve_monotone_violations(core_id, points)
         
         finally:
             # Always restore original settings
@@ -448,6 +1153,239 @@ class FrequencyWizard:
             if points:
                 self._save_intermediate_results(core_id, points)
         
+        return await self._complete_curve(core_id, points)
+    
+    async def run_parallel(self, core_ids: Optional[Iterable[int]] = None) -> Dict[int, FrequencyCurve]:
+        """Execute frequency sweeps for several cores at once.
+        
+        Each core runs its own CoreSweepState. Every round, the next voltage
+        of each unfinished core is collected and the whole set is tested
+        together: one ryzenadj call applies the combined four-core offset
+        vector and one pinned stress-ng runs per core. Since offsets are
+        per-core, a full 4-core sweep takes about as long as a single-core
+        sweep.
+        
+        Intermediate results are not persisted in parallel mode; an
+        interrupted parallel sweep starts over.
+        
+        Args:
+            core_ids: CPU core IDs to sweep (default: all four cores)
+            
+        Returns:
+            Dictionary mapping core_id to its frequency curve
+            
+        Raises:
+            WizardCancelled: If user cancels the wizard
+            ConfigurationError: If configuration is invalid
+            
+        Feature: frequency-based-wizard, Property 5: Wizard frequency coverage completeness
+        Validates: Requirements 1.1, 1.2, 1.4
+        """
+        self.config.validate()
+        
+        core_ids = list(core_ids) if core_ids is not None else [0, 1, 2, 3]
+        frequencies = self._calculate_frequency_points()
+        
+        if self.config.sparse_sampling:
+            logger.warning("Sparse sampling is not supported in parallel mode, sweeping the full grid")
+        states = {
+            core_id: CoreSweepState(core_id, frequencies, self.config)
+            for core_id in core_ids
+        }
+        
+        logger.info(
+            f"Starting parallel frequency wizard for cores {core_ids}: "
+            f"freq_range={self.config.freq_start}-{self.config.freq_end} MHz, "
+            f"step={self.config.freq_step} MHz, "
+            f"test_duration={self.config.test_duration}s"
+        )
+        
+        self.parallel_rounds = 0
+        self.isolation_retests = 0
+        self.monotone_violations = []
+        self.progress = WizardProgress(
+            running=True,
+            total_points=len(frequencies) * len(core_ids),
+            start_time=time.time()
+        )
+        self._notify_progress()
+        
+        # Store original state for restoration
+        for core_id in core_ids:
+            try:
+                self._original_governors[core_id] = self.cpufreq.get_current_governor(core_id)
+            except CPUFreqError as e:
+                logger.warning(f"Failed to get original governor for core {core_id}: {e}")
+                self._original_governors[core_id] = "schedutil"  # Default fallback
+        
+        try:
+            while True:
+                # Check for cancellation
+                if self.cancelled:
+                    logger.info("Wizard cancelled by user")
+                    raise WizardCancelled("Wizard cancelled by user")
+                
+                assignments: Dict[int, Tuple[int, int]] = {}
+                for core_id, state in states.items():
+                    voltage_mv = state.next_voltage()
+                    if voltage_mv is not None:
+                        assignments[core_id] = (state.current_frequency, voltage_mv)
+                
+                self.progress.completed_points = sum(len(s.points) for s in states.values())
+                self.progress.update_estimated_remaining()
+                
+                if not assignments:
+                    break
+                
+                freq_mhz, voltage_mv = next(iter(assignments.values()))
+                self.progress.current_frequency = freq_mhz
+                self.progress.current_voltage = voltage_mv
+                self._notify_progress()
+                
+                verdicts = await self._run_parallel_round(assignments)
+                for core_id, (_, voltage_mv) in assignments.items():
+                    states[core_id].record(voltage_mv, verdicts[core_id])
+        
+        finally:
+            # Always restore original settings
+            for core_id in core_ids:
+                await self._restore_original_state(core_id)
+            self.progress.running = False
+            self._notify_progress()
+        
+        curves = {}
+        for core_id, state in states.items():
+            self.monotone_violations.extend(state.monotone_violations)
+            curve = FrequencyCurve(
+                core_id=core_id,
+                points=state.points,
+                created_at=time.time(),
+                wizard_config=self.config.to_dict()
+            )
+            curve.validate()
+            curves[core_id] = curve
+        
+        logger.info(
+            f"Parallel wizard completed: {self.parallel_rounds} rounds, "
+            f"{self.isolation_retests} isolation re-tests"
+        )
+        
+        # Run verification tests
+        logger.info("Running verification tests...")
+        verification = await self._verify_curves_parallel(curves)
+        for core_id, passed in verification.items():
+            if not passed:
+                logger.warning(f"Verification tests failed for core {core_id} - curve may be unstable")
+        
+        return curves
+    
+    async def _run_parallel_round(self, assignments: Dict[int, Tuple[int, int]]) -> Dict[int, bool]:
+        """Test several cores at once and attribute failures to cores.
+        
+        A core that fails its own stress test is unstable. dmesg/MCE errors
+        and timeouts cannot be attributed to a core, so every core that
+        otherwise passed is ambiguous and is re-tested alone. A round with
+        a single core needs no re-test.
+        
+        Args:
+            assignments: Mapping core_id -> (freq_mhz, voltage_mv)
+            
+        Returns:
+            Mapping core_id -> stable
+            
+        Feature: frequency-based-wizard, Property 14: Temperature safety abort
+        Validates: Requirements 6.1, 9.1, 9.2, 9.3
+        """
+        self.parallel_rounds += 1
+        self.stress_test_count += len(assignments)
+        verdicts = {core_id: False for core_id in assignments}
+        ambiguous: List[int] = []
+        
+        # One shared duration: long enough for the most uncertain core
+        duration = max(
+            self._test_duration_for(core_id, freq_mhz, voltage_mv)
+            for core_id, (freq_mhz, voltage_mv) in assignments.items()
+        )
+        pacer = self._active_pacer()
+        if pacer is not None:
+            await pacer.wait_for_start(duration)
+        monitor_task = asyncio.create_task(
+            self._monitor_temperature_during_test(duration)
+        )
+        test_timeout = duration + TEST_TIMEOUT_MARGIN
+        
+        try:
+            results, dmesg_errors = await asyncio.wait_for(
+                self.test_runner.run_parallel_frequency_locked_round(
+                    assignments,
+                    duration
+                ),
+                timeout=test_timeout
+            )
+            
+            for core_id in assignments:
+                result = results.get(core_id)
+                verdicts[core_id] = result is not None and result.passed
+                if result is not None and not (dmesg_errors and result.passed):
+                    freq_mhz, voltage_mv = assignments[core_id]
+                    self._record_duration_result(core_id, freq_mhz, voltage_mv, result, duration)
+            
+            if dmesg_errors:
+                ambiguous = [core_id for core_id in assignments if verdicts[core_id]]
+                logger.warning(
+                    f"Round produced {len(dmesg_errors)} dmesg errors, "
+                    f"ambiguous cores: {ambiguous}"
+                )
+        
+        except asyncio.TimeoutError:
+            # Test timed out - any of the cores may have frozen
+            logger.error(f"Parallel round timeout detected (>{test_timeout}s): {assignments}")
+            ambiguous = list(assignments)
+        
+        except Exception as e:
+            logger.error(f"Parallel round failed with exception: {e}")
+            ambiguous = []
+        
+        finally:
+            monitor_task.cancel()
+            try:
+                await monitor_task
+            except asyncio.CancelledError:
+                pass
+        
+        if getattr(self, '_temperature_abort_triggered', False):
+            logger.warning(f"Round aborted due to temperature safety threshold: {assignments}")
+            return {core_id: False for core_id in assignments}
+        
+        if not ambiguous:
+            return verdicts
+        
+        if len(assignments) == 1:
+            # Only one core was under test, so the error is its own
+            return {core_id: False for core_id in assignments}
+        
+        for core_id in ambiguous:
+            if self.cancelled:
+                verdicts[core_id] = False
+                continue
+            
+            freq_mhz, voltage_mv = assignments[core_id]
+            self.isolation_retests += 1
+            logger.info(f"Re-testing core {core_id} in isolation: {freq_mhz}MHz @ {voltage_mv}mV")
+            verdicts[core_id] = await self._test_voltage_stability(core_id, freq_mhz, voltage_mv)
+        
+        return verdicts
+    
+    async def _complete_curve(self, core_id: int, points: List[FrequencyPoint]) -> FrequencyCurve:
+        """Create, validate and verify the curve of a finished sweep.
+        
+        Args:
+            core_id: CPU core ID
+            points: Points of the sweep, sorted by frequency
+            
+        Returns:
+            Validated frequency curve
+        """
         # Create frequency curve
         curve = FrequencyCurve(
             core_id=core_id,
@@ -461,7 +1399,8 @@ class FrequencyWizard:
         
         logger.info(
             f"Wizard completed successfully: {len(points)} points generated, "
-            f"{sum(1 for p in points if p.stable)} stable"
+            f"{sum(1 for p in points if p.stable)} stable, "
+            f"{len(self.monotone_violations)} monotone violations re-tested"
         )
         
         # Clear crash recovery marker on successful completion
@@ -478,6 +1417,126 @@ class FrequencyWizard:
         
         return curve
     
+    async def _run_sparse(self, core_id: int, frequencies: List[int]) -> FrequencyCurve:
+        """Execute a sparse frequency sweep for a CPU core.
+        
+        Searches anchor frequencies first and then only the grid frequencies
+        where the monotone model's interpolation error bound exceeds
+        sparse_tolerance (see SparseFrequencySampler). The remaining grid
+        frequencies are interpolated. Intermediate results are not persisted
+        in sparse mode; an interrupted sweep starts over.
+        
+        Args:
+            core_id: CPU core ID to test
+            frequencies: Full frequency grid in MHz
+            
+        Returns:
+            Frequency curve with a point for every grid frequency
+            
+        Raises:
+            WizardCancelled: If user cancels the wizard
+            
+        Feature: frequency-based-wizard, Property 5: Wizard frequency coverage completeness
+        Validates: Requirements 1.1, 1.4, 12.1
+        """
+        sampler = SparseFrequencySampler(frequencies, self.config.sparse_tolerance)
+        measured: List[FrequencyPoint] = []
+        
+        self.progress = WizardProgress(
+            running=True,
+            total_points=len(frequencies),
+            start_time=time.time()
+        )
+        self._notify_progress()
+        
+        # Store original state for restoration
+        try:
+            self._original_governors[core_id] = self.cpufreq.get_current_governor(core_id)
+        except CPUFreqError as e:
+            logger.warning(f"Failed to get original governor: {e}")
+            self._original_governors[core_id] = "schedutil"  # Default fallback
+        
+        try:
+            while (freq_mhz := sampler.next_frequency()) is not None:
+                # Check for cancellation
+                if self.cancelled:
+                    logger.info("Wizard cancelled by user")
+                    raise WizardCancelled("Wizard cancelled by user")
+                
+                self.progress.current_frequency = freq_mhz
+                self._notify_progress()
+                
+                sample = await self._sample_frequency(core_id, freq_mhz, measured)
+                sampler.add(sample)
+                
+                # Searched points seed the warm start of later searches
+                point = sample.to_frequency_point(self.config.safety_margin, self.config.test_duration)
+                measured = sorted(measured + [point], key=lambda p: p.frequency_mhz)
+                
+                self.progress.completed_points = len(sampler.samples)
+                self.progress.update_estimated_remaining()
+                self._notify_progress()
+        
+        finally:
+            await self._restore_original_state(core_id)
+            self.progress.running = False
+            self._notify_progress()
+        
+        logger.info(
+            f"Sparse sweep: searched {len(sampler.samples)}/{len(frequencies)} frequencies, "
+            f"max interpolation error bound {sampler.max_error_bound():.1f}mV "
+            f"(tolerance {self.config.sparse_tolerance}mV)"
+        )
+        
+        points = sampler.build_points(
+            self.config.safety_margin,
+            self.config.voltage_step,
+            self.config.test_duration
+        )
+        points = _enforce_monotone(points, self.config.monotone_noise_band)
+        
+        return await self._complete_curve(core_id, points)
+    
+    async def _sample_frequency(
+        self,
+        core_id: int,
+        freq_mhz: int,
+        measured: List[FrequencyPoint]
+    ) -> SampledPoint:
+        """Search one frequency of a sparse sweep.
+        
+        A result pinned at the monotone floor is searched again over the
+        full range.
+        
+        Args:
+            core_id: CPU core ID
+            freq_mhz: Frequency to search in MHz
+            measured: Points searched so far, sorted by frequency
+            
+        Returns:
+            Search result with its bracket
+        """
+        search = _create_voltage_search(self.config, freq_mhz, measured)
+        
+        for attempt in range(2):
+            try:
+                await self._run_voltage_search(core_id, freq_mhz, search)
+            except ConsecutiveFailureError:
+                logger.warning(
+                    f"Skipping frequency {freq_mhz} MHz after {CONSECUTIVE_FAILURE_THRESHOLD} "
+                    f"consecutive failures"
+                )
+                return SampledPoint(freq_mhz, 0, 0, stable=False)
+            
+            if attempt == 0 and search.violates_monotone():
+                logger.warning(f"Frequency {freq_mhz} MHz pinned at monotone floor, re-testing full range")
+                self.monotone_violations.append(freq_mhz)
+                search = _create_voltage_search(self.config, freq_mhz)
+                continue
+            break
+        
+        return SampledPoint(freq_mhz, search.last_stable_voltage, search.bracket_low)
+    
     def _calculate_frequency_points(self) -> List[int]:
         """Calculate list of frequency points to test.
         
@@ -514,41 +1573,27 @@ class FrequencyWizard:
         if not self.config.adaptive_step:
             return self.config.freq_step
         
-        # Track voltage history
-        self._last_voltages.append(current_voltage)
-        
-        # Keep only recent voltages (last 5)
-        if len(self._last_voltages) > 5:
-            self._last_voltages.pop(0)
-        
-        # Check if we have enough history
-        if len(self._last_voltages) < 3:
-            return self.config.freq_step
-        
-        # Check if recent voltages are similar (stable region)
-        recent_voltages = self._last_voltages[-3:]
-        max_voltage = max(recent_voltages)
-        min_voltage = min(recent_voltages)
-        voltage_range = max_voltage - min_voltage
+        adaptive_step = _adaptive_frequency_step(
+            self._last_voltages,
+            current_voltage,
+            self.config.freq_step,
+            self._voltage_similarity_threshold
+        )
         
-        if voltage_range <= self._voltage_similarity_threshold:
+        if adaptive_step > self.config.freq_step:
             # Stable region detected - increase step
             self._consecutive_stable_count += 1
             
-            # Increase step size (max 3x base step)
-            step_multiplier = min(2, 3)  # Start with 2x, max 3x
-            adaptive_step = self.config.freq_step * step_multiplier
-            
+            recent_voltages = self._last_voltages[-3:]
             logger.info(
-                f"Stable region detected (range={voltage_range}mV), "
+                f"Stable region detected (range={max(recent_voltages) - min(recent_voltages)}mV), "
                 f"increasing step to {adaptive_step}MHz"
             )
-            
-            return adaptive_step
         else:
             # Not stable - reset counter and use base step
             self._consecutive_stable_count = 0
-            return self.config.freq_step
+        
+        return adaptive_step
     
     def _save_intermediate_results(self, core_id: int, points: List[FrequencyPoint]) -> None:
         """Save intermediate results to allow resumption after interruption.
@@ -692,17 +1737,22 @@ class FrequencyWizard:
     async def _test_frequency_point(
         self,
         core_id: int,
-        freq_mhz: int
+        freq_mhz: int,
+        previous_points: Optional[List[FrequencyPoint]] = None
     ) -> FrequencyPoint:
         """Find optimal voltage for a single frequency point.
         
-        Uses binary search to find the maximum stable voltage offset (most aggressive
-        undervolt) for the given frequency. Implements consecutive failure tracking
+        Searches for the maximum stable voltage offset (most aggressive
+        undervolt) for the given frequency. With previous points of the
+        same sweep and warm_start enabled, the search is seeded from them
+        and bounded by the monotone constraint; otherwise it is a binary
+        search over the full range. Implements consecutive failure tracking
         to skip unstable frequencies.
         
         Args:
             core_id: CPU core ID
             freq_mhz: Frequency to test in MHz
+            previous_points: Completed points of this sweep (None for a cold search)
             
         Returns:
             FrequencyPoint with test results
@@ -713,17 +1763,10 @@ class FrequencyWizard:
         """
         logger.info(f"Testing frequency point: {freq_mhz} MHz")
         
-        # Track consecutive failures for this frequency
-        consecutive_failures = 0
+        search = _create_voltage_search(self.config, freq_mhz, previous_points)
         
-        # Binary search for optimal voltage
         try:
-            stable_voltage = await self._binary_search_voltage(
-                core_id,
-                freq_mhz,
-                self.config.voltage_start,
-                self.config.voltage_step
-            )
+            stable_voltage = await self._run_voltage_search(core_id, freq_mhz, search)
         except ConsecutiveFailureError as e:
             # Three consecutive failures - skip this frequency
             logger.warning(
@@ -742,6 +1785,13 @@ class FrequencyWizard:
             
             return point
         
+        if search.violates_monotone():
+            logger.warning(
+                f"Frequency {freq_mhz} MHz pinned at monotone floor {search.voltage_low}mV, "
+                f"flagged for re-test"
+            )
+            self.monotone_violations.append(freq_mhz)
+        
         # Add safety margin
         final_voltage = stable_voltage + self.config.safety_margin
         
@@ -750,7 +1800,8 @@ class FrequencyWizard:
         
         logger.info(
             f"Frequency {freq_mhz} MHz: stable_voltage={stable_voltage}mV, "
-            f"final_voltage={final_voltage}mV (with {self.config.safety_margin}mV margin)"
+            f"final_voltage={final_voltage}mV (with {self.config.safety_margin}mV margin, "
+            f"{search.test_count} tests)"
         )
         
         # Create frequency point
@@ -764,6 +1815,41 @@ class FrequencyWizard:
         
         return point
     
+    async def _resolve_monotone_violations(
+        self,
+        core_id: int,
+        points: List[FrequencyPoint]
+    ) -> List[FrequencyPoint]:
+        """Re-test monotone violations and enforce the monotone constraint.
+        
+        Args:
+            core_id: CPU core ID
+            points: Completed points of the sweep, sorted by frequency
+            
+        Returns:
+            Points with re-tested values, lifted where still non-monotone
+            
+        Feature: frequency-based-wizard
+        Validates: Requirements 1.3
+        """
+        retest = _monotone_retest_frequencies(points, self.monotone_violations)
+        
+        for freq_mhz in retest:
+            if self.cancelled:
+                logger.info("Wizard cancelled by user")
+                raise WizardCancelled("Wizard cancelled by user")
+            
+            logger.info(f"Re-testing {freq_mhz} MHz with full voltage range (monotone violation)")
+            # A spurious result may be stored, so really re-run the tests
+            self._consult_knowledge = False
+            try:
+                point = await self._test_frequency_point(core_id, freq_mhz)
+            finally:
+                self._consult_knowledge = True
+            points = [point if p.frequency_mhz == freq_mhz else p for p in points]
+        
+        return _enforce_monotone(points, self.config.monotone_noise_band)
+    
     async def _binary_search_voltage(
         self,
         core_id: int,
@@ -792,74 +1878,118 @@ class FrequencyWizard:
         Feature: frequency-based-wizard, Property 16: Consecutive failure skip
         Validates: Requirements 6.2, 9.4
         """
-        # Start with conservative voltage (0 mV = no undervolt)
-        voltage_low = voltage_start  # Most aggressive (e.g., -30)
-        voltage_high = 0  # Most conservative (no undervolt)
+        return await self._run_voltage_search(
+            core_id,
+            freq_mhz,
+            VoltageSearch(voltage_start, voltage_step)
+        )
+    
+    async def _run_voltage_search(
+        self,
+        core_id: int,
+        freq_mhz: int,
+        search: Union[VoltageSearch, BayesianVoltageSearch]
+    ) -> int:
+        """Run stability tests until a voltage search completes.
+        
+        Args:
+            core_id: CPU core ID
+            freq_mhz: Frequency to test in MHz
+            search: Search state for this frequency
+            
+        Returns:
+            Most aggressive stable voltage offset in mV
+            
+        Raises:
+            ConsecutiveFailureError: If consecutive failures exceed threshold
+            
+        Feature: frequency-based-wizard, Property 16: Consecutive failure skip
+        Validates: Requirements 6.2, 9.4
+        """
+        logger.info(
+            f"Voltage search: freq={freq_mhz}MHz, "
+            f"voltage_range=[{search.voltage_low}, {search.voltage_high}]mV, "
+            f"step={search.voltage_step}mV"
+        )
+        
+        consult_knowledge = self._consult_knowledge
+        if isinstance(search, BayesianVoltageSearch):
+            # Repeated tests carry information here, so seed the model with
+            # earlier evidence instead of skipping tests
+            if self._knowledge_base is not None and consult_knowledge:
+                passes, failures = self._knowledge_base.matching(
+                    core_id, "frequency_locked", self.config.test_duration, freq_mhz
+                )
+                search.seed([o.offset for o in passes], [o.offset for o in failures])
+            self._consult_knowledge = False
+        try:
+            await self._run_search_tests(core_id, freq_mhz, search)
+        finally:
+            self._consult_knowledge = consult_knowledge
         
-        last_stable_voltage = 0  # Default to no undervolt if all tests fail
-        consecutive_failures = 0
+        if self.cancelled:
+            return search.last_stable_voltage
+        
+        # Check if we've exceeded consecutive failure threshold
+        if search.failed:
+            logger.warning(
+                f"Consecutive failure threshold reached ({search.consecutive_failures})"
+            )
+            raise ConsecutiveFailureError(
+                f"Failed {search.consecutive_failures} consecutive tests at {freq_mhz}MHz"
+            )
         
         logger.info(
-            f"Binary search: freq={freq_mhz}MHz, "
-            f"voltage_range=[{voltage_low}, {voltage_high}]mV, step={voltage_step}mV"
+            f"Voltage search complete: freq={freq_mhz}MHz, "
+            f"stable_voltage={search.last_stable_voltage}mV, tests={search.test_count}"
         )
         
-        # Binary search loop
-        while voltage_high - voltage_low > voltage_step:
+        return search.last_stable_voltage
+    
+    async def _run_search_tests(
+        self,
+        core_id: int,
+        freq_mhz: int,
+        search: Union[VoltageSearch, BayesianVoltageSearch]
+    ) -> None:
+        """Test the voltages a search hands out until it completes or is cancelled.
+        
+        Args:
+            core_id: CPU core ID
+            freq_mhz: Frequency to test in MHz
+            search: Search state for this frequency
+        """
+        while True:
             # Check for cancellation
             if self.cancelled:
-                logger.info("Binary search cancelled")
-                return last_stable_voltage
+                logger.info("Voltage search cancelled")
+                return
             
-            # Calculate midpoint
-            voltage_mid = (voltage_low + voltage_high) // 2
-            
-            # Round to nearest step
-            voltage_mid = (voltage_mid // voltage_step) * voltage_step
+            voltage_mv = search.next_voltage()
+            if voltage_mv is None:
+                return
             
             # Update progress
-            self.progress.current_voltage = voltage_mid
+            self.progress.current_voltage = voltage_mv
             self._notify_progress()
             
-            logger.info(f"Testing voltage: {voltage_mid}mV at {freq_mhz}MHz")
+            logger.info(f"Testing voltage: {voltage_mv}mV at {freq_mhz}MHz")
             
             # Run stability test
             is_stable = await self._test_voltage_stability(
                 core_id,
                 freq_mhz,
-                voltage_mid
+                voltage_mv
             )
+            search.record(voltage_mv, is_stable)
             
             if is_stable:
-                # Voltage is stable, try more aggressive
-                last_stable_voltage = voltage_mid
-                voltage_high = voltage_mid
-                consecutive_failures = 0  # Reset failure counter
-                logger.info(f"Voltage {voltage_mid}mV is STABLE")
+                logger.info(f"Voltage {voltage_mv}mV is STABLE")
             else:
-                # Voltage is unstable, try more conservative
-                voltage_low = voltage_mid
-                consecutive_failures += 1
                 logger.info(
-                    f"Voltage {voltage_mid}mV is UNSTABLE "
-                    f"(consecutive failures: {consecutive_failures})"
+                    f"Voltage {voltage_mv}mV is UNSTABLE "
+                    f"(consecutive failures: {search.consecutive_failures})"
                 )
-                
-                # Check if we've exceeded consecutive failure threshold
-                if consecutive_failures >= CONSECUTIVE_FAILURE_THRESHOLD:
-                    logger.warning(
-                        f"Consecutive failure threshold reached ({consecutive_failures})"
-                    )
-                    raise ConsecutiveFailureError(
-                        f"Failed {consecutive_failures} consecutive tests at {freq_mhz}MHz"
-                    )
-        
-        logger.info(
-            f"Binary search complete: freq={freq_mhz}MHz, "
-            f"stable_voltage={last_stable_voltage}mV"
-        )
-        
-        return last_stable_voltage
     
     async def _test_voltage_stability(
         self,
@@ -883,25 +2013,49 @@ class FrequencyWizard:
         Feature: frequency-based-wizard, Property 14: Temperature safety abort
         Validates: Requirements 9.1, 9.2, 9.3
         """
+        if self._knowledge_base is not None and self._consult_knowledge:
+            known = self._knowledge_base.lookup(
+                core_id, voltage_mv, "frequency_locked", self.config.test_duration, freq_mhz
+            )
+            if known is not None:
+                logger.info(
+                    f"Skipping test at {freq_mhz}MHz, {voltage_mv}mV: "
+                    f"known {'stable' if known else 'unstable'}"
+                )
+                return known
+        
+        self.stress_test_count += 1
+        duration = self._test_duration_for(core_id, freq_mhz, voltage_mv)
+        pacer = self._active_pacer()
+        start_temp, peak_temp, cooldown = None, None, 0.0
+        
         try:
+            if pacer is not None:
+                start_temp, cooldown = await pacer.wait_for_start(duration)
+            
             # Start temperature monitoring task
             monitor_task = asyncio.create_task(
-                self._monitor_temperature_during_test(self.config.test_duration)
+                self._monitor_temperature_during_test(duration)
             )
             
             # Start the actual test with timeout
-            test_timeout = self.config.test_duration + TEST_TIMEOUT_MARGIN
+            test_timeout = duration + TEST_TIMEOUT_MARGIN
             
             try:
-                result = await asyncio.wait_for(
+                test = asyncio.wait_for(
                     self.test_runner.run_frequency_locked_test(
                         core_id=core_id,
                         freq_mhz=freq_mhz,
                         voltage_mv=voltage_mv,
-                        duration=self.config.test_duration
+                        duration=duration
                     ),
                     timeout=test_timeout
                 )
+                if pacer is not None:
+                    result, paced_run = await pacer.track(duration, test, start_temp, cooldown)
+                    peak_temp = paced_run.peak_temp
+                else:
+                    result = await test
                 
                 # Cancel temperature monitoring
                 monitor_task.cancel()
@@ -918,6 +2072,10 @@ class FrequencyWizard:
                     )
                     return False
                 
+                self._record_duration_result(core_id, freq_mhz, voltage_mv, result, duration)
+                self._record_observation(
+                    core_id, freq_mhz, voltage_mv, result.passed, duration, start_temp, peak_temp
+                )
                 return result.passed
             
             except asyncio.TimeoutError:
@@ -934,12 +2092,75 @@ class FrequencyWizard:
                 except asyncio.CancelledError:
                     pass
                 
+                self._record_observation(core_id, freq_mhz, voltage_mv, False, duration, start_temp)
                 return False
         
         except Exception as e:
             logger.error(f"Test failed with exception: {e}")
             return False
     
+    def _record_observation(
+        self,
+        core_id: int,
+        freq_mhz: int,
+        voltage_mv: int,
+        passed: bool,
+        duration: Optional[int] = None,
+        temperature: Optional[float] = None,
+        peak_temperature: Optional[float] = None
+    ) -> None:
+        """Store a stress test result in the knowledge base, if set."""
+        if self._knowledge_base is not None:
+            self._knowledge_base.record(
+                core_id, voltage_mv, "frequency_locked", duration or self.config.test_duration, passed, freq_mhz,
+                temperature=temperature, peak_temperature=peak_temperature
+            )
+    
+    def _active_pacer(self) -> Optional[ThermalPacer]:
+        """Pacer for the next test, or None without thermal_pacing."""
+        if not self.config.thermal_pacing:
+            return None
+        if self._thermal_pacer is None:
+            self._thermal_pacer = ThermalPacer(sensor=self._sensor_hub())
+        return self._thermal_pacer
+    
+    def _sensor_hub(self) -> Optional[SensorHub]:
+        """The test runner's shared SensorHub, if it has one."""
+        hub = getattr(self.test_runner, "sensor_hub", None)
+        return hub if isinstance(hub, SensorHub) else None
+    
+    def _test_duration_for(self, core_id: int, freq_mhz: int, voltage_mv: int) -> int:
+        """Duration of the next test in seconds.
+        
+        test_duration, or with adaptive_duration the duration the
+        sequential stopping rule needs for this voltage (see
+        SequentialDurationPolicy).
+        """
+        if not self.config.adaptive_duration:
+            return self.config.test_duration
+        
+        if self._duration_policy is None:
+            self._duration_policy = SequentialDurationPolicy(
+                self.config.test_duration, self.config.false_pass_rate,
+                offset_min=-100 - self.config.voltage_step
+            )
+        return self._duration_policy.duration_for((core_id, freq_mhz), voltage_mv)
+    
+    def _record_duration_result(
+        self,
+        core_id: int,
+        freq_mhz: int,
+        voltage_mv: int,
+        result: Any,
+        duration: int
+    ) -> None:
+        """Feed a test result to the duration policy, if adaptive."""
+        if self._duration_policy is not None:
+            self._duration_policy.record(
+                (core_id, freq_mhz), voltage_mv, result.passed,
+                getattr(result, "time_to_failure", None), duration
+            )
+    
     async def _monitor_temperature_during_test(self, duration: int) -> None:
         """Monitor CPU temperature during test and abort if threshold exceeded.
         
@@ -958,9 +2179,12 @@ class FrequencyWizard:
             for _ in range(duration):
                 await asyncio.sleep(1)
                 
-                # Read current temperature
-                metrics = self.test_runner.get_system_metrics()
-                temp = metrics.get('temperature')
+                # Read current temperature (only the temperature from a hub)
+                hub = self._sensor_hub()
+                if hub is not None:
+                    temp = hub.read_temperature()
+                else:
+                    temp = self.test_runner.get_system_metrics().get('temperature')
                 
                 if temp is not None and temp > TEMPERATURE_ABORT_THRESHOLD:
                     logger.critical(
@@ -1073,6 +2297,58 @@ class FrequencyWizard:
         # Consider verification successful if all tests passed
         return failed_count == 0
     
+    async def _verify_curves_parallel(self, curves: Dict[int, FrequencyCurve]) -> Dict[int, bool]:
+        """Run verification tests for several curves in parallel rounds.
+        
+        Selects up to VERIFICATION_TEST_COUNT random stable points per core
+        and tests the i-th point of every core in the same round.
+        
+        Args:
+            curves: Mapping core_id -> generated frequency curve
+            
+        Returns:
+            Mapping core_id -> True if all of its verification tests passed
+            
+        Feature: frequency-based-wizard, Property 21: Verification test execution
+        Validates: Requirements 9.5
+        """
+        selected: Dict[int, List[FrequencyPoint]] = {}
+        passed: Dict[int, bool] = {}
+        
+        for core_id, curve in curves.items():
+            stable_points = [p for p in curve.points if p.stable]
+            if not stable_points:
+                logger.warning(f"No stable points to verify for core {core_id}")
+                passed[core_id] = False
+                continue
+            
+            num_verify = min(VERIFICATION_TEST_COUNT, len(stable_points))
+            selected[core_id] = random.sample(stable_points, num_verify)
+            passed[core_id] = True
+        
+        num_rounds = max((len(points) for points in selected.values()), default=0)
+        for index in range(num_rounds):
+            if self.cancelled:
+                logger.info("Verification cancelled")
+                return {core_id: False for core_id in curves}
+            
+            assignments = {
+                core_id: (points[index].frequency_mhz, points[index].voltage_mv)
+                for core_id, points in selected.items()
+                if index < len(points)
+            }
+            verdicts = await self._run_parallel_round(assignments)
+            
+            for core_id, stable in verdicts.items():
+                if not stable:
+                    freq_mhz, _ = assignments[core_id]
+                    logger.warning(f"Verification FAILED: core {core_id} at {freq_mhz}MHz")
+                    passed[core_id] = False
+        
+        logger.info(f"Verification complete: {passed}")
+        
+        return passed
+    
     def _notify_progress(self) -> None:
         """Notify progress callback if set."""
         if self.progress_callback:
@@ -14,12 +14,16 @@ import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Dict, Any, Tuple, TYPE_CHECKING
+
+from .thermal_margin import TemperatureLimitModel, recommended_margin
+from .vdroop import SWEEP_RANGE_HZ, VdroopTestResult
 
 if TYPE_CHECKING:
     from ..core.ryzenadj import RyzenadjWrapper
     from ..core.safety import SafetyManager
     from ..api.events import EventEmitter
+    from .knowledge_base import StabilityKnowledgeBase
     from .vdroop import VdroopTester
 
 logger = logging.getLogger(__name__)
@@ -98,6 +102,15 @@ class IronSeekerConfig:
         test_duration: Test duration per iteration in seconds (default 60, valid range [10, 300])
         safety_margin: Safety margin to add to results in mV (default 5, valid range [0, 20])
         vdroop_pulse_ms: Pulse duration for Vdroop test in ms (default 100)
+        vdroop_sweep: Sweep the pulse frequency from 1 Hz to 1 kHz instead
+            of using vdroop_pulse_ms (default False)
+        vdroop_phase_aligned: Step all cores to load at the same instant
+            (default True); False staggers them across the period
+        temperature_margin: Size each core's margin from its limit-vs-
+            temperature model instead of using safety_margin (default
+            False; needs a knowledge base)
+        design_temperature: Temperature in °C the margin must hold at
+            (default None: the hottest test)
     
     Requirements: 7.1, 7.2, 7.3
     """
@@ -105,6 +118,10 @@ class IronSeekerConfig:
     test_duration: int = 60
     safety_margin: int = 5
     vdroop_pulse_ms: int = 100
+    vdroop_sweep: bool = False
+    vdroop_phase_aligned: bool = True
+    temperature_margin: bool = False
+    design_temperature: Optional[float] = None
     
     def __post_init__(self) -> None:
         """Clamp configuration values to valid ranges.
@@ -139,6 +156,10 @@ class CoreResult:
         quality_tier: Quality tier string ("gold", "silver", or "bronze")
         iterations: Number of test iterations performed
         failed_value: Value that caused failure (if any), None if hit limit
+        margin: Margin applied to max_stable in mV (None for the configured
+            safety_margin)
+        limit_by_band: Estimated limit in mV per temperature band (lower
+            edge in °C), with temperature_margin only
     
     Requirements: 4.1, 4.2, 4.3, 4.4
     """
@@ -148,6 +169,8 @@ class CoreResult:
     quality_tier: str
     iterations: int
     failed_value: Optional[int] = None
+    margin: Optional[int] = None
+    limit_by_band: Dict[int, int] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -597,6 +620,28 @@ class IronSeekerEngine:
         # Progress tracking
         self._current_iteration: int = 0  # Current iteration within core
         self._total_iterations_per_core: int = 0  # Estimated iterations per core
+        
+        # Shared stability evidence
+        self._knowledge_base: Optional["StabilityKnowledgeBase"] = None
+        self._temperature_sensor: Optional[Any] = None
+    
+    def set_knowledge_base(self, knowledge_base: "StabilityKnowledgeBase") -> None:
+        """Set the stability knowledge base consulted before each test.
+        
+        Args:
+            knowledge_base: Shared StabilityKnowledgeBase instance
+        """
+        self._knowledge_base = knowledge_base
+    
+    def set_temperature_sensor(self, sensor: Any) -> None:
+        """Set the sensor whose readings are recorded with each test.
+        
+        Args:
+            sensor: Object with a read_temperature() method returning °C
+                or None (default when temperature_margin is enabled:
+                HwmonInterface())
+        """
+        self._temperature_sensor = sensor
     
     def is_running(self) -> bool:
         """Check if Iron Seeker is currently running.
@@ -687,6 +732,49 @@ class IronSeekerEngine:
         """
         return calculate_recommended_value(max_stable, safety_margin)
     
+    def _read_temperature(self) -> Optional[float]:
+        """Current temperature in °C, or None without a sensor reading."""
+        if self._temperature_sensor is None:
+            return None
+        try:
+            return self._temperature_sensor.read_temperature()
+        except Exception as e:
+            logger.debug(f"Temperature read failed: {e}")
+            return None
+    
+    def _temperature_margin(
+        self,
+        core_index: int,
+        max_stable: int,
+        config: IronSeekerConfig
+    ) -> Tuple[Optional[int], Dict[int, int]]:
+        """Margin for a core from its limit-vs-temperature model.
+        
+        Args:
+            core_index: Core (0-3)
+            max_stable: Maximum stable value found in mV
+            config: Iron Seeker configuration
+            
+        Returns:
+            Tuple of (margin in mV or None without temperature data,
+            limit per temperature band)
+        """
+        if not config.temperature_margin or self._knowledge_base is None:
+            return None, {}
+        
+        model = TemperatureLimitModel.from_observations(
+            self._knowledge_base.observations, core_index, test_types={"vdroop"},
+            offset_min=self._safe_limit - config.step_size
+        )
+        margin = recommended_margin(model, max_stable, config.design_temperature)
+        if margin is not None:
+            logger.info(
+                f"Core {core_index}: {margin}mV margin for "
+                f"{config.design_temperature or max(model.temperatures):.0f}°C "
+                f"(coefficient {model.coefficient():.2f}mV/°C)"
+            )
+        return margin, model.limit_by_band(config.design_temperature)
+    
     def _build_apply_values(self, core_being_tested: int, test_value: int) -> List[int]:
         """Build the values array to apply during testing.
         
@@ -953,29 +1041,52 @@ class IronSeekerEngine:
                 estimated_iterations_per_core=estimated_iterations_per_core
             )
             
-            # Persist state before applying (Req 3.1)
-            await self._persist_state(core_index, test_value, config)
-            
-            # Build values array with proper isolation (Req 1.1)
-            apply_values = self._build_apply_values(core_index, test_value)
+            known = None
+            if self._knowledge_base is not None:
+                known = self._knowledge_base.lookup(core_index, test_value, "vdroop", config.test_duration)
             
-            # Apply the values
-            logger.info(f"Testing core {core_index} at {test_value}mV, applying: {apply_values}")
-            success, error = await self._ryzenadj.apply_values_async(apply_values)
-            
-            if not success:
-                logger.error(f"Failed to apply values: {error}")
-                failed_value = test_value
-                break
-            
-            # Run Vdroop test
-            test_start = time.time()
-            result = await self._vdroop_tester.run_vdroop_test(
-                config.test_duration,
-                config.vdroop_pulse_ms
-            )
-            test_duration = time.time() - test_start
-            self._test_durations.append(test_duration)
+            if known is not None:
+                logger.info(f"Core {core_index}: {test_value}mV known {'stable' if known else 'unstable'}, skipping test")
+                result = VdroopTestResult(
+                    passed=known,
+                    duration=0.0,
+                    exit_code=0,
+                    mce_detected=False,
+                    error=None if known else "Known unstable"
+                )
+            else:
+                # Persist state before applying (Req 3.1)
+                await self._persist_state(core_index, test_value, config)
+                
+                # Build values array with proper isolation (Req 1.1)
+                apply_values = self._build_apply_values(core_index, test_value)
+                
+                # Apply the values
+                logger.info(f"Testing core {core_index} at {test_value}mV, applying: {apply_values}")
+                success, error = await self._ryzenadj.apply_values_async(apply_values)
+                
+                if not success:
+                    logger.error(f"Failed to apply values: {error}")
+                    failed_value = test_value
+                    break
+                
+                # Run Vdroop test
+                start_temp = self._read_temperature()
+                test_start = time.time()
+                result = await self._vdroop_tester.run_vdroop_test(
+                    config.test_duration,
+                    config.vdroop_pulse_ms
+                )
+                test_duration = time.time() - test_start
+                self._test_durations.append(test_duration)
+                end_temp = self._read_temperature()
+                
+                if self._knowledge_base is not None:
+                    readings = [t for t in (start_temp, end_temp) if t is not None]
+                    self._knowledge_base.record(
+                        core_index, test_value, "vdroop", config.test_duration, result.passed,
+                        temperature=start_temp, peak_temperature=max(readings) if readings else None
+                    )
             
             if result.passed:
                 # Test passed - this value is stable
@@ -1004,7 +1115,10 @@ class IronSeekerEngine:
         
         # Calculate quality tier and recommended value
         tier = QualityTier.from_value(max_stable)
-        recommended = self._calculate_recommended(max_stable, config.safety_margin)
+        margin, limit_by_band = self._temperature_margin(core_index, max_stable, config)
+        recommended = self._calculate_recommended(
+            max_stable, config.safety_margin if margin is None else margin
+        )
         
         return CoreResult(
             core_index=core_index,
@@ -1012,7 +1126,9 @@ class IronSeekerEngine:
             recommended=recommended,
             quality_tier=tier.value,
             iterations=iterations,
-            failed_value=failed_value
+            failed_value=failed_value,
+            margin=margin,
+            limit_by_band=limit_by_band
         )
     
     async def start(
@@ -1039,6 +1155,12 @@ class IronSeekerEngine:
         self._cancelled = False
         self._config = config or IronSeekerConfig()
         self._start_time = time.time()
+        if self._config.temperature_margin and self._temperature_sensor is None:
+            from ..core.fan_control import HwmonInterface
+            self._temperature_sensor = HwmonInterface()
+        if self._vdroop_tester is not None:
+            self._vdroop_tester.sweep_hz = SWEEP_RANGE_HZ if self._config.vdroop_sweep else None
+            self._vdroop_tester.phase_aligned = self._config.vdroop_phase_aligned
         self._test_durations = []
         
         # Initialize tracking
@@ -1119,7 +1241,10 @@ class IronSeekerEngine:
                     # Create result from recovered data
                     max_stable = self._core_results[core_index]
                     tier = QualityTier.from_value(max_stable)
-                    recommended = self._calculate_recommended(max_stable, self._config.safety_margin)
+                    margin, limit_by_band = self._temperature_margin(core_index, max_stable, self._config)
+                    recommended = self._calculate_recommended(
+                        max_stable, self._config.safety_margin if margin is None else margin
+                    )
                     failed = self._failed_values.get(core_index, [None])[-1] if core_index in self._failed_values else None
                     
                     results.insert(core_index, CoreResult(
@@ -1128,7 +1253,9 @@ class IronSeekerEngine:
                         recommended=recommended,
                         quality_tier=tier.value,
                         iterations=0,  # Unknown from recovery
-                        failed_value=failed
+                        failed_value=failed,
+                        margin=margin,
+                        limit_by_band=limit_by_band
                     ))
             
             # If cancelled, restore initial values (Req 3.5)
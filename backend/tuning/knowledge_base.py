@@ -0,0 +1,402 @@
+"""Persistent stability knowledge base shared by all tuning engines.
+
+Feature: decktune, Stability Knowledge Base
+Validates: Requirements 2.1, 2.3
+
+Every stress test result is stored as an observation keyed by core, offset,
+frequency lock, test type, test duration and temperature band, together
+with the platform identity (model, variant, BIOS version). Engines consult
+the store before testing: an offset that is already settled is answered
+from the store instead of running the stress test again.
+
+# Dominance Rules
+
+Observations only settle a query if they are at least as strong as the
+test that would be run:
+
+- A failure at offset F means every offset <= F fails. It applies to
+  queries with an equal or longer duration and an equal or hotter band.
+  A single core failing also settles the lockstep (all cores) query.
+- A pass at offset P means every offset >= P passes. It applies to queries
+  with an equal or shorter duration and an equal or cooler band. A lockstep
+  pass also settles the per-core query.
+
+Where a pass and a failure contradict each other (P <= F, e.g. after a
+spurious failure was re-tested), the offsets between them stay unsettled.
+
+# Invalidation
+
+The store is bound to the platform identity. When the model, variant or
+BIOS version differs from the stored one, all observations are discarded.
+
+# Usage Example
+
+```python
+kb = StabilityKnowledgeBase(Path(settings_dir) / "stability_knowledge.json", platform)
+known = kb.lookup(core, offset, "cpu_quick", 30)
+if known is None:
+    known = await run_test()
+    kb.record(core, offset, "cpu_quick", 30, known, temperature=62.0)
+```
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..platform.detect import PlatformInfo
+
+logger = logging.getLogger(__name__)
+
+# Core index of observations made with all cores at the same offset
+ALL_CORES = -1
+
+# Width of a temperature band in °C
+TEMPERATURE_BAND_C = 10
+
+
+def temperature_band(temperature: Optional[float]) -> Optional[int]:
+    """Lower edge of the temperature band containing temperature.
+
+    Args:
+        temperature: Temperature in °C, or None if unknown
+
+    Returns:
+        Band lower edge in °C, or None if unknown
+    """
+    if temperature is None:
+        return None
+    return int(temperature // TEMPERATURE_BAND_C) * TEMPERATURE_BAND_C
+
+
+@dataclass
+class StabilityObservation:
+    """Result of one stress test.
+
+    Attributes:
+        core: Core index (0-3) or ALL_CORES for lockstep tests
+        offset: Tested offset in mV
+        freq_mhz: Locked frequency in MHz (0 if not frequency locked)
+        test_type: Test name (e.g. "cpu_quick", "combo", "vdroop")
+        duration: Test duration in seconds
+        temp_band: Temperature band lower edge in °C (None if unknown)
+        passed: True if the test passed
+        timestamp: Unix timestamp of the test
+        start_temp: Temperature at the start of the test in °C (None if
+            unknown)
+        peak_temp: Highest temperature during the test in °C (None if
+            unknown)
+    """
+    core: int
+    offset: int
+    freq_mhz: int
+    test_type: str
+    duration: int
+    temp_band: Optional[int]
+    passed: bool
+    timestamp: float
+    start_temp: Optional[float] = None
+    peak_temp: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StabilityObservation":
+        """Create StabilityObservation from dictionary.
+
+        Raises:
+            KeyError: If required fields are missing
+            TypeError: If field types are invalid
+        """
+        temp_band = data.get("temp_band")
+        start_temp = data.get("start_temp")
+        peak_temp = data.get("peak_temp")
+        return cls(
+            core=int(data["core"]),
+            offset=int(data["offset"]),
+            freq_mhz=int(data["freq_mhz"]),
+            test_type=str(data["test_type"]),
+            duration=int(data["duration"]),
+            temp_band=int(temp_band) if temp_band is not None else None,
+            passed=bool(data["passed"]),
+            timestamp=float(data["timestamp"]),
+            start_temp=float(start_temp) if start_temp is not None else None,
+            peak_temp=float(peak_temp) if peak_temp is not None else None
+        )
+
+
+def platform_identity(platform: "PlatformInfo") -> Dict[str, str]:
+    """Identity of the platform the observations are valid for.
+
+    Args:
+        platform: Detected platform
+
+    Returns:
+        Dictionary with model, variant and bios_version
+    """
+    return {
+        "model": platform.model,
+        "variant": platform.variant,
+        "bios_version": getattr(platform, "bios_version", ""),
+    }
+
+
+class StabilityKnowledgeBase:
+    """Local store of stability observations.
+
+    Feature: decktune, Stability Knowledge Base
+    Validates: Requirements 2.1, 2.3
+    """
+
+    # Oldest observations are dropped beyond this count
+    MAX_OBSERVATIONS = 5000
+
+    def __init__(self, path: Path, platform: "PlatformInfo"):
+        """Load the store, discarding it if the platform changed.
+
+        Args:
+            path: JSON file holding the observations
+            platform: Currently detected platform
+        """
+        self._path = Path(path)
+        self._identity = platform_identity(platform)
+        self._observations: List[StabilityObservation] = []
+        self._load()
+
+    @property
+    def observations(self) -> List[StabilityObservation]:
+        """All stored observations, oldest first."""
+        return list(self._observations)
+
+    def _load(self) -> None:
+        """Load observations from disk."""
+        if not self._path.exists():
+            return
+
+        try:
+            with open(self._path, "r") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Failed to load stability knowledge base: {e}")
+            return
+
+        if data.get("platform") != self._identity:
+            logger.info(
+                f"Platform changed ({data.get('platform')} -> {self._identity}), "
+                f"discarding {len(data.get('observations', []))} stability observations"
+            )
+            self.save()
+            return
+
+        for entry in data.get("observations", []):
+            try:
+                self._observations.append(StabilityObservation.from_dict(entry))
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid stability observation: {e}")
+
+        logger.info(f"Loaded {len(self._observations)} stability observations")
+
+    def save(self) -> bool:
+        """Write observations to disk atomically.
+
+        Returns:
+            True if saved successfully
+        """
+        data = {
+            "platform": self._identity,
+            "observations": [o.to_dict() for o in self._observations],
+        }
+        tmp_path = self._path.with_name(self._path.name + ".tmp")
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self._path)
+            return True
+        except OSError as e:
+            logger.error(f"Failed to save stability knowledge base: {e}")
+            return False
+
+    def set_platform(self, platform: "PlatformInfo") -> None:
+        """Update the platform identity, discarding observations if it changed.
+
+        Args:
+            platform: Newly detected platform
+        """
+        identity = platform_identity(platform)
+        if identity == self._identity:
+            return
+
+        logger.info(
+            f"Platform changed ({self._identity} -> {identity}), "
+            f"discarding {len(self._observations)} stability observations"
+        )
+        self._identity = identity
+        self._observations = []
+        self.save()
+
+    def clear(self) -> None:
+        """Discard all observations."""
+        self._observations = []
+        self.save()
+
+    def record(
+        self,
+        core: int,
+        offset: int,
+        test_type: str,
+        duration: int,
+        passed: bool,
+        freq_mhz: int = 0,
+        temperature: Optional[float] = None,
+        peak_temperature: Optional[float] = None
+    ) -> StabilityObservation:
+        """Store a test result and persist the store.
+
+        Args:
+            core: Core index (0-3) or ALL_CORES
+            offset: Tested offset in mV
+            test_type: Test name
+            duration: Test duration in seconds
+            passed: True if the test passed
+            freq_mhz: Locked frequency in MHz (0 if not locked)
+            temperature: Temperature at the start of the test in °C; sets
+                the temperature band
+            peak_temperature: Highest temperature during the test in °C
+
+        Returns:
+            The stored observation
+        """
+        observation = StabilityObservation(
+            core=core,
+            offset=offset,
+            freq_mhz=freq_mhz,
+            test_type=test_type,
+            duration=duration,
+            temp_band=temperature_band(temperature),
+            passed=passed,
+            timestamp=time.time(),
+            start_temp=temperature,
+            peak_temp=peak_temperature
+        )
+        self._observations.append(observation)
+        if len(self._observations) > self.MAX_OBSERVATIONS:
+            self._observations = self._observations[-self.MAX_OBSERVATIONS:]
+        self.save()
+        return observation
+
+    def matching(
+        self,
+        core: int,
+        test_type: str,
+        duration: int,
+        freq_mhz: int = 0,
+        temperature: Optional[float] = None
+    ) -> Tuple[List[StabilityObservation], List[StabilityObservation]]:
+        """Observations that settle a query, split by outcome.
+
+        Args:
+            core: Core index (0-3) or ALL_CORES
+            test_type: Test name
+            duration: Test duration in seconds
+            freq_mhz: Locked frequency in MHz (0 if not locked)
+            temperature: Current temperature in °C (None matches any band)
+
+        Returns:
+            Tuple of (applicable passes, applicable failures)
+        """
+        band = temperature_band(temperature)
+        passes: List[StabilityObservation] = []
+        failures: List[StabilityObservation] = []
+
+        for o in self._observations:
+            if o.test_type != test_type or o.freq_mhz != freq_mhz:
+                continue
+
+            comparable_band = band is None or o.temp_band is None
+            if o.passed:
+                if (
+                    o.core in (core, ALL_CORES)
+                    and o.duration >= duration
+                    and (comparable_band or o.temp_band >= band)
+                ):
+                    passes.append(o)
+            elif (
+                (o.core == core or core == ALL_CORES)
+                and o.duration <= duration
+                and (comparable_band or o.temp_band <= band)
+            ):
+                failures.append(o)
+
+        return passes, failures
+
+    def bracket(
+        self,
+        core: int,
+        test_type: str,
+        duration: int,
+        freq_mhz: int = 0,
+        temperature: Optional[float] = None
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Settled search bracket for a query.
+
+        Args:
+            core: Core index (0-3) or ALL_CORES
+            test_type: Test name
+            duration: Test duration in seconds
+            freq_mhz: Locked frequency in MHz (0 if not locked)
+            temperature: Current temperature in °C
+
+        Returns:
+            Tuple of (last_good, first_fail): the most aggressive offset
+            settled as passing and the least aggressive offset settled as
+            failing; None where unknown
+        """
+        passes, failures = self.matching(core, test_type, duration, freq_mhz, temperature)
+        most_aggressive_pass = min((o.offset for o in passes), default=None)
+        least_aggressive_fail = max((o.offset for o in failures), default=None)
+
+        # Offsets (whole mV) claimed by both a pass and a failure are unsettled
+        last_good = most_aggressive_pass
+        if last_good is not None and least_aggressive_fail is not None:
+            last_good = max(last_good, least_aggressive_fail + 1)
+        first_fail = least_aggressive_fail
+        if first_fail is not None and most_aggressive_pass is not None:
+            first_fail = min(first_fail, most_aggressive_pass - 1)
+        return last_good, first_fail
+
+    def lookup(
+        self,
+        core: int,
+        offset: int,
+        test_type: str,
+        duration: int,
+        freq_mhz: int = 0,
+        temperature: Optional[float] = None
+    ) -> Optional[bool]:
+        """Known outcome of a test, if settled.
+
+        Args:
+            core: Core index (0-3) or ALL_CORES
+            offset: Offset to test in mV
+            test_type: Test name
+            duration: Test duration in seconds
+            freq_mhz: Locked frequency in MHz (0 if not locked)
+            temperature: Current temperature in °C
+
+        Returns:
+            True if known stable, False if known unstable, None if unsettled
+        """
+        last_good, first_fail = self.bracket(core, test_type, duration, freq_mhz, temperature)
+        if first_fail is not None and offset <= first_fail:
+            return False
+        if last_good is not None and offset >= last_good:
+            return True
+        return None
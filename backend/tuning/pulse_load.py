@@ -0,0 +1,420 @@
+"""Duty-cycle load pulse generator for Vdroop testing.
+
+Feature: iron-seeker, VdroopTester Module
+Validates: Requirements 2.1, 2.2, 2.4
+
+Transient droop happens when a core goes from idle to full load faster
+than the voltage regulator can respond. A continuous stress load only
+produces that step once, so this generator alternates full load and
+idle on every core with fixed on/off periods for the whole test.
+
+The script is standalone (standard library only, no package imports) so
+VdroopTester can start it with any Python 3 interpreter. Each worker
+process is pinned to one core with sched_setaffinity.
+
+# Timing
+
+All workers share one start time on CLOCK_MONOTONIC, passed on the
+command line, and compute every pulse edge from it as an absolute
+deadline. Idle phases sleep with clock_nanosleep(TIMER_ABSTIME) through
+ctypes (Python has no timerfd binding before 3.13), falling back to a
+relative sleep to the same deadline. Because edges never depend on when
+the previous phase actually ended, wake-up latency does not accumulate
+and the cores stay phase-aligned for the whole run.
+
+- aligned: every core steps from idle to load at the same instant, the
+  worst case for the regulator
+- staggered: core i starts i/N of a period late, spreading the steps
+
+A frequency sweep splits the duration into log-spaced steps between
+two frequencies (1 Hz to 1 kHz).
+
+# Load
+
+The load phase hashes a fixed block with SHA-256 (OpenSSL, SHA/SIMD
+units) in a tight loop and compares every digest with the expected one,
+so a miscomputation during a load step is reported as a failure too.
+
+This is integer and SHA-extension work, not 256-bit FMA: each core
+draws less current than under stress-ng's wide-vector methods, so the
+load step, and with it the droop, is smaller than a stress-ng start.
+The pulse test trades amplitude for many precisely timed edges; the
+constant-load stress-ng tests still cover the full-current case.
+
+# Output
+
+Every line starts with "pulse:". Each worker reports its measured
+timing when it finishes:
+
+    pulse: core=0 cycles=6000 missed=0 duty=0.5004 lateness_us=38.2 lateness_p99_us=95.0
+
+duty is the measured load time divided by the elapsed time, lateness
+is how long after its deadline each load phase actually started. The
+parent prints "pulse: successful run completed" when all workers passed.
+A mismatch prints a "fail:" line naming the core.
+
+# Usage Example
+
+    python3 pulse_load.py --cores 0,1,2,3 --duration 60 --frequency 5
+    python3 pulse_load.py --cores 0,1,2,3 --duration 60 --sweep 1:1000
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import hashlib
+import math
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+# Supported pulse frequency range in Hz
+MIN_FREQUENCY_HZ = 1.0
+MAX_FREQUENCY_HZ = 1000.0
+
+# Delay between launching the workers and the first pulse edge
+START_DELAY_SEC = 0.5
+
+_CLOCK_MONOTONIC = 1
+_TIMER_ABSTIME = 1
+_EINTR = 4
+
+_BLOCK = bytes(range(256)) * 16
+_BLOCK_DIGEST = hashlib.sha256(_BLOCK).digest()
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _load_clock_nanosleep():
+    """Get libc clock_nanosleep, or None if unavailable."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        function = libc.clock_nanosleep
+    except (OSError, AttributeError):
+        return None
+    function.argtypes = [
+        ctypes.c_int, ctypes.c_int, ctypes.POINTER(_Timespec), ctypes.POINTER(_Timespec)
+    ]
+    function.restype = ctypes.c_int
+    return function
+
+
+_clock_nanosleep = _load_clock_nanosleep()
+
+
+def sleep_until(deadline: float) -> None:
+    """Sleep until an absolute time.monotonic() deadline.
+
+    time.monotonic() reads CLOCK_MONOTONIC on Linux, so the deadline can
+    be passed to clock_nanosleep directly.
+    """
+    if _clock_nanosleep is not None:
+        seconds = int(deadline)
+        request = _Timespec(seconds, int((deadline - seconds) * 1e9))
+        while _clock_nanosleep(_CLOCK_MONOTONIC, _TIMER_ABSTIME, ctypes.byref(request), None) == _EINTR:
+            pass
+        return
+
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def busy_until(deadline: float) -> bool:
+    """Run full load until an absolute time.monotonic() deadline.
+
+    Returns:
+        False if a digest did not match the expected value
+    """
+    sha256 = hashlib.sha256
+    monotonic = time.monotonic
+    while monotonic() < deadline:
+        if sha256(_BLOCK).digest() != _BLOCK_DIGEST:
+            return False
+    return True
+
+
+def sweep_frequencies(min_hz: float, max_hz: float, steps: int) -> List[float]:
+    """Log-spaced frequencies from min_hz to max_hz (inclusive).
+
+    Both ends are clamped to [MIN_FREQUENCY_HZ, MAX_FREQUENCY_HZ].
+    """
+    low = min(max(min_hz, MIN_FREQUENCY_HZ), MAX_FREQUENCY_HZ)
+    high = min(max(max_hz, low), MAX_FREQUENCY_HZ)
+    if steps <= 1 or high == low:
+        return [low]
+    ratio = math.log(high / low) / (steps - 1)
+    return [low * math.exp(ratio * i) for i in range(steps)]
+
+
+def build_schedule(
+    start: float,
+    duration: float,
+    frequencies: List[float]
+) -> List[Tuple[float, float]]:
+    """Split a run into equal steps, one per frequency.
+
+    Returns:
+        List of (frequency_hz, step_end) with absolute end times
+    """
+    step = duration / len(frequencies)
+    return [(freq, start + step * (i + 1)) for i, freq in enumerate(frequencies)]
+
+
+def phase_offset(core_index: int, core_count: int, frequency: float, aligned: bool) -> float:
+    """Delay of a core's pulse edges within one period."""
+    if aligned or core_count <= 1:
+        return 0.0
+    return (core_index / core_count) / frequency
+
+
+@dataclass
+class PulseStats:
+    """Measured timing of one worker.
+
+    Attributes:
+        cycles: Load phases run
+        missed: Periods skipped because the worker woke after them
+        load_time: Total measured load time in seconds
+        elapsed: Time from the first load edge to the end of the last period
+        lateness: Start delay of every load phase after its deadline
+    """
+    cycles: int = 0
+    missed: int = 0
+    load_time: float = 0.0
+    elapsed: float = 0.0
+    lateness: Optional[List[float]] = None
+
+    @property
+    def duty(self) -> float:
+        return self.load_time / self.elapsed if self.elapsed > 0 else 0.0
+
+    def lateness_us(self, quantile: float = 0.5) -> float:
+        if not self.lateness:
+            return 0.0
+        ordered = sorted(self.lateness)
+        return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))] * 1e6
+
+    def format(self, core: int) -> str:
+        return (
+            f"pulse: core={core} cycles={self.cycles} missed={self.missed} "
+            f"duty={self.duty:.4f} lateness_us={self.lateness_us():.1f} "
+            f"lateness_p99_us={self.lateness_us(0.99):.1f}"
+        )
+
+
+def run_pulses(
+    schedule: List[Tuple[float, float]],
+    start: float,
+    duty: float,
+    offset_fn=lambda frequency: 0.0
+) -> Tuple[PulseStats, bool]:
+    """Alternate load and idle following a schedule of absolute deadlines.
+
+    Args:
+        schedule: (frequency_hz, step_end) pairs from build_schedule
+        start: Absolute start time of the first step
+        duty: Fraction of each period under load
+        offset_fn: Phase offset in seconds for a frequency
+
+    Returns:
+        Tuple of (measured stats, False if a load phase miscomputed)
+    """
+    stats = PulseStats(lateness=[])
+    step_start = start
+    first_edge: Optional[float] = None
+
+    for frequency, step_end in schedule:
+        period = 1.0 / frequency
+        on_time = period * duty
+        edge = step_start + offset_fn(frequency)
+
+        while edge + period <= step_end + 1e-9:
+            sleep_until(edge)
+            actual_start = time.monotonic()
+            late = actual_start - edge
+            if late >= period:
+                # Descheduled past this whole period; resume on the grid
+                skipped = int(late // period)
+                stats.missed += skipped
+                edge += skipped * period
+                continue
+
+            ok = busy_until(edge + on_time)
+            actual_end = time.monotonic()
+            if not ok:
+                return stats, False
+
+            if first_edge is None:
+                first_edge = edge
+            stats.cycles += 1
+            stats.load_time += actual_end - actual_start
+            stats.lateness.append(late)
+            edge += period
+            stats.elapsed = edge - first_edge
+
+        step_start = step_end
+
+    return stats, True
+
+
+def run_worker(
+    core: int,
+    core_index: int,
+    core_count: int,
+    start: float,
+    duration: float,
+    frequencies: List[float],
+    duty: float,
+    aligned: bool
+) -> int:
+    """Run the pulse schedule on one pinned core.
+
+    Returns:
+        Process exit code: 0 on success, 1 on a miscomputation
+    """
+    try:
+        os.sched_setaffinity(0, {core})
+    except (AttributeError, OSError) as e:
+        print(f"pulse: warning: core={core} not pinned: {e}", flush=True)
+
+    schedule = build_schedule(start, duration, frequencies)
+    stats, ok = run_pulses(
+        schedule, start, duty,
+        lambda frequency: phase_offset(core_index, core_count, frequency, aligned)
+    )
+    if not ok:
+        print(f"pulse: fail: core={core} load digest mismatch after {stats.cycles} cycles", flush=True)
+        return 1
+
+    print(stats.format(core), flush=True)
+    return 0
+
+
+@dataclass
+class PulseSummary:
+    """Timing measured by all workers of a run.
+
+    Attributes:
+        cores: Workers that reported
+        cycles: Load phases run on all cores
+        missed: Periods skipped on all cores
+        duty_cycle: Mean measured duty cycle
+        duty_cycle_error: Largest per-core deviation from the target duty
+        phase_skew_us: Spread of median start lateness across cores
+    """
+    cores: int
+    cycles: int
+    missed: int
+    duty_cycle: float
+    duty_cycle_error: float
+    phase_skew_us: float
+
+
+def summarize(output: str, target_duty: float) -> Optional[PulseSummary]:
+    """Aggregate the worker lines of a run.
+
+    Returns:
+        PulseSummary, or None if no worker reported
+    """
+    workers = []
+    for line in output.splitlines():
+        if not line.startswith("pulse: core="):
+            continue
+        fields = dict(part.split("=", 1) for part in line.split()[1:] if "=" in part)
+        try:
+            workers.append((
+                int(fields["cycles"]),
+                int(fields["missed"]),
+                float(fields["duty"]),
+                float(fields["lateness_us"]),
+            ))
+        except (KeyError, ValueError):
+            continue
+
+    if not workers:
+        return None
+
+    duties = [w[2] for w in workers]
+    lateness = [w[3] for w in workers]
+    return PulseSummary(
+        cores=len(workers),
+        cycles=sum(w[0] for w in workers),
+        missed=sum(w[1] for w in workers),
+        duty_cycle=sum(duties) / len(duties),
+        duty_cycle_error=max(abs(d - target_duty) for d in duties),
+        phase_skew_us=max(lateness) - min(lateness),
+    )
+
+
+def _parse_sweep(value: str) -> Tuple[float, float]:
+    low, _, high = value.partition(":")
+    return float(low), float(high or low)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Duty-cycle load pulse generator")
+    parser.add_argument("--cores", default="0", help="Comma-separated cores, one worker each")
+    parser.add_argument("--duration", type=float, default=30.0, help="Run time in seconds")
+    parser.add_argument("--frequency", type=float, default=5.0, help="Pulse frequency in Hz")
+    parser.add_argument("--sweep", type=_parse_sweep, help="Sweep frequencies MIN:MAX in Hz")
+    parser.add_argument("--steps", type=int, default=8, help="Frequency steps of a sweep")
+    parser.add_argument("--duty", type=float, default=0.5, help="Load fraction of each period")
+    parser.add_argument("--phase", choices=("aligned", "staggered"), default="aligned")
+    parser.add_argument("--start", type=float, help=argparse.SUPPRESS)
+    parser.add_argument("--index", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--count", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    cores = [int(c) for c in args.cores.split(",") if c]
+    if not 0.0 < args.duty < 1.0:
+        print(f"pulse: error: duty {args.duty} not in (0, 1)", flush=True)
+        return 2
+    if args.sweep:
+        frequencies = sweep_frequencies(args.sweep[0], args.sweep[1], args.steps)
+    else:
+        frequencies = sweep_frequencies(args.frequency, args.frequency, 1)
+    start = args.start if args.start is not None else time.monotonic() + START_DELAY_SEC
+
+    if len(cores) == 1:
+        code = run_worker(
+            cores[0], args.index, args.count or 1, start, args.duration,
+            frequencies, args.duty, args.phase == "aligned"
+        )
+        if args.start is not None:
+            return code  # Worker of a multi-core run
+    else:
+        # One pinned worker process per core, sharing stdout and start time
+        common = [
+            "--duration", str(args.duration),
+            "--duty", str(args.duty),
+            "--phase", args.phase,
+            "--start", repr(start),
+            "--count", str(len(cores)),
+        ]
+        if args.sweep:
+            common += ["--sweep", f"{args.sweep[0]}:{args.sweep[1]}", "--steps", str(args.steps)]
+        else:
+            common += ["--frequency", str(args.frequency)]
+        workers = [
+            subprocess.Popen([
+                sys.executable, os.path.abspath(__file__),
+                "--cores", str(core), "--index", str(index), *common,
+            ])
+            for index, core in enumerate(cores)
+        ]
+        codes = [worker.wait() for worker in workers]
+        code = max(codes)
+
+    if code == 0:
+        print("pulse: successful run completed", flush=True)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,14 +9,20 @@ bundled as static binaries in the bin/ directory since pacman is unavailable.
 
 import asyncio
 import logging
+import math
 import os
+import re
+import signal
 import subprocess
+import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, List, Dict, Any, Set, Tuple
 
 from ..platform.cpufreq import CPUFreqError
+from ..platform.kmsg import KMSG_PATH, KmsgReader
+from ..platform.sensors import TEMPERATURE, SensorHub, cpu_freq_channel
 
 logger = logging.getLogger(__name__)
 
@@ -28,8 +34,11 @@ BIN_DIR = os.path.join(PLUGIN_DIR, "bin")
 STRESS_NG_PATH = os.path.join(BIN_DIR, "stress-ng")
 MEMTESTER_PATH = os.path.join(BIN_DIR, "memtester")
 
+# Known-answer verification workload, run as a standalone script
+SDC_WORKLOAD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sdc_workload.py")
 
-def _get_binary_path(binary_name: str) -> str:
+
+def get_binary_path(binary_name: str) -> str:
     """Get path to binary, preferring bundled version.
     
     Falls back to system PATH if bundled binary not found.
@@ -50,6 +59,10 @@ def _get_binary_path(binary_name: str) -> str:
     if bundled_path and os.path.isfile(bundled_path):
         return bundled_path
     
+    # The plugin's own interpreter, unless it is a frozen (PyInstaller) host
+    if binary_name == "python3" and sys.executable and not getattr(sys, "frozen", False):
+        return sys.executable
+    
     # Fallback to system PATH
     return binary_name
 
@@ -79,11 +92,28 @@ class TestResult:
         duration: Execution time in seconds
         logs: Captured stdout/stderr output
         error: Error message if test failed due to error (not test failure)
+        time_to_failure: Seconds from test start until the failure was
+            detected (None if the test passed or timed out)
     """
     passed: bool
     duration: float
     logs: str
     error: Optional[str] = None
+    time_to_failure: Optional[float] = None
+
+
+# Output lines that mean the test has already failed: stress-ng "fail:"
+# lines and non-zero failure counts, stress-ng --verify errors and
+# memtester "FAILURE:" lines
+STRESS_FAILURE_PATTERN = re.compile(
+    r"\bfail:|failure:|failed:\s*[1-9]|unsuccessful run|verification fail|miscompare",
+    re.IGNORECASE
+)
+
+
+def _is_failure_line(line: str) -> bool:
+    """Check whether a stress tool output line reports a failure."""
+    return STRESS_FAILURE_PATTERN.search(line) is not None
 
 
 def _parse_stress_ng_output(output: str) -> bool:
@@ -91,6 +121,39 @@ def _parse_stress_ng_output(output: str) -> bool:
     return "successful" in output.lower()
 
 
+def _parse_sdc_output(output: str) -> bool:
+    """Parse verification workload output for success."""
+    return "sdc: successful run completed" in output and not _is_failure_line(output)
+
+
+def _with_duration(test_case: TestCase, duration: float) -> Tuple[List[str], float]:
+    """Command and timeout of a test case run for a different duration.
+
+    The duration argument (stress-ng --timeout, workload --duration) is
+    replaced and the timeout keeps the case's startup/cleanup margin.
+    Commands without a duration argument are returned unchanged.
+
+    Args:
+        test_case: Test definition
+        duration: Run time in seconds
+
+    Returns:
+        Tuple of (command, timeout)
+    """
+    command = test_case.command.copy()
+    for flag, unit in (("--timeout", "s"), ("--duration", "")):
+        if flag not in command:
+            continue
+        index = command.index(flag) + 1
+        original = command[index]
+        seconds = float(original[:-1]) * 60 if original.endswith("m") else float(original.rstrip("s"))
+        if seconds == 0:
+            break  # Runs until cancelled
+        command[index] = f"{int(math.ceil(duration))}{unit}"
+        return command, test_case.timeout - seconds + math.ceil(duration)
+    return command, test_case.timeout
+
+
 def _parse_memtester_output(output: str) -> bool:
     """Parse memtester output for success."""
     lower_output = output.lower()
@@ -147,6 +210,12 @@ class TestRunner:
             command=["stress-ng", "--cpu", "4", "--vm", "2", "--timeout", "5m"],
             timeout=310,
             parse_fn=_parse_stress_ng_output
+        ),
+        "sdc_verify": TestCase(
+            name="Silent Data Corruption Check",
+            command=["python3", SDC_WORKLOAD_PATH, "--cores", "0,1,2,3", "--duration", "60"],
+            timeout=70,
+            parse_fn=_parse_sdc_output
         )
     }
 
@@ -160,16 +229,41 @@ class TestRunner:
         "/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq",
     ]
     
-    def __init__(self, cpufreq_controller=None, ryzenadj_wrapper=None):
+    # Seconds between kernel log checks while a stress test runs
+    KERNEL_POLL_INTERVAL = 2.0
+    
+    # Staleness tolerance of SensorHub readings in get_system_metrics()
+    SENSOR_MAX_AGE = 0.5
+    
+    def __init__(self, cpufreq_controller=None, ryzenadj_wrapper=None, kmsg_path: str = KMSG_PATH):
         """Initialize the test runner.
         
         Args:
             cpufreq_controller: Optional CPUFreqController instance for frequency locking
             ryzenadj_wrapper: Optional RyzenadjWrapper instance for voltage application
+            kmsg_path: Kernel log to watch for hardware errors
         """
         self._current_process: Optional[asyncio.subprocess.Process] = None
+        # All running stress processes (several when cores are tested in parallel)
+        self._active_processes: Set[asyncio.subprocess.Process] = set()
         self._cpufreq_controller = cpufreq_controller
         self._ryzenadj_wrapper = ryzenadj_wrapper
+        self._kmsg_path = kmsg_path
+        # Cursor for check_dmesg_errors, moved to the end once per test or round
+        self._kernel_log = KmsgReader(kmsg_path)
+        # Run the known-answer workload alongside stress tests (off by
+        # default; main.py enables it from the sdc_verification setting)
+        self.verify_sdc = False
+        # Shared sensor sampling (None: read sysfs directly)
+        self.sensor_hub: Optional[SensorHub] = None
+    
+    def set_sensor_hub(self, hub: Optional[SensorHub]) -> None:
+        """Read system metrics from a shared SensorHub.
+        
+        Args:
+            hub: SensorHub instance, or None to read sysfs directly
+        """
+        self.sensor_hub = hub
     
     def check_binaries(self) -> Dict[str, bool]:
         """Check availability of required binaries.
@@ -179,8 +273,8 @@ class TestRunner:
             Useful for diagnostics and UI warnings.
         """
         binaries = {
-            "stress-ng": _get_binary_path("stress-ng"),
-            "memtester": _get_binary_path("memtester"),
+            "stress-ng": get_binary_path("stress-ng"),
+            "memtester": get_binary_path("memtester"),
         }
         
         result = {}
@@ -212,10 +306,16 @@ class TestRunner:
         
         CRITICAL FIX: Also kills any orphaned stress-ng processes.
         """
-        if self._current_process and self._current_process.returncode is None:
+        processes = set(self._active_processes)
+        if self._current_process:
+            processes.add(self._current_process)
+        
+        for process in processes:
+            if process.returncode is not None:
+                continue
             try:
                 logger.info("[RUNNER] Cancelling current test - killing process")
-                self._current_process.kill()
+                self._kill_process_group(process)
                 logger.info("[RUNNER] Process killed successfully")
             except Exception as e:
                 logger.error(f"[RUNNER] Failed to kill process: {e}")
@@ -229,11 +329,228 @@ class TestRunner:
         except Exception as e:
             logger.warning(f"[RUNNER] Failed to cleanup orphaned processes: {e}")
     
-    async def run_test(self, test_name: str) -> TestResult:
+    def _register_process(self, process: asyncio.subprocess.Process) -> None:
+        """Track a started stress process so it can be cancelled."""
+        self._current_process = process
+        self._active_processes.add(process)
+    
+    def _unregister_process(self, process: Optional[asyncio.subprocess.Process]) -> None:
+        """Stop tracking a finished stress process."""
+        self._active_processes.discard(process)
+        if self._current_process is process:
+            self._current_process = None
+    
+    @staticmethod
+    def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+        """Kill a stress process together with its worker processes.
+        
+        Stress processes are started in their own session, so the process
+        group contains the stress-ng workers forked by the parent.
+        """
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError, OSError):
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+    
+    async def _run_streaming(
+        self,
+        command: List[str],
+        timeout: float,
+        parse_fn: Callable[[str], bool],
+        watch_kernel: bool = True,
+        stop: Optional[asyncio.Event] = None
+    ) -> TestResult:
+        """Run a stress command, aborting on the first failure signature.
+        
+        stdout and stderr are read line by line while the test runs, and
+        kernel log records written after the test started are checked
+        concurrently, and once more when it ends. The first output
+        line matching STRESS_FAILURE_PATTERN or the first new kernel error
+        kills the whole process group instead of waiting for the test's
+        full duration at an unstable offset.
+        
+        Args:
+            command: Command and arguments (binary path already resolved)
+            timeout: Maximum execution time in seconds (0 = no timeout)
+            parse_fn: Final pass/fail check of the complete output
+            watch_kernel: Abort on new kernel error lines. Disable when
+                several tests run at once and a kernel error cannot be
+                attributed to this one.
+            stop: Event that ends the test early; if no failure was seen
+                by then the test passes
+            
+        Returns:
+            TestResult; time_to_failure is set when the test failed
+            
+        Raises:
+            FileNotFoundError: If the binary does not exist
+        """
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+        failure: Optional[str] = None
+        failure_time: Optional[float] = None
+        aborted = asyncio.Event()
+        
+        # Own cursor at the end of the log: only errors from this test count
+        kernel_log: Optional[KmsgReader] = None
+        if watch_kernel:
+            kernel_log = KmsgReader(self._kmsg_path)
+            if not kernel_log.open():
+                kernel_log = None
+        
+        start_time = time.time()
+        
+        def fail(reason: str) -> None:
+            nonlocal failure, failure_time
+            if failure is None:
+                failure = reason
+                failure_time = time.time() - start_time
+                aborted.set()
+        
+        async def pump(stream: asyncio.StreamReader, sink: List[str]) -> None:
+            while True:
+                try:
+                    raw = await stream.readline()
+                except ValueError:
+                    # Line longer than the stream limit; take what is buffered
+                    raw = await stream.read(65536)
+                if not raw:
+                    return
+                line = raw.decode("utf-8", errors="replace").rstrip("\n")
+                sink.append(line)
+                if _is_failure_line(line):
+                    fail(f"Stress failure detected: {line.strip()}")
+        
+        async def watch(reader: KmsgReader) -> None:
+            while not aborted.is_set():
+                await asyncio.sleep(self.KERNEL_POLL_INTERVAL)
+                errors = reader.read_errors()
+                if errors:
+                    fail(f"System errors detected ({errors[0].category}): {errors[0].format()}")
+                    return
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True
+            )
+        except BaseException:
+            if kernel_log is not None:
+                kernel_log.close()
+            raise
+        self._register_process(process)
+        
+        finished = asyncio.ensure_future(asyncio.gather(
+            pump(process.stdout, stdout_lines),
+            pump(process.stderr, stderr_lines),
+            process.wait()
+        ))
+        abort_wait = asyncio.ensure_future(aborted.wait())
+        stop_wait = asyncio.ensure_future(stop.wait()) if stop is not None else None
+        watcher = asyncio.ensure_future(watch(kernel_log)) if kernel_log is not None else None
+        timed_out = False
+        stopped = False
+        
+        try:
+            done, _ = await asyncio.wait(
+                {t for t in (finished, abort_wait, stop_wait) if t is not None},
+                timeout=timeout or None,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            timed_out = not done
+            stopped = stop_wait in done and finished not in done and failure is None
+            
+            if finished not in done:
+                self._kill_process_group(process)
+                try:
+                    # Drain output written before the kill
+                    await asyncio.wait_for(asyncio.shield(finished), timeout=5)
+                except asyncio.TimeoutError:
+                    await process.wait()
+            
+            if kernel_log is not None and failure is None:
+                # Records of the last poll interval
+                errors = kernel_log.read_errors()
+                if errors:
+                    fail(f"System errors detected ({errors[0].category}): {errors[0].format()}")
+        finally:
+            for task in (abort_wait, stop_wait, watcher):
+                if task is not None:
+                    task.cancel()
+            if not finished.done():
+                finished.cancel()
+            if kernel_log is not None:
+                kernel_log.close()
+            self._unregister_process(process)
+        
+        logs = "\n".join(stdout_lines)
+        if stderr_lines:
+            logs += "\n--- STDERR ---\n" + "\n".join(stderr_lines)
+        duration = time.time() - start_time
+        
+        if failure is not None:
+            logger.warning(f"[RUNNER] Aborted after {failure_time:.1f}s: {failure}")
+            return TestResult(
+                passed=False,
+                duration=duration,
+                logs=logs,
+                error=failure,
+                time_to_failure=failure_time
+            )
+        
+        if stopped:
+            return TestResult(passed=True, duration=duration, logs=logs)
+        
+        if timed_out:
+            return TestResult(
+                passed=False,
+                duration=duration,
+                logs=f"[TIMEOUT] Process killed after {timeout}s\n" + logs,
+                error=f"Test timed out after {timeout} seconds"
+            )
+        
+        if process.returncode != 0:
+            return TestResult(
+                passed=False,
+                duration=duration,
+                logs=logs,
+                error=f"Process exited with code {process.returncode}",
+                time_to_failure=duration
+            )
+        
+        if not parse_fn(logs):
+            return TestResult(
+                passed=False,
+                duration=duration,
+                logs=logs,
+                error="Test output indicates failure",
+                time_to_failure=duration
+            )
+        
+        return TestResult(passed=True, duration=duration, logs=logs)
+    
+    async def run_test(
+        self,
+        test_name: str,
+        verify: Optional[bool] = None,
+        duration: Optional[float] = None
+    ) -> TestResult:
         """Execute a test case and return results.
         
+        Output is streamed and the test is aborted on the first failure
+        signature or new kernel error (see _run_streaming).
+        
         Args:
             test_name: Key from TESTS dictionary
+            verify: Run the known-answer verification workload on all cores
+                alongside the test (default: self.verify_sdc)
+            duration: Run time in seconds instead of the test's own
+                (e.g. from a SequentialDurationPolicy)
             
         Returns:
             TestResult with pass/fail status, duration, logs, and any error
@@ -250,111 +567,140 @@ class TestRunner:
         
         test_case = self.TESTS[test_name]
         start_time = time.time()
-        logs = ""
-        error = None
-        passed = False
+        
+        if duration is not None:
+            command, timeout = _with_duration(test_case, duration)
+        else:
+            command, timeout = test_case.command.copy(), test_case.timeout
         
         # Resolve binary path (bundled or system)
-        command = test_case.command.copy()
-        command[0] = _get_binary_path(command[0])
+        command[0] = get_binary_path(command[0])
+        
+        if verify is None:
+            verify = self.verify_sdc
+        
+        # check_dmesg_errors() reports only errors logged from here on, not
+        # those of an earlier test that failed before its check
+        self._kernel_log.seek_end()
         
         try:
-            # Execute subprocess with timeout
-            self._current_process = await asyncio.create_subprocess_exec(
-                *command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            try:
-                stdout, stderr = await asyncio.wait_for(
-                    self._current_process.communicate(),
-                    timeout=test_case.timeout
-                )
-                
-                # Combine stdout and stderr for logs
-                logs = stdout.decode("utf-8", errors="replace")
-                if stderr:
-                    logs += "\n--- STDERR ---\n" + stderr.decode("utf-8", errors="replace")
-                
-                # Check exit code and parse output
-                if self._current_process.returncode == 0:
-                    passed = test_case.parse_fn(logs)
-                    if not passed:
-                        error = "Test output indicates failure"
-                else:
-                    passed = False
-                    error = f"Process exited with code {self._current_process.returncode}"
-                    
-            except asyncio.TimeoutError:
-                # Kill the process on timeout
-                self._current_process.kill()
-                await self._current_process.wait()
-                passed = False
-                error = f"Test timed out after {test_case.timeout} seconds"
-                logs = f"[TIMEOUT] Process killed after {test_case.timeout}s"
-                
+            if verify and test_case.parse_fn is not _parse_sdc_output:
+                return await self._run_verified(command, timeout, test_case.parse_fn)
+            return await self._run_streaming(command, timeout, test_case.parse_fn)
         except FileNotFoundError:
-            passed = False
             error = f"Command not found: {test_case.command[0]}"
-            logs = ""
         except Exception as e:
-            passed = False
             error = f"Execution error: {str(e)}"
-            logs = ""
-        finally:
-            self._current_process = None
-        
-        duration = time.time() - start_time
         
         return TestResult(
-            passed=passed,
-            duration=duration,
-            logs=logs,
+            passed=False,
+            duration=time.time() - start_time,
+            logs="",
             error=error
         )
     
-    async def check_dmesg_errors(self) -> List[str]:
-        """Check dmesg for MCE/segfault errors.
+    async def _run_verified(
+        self,
+        command: List[str],
+        timeout: float,
+        parse_fn: Callable[[str], bool]
+    ) -> TestResult:
+        """Run a stress command with the verification workload alongside.
+        
+        The known-answer workload (sdc_workload.py) runs one pinned worker
+        per core for as long as the stress command. A result mismatch stops
+        the stress command and fails the test with the core and kernel
+        that diverged; a stress failure or the end of the stress command
+        stops the workload.
         
+        Args:
+            command: Stress command (binary path already resolved)
+            timeout: Maximum execution time in seconds (0 = no timeout)
+            parse_fn: Final pass/fail check of the stress output
+            
         Returns:
-            List of error lines found in dmesg
+            TestResult of the first failing run, or of the stress command
             
-        Requirements: 3.6
+        Raises:
+            FileNotFoundError: If the stress binary does not exist
         """
-        errors = []
-        error_patterns = ["mce", "segfault", "machine check", "hardware error"]
+        stress_done = asyncio.Event()
+        sdc_failed = asyncio.Event()
+        sdc_command = [
+            get_binary_path("python3"), SDC_WORKLOAD_PATH,
+            "--cores", "0,1,2,3",
+            # Stopped when the stress command ends
+            "--duration", str(timeout or 24 * 3600),
+        ]
         
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "dmesg", "--level=err,crit,alert,emerg",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=10
+        async def stress() -> TestResult:
+            try:
+                return await self._run_streaming(command, timeout, parse_fn, stop=sdc_failed)
+            finally:
+                stress_done.set()
+        
+        async def verify() -> Optional[TestResult]:
+            try:
+                result = await self._run_streaming(
+                    sdc_command, 0, _parse_sdc_output,
+                    watch_kernel=False,
+                    stop=stress_done
+                )
+            except OSError as e:
+                logger.warning(f"[RUNNER] Verification workload unavailable: {e}")
+                return None
+            if not result.passed:
+                sdc_failed.set()
+            return result
+        
+        stress_result, sdc_result = await asyncio.gather(stress(), verify(), return_exceptions=True)
+        if isinstance(stress_result, BaseException):
+            raise stress_result
+        if isinstance(sdc_result, BaseException):
+            logger.warning(f"[RUNNER] Verification workload error: {sdc_result}")
+            sdc_result = None
+        
+        if sdc_result is None:
+            return stress_result
+        
+        logs = stress_result.logs + "\n--- VERIFICATION ---\n" + sdc_result.logs
+        sdc_first = sdc_result.time_to_failure is not None and (
+            stress_result.time_to_failure is None
+            or sdc_result.time_to_failure <= stress_result.time_to_failure
+        )
+        if not sdc_result.passed and (stress_result.passed or sdc_first):
+            return TestResult(
+                passed=False,
+                duration=max(stress_result.duration, sdc_result.duration),
+                logs=logs,
+                error=f"Verification workload failed: {sdc_result.error}",
+                time_to_failure=sdc_result.time_to_failure
             )
-            
-            output = stdout.decode("utf-8", errors="replace")
-            
-            for line in output.splitlines():
-                lower_line = line.lower()
-                if any(pattern in lower_line for pattern in error_patterns):
-                    errors.append(line.strip())
-                    
-        except (asyncio.TimeoutError, FileNotFoundError, Exception):
-            # If dmesg fails, return empty list
-            pass
         
-        return errors
+        return replace(stress_result, logs=logs)
+    
+    async def check_dmesg_errors(self) -> List[str]:
+        """Check the kernel log for hardware errors since the last test started.
+        
+        Records are read from the runner's kernel log cursor, which moves
+        to the end of the log when run_test(), run_frequency_locked_test()
+        or run_parallel_frequency_locked_round() starts its stress test. Errors are
+        classified by the shared patterns in backend.platform.kmsg.
+        
+        Returns:
+            List of new error lines, formatted like dmesg output
+            
+        Requirements: 3.6
+        """
+        if not self._kernel_log.open():
+            return []
+        return [record.format() for record in self._kernel_log.read_errors()]
     
     async def monitor_dmesg_realtime(self, duration: int) -> List[str]:
-        """Monitor dmesg for hardware errors in real-time during test.
+        """Monitor the kernel log for hardware errors during a test.
         
-        Captures the dmesg timestamp before test, then checks for new errors
-        after the test completes.
+        Opens a cursor at the end of the kernel log, waits for the test
+        duration, then returns the error records logged in between.
         
         Args:
             duration: Test duration in seconds
@@ -362,44 +708,15 @@ class TestRunner:
         Returns:
             List of new error lines detected during the test period
         """
-        errors = []
-        error_patterns = ["mce", "machine check", "hardware error", "whea", "corrected error"]
-        
+        reader = KmsgReader(self._kmsg_path)
+        opened = reader.open()
         try:
-            # Get current dmesg line count as baseline
-            process = await asyncio.create_subprocess_exec(
-                "dmesg",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=5)
-            baseline_lines = len(stdout.decode("utf-8", errors="replace").splitlines())
-            
-            # Wait for test duration
             await asyncio.sleep(duration)
-            
-            # Check for new errors
-            process = await asyncio.create_subprocess_exec(
-                "dmesg", "--level=err,crit,alert,emerg",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=10)
-            output = stdout.decode("utf-8", errors="replace")
-            lines = output.splitlines()
-            
-            # Check only new lines
-            new_lines = lines[baseline_lines:] if len(lines) > baseline_lines else []
-            
-            for line in new_lines:
-                lower_line = line.lower()
-                if any(pattern in lower_line for pattern in error_patterns):
-                    errors.append(line.strip())
-                    
-        except (asyncio.TimeoutError, FileNotFoundError, Exception):
-            pass
-        
-        return errors
+            if not opened:
+                return []
+            return [record.format() for record in reader.read_errors()]
+        finally:
+            reader.close()
     
     def read_voltage_sensors(self) -> Dict[str, Optional[float]]:
         """Read actual voltage values from hwmon sensors.
@@ -433,7 +750,13 @@ class TestRunner:
         
         return voltages
     
-    async def run_per_core_test(self, core_id: int, duration: int, gradual_load: bool = True) -> TestResult:
+    async def run_per_core_test(
+        self,
+        core_id: int,
+        duration: int,
+        gradual_load: bool = True,
+        watch_kernel: bool = True
+    ) -> TestResult:
         """Run stress test pinned to a specific CPU core.
         
         Uses taskset to pin the stress test to a single core for
@@ -446,16 +769,14 @@ class TestRunner:
             core_id: CPU core ID (0-3 for Steam Deck)
             duration: Test duration in seconds
             gradual_load: If True, gradually decrease load from 100% to 80% (default: True)
+            watch_kernel: Abort on new kernel errors (False when other cores
+                are stressed at the same time)
             
         Returns:
             TestResult with pass/fail status
         """
         start_time = time.time()
-        logs = ""
-        error = None
-        passed = False
-        
-        stress_ng_path = _get_binary_path("stress-ng")
+        stress_ng_path = get_binary_path("stress-ng")
         
         if gradual_load and duration >= 20:
             # Use gradual load decrease: start at 100%, end at 80%
@@ -464,151 +785,84 @@ class TestRunner:
             remaining = duration - (phase_duration * 2)
             
             logger.info(f"[RUNNER] Per-core test with gradual load: core={core_id}, duration={duration}s")
-            logger.info(f"[RUNNER] Phase 1: 100% load for {phase_duration}s")
-            logger.info(f"[RUNNER] Phase 2: 90% load for {phase_duration}s")
-            logger.info(f"[RUNNER] Phase 3: 80% load for {remaining}s")
             
             phases = [
                 (100, phase_duration),  # 100% load
                 (90, phase_duration),   # 90% load
                 (80, remaining)         # 80% load
             ]
-            
-            all_logs = []
-            
-            for phase_num, (load_percent, phase_time) in enumerate(phases, 1):
-                if phase_time <= 0:
-                    continue
-                
-                command = [
-                    stress_ng_path,
-                    "--cpu", "1",
-                    "--taskset", str(core_id),
-                    "--cpu-load", str(load_percent),  # Gradual load decrease
-                    "--timeout", f"{phase_time}s",
-                    "--metrics-brief"
-                ]
-                
-                logger.info(f"[RUNNER] Phase {phase_num}: {load_percent}% load for {phase_time}s")
-                
-                try:
-                    self._current_process = await asyncio.create_subprocess_exec(
-                        *command,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE
-                    )
-                    
-                    stdout, stderr = await asyncio.wait_for(
-                        self._current_process.communicate(),
-                        timeout=phase_time + 10
-                    )
-                    
-                    phase_logs = stdout.decode("utf-8", errors="replace")
-                    if stderr:
-                        phase_logs += "\n--- STDERR ---\n" + stderr.decode("utf-8", errors="replace")
-                    
-                    all_logs.append(f"=== Phase {phase_num} ({load_percent}% load) ===\n{phase_logs}")
-                    
-                    if self._current_process.returncode != 0:
-                        passed = False
-                        error = f"Phase {phase_num} failed with code {self._current_process.returncode}"
-                        logs = "\n".join(all_logs)
-                        logger.error(f"[RUNNER] Phase {phase_num} failed: {error}")
-                        return TestResult(
-                            passed=passed,
-                            duration=time.time() - start_time,
-                            logs=logs,
-                            error=error
-                        )
-                    
-                except asyncio.TimeoutError:
-                    if self._current_process:
-                        self._current_process.kill()
-                        await self._current_process.wait()
-                    passed = False
-                    error = f"Phase {phase_num} timed out"
-                    logs = "\n".join(all_logs)
-                    logger.error(f"[RUNNER] Phase {phase_num} timeout")
-                    return TestResult(
-                        passed=passed,
-                        duration=time.time() - start_time,
-                        logs=logs,
-                        error=error
-                    )
-                finally:
-                    self._current_process = None
-            
-            # All phases passed
-            logs = "\n".join(all_logs)
-            passed = True
-            logger.info(f"[RUNNER] Core {core_id} completed all phases successfully")
-            
         else:
-            # Standard test without gradual load
+            logger.info(f"[RUNNER] Per-core test: core={core_id}, duration={duration}s")
+            phases = [(None, duration)]
+        
+        all_logs = []
+        
+        for phase_num, (load_percent, phase_time) in enumerate(phases, 1):
+            if phase_time <= 0:
+                continue
+            
             command = [
                 stress_ng_path,
                 "--cpu", "1",
                 "--taskset", str(core_id),
-                "--timeout", f"{duration}s",
-                "--metrics-brief"
             ]
+            if load_percent is not None:
+                command += ["--cpu-load", str(load_percent)]  # Gradual load decrease
+                logger.info(f"[RUNNER] Phase {phase_num}: {load_percent}% load for {phase_time}s")
+            command += ["--timeout", f"{phase_time}s", "--metrics-brief"]
             
-            logger.info(f"[RUNNER] Per-core test: core={core_id}, duration={duration}s")
-            
+            phase_start = time.time() - start_time
             try:
-                self._current_process = await asyncio.create_subprocess_exec(
-                    *command,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
+                result = await self._run_streaming(
+                    command,
+                    phase_time + 10,
+                    _parse_stress_ng_output,
+                    watch_kernel=watch_kernel
                 )
-                
-                try:
-                    stdout, stderr = await asyncio.wait_for(
-                        self._current_process.communicate(),
-                        timeout=duration + 10
-                    )
-                    
-                    logs = stdout.decode("utf-8", errors="replace")
-                    if stderr:
-                        logs += "\n--- STDERR ---\n" + stderr.decode("utf-8", errors="replace")
-                    
-                    logger.info(f"[RUNNER] Core {core_id} completed: returncode={self._current_process.returncode}")
-                    
-                    if self._current_process.returncode == 0:
-                        passed = _parse_stress_ng_output(logs)
-                        if not passed:
-                            error = "Test output indicates failure"
-                    else:
-                        passed = False
-                        error = f"Process exited with code {self._current_process.returncode}"
-                        
-                except asyncio.TimeoutError:
-                    self._current_process.kill()
-                    await self._current_process.wait()
-                    passed = False
-                    error = f"Test timed out after {duration + 10} seconds"
-                    logs = f"[TIMEOUT] Process killed"
-                    
             except FileNotFoundError as e:
-                passed = False
-                error = f"stress-ng not found: {e}"
-                logs = ""
                 logger.error(f"[RUNNER] FileNotFoundError: {e}")
+                return TestResult(
+                    passed=False,
+                    duration=time.time() - start_time,
+                    logs="",
+                    error=f"stress-ng not found: {e}"
+                )
             except Exception as e:
-                passed = False
-                error = f"Execution error: {str(e)}"
-                logs = ""
                 logger.error(f"[RUNNER] Exception: {e}", exc_info=True)
-            finally:
-                self._current_process = None
+                return TestResult(
+                    passed=False,
+                    duration=time.time() - start_time,
+                    logs="",
+                    error=f"Execution error: {str(e)}"
+                )
+            
+            if load_percent is None:
+                all_logs.append(result.logs)
+            else:
+                all_logs.append(f"=== Phase {phase_num} ({load_percent}% load) ===\n{result.logs}")
+            
+            if not result.passed:
+                error = result.error
+                if load_percent is not None:
+                    error = f"Phase {phase_num} failed: {error}"
+                logger.error(f"[RUNNER] Core {core_id}: {error}")
+                return TestResult(
+                    passed=False,
+                    duration=time.time() - start_time,
+                    logs="\n".join(all_logs),
+                    error=error,
+                    time_to_failure=(
+                        phase_start + result.time_to_failure
+                        if result.time_to_failure is not None else None
+                    )
+                )
         
-        duration_actual = time.time() - start_time
+        logger.info(f"[RUNNER] Core {core_id} completed successfully")
         
         return TestResult(
-            passed=passed,
-            duration=duration_actual,
-            logs=logs,
-            error=error
+            passed=True,
+            duration=time.time() - start_time,
+            logs="\n".join(all_logs)
         )
     
     async def run_benchmark_with_progress(
@@ -632,7 +886,7 @@ class TestRunner:
         max_freq = 0.0
         operations = 0
         
-        stress_ng_path = _get_binary_path("stress-ng")
+        stress_ng_path = get_binary_path("stress-ng")
         
         try:
             # Start stress-ng benchmark
@@ -734,6 +988,13 @@ class TestRunner:
             
         Requirements: 3.6
         """
+        if self.sensor_hub is not None:
+            snapshot = self.sensor_hub.latest((TEMPERATURE, cpu_freq_channel(0)), max_age=self.SENSOR_MAX_AGE)
+            return {
+                "temperature": snapshot.temperature_c,
+                "frequency": snapshot.cpu_freq_mhz[0] if snapshot.cpu_freq_mhz else None
+            }
+        
         metrics: Dict[str, Any] = {
             "temperature": None,
             "frequency": None
@@ -815,6 +1076,7 @@ class TestRunner:
         logs = ""
         error = None
         passed = False
+        time_to_failure = None
         
         # Store original state for restoration
         original_governor = None
@@ -881,12 +1143,14 @@ class TestRunner:
                     error=error
                 )
             
-            # Step 3: Run stress test
+            # Step 3: Run stress test; Step 4 checks the errors logged from here on
+            self._kernel_log.seek_end()
             try:
                 test_result = await self.run_per_core_test(core_id, duration)
                 passed = test_result.passed
                 logs = test_result.logs
                 error = test_result.error
+                time_to_failure = test_result.time_to_failure
                 
                 logger.info(
                     f"[FREQ-TEST] Test completed: passed={passed}, "
@@ -939,5 +1203,126 @@ class TestRunner:
             passed=passed,
             duration=duration_actual,
             logs=logs,
-            error=error
+            error=error,
+            time_to_failure=time_to_failure
         )
+    
+    async def run_parallel_frequency_locked_round(
+        self,
+        assignments: Dict[int, Tuple[int, int]],
+        duration: int
+    ) -> Tuple[Dict[int, TestResult], List[str]]:
+        """Run frequency-locked tests on several cores at once.
+        
+        Each core is locked to its own frequency and gets its own voltage
+        offset. The combined four-core offset vector is applied with a
+        single ryzenadj call, then one stress-ng per core runs pinned with
+        taskset, all concurrently. dmesg is checked once after the round;
+        MCE lines cannot be reliably attributed to a core, so they are
+        returned separately instead of failing every core.
+        
+        Args:
+            assignments: Mapping core_id -> (freq_mhz, voltage_mv). Cores
+                not listed keep a 0 mV offset and are not stressed.
+            duration: Test duration in seconds
+            
+        Returns:
+            Tuple of (per-core TestResult, dmesg error lines seen after the round)
+            
+        Raises:
+            RuntimeError: If cpufreq_controller or ryzenadj_wrapper not provided
+            
+        Feature: frequency-based-wizard
+        Validates: Requirements 1.2, 6.1
+        """
+        if self._cpufreq_controller is None or self._ryzenadj_wrapper is None:
+            raise RuntimeError(
+                "CPUFreqController and RyzenadjWrapper required for frequency-locked tests"
+            )
+        
+        start_time = time.time()
+        results: Dict[int, TestResult] = {}
+        dmesg_errors: List[str] = []
+        original_governors: Dict[int, Optional[str]] = {}
+        
+        logger.info(f"[FREQ-TEST] Parallel round: {assignments}, duration={duration}s")
+        
+        try:
+            # Step 1: Lock each core to its own frequency
+            for core_id, (freq_mhz, _) in assignments.items():
+                try:
+                    original_governors[core_id] = self._cpufreq_controller.get_current_governor(core_id)
+                    self._cpufreq_controller.lock_frequency(core_id, freq_mhz)
+                except Exception as e:
+                    results[core_id] = TestResult(
+                        passed=False,
+                        duration=0.0,
+                        logs="",
+                        error=f"Failed to lock frequency: {str(e)}"
+                    )
+            
+            # Step 2: Apply the combined offset vector once
+            voltage_array = [0, 0, 0, 0]
+            for core_id, (_, voltage_mv) in assignments.items():
+                voltage_array[core_id] = voltage_mv
+            
+            success, voltage_error = await self._ryzenadj_wrapper.apply_values_async(voltage_array)
+            if not success:
+                error = f"Failed to apply voltage: {voltage_error}"
+                logger.error(f"[FREQ-TEST] {error}")
+                for core_id in assignments:
+                    results.setdefault(core_id, TestResult(
+                        passed=False,
+                        duration=time.time() - start_time,
+                        logs="",
+                        error=error
+                    ))
+                return results, dmesg_errors
+            
+            # Step 3: Stress all locked cores concurrently; Step 4 checks the
+            # errors logged from here on, across every phase of every core
+            self._kernel_log.seek_end()
+            cores = [core_id for core_id in assignments if core_id not in results]
+            outcomes = await asyncio.gather(
+                *(
+                    self.run_per_core_test(core_id, duration, watch_kernel=False)
+                    for core_id in cores
+                ),
+                return_exceptions=True
+            )
+            for core_id, outcome in zip(cores, outcomes):
+                if isinstance(outcome, BaseException):
+                    outcome = TestResult(
+                        passed=False,
+                        duration=time.time() - start_time,
+                        logs="",
+                        error=f"Test execution failed: {str(outcome)}"
+                    )
+                results[core_id] = outcome
+            
+            # Step 4: Check for system errors once for the whole round
+            try:
+                dmesg_errors = await self.check_dmesg_errors()
+            except Exception as e:
+                logger.warning(f"[FREQ-TEST] Failed to check dmesg: {e}")
+        
+        finally:
+            # Step 5: Restore original settings (ALWAYS execute)
+            try:
+                await self._ryzenadj_wrapper.apply_values_async([0, 0, 0, 0])
+            except Exception as e:
+                logger.error(f"[FREQ-TEST] Failed to restore voltage: {e}")
+            
+            for core_id, governor in original_governors.items():
+                try:
+                    self._cpufreq_controller.unlock_frequency(core_id, governor)
+                except Exception as e:
+                    logger.error(f"[FREQ-TEST] Failed to restore frequency for core {core_id}: {e}")
+        
+        logger.info(
+            f"[FREQ-TEST] Parallel round complete: "
+            f"{ {core_id: r.passed for core_id, r in results.items()} }, "
+            f"dmesg_errors={len(dmesg_errors)}, duration={time.time() - start_time:.1f}s"
+        )
+        
+        return results, dmesg_errors
@@ -0,0 +1,320 @@
+"""Known-answer verification workload for silent data corruption.
+
+Feature: decktune, Test Runner Module
+Validates: Requirements 3.1, 3.4, 3.5
+
+A marginal undervolt often first shows up as a wrong result, not as a
+crash or an MCE. This workload runs deterministic compute kernels and
+compares every result with a precomputed checksum, so a miscomputation
+fails the test even when the stress tool and the kernel log stay quiet.
+
+The script is standalone (standard library only, no package imports) so
+TestRunner can start it with any Python 3 interpreter. Each worker
+process is pinned to one core with sched_setaffinity.
+
+# Kernels
+
+- sha256: chained SHA-256 over a 256 KiB buffer (hashlib, SHA/SIMD units)
+- crc32: chained CRC-32 over the same buffer (zlib, SIMD folding)
+- int_matmul: 24x24 integer matrix product modulo 2**64 (integer ALU)
+- fp_matmul: 24x24 double matrix product (FP multiply/add)
+- fft: 1024-point complex radix-2 FFT (FP, twiddles from half-angle
+  square roots)
+
+Only IEEE-754 basic operations and sqrt are used for floating point (no
+libm transcendentals), so results are bit-identical on any x86-64 Linux
+machine.
+
+# Output
+
+Every line starts with "sdc:". A mismatch prints a "fail:" line naming
+the core and kernel, which TestRunner's streaming reader treats as a
+failure signature:
+
+    sdc: fail: core=2 kernel=fp_matmul iteration=17 expected=... got=...
+
+A worker that finishes prints "sdc: core=N iterations=M passed"; the
+parent prints "sdc: successful run completed" when all workers passed.
+
+# Fault Injection
+
+Setting DECKTUNE_SDC_INJECT_FAULT to "kernel" or "kernel@core" corrupts
+one intermediate value of that kernel, for testing the mismatch path.
+
+# Usage Example
+
+    python3 sdc_workload.py --cores 0,1,2,3 --duration 60
+"""
+
+import argparse
+import hashlib
+import math
+import os
+import struct
+import subprocess
+import sys
+import time
+import zlib
+from typing import Callable, Dict, List, Optional
+
+# Environment variable selecting a kernel (and optionally core) to corrupt
+FAULT_ENV = "DECKTUNE_SDC_INJECT_FAULT"
+
+_MASK64 = (1 << 64) - 1
+_MATRIX_SIZE = 24
+_FFT_SIZE = 1024
+_BUFFER_SIZE = 256 * 1024
+
+
+def _lcg(seed: int, count: int) -> List[int]:
+    """Deterministic 32-bit pseudo-random sequence (Numerical Recipes LCG)."""
+    values = []
+    state = seed
+    for _ in range(count):
+        state = (1664525 * state + 1013904223) & 0xFFFFFFFF
+        values.append(state)
+    return values
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _pack_floats(values: List[float]) -> bytes:
+    return struct.pack(f"<{len(values)}d", *values)
+
+
+_BUFFER = b"".join(struct.pack("<I", v) for v in _lcg(1, _BUFFER_SIZE // 4))
+
+
+def kernel_sha256(fault: bool = False) -> str:
+    """Chained SHA-256 over a fixed buffer."""
+    state = b"decktune"
+    for i in range(16):
+        state = hashlib.sha256(state + _BUFFER).digest()
+        if fault and i == 7:
+            state = bytes([state[0] ^ 1]) + state[1:]
+    return state.hex()[:16]
+
+
+def kernel_crc32(fault: bool = False) -> str:
+    """Chained CRC-32 over a fixed buffer."""
+    crc = 0
+    for i in range(16):
+        crc = zlib.crc32(_BUFFER, crc)
+        if fault and i == 7:
+            crc ^= 1 << 5
+    return f"{crc:08x}"
+
+
+def kernel_int_matmul(fault: bool = False) -> str:
+    """Integer matrix product modulo 2**64."""
+    n = _MATRIX_SIZE
+    a = _lcg(2, n * n)
+    b = _lcg(3, n * n)
+    c = [0] * (n * n)
+    for i in range(n):
+        row = a[i * n:(i + 1) * n]
+        for j in range(n):
+            total = 0
+            for k in range(n):
+                total += row[k] * b[k * n + j]
+            c[i * n + j] = total & _MASK64
+    if fault:
+        c[n + 3] ^= 1 << 17
+    return _digest(struct.pack(f"<{n * n}Q", *c))
+
+
+def kernel_fp_matmul(fault: bool = False) -> str:
+    """Double-precision matrix product."""
+    n = _MATRIX_SIZE
+    a = [v / 4294967296.0 - 0.5 for v in _lcg(4, n * n)]
+    b = [v / 4294967296.0 - 0.5 for v in _lcg(5, n * n)]
+    c = [0.0] * (n * n)
+    for i in range(n):
+        row = a[i * n:(i + 1) * n]
+        for j in range(n):
+            total = 0.0
+            for k in range(n):
+                total += row[k] * b[k * n + j]
+            c[i * n + j] = total
+    if fault:
+        c[2 * n + 5] += 2.0 ** -40
+    return _digest(_pack_floats(c))
+
+
+def _twiddles(size: int) -> List[complex]:
+    """exp(-2*pi*i*k/size) for k < size/2 using only +, *, / and sqrt.
+
+    IEEE-754 defines these operations exactly, so unlike cos/sin from
+    libm the table is bit-identical on every platform.
+    """
+    # Roots of unity exp(-i*pi/2^m) for m = 1, 2, ...
+    cos_t, sin_t = 0.0, 1.0
+    roots = [complex(cos_t, -sin_t)]
+    while (2 << len(roots)) <= size:
+        cos_half = math.sqrt((1.0 + cos_t) / 2.0)
+        sin_t = sin_t / (2.0 * cos_half)
+        cos_t = cos_half
+        roots.append(complex(cos_t, -sin_t))
+
+    # roots[m] = exp(-2*pi*i / 2^(m+2)); w = roots for size
+    levels = size.bit_length() - 1
+    w = roots[levels - 2] if levels >= 2 else complex(-1.0, 0.0)
+    table = [complex(1.0, 0.0)]
+    for _ in range(size // 2 - 1):
+        table.append(table[-1] * w)
+    return table
+
+
+_FFT_TWIDDLES = _twiddles(_FFT_SIZE)
+
+
+def kernel_fft(fault: bool = False) -> str:
+    """Iterative radix-2 complex FFT."""
+    n = _FFT_SIZE
+    values = _lcg(6, 2 * n)
+    data = [
+        complex(values[2 * i] / 4294967296.0 - 0.5, values[2 * i + 1] / 4294967296.0 - 0.5)
+        for i in range(n)
+    ]
+
+    # Bit-reversal permutation
+    j = 0
+    for i in range(1, n):
+        bit = n >> 1
+        while j & bit:
+            j ^= bit
+            bit >>= 1
+        j |= bit
+        if i < j:
+            data[i], data[j] = data[j], data[i]
+
+    length = 2
+    while length <= n:
+        step = n // length
+        half = length // 2
+        for start in range(0, n, length):
+            for k in range(half):
+                t = _FFT_TWIDDLES[k * step] * data[start + k + half]
+                u = data[start + k]
+                data[start + k] = u + t
+                data[start + k + half] = u - t
+        length <<= 1
+
+    if fault:
+        data[100] += complex(2.0 ** -40, 0.0)
+
+    flat: List[float] = []
+    for value in data:
+        flat.append(value.real)
+        flat.append(value.imag)
+    return _digest(_pack_floats(flat))
+
+
+KERNELS: Dict[str, Callable[..., str]] = {
+    "sha256": kernel_sha256,
+    "crc32": kernel_crc32,
+    "int_matmul": kernel_int_matmul,
+    "fp_matmul": kernel_fp_matmul,
+    "fft": kernel_fft,
+}
+
+# Expected result of every kernel on correct hardware
+KNOWN_ANSWERS: Dict[str, str] = {
+    "sha256": "e663189959b01b5c",
+    "crc32": "953096c8",
+    "int_matmul": "c1fa657902296366",
+    "fp_matmul": "54dfcba47bbbef17",
+    "fft": "35a384e595db3a8e",
+}
+
+
+def _fault_target(core: int) -> Optional[str]:
+    """Kernel to corrupt on this core, from FAULT_ENV."""
+    spec = os.environ.get(FAULT_ENV, "")
+    if not spec:
+        return None
+    kernel, _, fault_core = spec.partition("@")
+    if fault_core and int(fault_core) != core:
+        return None
+    return kernel
+
+
+def run_worker(core: int, duration: float, kernels: List[str]) -> int:
+    """Run the kernels on one pinned core until duration has elapsed.
+
+    Args:
+        core: CPU core to pin to
+        duration: Run time in seconds (at least one pass always runs)
+        kernels: Kernel names to run
+
+    Returns:
+        Process exit code: 0 if every result matched, 1 on a mismatch
+    """
+    try:
+        os.sched_setaffinity(0, {core})
+    except (AttributeError, OSError) as e:
+        print(f"sdc: warning: core={core} not pinned: {e}", flush=True)
+
+    fault_kernel = _fault_target(core)
+    deadline = time.monotonic() + duration
+    iterations = 0
+
+    while iterations == 0 or time.monotonic() < deadline:
+        for name in kernels:
+            result = KERNELS[name](fault=(name == fault_kernel))
+            expected = KNOWN_ANSWERS[name]
+            if result != expected:
+                print(
+                    f"sdc: fail: core={core} kernel={name} iteration={iterations} "
+                    f"expected={expected} got={result}",
+                    flush=True
+                )
+                return 1
+        iterations += 1
+
+    print(f"sdc: core={core} iterations={iterations} passed", flush=True)
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Known-answer SDC verification workload")
+    parser.add_argument("--cores", default="0", help="Comma-separated cores, one worker each")
+    parser.add_argument("--duration", type=float, default=30.0, help="Run time in seconds")
+    parser.add_argument(
+        "--kernels", default=",".join(KERNELS),
+        help=f"Comma-separated kernels ({', '.join(KERNELS)})"
+    )
+    args = parser.parse_args(argv)
+
+    cores = [int(c) for c in args.cores.split(",") if c]
+    kernels = [k for k in args.kernels.split(",") if k]
+    unknown = [k for k in kernels if k not in KERNELS]
+    if unknown:
+        print(f"sdc: error: unknown kernels {unknown}", flush=True)
+        return 2
+
+    if len(cores) == 1:
+        code = run_worker(cores[0], args.duration, kernels)
+    else:
+        # One pinned worker process per core, sharing stdout
+        workers = [
+            subprocess.Popen([
+                sys.executable, os.path.abspath(__file__),
+                "--cores", str(core),
+                "--duration", str(args.duration),
+                "--kernels", ",".join(kernels),
+            ])
+            for core in cores
+        ]
+        codes = [worker.wait() for worker in workers]
+        code = max(codes)
+
+    if code == 0:
+        print("sdc: successful run completed", flush=True)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
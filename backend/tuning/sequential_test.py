@@ -0,0 +1,269 @@
+"""Sequential-probability stopping rule for stress test durations.
+
+Feature: decktune, Autotune Engine Module
+Validates: Requirements 2.3, 8.1
+
+A fixed test duration spends as long on an offset far inside the stable
+region as on one right at the limit. This module chooses the duration of
+each test from a sequential probability ratio test (SPRT) instead.
+
+# Model
+
+An unstable offset fails after an exponentially distributed time with
+rate lambda; a stable one never fails. Surviving t seconds multiplies
+the odds of "unstable" by the likelihood ratio exp(-lambda * t):
+
+    P(unstable | pass at t) = p * exp(-lambda*t) / (p * exp(-lambda*t) + 1 - p)
+
+where p is the prior probability that the offset is unstable. The test
+can stop as passed once this drops to the accepted false-pass rate beta,
+which gives the duration
+
+    t = ln(p * (1 - beta) / ((1 - p) * beta)) / lambda
+
+Any failure ends the test immediately (the stress runner aborts on the
+first failure), so the time to the decision is known before the test
+starts and is used as the test duration.
+
+# Prior and Failure Rate
+
+p comes from the offsets already tested in the same context (a core, a
+core at a frequency), with the limit uniformly distributed between the
+least aggressive failure (or offset_min) and the most aggressive pass
+(or offset_max):
+
+    p = (upper - x) / (upper - lower)
+
+Offsets at or above the most aggressive pass are in the known-good
+region and offsets at or below the least aggressive failure in the
+known-bad region. Callers with a better estimate, like the
+StabilityModel, pass p directly.
+
+lambda is estimated from observed times to failure, with a prior that
+reproduces the configured base duration for an offset of unknown
+stability (p = 0.5) at a false-pass rate of 5%. Only failures close
+to a passing offset count: failures far past the limit come much sooner
+and would shorten the tests that matter. A failure can only be seen
+within the test duration, so each observed time is weighted as a draw
+truncated at that duration; otherwise short tests would see only the
+quick failures and keep shortening themselves. Offsets well inside the
+known-good region therefore stop early, and offsets near the limit,
+stricter false-pass rates and slowly failing silicon extend the test.
+
+# Usage Example
+
+```python
+policy = SequentialDurationPolicy(base_duration=30, false_pass_rate=0.01)
+duration = policy.duration_for(core, offset)
+result = await runner.run_test("cpu_quick", duration=duration)
+policy.record(core, offset, result.passed, result.time_to_failure)
+```
+"""
+
+import math
+from typing import Dict, Hashable, List, Optional, Tuple
+
+
+# Accepted probability that a passed offset is unstable
+DEFAULT_FALSE_PASS_RATE = 0.01
+
+# False-pass rate at which the base duration is calibrated
+CALIBRATION_FALSE_PASS_RATE = 0.05
+
+# Weight of the prior failure rate, in pseudo-failures
+PRIOR_FAILURES = 2.0
+
+
+def unstable_after_pass(p_unstable: float, failure_rate: float, elapsed: float) -> float:
+    """Posterior probability that an offset is unstable after passing.
+
+    Args:
+        p_unstable: Prior probability that the offset is unstable
+        failure_rate: Failure rate of an unstable offset in 1/s
+        elapsed: Seconds survived without a failure
+
+    Returns:
+        Probability in [0, 1]
+    """
+    survived = p_unstable * math.exp(-failure_rate * elapsed)
+    return survived / (survived + 1.0 - p_unstable) if survived > 0 else 0.0
+
+
+class SequentialDurationPolicy:
+    """Choose stress test durations with a sequential probability ratio test.
+
+    Offsets are undervolt values in mV: more negative is more aggressive.
+    Results are tracked per context key (for example a core index or a
+    (core, frequency) pair).
+    """
+
+    def __init__(
+        self,
+        base_duration: float,
+        false_pass_rate: float = DEFAULT_FALSE_PASS_RATE,
+        offset_min: int = -100,
+        offset_max: int = 0,
+        min_duration: Optional[float] = None,
+        max_duration: Optional[float] = None,
+        marginal_mv: float = 10.0
+    ):
+        """Initialize the policy.
+
+        Args:
+            base_duration: Configured fixed duration in seconds; an offset
+                of unknown stability gets this duration at a 5% false-pass
+                rate
+            false_pass_rate: Accepted probability that a passed offset is
+                unstable, in (0, 0.5)
+            offset_min: Most aggressive offset the limit can be at in mV
+            offset_max: Offset known to be stable in mV
+            min_duration: Shortest test in seconds (default base / 6, at
+                least 5)
+            max_duration: Longest test in seconds (default 3 * base)
+            marginal_mv: Failures within this distance of a passing offset
+                update the failure rate
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if base_duration <= 0:
+            raise ValueError(f"base_duration must be positive, got {base_duration}")
+        if not 0.0 < false_pass_rate < 0.5:
+            raise ValueError(f"false_pass_rate must be in (0, 0.5), got {false_pass_rate}")
+
+        self.base_duration = base_duration
+        self.false_pass_rate = false_pass_rate
+        self.min_duration = min_duration if min_duration is not None else max(5.0, base_duration / 6)
+        self.max_duration = max_duration if max_duration is not None else 3.0 * base_duration
+        self.offset_min = offset_min
+        self.offset_max = offset_max
+        self.marginal_mv = marginal_mv
+
+        beta = CALIBRATION_FALSE_PASS_RATE
+        self._prior_rate = math.log((1.0 - beta) / beta) / base_duration
+        # (time to failure, test duration or None) of marginal failures
+        self._failure_times: List[Tuple[float, Optional[float]]] = []
+        # key -> [most aggressive pass, least aggressive failure]
+        self._bounds: Dict[Hashable, list] = {}
+
+    @property
+    def failure_rate(self) -> float:
+        """Estimated failure rate of an unstable offset in 1/s.
+
+        Posterior mode under a gamma prior worth PRIOR_FAILURES failures,
+        with each observed time truncated at its test duration.
+        """
+        count = PRIOR_FAILURES + len(self._failure_times)
+        exposure = PRIOR_FAILURES / self._prior_rate + sum(t for t, _ in self._failure_times)
+        windows = [d for _, d in self._failure_times if d is not None and d > 0]
+        if not windows:
+            return count / exposure
+
+        def slope(rate: float) -> float:
+            # d/d(rate) of the log posterior
+            return count / rate - exposure - sum(d / math.expm1(min(rate * d, 700.0)) for d in windows)
+
+        # Bisect in log space; slope > 0 below the mode, < 0 above it
+        low, high = self._prior_rate * 1e-3, self._prior_rate * 1e3
+        for _ in range(60):
+            mid = math.sqrt(low * high)
+            if slope(mid) > 0:
+                low = mid
+            else:
+                high = mid
+        return math.sqrt(low * high)
+
+    def bounds(self, key: Hashable) -> Tuple[Optional[int], Optional[int]]:
+        """Known bounds of a context.
+
+        Returns:
+            Tuple of (last_good, first_fail); None where unknown
+        """
+        last_good, first_fail = self._bounds.get(key, (None, None))
+        return last_good, first_fail
+
+    def seed(self, key: Hashable, last_good: Optional[int], first_fail: Optional[int]) -> None:
+        """Add bounds known from elsewhere (e.g. the knowledge base)."""
+        if last_good is not None:
+            self._update(key, last_good, True)
+        if first_fail is not None:
+            self._update(key, first_fail, False)
+
+    def _update(self, key: Hashable, offset: int, passed: bool) -> None:
+        bounds = self._bounds.setdefault(key, [None, None])
+        if passed:
+            bounds[0] = offset if bounds[0] is None else min(bounds[0], offset)
+        else:
+            bounds[1] = offset if bounds[1] is None else max(bounds[1], offset)
+
+    def prior_unstable(self, key: Hashable, offset: int) -> float:
+        """Probability that an offset is unstable before testing it.
+
+        Args:
+            key: Context key
+            offset: Offset to test in mV
+
+        Returns:
+            Probability in (0, 1)
+        """
+        beta = self.false_pass_rate
+        last_good, first_fail = self.bounds(key)
+        upper = self.offset_max if last_good is None else min(last_good, self.offset_max)
+        lower = self.offset_min if first_fail is None else max(first_fail, self.offset_min)
+
+        if offset >= upper:
+            return beta  # Known-good region
+        if offset <= lower:
+            return 1.0 - beta  # Known-bad region
+
+        p = (upper - offset) / (upper - lower)
+        return min(max(p, beta), 1.0 - beta)
+
+    def duration_for(
+        self,
+        key: Hashable,
+        offset: int,
+        p_unstable: Optional[float] = None
+    ) -> int:
+        """Test duration after which a pass meets the false-pass rate.
+
+        Args:
+            key: Context key
+            offset: Offset to test in mV
+            p_unstable: Prior probability that the offset is unstable
+                (default: prior_unstable(key, offset))
+
+        Returns:
+            Duration in whole seconds within [min_duration, max_duration]
+        """
+        if p_unstable is None:
+            p_unstable = self.prior_unstable(key, offset)
+
+        beta = self.false_pass_rate
+        p = min(max(p_unstable, 1e-9), 1.0 - 1e-9)
+        log_odds = math.log(p * (1.0 - beta) / ((1.0 - p) * beta))
+        duration = max(0.0, log_odds) / self.failure_rate
+        return int(math.ceil(min(max(duration, self.min_duration), self.max_duration)))
+
+    def record(
+        self,
+        key: Hashable,
+        offset: int,
+        passed: bool,
+        time_to_failure: Optional[float] = None,
+        duration: Optional[float] = None
+    ) -> None:
+        """Update bounds and the failure rate with a test result.
+
+        Args:
+            key: Context key
+            offset: Tested offset in mV
+            passed: True if the test passed
+            time_to_failure: Seconds until the failure, if known
+            duration: Planned test duration in seconds, if known
+        """
+        last_good, _ = self.bounds(key)
+        marginal = last_good is not None and last_good - offset <= self.marginal_mv
+        if not passed and marginal and time_to_failure is not None and time_to_failure >= 0:
+            self._failure_times.append((time_to_failure, duration))
+        self._update(key, offset, passed)
@@ -0,0 +1,273 @@
+"""Probabilistic stability model for choosing undervolt test values.
+
+Feature: decktune, Autotune Engine Module
+Validates: Requirements 2.1, 2.3, 2.5
+
+Marginal offsets do not fail deterministically: the probability of a
+stress test failing rises steeply, but not instantly, past the silicon's
+limit. A single lucky pass can therefore set an unsafe value and a single
+unlucky failure can waste a step.
+
+This module models one core's failure probability as a logistic function
+of the offset:
+
+    P(fail | x) = lapse + (1 - lapse) / (1 + exp(slope * (x - threshold)))
+
+The posterior over (threshold, slope) is kept on a discrete grid and
+updated by Bayes' rule after every test. The quantity of interest is the
+offset x_r at which P(fail) crosses a user-chosen risk level r; offsets at
+or above x_r (less aggressive) fail with probability at most r.
+
+# Test Selection
+
+The next offset maximizes the expected information (in bits) a pass/fail
+outcome gives about x_r:
+
+    I(x) = H(p(x)) - sum_b P(x_r in b) * H(p_b(x))
+
+where p(x) is the predictive failure probability and p_b(x) the predictive
+failure probability given x_r in bin b.
+
+# Usage Example
+
+```python
+from backend.tuning.stability_model import StabilityModel
+
+model = StabilityModel(offset_min=-50, offset_max=0)
+while model.information_gain(x := model.next_offset(risk=0.05)) > 0.05:
+    model.update(x, passed=await run_test(x))
+estimate = model.recommend(risk=0.05, confidence=0.9, step=1)
+```
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+# Logistic slopes in 1/mV; 0.25 spreads the transition over ~20 mV,
+# 4.0 makes it practically a hard threshold
+DEFAULT_SLOPES: Tuple[float, ...] = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+# Failure probability far above the limit (spurious failures)
+DEFAULT_LAPSE = 0.01
+
+
+def _binary_entropy(p: float) -> float:
+    """Entropy of a Bernoulli(p) variable in bits."""
+    if p <= 0.0 or p >= 1.0:
+        return 0.0
+    return -(p * math.log2(p) + (1.0 - p) * math.log2(1.0 - p))
+
+
+@dataclass
+class StabilityEstimate:
+    """Recommended offset with its confidence.
+
+    Attributes:
+        offset: Most aggressive offset meeting the confidence target in mV
+        confidence: Posterior probability that P(fail | offset) <= risk
+        p_fail: Posterior mean failure probability at offset
+        tests: Number of tests the estimate is based on
+    """
+    offset: int
+    confidence: float
+    p_fail: float
+    tests: int
+
+
+class StabilityModel:
+    """Bayesian logistic failure-probability model for one core.
+
+    Feature: decktune, Autotune Engine Module
+    Validates: Requirements 2.1, 2.3, 2.5
+    """
+
+    def __init__(
+        self,
+        offset_min: int,
+        offset_max: int = 0,
+        slopes: Sequence[float] = DEFAULT_SLOPES,
+        lapse: float = DEFAULT_LAPSE
+    ):
+        """Initialize with a uniform prior.
+
+        Args:
+            offset_min: Most aggressive testable offset in mV (e.g. safe_limit)
+            offset_max: Least aggressive testable offset in mV (e.g. 0)
+            slopes: Candidate logistic slopes in 1/mV
+            lapse: Failure probability independent of the offset
+        """
+        self.offset_min = offset_min
+        self.offset_max = offset_max
+        self.lapse = lapse
+        self.tests: List[Tuple[int, bool]] = []
+
+        # Thresholds extend past the testable range so that "never fails"
+        # and "always fails" remain representable
+        thresholds = range(offset_min - 10, offset_max + 6)
+        self._hypotheses: List[Tuple[float, float]] = [
+            (float(t), s) for t in thresholds for s in slopes
+        ]
+        self._weights: List[float] = [1.0 / len(self._hypotheses)] * len(self._hypotheses)
+
+    def _p_fail(self, hypothesis: Tuple[float, float], offset: float) -> float:
+        """Failure probability at offset under one hypothesis."""
+        threshold, slope = hypothesis
+        z = slope * (offset - threshold)
+        if z > 50:
+            core = 0.0
+        elif z < -50:
+            core = 1.0
+        else:
+            core = 1.0 / (1.0 + math.exp(z))
+        return self.lapse + (1.0 - self.lapse) * core
+
+    def _crossing(self, hypothesis: Tuple[float, float], risk: float) -> float:
+        """Offset where P(fail) equals risk under one hypothesis."""
+        threshold, slope = hypothesis
+        q = (risk - self.lapse) / (1.0 - self.lapse)
+        if q <= 0.0:
+            # Risk at or below the lapse rate is never reached
+            return math.inf
+        return threshold + math.log((1.0 - q) / q) / slope
+
+    def update(self, offset: int, passed: bool) -> None:
+        """Bayesian update after a stress test.
+
+        Args:
+            offset: Tested offset in mV
+            passed: True if the test passed
+        """
+        self.tests.append((offset, passed))
+
+        for i, hypothesis in enumerate(self._hypotheses):
+            p = self._p_fail(hypothesis, offset)
+            self._weights[i] *= (1.0 - p) if passed else p
+
+        total = sum(self._weights)
+        if total <= 0.0:
+            # Contradictory evidence under every hypothesis; fall back to the prior
+            self._weights = [1.0 / len(self._weights)] * len(self._weights)
+        else:
+            self._weights = [w / total for w in self._weights]
+
+    def predictive_p_fail(self, offset: int) -> float:
+        """Posterior mean failure probability at offset.
+
+        Args:
+            offset: Offset in mV
+
+        Returns:
+            Probability of failure in [0, 1]
+        """
+        return sum(
+            w * self._p_fail(h, offset)
+            for h, w in zip(self._hypotheses, self._weights)
+        )
+
+    def _crossing_bins(self, risk: float) -> Dict[int, List[int]]:
+        """Group hypotheses by their risk crossing, rounded up to 1 mV."""
+        bins: Dict[int, List[int]] = {}
+        for i, hypothesis in enumerate(self._hypotheses):
+            crossing = self._crossing(hypothesis, risk)
+            key = self.offset_max + 1 if crossing > self.offset_max else max(
+                self.offset_min - 1, math.ceil(crossing)
+            )
+            bins.setdefault(key, []).append(i)
+        return bins
+
+    def information_gain(self, offset: int, risk: float = 0.05) -> float:
+        """Expected information about the risk crossing from testing offset.
+
+        Args:
+            offset: Candidate offset in mV
+            risk: Acceptable failure probability
+
+        Returns:
+            Expected information gain in bits
+        """
+        return self._information_gain(offset, self._crossing_bins(risk))
+
+    def _information_gain(self, offset: int, bins: Dict[int, List[int]]) -> float:
+        p_fail = [self._p_fail(h, offset) for h in self._hypotheses]
+
+        total_fail = 0.0
+        conditional_entropy = 0.0
+        for members in bins.values():
+            weight = sum(self._weights[i] for i in members)
+            if weight <= 0.0:
+                continue
+            bin_fail = sum(self._weights[i] * p_fail[i] for i in members)
+            total_fail += bin_fail
+            conditional_entropy += weight * _binary_entropy(bin_fail / weight)
+
+        return max(0.0, _binary_entropy(total_fail) - conditional_entropy)
+
+    def next_offset(self, risk: float = 0.05, step: int = 1) -> int:
+        """Choose the most informative offset to test next.
+
+        Args:
+            risk: Acceptable failure probability
+            step: Candidate spacing in mV, counted from offset_max
+
+        Returns:
+            Offset in [offset_min, offset_max]; ties prefer the less
+            aggressive offset
+        """
+        bins = self._crossing_bins(risk)
+        best_offset = self.offset_max
+        best_gain = -1.0
+
+        for offset in range(self.offset_max, self.offset_min - 1, -step):
+            gain = self._information_gain(offset, bins)
+            if gain > best_gain + 1e-9:
+                best_offset, best_gain = offset, gain
+
+        return best_offset
+
+    def confidence(self, offset: int, risk: float = 0.05) -> float:
+        """Posterior probability that P(fail | offset) <= risk.
+
+        Args:
+            offset: Offset in mV
+            risk: Acceptable failure probability
+
+        Returns:
+            Probability in [0, 1]
+        """
+        return sum(
+            w for h, w in zip(self._hypotheses, self._weights)
+            if self._crossing(h, risk) <= offset
+        )
+
+    def recommend(
+        self,
+        risk: float = 0.05,
+        confidence: float = 0.9,
+        step: int = 1
+    ) -> StabilityEstimate:
+        """Most aggressive offset whose risk is met with the required confidence.
+
+        Args:
+            risk: Acceptable failure probability
+            confidence: Required posterior probability of meeting risk
+            step: Offset granularity in mV, counted from offset_max
+
+        Returns:
+            StabilityEstimate; offset_max if no offset meets the target
+        """
+        best: Optional[int] = None
+        for offset in range(self.offset_max, self.offset_min - 1, -step):
+            if self.confidence(offset, risk) >= confidence:
+                best = offset
+            else:
+                break
+
+        offset = best if best is not None else self.offset_max
+        return StabilityEstimate(
+            offset=offset,
+            confidence=self.confidence(offset, risk),
+            p_fail=self.predictive_p_fail(offset),
+            tests=len(self.tests)
+        )
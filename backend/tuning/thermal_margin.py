@@ -0,0 +1,254 @@
+"""Temperature-compensated stability margins.
+
+Feature: decktune, Stability Knowledge Base
+Validates: Requirements 2.5, 6.1, 6.2
+
+A fixed safety margin assumes the limit found on the bench holds in the
+field, but stability limits shift with die temperature: an offset that
+passed at 60°C can fail in a hot handheld at 85°C. This module estimates
+each core's limit as a function of temperature from the pass/fail
+observations in the knowledge base, and sizes the margin for the hottest
+temperature the user's own sessions reached.
+
+# Model
+
+The limit moves linearly with temperature, and the failure probability
+is logistic around it:
+
+    limit(T) = limit_ref + coefficient * (T - reference_temp)
+    P(fail | x, T) = lapse + (1 - lapse) / (1 + exp(slope * (x - limit(T))))
+
+A positive coefficient (mV per °C) means hotter silicon needs more
+voltage. The posterior over (limit_ref, coefficient) is kept on a
+discrete grid, as in StabilityModel. The temperature of an observation is
+its peak temperature if recorded, else its start temperature, else the
+middle of its temperature band.
+
+# Margin
+
+The recommended value is the offset that stays at or above limit(T_hot)
+with the requested confidence; the margin is its distance from the
+max_stable value the engine found:
+
+    margin = ceil(quantile(limit(T_hot), confidence) - max_stable)
+
+# Usage Example
+
+```python
+model = TemperatureLimitModel.from_observations(kb.observations, core=0, test_types={"vdroop"})
+margin = recommended_margin(model, max_stable=-30, temperature=hottest)
+print(model.limit_by_band(hottest))  # {50: -33, 60: -32, 70: -29, 80: -26}
+```
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .knowledge_base import ALL_CORES, TEMPERATURE_BAND_C, StabilityObservation
+
+
+# Temperature coefficients of the limit in mV/°C
+DEFAULT_COEFFICIENTS: Tuple[float, ...] = (0.0, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0)
+
+# Temperature at which limit_ref applies in °C
+REFERENCE_TEMP = 60.0
+
+# Logistic slope of the failure probability in 1/mV
+DEFAULT_SLOPE = 1.0
+
+# Failure probability far above the limit (spurious failures)
+DEFAULT_LAPSE = 0.01
+
+# Probability that the recommended value is at or above the limit
+DEFAULT_CONFIDENCE = 0.9
+
+# Largest margin ever recommended in mV (Iron Seeker's safety_margin range)
+MAX_MARGIN = 20
+
+
+def observation_temperature(observation: StabilityObservation) -> Optional[float]:
+    """Die temperature an observation was made at, in °C (None if unknown)."""
+    if observation.peak_temp is not None:
+        return observation.peak_temp
+    if observation.start_temp is not None:
+        return observation.start_temp
+    if observation.temp_band is not None:
+        return observation.temp_band + TEMPERATURE_BAND_C / 2
+    return None
+
+
+class TemperatureLimitModel:
+    """Bayesian model of one core's limit as a function of temperature."""
+
+    def __init__(
+        self,
+        offset_min: int = -100,
+        offset_max: int = 0,
+        coefficients: Sequence[float] = DEFAULT_COEFFICIENTS,
+        reference_temp: float = REFERENCE_TEMP,
+        slope: float = DEFAULT_SLOPE,
+        lapse: float = DEFAULT_LAPSE
+    ):
+        """Initialize with a uniform prior.
+
+        Args:
+            offset_min: Most aggressive limit_ref considered in mV
+            offset_max: Least aggressive limit_ref considered in mV
+            coefficients: Temperature coefficients considered in mV/°C
+            reference_temp: Temperature of limit_ref in °C
+            slope: Logistic slope in 1/mV
+            lapse: Spurious failure probability
+        """
+        self.reference_temp = reference_temp
+        self.slope = slope
+        self.lapse = lapse
+        self._hypotheses: List[Tuple[int, float]] = [
+            (limit, coefficient)
+            for limit in range(offset_min, offset_max + 1)
+            for coefficient in coefficients
+        ]
+        self._log_posterior = [0.0] * len(self._hypotheses)
+        self.tests = 0
+        self.temperatures: List[float] = []
+
+    def _limit(self, hypothesis: Tuple[int, float], temperature: float) -> float:
+        limit_ref, coefficient = hypothesis
+        return limit_ref + coefficient * (temperature - self.reference_temp)
+
+    def _log_likelihood(self, hypothesis: Tuple[int, float], offset: float, temperature: float, passed: bool) -> float:
+        z = self.slope * (offset - self._limit(hypothesis, temperature))
+        # log(1 / (1 + exp(-z))), stable for large |z|
+        log_above = -math.log1p(math.exp(-z)) if z > -700 else z
+        if passed:
+            return math.log(1.0 - self.lapse) + log_above
+        p_pass = (1.0 - self.lapse) * math.exp(log_above)
+        return math.log(1.0 - p_pass)
+
+    def update(self, offset: int, temperature: float, passed: bool) -> None:
+        """Bayes update with one test result.
+
+        Args:
+            offset: Tested offset in mV
+            temperature: Die temperature during the test in °C
+            passed: True if the test passed
+        """
+        for i, hypothesis in enumerate(self._hypotheses):
+            self._log_posterior[i] += self._log_likelihood(hypothesis, offset, temperature, passed)
+        self.tests += 1
+        self.temperatures.append(temperature)
+
+    def _weights(self) -> List[float]:
+        peak = max(self._log_posterior)
+        weights = [math.exp(lp - peak) for lp in self._log_posterior]
+        total = sum(weights)
+        return [w / total for w in weights]
+
+    def coefficient(self) -> float:
+        """Posterior mean temperature coefficient in mV/°C."""
+        return sum(w * h[1] for w, h in zip(self._weights(), self._hypotheses))
+
+    def limit_at(self, temperature: float, confidence: float = 0.5) -> float:
+        """Offset at or above which the limit lies with the given confidence.
+
+        Args:
+            temperature: Die temperature in °C
+            confidence: Posterior probability that limit(T) <= the result
+
+        Returns:
+            Limit in mV (the median for confidence 0.5)
+        """
+        limits = sorted(
+            zip((self._limit(h, temperature) for h in self._hypotheses), self._weights())
+        )
+        cumulative = 0.0
+        for limit, weight in limits:
+            cumulative += weight
+            if cumulative >= confidence:
+                return limit
+        return limits[-1][0]
+
+    def limit_by_band(self, hottest: Optional[float] = None) -> Dict[int, int]:
+        """Median limit at the middle of each temperature band.
+
+        Covers the bands of all observations and, if given, up to the band
+        of the hottest temperature.
+
+        Returns:
+            Mapping band lower edge in °C -> limit in mV
+        """
+        temperatures = list(self.temperatures)
+        if hottest is not None:
+            temperatures.append(hottest)
+        if not temperatures:
+            return {}
+
+        low = int(min(temperatures) // TEMPERATURE_BAND_C) * TEMPERATURE_BAND_C
+        high = int(max(temperatures) // TEMPERATURE_BAND_C) * TEMPERATURE_BAND_C
+        return {
+            band: int(round(self.limit_at(band + TEMPERATURE_BAND_C / 2)))
+            for band in range(low, high + 1, TEMPERATURE_BAND_C)
+        }
+
+    @classmethod
+    def from_observations(
+        cls,
+        observations: Iterable[StabilityObservation],
+        core: int,
+        test_types: Optional[Set[str]] = None,
+        **kwargs
+    ) -> "TemperatureLimitModel":
+        """Fit a model to a core's knowledge base observations.
+
+        Per-core results count for the core. Lockstep (ALL_CORES) passes
+        count too, since every core passed; lockstep failures do not, as
+        any core may have caused them. Observations without a temperature
+        are skipped.
+
+        Args:
+            observations: Knowledge base observations
+            core: Core index (0-3)
+            test_types: Test names to use (None for all)
+            **kwargs: Passed to the constructor
+
+        Returns:
+            Fitted TemperatureLimitModel
+        """
+        model = cls(**kwargs)
+        for observation in observations:
+            if test_types is not None and observation.test_type not in test_types:
+                continue
+            if observation.core != core and not (observation.core == ALL_CORES and observation.passed):
+                continue
+            temperature = observation_temperature(observation)
+            if temperature is None:
+                continue
+            model.update(observation.offset, temperature, observation.passed)
+        return model
+
+
+def recommended_margin(
+    model: TemperatureLimitModel,
+    max_stable: int,
+    temperature: Optional[float] = None,
+    confidence: float = DEFAULT_CONFIDENCE
+) -> Optional[int]:
+    """Margin that keeps max_stable + margin stable at a temperature.
+
+    Args:
+        model: Fitted limit model of the core
+        max_stable: Most aggressive offset found stable in mV
+        temperature: Design temperature in °C (default: the hottest test)
+        confidence: Probability that the recommended value is at or
+            above the limit at that temperature
+
+    Returns:
+        Margin in mV within [0, MAX_MARGIN], or None without observations
+        that have a temperature
+    """
+    if model.tests == 0:
+        return None
+    if temperature is None:
+        temperature = max(model.temperatures)
+
+    required = model.limit_at(temperature, confidence)
+    return max(0, min(MAX_MARGIN, int(math.ceil(required - max_stable - 1e-9))))
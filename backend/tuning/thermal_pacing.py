@@ -0,0 +1,323 @@
+"""Thermal-aware pacing of back-to-back stress tests.
+
+Feature: decktune, Test Runner Module
+Validates: Requirements 3.6, 9.1, 9.2
+
+Back-to-back stress tests heat-soak the APU: every test starts hotter
+than the one before, so later offsets are tested under harsher conditions
+than earlier ones and long runs drift into throttling. The pacer inserts
+just enough cool-down before each test to start it at or below a target
+temperature, and records the start and peak temperature of each run.
+
+# Model
+
+The APU is treated as a first-order thermal system. Idle, it decays
+towards idle_temp with time constant cool_tau; under stress it rises
+towards load_temp with time constant heat_tau:
+
+    T(t) = idle + (T0 - idle) * exp(-t / cool_tau)       (cooling)
+    T(t) = load - (load - T0) * exp(-t / heat_tau)       (test)
+
+Before a test the current slope gives cool_tau directly (slope =
+-(T - idle) / cool_tau), which sizes the next wait. The start target is
+the lower of start_temp and the hottest start whose predicted peak stays
+below peak_limit, but never below idle: when the peak limit cannot be
+met, tests start from idle. load_temp is re-estimated from the start
+and peak of every paced test, and idle_temp from cool-downs that stop
+making progress.
+
+Temperatures are read from hwmon only (HwmonInterface), the same sensor
+fan control uses.
+
+# Usage Example
+
+```python
+pacer = ThermalPacer(start_temp=60.0, peak_limit=80.0)
+result, run = await pacer.paced(30, runner.run_test("cpu_quick"))
+kb.record(core, offset, "cpu_quick", 30, result.passed,
+          temperature=run.start_temp, peak_temperature=run.peak_temp)
+```
+"""
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Readings older than this are not used for the slope (seconds)
+SLOPE_MAX_AGE = 30.0
+
+# A cool-down wait that lowers the temperature by less than this (°C)
+# means the APU has settled at idle
+SETTLED_DROP = 0.1
+
+# Closest a start target may get to idle_temp (°C); targets below idle
+# could never be reached
+IDLE_MARGIN = 1.0
+
+# Weight of a new load_temp estimate in the running average
+LOAD_TEMP_SMOOTHING = 0.5
+
+
+@dataclass
+class ThermalModel:
+    """First-order thermal model of the APU.
+
+    Attributes:
+        idle_temp: Temperature the APU settles at without load (°C)
+        load_temp: Temperature the APU settles at under stress (°C)
+        heat_tau: Heat-up time constant under stress (seconds)
+        cool_tau: Cool-down time constant at idle (seconds)
+    """
+    idle_temp: float = 45.0
+    load_temp: float = 90.0
+    heat_tau: float = 60.0
+    cool_tau: float = 60.0
+
+    def peak(self, start: float, duration: float) -> float:
+        """Temperature at the end of a test of duration seconds."""
+        if start >= self.load_temp:
+            return start
+        return self.load_temp - (self.load_temp - start) * math.exp(-duration / self.heat_tau)
+
+    def max_start(self, duration: float, peak_limit: float) -> float:
+        """Hottest start temperature whose peak stays at or below peak_limit."""
+        if peak_limit >= self.load_temp:
+            return peak_limit
+        return self.load_temp - (self.load_temp - peak_limit) * math.exp(duration / self.heat_tau)
+
+    def cooldown(self, current: float, target: float) -> float:
+        """Idle seconds until current cools to target (inf if it never does)."""
+        if current <= target:
+            return 0.0
+        if target <= self.idle_temp:
+            return math.inf
+        return self.cool_tau * math.log((current - self.idle_temp) / (target - self.idle_temp))
+
+    def fit_cool_tau(self, before: float, after: float, elapsed: float) -> None:
+        """Update cool_tau from two idle readings elapsed seconds apart."""
+        if elapsed <= 0 or not (self.idle_temp < after < before):
+            return
+        self.cool_tau = elapsed / math.log((before - self.idle_temp) / (after - self.idle_temp))
+
+    def fit_load_temp(self, start: float, peak: float, duration: float) -> None:
+        """Update load_temp from the start and peak of a test."""
+        decay = math.exp(-duration / self.heat_tau)
+        if duration <= 0 or peak <= start or decay >= 1.0:
+            return
+        estimate = (peak - start * decay) / (1.0 - decay)
+        self.load_temp += LOAD_TEMP_SMOOTHING * (estimate - self.load_temp)
+
+
+@dataclass
+class PacedRun:
+    """Thermal record of one paced test.
+
+    Attributes:
+        start_temp: Temperature when the test started (°C, None if unknown)
+        peak_temp: Highest temperature during the test (°C, None if unknown)
+        predicted_peak: Peak predicted before the test (°C, None if unknown)
+        cooldown: Seconds waited before the test
+    """
+    start_temp: Optional[float]
+    peak_temp: Optional[float]
+    predicted_peak: Optional[float]
+    cooldown: float
+
+
+class ThermalPacer:
+    """Insert cool-down before stress tests so each starts in the target band.
+
+    The sensor is any object with a read_temperature() method returning °C
+    or None; by default the hwmon CPU sensor. Without a reading, tests run
+    unpaced.
+    """
+
+    def __init__(
+        self,
+        sensor: Optional[Any] = None,
+        start_temp: float = 60.0,
+        peak_limit: float = 80.0,
+        max_cooldown: float = 300.0,
+        sample_interval: float = 1.0,
+        model: Optional[ThermalModel] = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize the pacer.
+
+        Args:
+            sensor: Temperature sensor (default: HwmonInterface())
+            start_temp: Upper edge of the target start band in °C
+            peak_limit: Highest predicted peak a test may start with in °C
+            max_cooldown: Longest cool-down before a single test in seconds
+            sample_interval: Seconds between readings during tests and
+                between slope readings
+            model: Initial thermal model
+            sleep: Coroutine used for cool-down waits
+            clock: Monotonic clock in seconds
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if peak_limit < start_temp:
+            raise ValueError(f"peak_limit must be >= start_temp, got {peak_limit} < {start_temp}")
+        if max_cooldown < 0 or sample_interval <= 0:
+            raise ValueError("max_cooldown must be >= 0 and sample_interval > 0")
+
+        if sensor is None:
+            from ..core.fan_control import HwmonInterface
+            sensor = HwmonInterface()
+
+        self.sensor = sensor
+        self.start_temp = start_temp
+        self.peak_limit = peak_limit
+        self.max_cooldown = max_cooldown
+        self.sample_interval = sample_interval
+        self.model = model or ThermalModel()
+        self._sleep = sleep
+        self._clock = clock
+        # Last reading as (time, temperature), for the slope
+        self._last_reading: Optional[Tuple[float, float]] = None
+        self.total_cooldown = 0.0
+        self.runs: List[PacedRun] = []
+
+    def read(self) -> Optional[float]:
+        """Read the sensor and remember the reading for the slope."""
+        try:
+            temperature = self.sensor.read_temperature()
+        except Exception as e:
+            logger.debug(f"Temperature read failed: {e}")
+            return None
+        if temperature is not None:
+            self._last_reading = (self._clock(), temperature)
+        return temperature
+
+    def start_target(self, duration: float) -> float:
+        """Temperature a test of duration seconds should start at or below."""
+        target = min(self.start_temp, self.model.max_start(duration, self.peak_limit))
+        return max(target, self.model.idle_temp + IDLE_MARGIN)
+
+    async def wait_for_start(self, duration: float) -> Tuple[Optional[float], float]:
+        """Cool down until a test of duration seconds may start.
+
+        Args:
+            duration: Planned test duration in seconds
+
+        Returns:
+            Tuple of (start temperature or None, seconds waited)
+        """
+        previous = self._last_reading
+        temperature = self.read()
+        if temperature is None:
+            return None, 0.0
+
+        # The slope since the last reading (usually the end of the previous
+        # test) calibrates the cooling time constant
+        if previous is not None and 0 < self._clock() - previous[0] <= SLOPE_MAX_AGE:
+            self.model.fit_cool_tau(previous[1], temperature, self._clock() - previous[0])
+
+        target = self.start_target(duration)
+        waited = 0.0
+        while temperature > target and waited < self.max_cooldown:
+            wait = self.model.cooldown(temperature, target)
+            wait = min(max(wait, self.sample_interval), self.max_cooldown - waited)
+            logger.info(
+                f"Cooling down {wait:.0f}s: {temperature:.1f}°C > {target:.1f}°C target"
+            )
+            await self._sleep(wait)
+            waited += wait
+
+            before = temperature
+            temperature = self.read()
+            if temperature is None:
+                break
+            if temperature > before - SETTLED_DROP:
+                # Not cooling any further: the target is below idle
+                logger.info(f"Temperature settled at {temperature:.1f}°C above the target")
+                self.model.idle_temp = temperature
+                break
+            self.model.fit_cool_tau(before, temperature, wait)
+
+        self.total_cooldown += waited
+        return temperature, waited
+
+    async def _track_peak(self, peak: List[float]) -> None:
+        """Sample the sensor until cancelled, keeping the maximum in peak[0]."""
+        while True:
+            await asyncio.sleep(self.sample_interval)
+            temperature = self.read()
+            if temperature is not None:
+                peak[0] = max(peak[0], temperature)
+
+    async def paced(self, duration: float, test: Awaitable[T]) -> Tuple[T, PacedRun]:
+        """Run a test after cooling down, recording its start and peak.
+
+        Args:
+            duration: Planned test duration in seconds
+            test: Awaitable running the test
+
+        Returns:
+            Tuple of (test result, PacedRun)
+        """
+        start_temp, waited = await self.wait_for_start(duration)
+        return await self.track(duration, test, start_temp, waited)
+
+    async def track(
+        self,
+        duration: float,
+        test: Awaitable[T],
+        start_temp: Optional[float],
+        cooldown: float = 0.0
+    ) -> Tuple[T, PacedRun]:
+        """Run a test that starts now, recording its peak temperature.
+
+        For callers that need to act between the cool-down and the test;
+        paced() does both.
+
+        Args:
+            duration: Planned test duration in seconds
+            test: Awaitable running the test
+            start_temp: Start temperature from wait_for_start()
+            cooldown: Seconds waited from wait_for_start()
+
+        Returns:
+            Tuple of (test result, PacedRun)
+        """
+        waited = cooldown
+        if start_temp is None:
+            run = PacedRun(None, None, None, waited)
+            self.runs.append(run)
+            return await test, run
+
+        predicted = self.model.peak(start_temp, duration)
+        peak = [start_temp]
+        started = self._clock()
+        tracker = asyncio.create_task(self._track_peak(peak))
+        try:
+            result = await test
+        finally:
+            tracker.cancel()
+            try:
+                await tracker
+            except asyncio.CancelledError:
+                pass
+
+        end_temp = self.read()
+        if end_temp is not None:
+            peak[0] = max(peak[0], end_temp)
+        self.model.fit_load_temp(start_temp, peak[0], self._clock() - started)
+
+        run = PacedRun(start_temp, peak[0], predicted, waited)
+        self.runs.append(run)
+        logger.info(
+            f"Paced test: start {start_temp:.1f}°C, peak {peak[0]:.1f}°C "
+            f"(predicted {predicted:.1f}°C), cool-down {waited:.0f}s"
+        )
+        return result, run
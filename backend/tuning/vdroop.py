@@ -7,6 +7,12 @@ This module implements the Vdroop stress test which uses pulsating load
 patterns to detect undervolt instability during voltage transients.
 Unlike constant load tests, Vdroop tests stress the CPU during rapid
 load transitions which are more likely to expose marginal undervolts.
+
+The load comes from the duty-cycle pulse generator in pulse_load.py,
+which alternates full load and idle on every core at absolute
+deadlines and reports the duty cycle it actually achieved. Its load is
+SHA-256 hashing rather than wide-vector math, so each step is smaller
+than a stress-ng start (see pulse_load.py).
 """
 
 import asyncio
@@ -14,25 +20,22 @@ import logging
 import os
 import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+from ..platform.kmsg import KMSG_PATH, MCE_CATEGORIES, KmsgReader
+from . import pulse_load
+from .runner import get_binary_path
 
 logger = logging.getLogger(__name__)
 
-# Plugin directory for bundled binaries (set by Decky Loader)
-PLUGIN_DIR = os.environ.get("DECKY_PLUGIN_DIR", ".")
-BIN_DIR = os.path.join(PLUGIN_DIR, "bin")
-STRESS_NG_PATH = os.path.join(BIN_DIR, "stress-ng")
+# Standalone pulse generator script, started with python3
+PULSE_LOAD_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pulse_load.py")
 
+# Cores loaded by the Vdroop test (Steam Deck APU)
+VDROOP_CORES = (0, 1, 2, 3)
 
-def _get_stress_ng_path() -> str:
-    """Get path to stress-ng binary, preferring bundled version.
-    
-    Returns:
-        Full path to bundled binary or 'stress-ng' for PATH lookup
-    """
-    if os.path.isfile(STRESS_NG_PATH):
-        return STRESS_NG_PATH
-    return "stress-ng"
+# Frequency range of a full sweep in Hz
+SWEEP_RANGE_HZ = (pulse_load.MIN_FREQUENCY_HZ, pulse_load.MAX_FREQUENCY_HZ)
 
 
 @dataclass
@@ -43,9 +46,13 @@ class VdroopTestResult:
         passed: Whether the test passed (no crashes, no MCE errors)
         duration: Actual test duration in seconds
         exit_code: Process exit code (0 = success)
-        mce_detected: True if MCE errors found in dmesg
+        mce_detected: True if MCE errors found in the kernel log
         error: Error message if test failed due to error
         logs: Captured stdout/stderr output
+        duty_cycle: Measured mean duty cycle (None if not reported)
+        duty_cycle_error: Largest per-core deviation from the target duty
+        phase_skew_us: Spread of load step timing across cores in µs
+        pulse_cycles: Load pulses run on all cores
     """
     passed: bool
     duration: float
@@ -53,6 +60,10 @@ class VdroopTestResult:
     mce_detected: bool
     error: Optional[str] = None
     logs: str = ""
+    duty_cycle: Optional[float] = None
+    duty_cycle_error: Optional[float] = None
+    phase_skew_us: Optional[float] = None
+    pulse_cycles: int = 0
 
 
 class VdroopTester:
@@ -63,41 +74,41 @@ class VdroopTester:
     during rapid transitions, which is more effective at detecting
     marginal undervolts than constant load tests.
     
-    The test uses stress-ng with the ackermann CPU method which provides
-    AVX2-like workload characteristics for maximum power draw during
-    load phases.
+    By default all cores step to full load at the same instant, the worst
+    case for the regulator. The pattern can instead sweep the pulse
+    frequency from 1 Hz to 1 kHz (sweep_hz) or stagger the cores
+    (phase_aligned=False).
     
     Requirements: 2.1, 2.2, 2.3, 2.4, 2.5
     """
     
-    # MCE error patterns to search for in dmesg
-    MCE_PATTERNS = [
-        "mce",
-        "machine check",
-        "hardware error",
-        "uncorrected error",
-        "fatal error"
-    ]
-    
-    def __init__(self):
-        """Initialize the Vdroop tester."""
+    def __init__(self, kmsg_path: str = KMSG_PATH):
+        """Initialize the Vdroop tester.
+        
+        Args:
+            kmsg_path: Kernel log to check for MCE errors
+        """
         self._current_process: Optional[asyncio.subprocess.Process] = None
         self._cancelled = False
+        self._kmsg_path = kmsg_path
+        # Kernel log cursor opened at the start of the running test
+        self._kernel_log: Optional[KmsgReader] = None
+        # Pulse pattern options
+        self.sweep_hz: Optional[Tuple[float, float]] = None
+        self.phase_aligned = True
+        self.duty_cycle = 0.5
     
     def generate_vdroop_command(
         self,
         duration_sec: int,
         pulse_ms: int = 100
     ) -> List[str]:
-        """Generate stress-ng command for pulsating load pattern.
+        """Generate the pulse generator command for the load pattern.
         
-        Creates a command that runs stress-ng with parameters designed to
-        create a pulsating load pattern. The pattern alternates between
-        100% AVX2-like load and idle every pulse_ms milliseconds.
-        
-        stress-ng doesn't have native pulse support, so we use a combination
-        of short timeout and cpu-ops to create bursts. The actual pulsing
-        is achieved by running multiple short stress iterations.
+        The pattern alternates full load and idle on every core: each
+        pulse is pulse_ms of load followed by pulse_ms of idle (at the
+        default 50% duty cycle), i.e. a frequency of 1000 / (2 * pulse_ms)
+        Hz. When sweep_hz is set the frequency sweeps that range instead.
         
         Args:
             duration_sec: Total test duration in seconds
@@ -108,75 +119,49 @@ class VdroopTester:
             
         Requirements: 2.1, 2.2
         """
-        stress_ng = _get_stress_ng_path()
-        
-        # Calculate number of operations per pulse
-        # ackermann method is CPU-intensive, ~1000 ops takes ~100ms on Steam Deck
-        # We tune ops to match the pulse duration
-        ops_per_pulse = max(100, (pulse_ms * 10))  # Rough estimate
-        
-        # Number of cycles = duration / (2 * pulse_ms) since each cycle is on+off
-        # But stress-ng runs continuously, so we use timeout for total duration
-        
-        # Use --cpu-method=ackermann for AVX2-like workload
-        # Use --cpu 4 to stress all 4 cores
-        # Use --timeout for total duration
-        # Use --cpu-ops to limit operations (creates natural pauses between batches)
-        
         command = [
-            stress_ng,
-            "--cpu", "4",                          # All 4 cores
-            "--cpu-method", "ackermann",           # AVX2-like workload (Req 2.2)
-            "--cpu-ops", str(ops_per_pulse),       # Ops per burst
-            "--timeout", f"{duration_sec}s",       # Total duration (Req 2.4)
-            "--metrics-brief",                     # Brief output
+            get_binary_path("python3"),
+            PULSE_LOAD_PATH,
+            "--cores", ",".join(str(core) for core in VDROOP_CORES),
+            "--duration", str(duration_sec),               # Total duration (Req 2.4)
+            "--duty", str(self.duty_cycle),
+            "--phase", "aligned" if self.phase_aligned else "staggered",
         ]
         
+        if self.sweep_hz is not None:
+            command += ["--sweep", f"{self.sweep_hz[0]}:{self.sweep_hz[1]}"]
+        else:
+            frequency = 1000.0 / (2 * max(1, pulse_ms))
+            command += ["--frequency", f"{frequency:g}"]
+        
         return command
     
     async def _check_mce_errors(self) -> bool:
-        """Check dmesg for MCE (Machine Check Exception) errors.
+        """Check the kernel log for MCE (Machine Check Exception) errors.
         
         MCE errors indicate hardware-level CPU errors which are a strong
-        signal of undervolt instability.
+        signal of undervolt instability. Only records logged since the
+        test started are considered.
         
         Returns:
             True if MCE errors were detected, False otherwise
             
         Requirements: 2.3
         """
-        try:
-            process = await asyncio.create_subprocess_exec(
-                "dmesg", "--level=err,crit,alert,emerg",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            
-            stdout, _ = await asyncio.wait_for(
-                process.communicate(),
-                timeout=10
-            )
-            
-            output = stdout.decode("utf-8", errors="replace").lower()
-            
-            for pattern in self.MCE_PATTERNS:
-                if pattern in output:
-                    logger.warning(f"MCE pattern '{pattern}' detected in dmesg")
-                    return True
-                    
-        except asyncio.TimeoutError:
-            logger.warning("dmesg check timed out")
-        except FileNotFoundError:
-            logger.warning("dmesg command not found")
-        except Exception as e:
-            logger.warning(f"dmesg check failed: {e}")
+        if self._kernel_log is None:
+            return False
+        
+        for record in self._kernel_log.read_errors():
+            if record.category in MCE_CATEGORIES:
+                logger.warning(f"MCE detected in kernel log: {record.format()}")
+                return True
         
         return False
     
     def cancel(self) -> None:
         """Cancel the running Vdroop test.
         
-        Terminates the stress-ng process if running.
+        Terminates the pulse generator if running.
         """
         self._cancelled = True
         if self._current_process is not None:
@@ -192,8 +177,9 @@ class VdroopTester:
     ) -> VdroopTestResult:
         """Execute Vdroop test and return result.
         
-        Runs the stress-ng command with pulsating load pattern and monitors
-        for failures. After the test completes, checks dmesg for MCE errors.
+        Runs the pulse generator and monitors for failures. After the test
+        completes, checks the kernel log for MCE errors logged during the
+        test and records the duty cycle the generator measured.
         
         Args:
             duration_sec: Total test duration in seconds
@@ -218,6 +204,10 @@ class VdroopTester:
         # Timeout is test duration + 10 seconds for startup/cleanup overhead
         timeout = duration_sec + 10
         
+        self._kernel_log = KmsgReader(self._kmsg_path)
+        if not self._kernel_log.open():
+            self._kernel_log = None
+        
         try:
             self._current_process = await asyncio.create_subprocess_exec(
                 *command,
@@ -238,7 +228,11 @@ class VdroopTester:
                 
                 # Non-zero exit code indicates process failure (Req 2.5)
                 if exit_code != 0:
-                    error = f"stress-ng exited with code {exit_code}"
+                    error = f"Pulse generator exited with code {exit_code}"
+                    for line in logs.splitlines():
+                        if line.startswith("pulse: fail:"):
+                            error = line
+                            break
                     logger.warning(error)
                     
             except asyncio.TimeoutError:
@@ -252,7 +246,7 @@ class VdroopTester:
                 
         except FileNotFoundError:
             exit_code = -1
-            error = f"stress-ng not found at {command[0]}"
+            error = f"Python interpreter not found at {command[0]}"
             logger.error(error)
         except Exception as e:
             exit_code = -1
@@ -263,15 +257,20 @@ class VdroopTester:
         
         duration = time.time() - start_time
         
-        # Check dmesg for MCE errors after test (Req 2.3)
-        if exit_code == 0 and not self._cancelled:
-            mce_detected = await self._check_mce_errors()
-            if mce_detected:
-                error = "MCE errors detected in dmesg"
+        # Check the kernel log for MCE errors after test (Req 2.3)
+        try:
+            if exit_code == 0 and not self._cancelled:
+                mce_detected = await self._check_mce_errors()
+                if mce_detected:
+                    error = "MCE errors detected in kernel log"
+        finally:
+            if self._kernel_log is not None:
+                self._kernel_log.close()
+                self._kernel_log = None
         
         # Test passes only if:
         # 1. Process exited with code 0
-        # 2. No MCE errors in dmesg
+        # 2. No MCE errors in the kernel log
         # 3. Test was not cancelled
         passed = (
             exit_code == 0 and
@@ -289,9 +288,17 @@ class VdroopTester:
             logs=logs
         )
         
+        summary = pulse_load.summarize(logs, self.duty_cycle)
+        if summary is not None:
+            result.duty_cycle = summary.duty_cycle
+            result.duty_cycle_error = summary.duty_cycle_error
+            result.phase_skew_us = summary.phase_skew_us
+            result.pulse_cycles = summary.cycles
+        
         logger.info(
             f"Vdroop test complete: passed={passed}, "
-            f"duration={duration:.1f}s, exit_code={exit_code}"
+            f"duration={duration:.1f}s, exit_code={exit_code}, "
+            f"duty_cycle={result.duty_cycle}"
         )
         
         return result
@@ -25,10 +25,13 @@ from enum import Enum
 from pathlib import Path
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
 
+from .knowledge_base import ALL_CORES
+
 if TYPE_CHECKING:
     from ..core.ryzenadj import RyzenadjWrapper
     from ..core.safety import SafetyManager
     from ..api.events import EventEmitter
+    from .knowledge_base import StabilityKnowledgeBase
     from .runner import TestRunner
     from ..dynamic.controller import DynamicController
 
@@ -102,13 +105,16 @@ class CurveDataPoint:
     Attributes:
         offset: Voltage offset in mV (negative value)
         result: Test result ("pass", "fail", "crash")
-        temp: Temperature during test (0 if crashed)
+        temp: Temperature during test (0 if crashed or not tested)
         timestamp: ISO timestamp
+        source: "test" if measured in this session, "knowledge_base" if
+            the result was known and the test skipped
     """
     offset: int
     result: str
     temp: float
     timestamp: str
+    source: str = "test"
 
 
 @dataclass
@@ -230,9 +236,20 @@ class WizardSession:
         # Previous values for restoration
         self._previous_values: Optional[List[int]] = None
         
+        # Shared stability evidence
+        self._knowledge_base: Optional["StabilityKnowledgeBase"] = None
+        
         # Ensure settings directory exists
         self.settings_dir.mkdir(parents=True, exist_ok=True)
     
+    def set_knowledge_base(self, knowledge_base: "StabilityKnowledgeBase") -> None:
+        """Set the stability knowledge base consulted before each test.
+        
+        Args:
+            knowledge_base: Shared StabilityKnowledgeBase instance
+        """
+        self._knowledge_base = knowledge_base
+    
     # ==================== State Management ====================
     
     def get_state(self) -> WizardState:
@@ -513,6 +530,21 @@ class WizardSession:
         # (actual verification would require baseline comparison)
         return True
     
+    def _record_known_point(self, offset: int, passed: bool) -> None:
+        """Record a curve point for a result taken from the knowledge base.
+        
+        Args:
+            offset: Voltage offset in mV (negative)
+            passed: Known outcome
+        """
+        self._curve_data.append(CurveDataPoint(
+            offset=offset,
+            result="pass" if passed else "fail",
+            temp=0,
+            timestamp=datetime.now().isoformat(),
+            source="knowledge_base"
+        ))
+    
     async def _test_offset_per_core(self, offset: int, core_id: int) -> bool:
         """Test a specific offset on a single CPU core.
         
@@ -527,6 +559,14 @@ class WizardSession:
         """
         logger.info(f"Testing core {core_id} at {offset}mV")
         
+        test_duration = self._config.get_test_duration_seconds()
+        if self._knowledge_base is not None:
+            known = self._knowledge_base.lookup(core_id, offset, "per_core", test_duration)
+            if known is not None:
+                logger.info(f"Core {core_id} at {offset}mV known {'stable' if known else 'unstable'}, skipping test")
+                self._record_known_point(offset, known)
+                return known
+        
         # Set crash flag before applying
         self._set_crash_flag()
         
@@ -548,8 +588,6 @@ class WizardSession:
             return False
         
         # STEP 2: Run per-core stress test
-        test_duration = self._config.get_test_duration_seconds()
-        
         logger.info(f"[WIZARD] Starting {test_duration}s stress test on core {core_id}")
         
         # Start dmesg monitoring in parallel
@@ -594,6 +632,9 @@ class WizardSession:
             )
             self._curve_data.append(curve_point)
             
+            if self._knowledge_base is not None:
+                self._knowledge_base.record(core_id, offset, "per_core", test_duration, passed, temperature=temp)
+            
             # Clear crash flag after successful test
             self._clear_crash_flag()
             
@@ -641,6 +682,15 @@ class WizardSession:
         """
         logger.info(f"Testing {domain} offset: {offset}mV")
         
+        test_duration = self._config.get_test_duration_seconds()
+        test_name = "cpu_quick" if test_duration == 30 else "cpu_long"
+        if self._knowledge_base is not None and domain == "cpu":
+            known = self._knowledge_base.lookup(ALL_CORES, offset, test_name, test_duration)
+            if known is not None:
+                logger.info(f"{offset}mV known {'stable' if known else 'unstable'}, skipping test")
+                self._record_known_point(offset, known)
+                return known
+        
         # Set crash flag before applying
         self._set_crash_flag()
         
@@ -695,9 +745,6 @@ class WizardSession:
             return False
         
         # STEP 2: Run stress test
-        test_duration = self._config.get_test_duration_seconds()
-        test_name = "cpu_quick" if test_duration == 30 else "cpu_long"
-        
         # Start dmesg monitoring in parallel
         dmesg_task = asyncio.create_task(
             self.runner.monitor_dmesg_realtime(test_duration)
@@ -726,6 +773,9 @@ class WizardSession:
             )
             self._curve_data.append(curve_point)
             
+            if self._knowledge_base is not None and domain == "cpu":
+                self._knowledge_base.record(ALL_CORES, offset, test_name, test_duration, passed, temperature=temp)
+            
             # Stop dynamic mode
             if self.dynamic_controller:
                 await self.dynamic_controller.stop()
@@ -1337,7 +1387,8 @@ class WizardSession:
                         "offset": getattr(point, 'offset', 0),
                         "result": getattr(point, 'result', 'unknown'),
                         "temp": getattr(point, 'temp', 0),
-                        "timestamp": getattr(point, 'timestamp', '')
+                        "timestamp": getattr(point, 'timestamp', ''),
+                        "source": getattr(point, 'source', 'test')
                     })
         
         # Create wizard preset with full metadata
@@ -37,6 +37,7 @@ from backend.dynamic.config import DynamicConfig, CoreConfig
 from backend.dynamic.migration import migrate_dynamic_settings, is_old_format
 from backend.dynamic.profile_manager import ProfileManager
 from backend.platform.appwatcher import AppWatcher
+from backend.dynamic.context_source import PowerSupplyContextSource
 
 # Environment paths
 SETTINGS_DIR = os.environ.get("DECKY_PLUGIN_SETTINGS_DIR")
@@ -75,6 +76,7 @@ DEFAULT_SETTINGS = {
     "expert_mode": False,  # Expert Overclocker Mode (Requirements 13.1-13.5)
     "expert_mode_confirmed": False,  # User has confirmed risks
     "simple_mode": False,  # Simple Mode toggle (Requirements 14.1, 14.2)
+    "sdc_verification": False,  # Known-answer workload alongside stress tests
     "test_history": [],
 }
 
@@ -100,13 +102,18 @@ class Plugin:
         self.test_runner = None
         self.autotune_engine = None
         self.binning_engine = None
+        self.knowledge_base = None  # Stability observations shared by tuning engines
         self.benchmark_runner = None
         self.watchdog = None
         self.rpc = None
         self.dynamic_controller = None  # New gymdeck3 controller
         self.profile_manager = None  # Per-game profile manager
         self.app_watcher = None  # Steam app watcher
+        self.context_source = None  # Battery/AC/temperature context for profiles
         self.fan_control_service = None  # Fan control service
+        self.sensor_hub = None  # Shared sysfs sensor sampling
+        self.power_monitor = None  # Power draw and energy per profile/game
+        self.session_manager = None  # Dynamic mode session history
         self.wizard_session = None  # Wizard mode session
         self.update_manager = None  # Update manager
 
@@ -271,6 +278,7 @@ class Plugin:
             cpufreq_controller=self.cpufreq_controller,
             ryzenadj_wrapper=self.ryzenadj
         )
+        self.test_runner.verify_sdc = bool(settings.get_setting("sdc_verification"))
         
         # 6. Initialize autotune engine
         self.autotune_engine = AutotuneEngine(
@@ -298,6 +306,15 @@ class Plugin:
             test_runner=self.test_runner
         )
         
+        # 7.6. Initialize stability knowledge base shared by tuning engines
+        from backend.tuning.knowledge_base import StabilityKnowledgeBase
+        self.knowledge_base = StabilityKnowledgeBase(
+            Path(SETTINGS_DIR or ".") / "stability_knowledge.json",
+            self.platform
+        )
+        self.autotune_engine.set_knowledge_base(self.knowledge_base)
+        self.binning_engine.set_knowledge_base(self.knowledge_base)
+        
         # 8. Initialize RPC handler
         self.rpc = DeckTuneRPC(
             platform=self.platform,
@@ -317,8 +334,24 @@ class Plugin:
         hwmon_interface = HwmonInterface()
         self.fan_control_service = FanControlService(hwmon_interface)
         
+        # 8.6. Shared sensor sampling (same temperature input as the fan)
+        from backend.platform.sensors import SensorHub
+        self.sensor_hub = SensorHub.discover(temperature=hwmon_interface.temp_sensor_path)
+        self.sensor_hub.start()
+        self.fan_control_service.set_sensor_hub(self.sensor_hub)
+        self.test_runner.set_sensor_hub(self.sensor_hub)
+        self.cpufreq_controller.set_sensor_hub(self.sensor_hub)
+        self.rpc.set_sensor_hub(self.sensor_hub)
+        
+        # Power telemetry through the sensor hub
+        from backend.core.power import PowerMonitor
+        self.power_monitor = PowerMonitor(self.sensor_hub)
+        self.power_monitor.start()
+        self.rpc.set_power_monitor(self.power_monitor)
+        
         # Set fan control service in RPC
         self.rpc.set_fan_control_service(self.fan_control_service)
+        self.rpc.set_knowledge_base(self.knowledge_base)
         
         # Start fan monitoring
         self.fan_control_service.start_monitoring()
@@ -334,6 +367,18 @@ class Plugin:
             event_emitter=self.event_emitter,
             safety_manager=self.safety,
         )
+        # Hand the fan to gymdeck3 while it runs with fan control
+        self.dynamic_controller.set_fan_control_service(self.fan_control_service)
+        self.dynamic_controller.set_sensor_hub(self.sensor_hub)
+        # Samples and sessions record the measured power
+        from backend.core.session_manager import SessionManager
+        self.session_manager = SessionManager(settings)
+        self.session_manager.set_battery_capacity(self.power_monitor.battery_capacity_wh())
+        self.dynamic_controller.set_power_monitor(self.power_monitor)
+        self.dynamic_controller.set_session_manager(self.session_manager)
+        self.rpc.set_session_manager(self.session_manager)
+        # gymdeck3's load reports feed predictive fan control
+        self.fan_control_service.set_load_source(self.dynamic_controller.current_load)
         
         # 9.5. Initialize Manual Dynamic Mode
         from backend.dynamic.manual_manager import DynamicManager
@@ -371,6 +416,13 @@ class Plugin:
             core_settings_manager=None  # Will be set after CoreSettingsManager is initialized
         )
         
+        # Profile fan settings go through the fan control service so that
+        # fan-only profile switches do not restart gymdeck3
+        self.profile_manager.set_fan_control_service(self.fan_control_service)
+        
+        # Energy is attributed to the active profile and game
+        self.power_monitor.set_attribution_source(self.profile_manager.get_energy_attribution)
+        
         # Set profile manager in RPC
         self.rpc.set_profile_manager(self.profile_manager)
         
@@ -387,6 +439,11 @@ class Plugin:
         await self.app_watcher.start()
         decky.logger.info("AppWatcher started for automatic profile switching")
         
+        # 11.5. Start context source for contextual profiles (AC/battery/temperature)
+        self.context_source = PowerSupplyContextSource(self.profile_manager, sensor_hub=self.sensor_hub)
+        await self.context_source.start()
+        decky.logger.info("Context source started for contextual profile switching")
+        
         # 12. Initialize Game Only Mode
         from backend.core.game_only_mode import GameOnlyModeController
         from backend.core.game_state_monitor import GameStateMonitor
@@ -455,6 +512,8 @@ class Plugin:
                 dynamic_controller=self.dynamic_controller
             )
             
+            self.wizard_session.set_knowledge_base(self.knowledge_base)
+            
             # Set in RPC
             self.rpc.set_wizard_session(self.wizard_session)
             
@@ -665,13 +724,18 @@ root ALL=(ALL) NOPASSWD: {ryzenadj_path}
 
     # ==================== Autotune (delegated to RPC) ====================
     
-    async def start_autotune(self, mode="quick"):
+    async def start_autotune(
+        self, mode="quick", strategy="linear", adaptive_duration=False, false_pass_rate=0.01, thermal_pacing=False,
+        temperature_margin=False
+    ):
         """Start autotune process."""
         # Stop dynamic mode if running (using new controller)
         if self.dynamic_controller and self.dynamic_controller.is_running():
             await self.stop_gymdeck()
         
-        return await self.rpc.start_autotune(mode)
+        return await self.rpc.start_autotune(
+            mode, strategy, adaptive_duration, false_pass_rate, thermal_pacing, temperature_margin
+        )
     
     async def stop_autotune(self):
         """Stop running autotune."""
@@ -706,9 +770,9 @@ root ALL=(ALL) NOPASSWD: {ryzenadj_path}
         """Check availability of stress test binaries (stress-ng, memtester)."""
         return await self.rpc.check_binaries()
     
-    async def run_test(self, test_name):
+    async def run_test(self, test_name, verify=None):
         """Run a specific stress test."""
-        return await self.rpc.run_test(test_name)
+        return await self.rpc.run_test(test_name, verify)
     
     async def get_test_history(self):
         """Get last 10 test results."""
@@ -721,6 +785,10 @@ root ALL=(ALL) NOPASSWD: {ryzenadj_path}
         """Run 10-second performance benchmark."""
         return await self.rpc.run_benchmark()
     
+    async def run_benchmark_suite(self, workloads=None, trials=5):
+        """Run the multi-workload benchmark suite with repeated trials."""
+        return await self.rpc.run_benchmark_suite(workloads, trials)
+    
     async def get_benchmark_history(self):
         """Get last 20 benchmark results with comparisons."""
         return await self.rpc.get_benchmark_history()
@@ -1315,6 +1383,18 @@ root ALL=(ALL) NOPASSWD: {ryzenadj_path}
     async def fan_get_status(self):
         """Get current fan control status."""
         return await self.rpc.fan_get_status()
+    
+    async def fan_set_control_mode(self, mode, settings=None):
+        """Select curve-only or predictive fan control."""
+        return await self.rpc.fan_set_control_mode(mode, settings)
+    
+    async def get_sensor_status(self):
+        """Get shared sensor sampling status and read rate."""
+        return await self.rpc.get_sensor_status()
+    
+    async def get_power_status(self):
+        """Get current power draw and energy per profile and game."""
+        return await self.rpc.get_power_status()
 
     # ==================== Crash Metrics (v3.1) ====================
     # Feature: decktune-3.1-reliability-ux
@@ -1433,6 +1513,11 @@ root ALL=(ALL) NOPASSWD: {ryzenadj_path}
             await self.app_watcher.stop()
             decky.logger.info("AppWatcher stopped")
         
+        # Stop context source
+        if self.context_source and self.context_source.is_running():
+            await self.context_source.stop()
+            decky.logger.info("Context source stopped")
+        
         # Stop dynamic controller if running
         if self.dynamic_controller and self.dynamic_controller.is_running():
             await self.dynamic_controller.stop()
@@ -1443,6 +1528,14 @@ root ALL=(ALL) NOPASSWD: {ryzenadj_path}
             self.fan_control_service.stop_monitoring()
             decky.logger.info("Fan control service stopped")
         
+        # Stop shared sensor sampling
+        if self.power_monitor:
+            self.power_monitor.stop()
+        if self.sensor_hub:
+            self.sensor_hub.stop()
+            self.sensor_hub.close()
+            decky.logger.info("Sensor hub stopped")
+        
         decky.logger.info("DeckTune plugin unloaded")
 
     # ==================== Manual Dynamic Mode ====================
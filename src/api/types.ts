@@ -210,6 +210,7 @@ export interface BinningConfig {
   test_duration: number;    // Test duration per iteration (seconds), default 60
   max_iterations: number;   // Safety limit, default 20
   consecutive_fail_limit: number;  // Abort after N consecutive failures, default 3
+  strategy?: "linear" | "bayesian";  // Search strategy, default "linear"
 }
 
 /**
@@ -362,6 +363,9 @@ export interface SessionMetrics {
   avg_power_w: number;               // Average power consumption
   estimated_battery_saved_wh: number; // Estimated battery savings
   undervolt_values: number[];        // Undervolt values used during session
+  energy_wh?: number | null;         // Battery energy drawn (null without battery samples)
+  wh_per_hour?: number | null;       // Average battery draw over the sampled time
+  estimated_battery_life_h?: number | null; // Full battery at wh_per_hour
 }
 
 /**
@@ -371,7 +375,8 @@ export interface SessionMetrics {
 export interface SessionTelemetrySample {
   timestamp: number;       // Unix timestamp
   temperature_c: number;   // CPU temperature
-  power_w: number;         // Power consumption
+  power_w: number | null;  // Power consumption (null if unknown)
+  source?: string | null;  // "battery" or "apu"
 }
 
 /**
@@ -402,6 +407,8 @@ export interface SessionComparison {
     max_temperature_c: number;
     avg_power_w: number;
     estimated_battery_saved_wh: number;
+    energy_wh?: number;     // Only when both sessions have battery samples
+    wh_per_hour?: number;
   };
 }
 
@@ -440,6 +447,7 @@ export interface FrequencyWizardConfig {
   voltage_start: number;    // Starting voltage offset in mV (-100 to 0)
   voltage_step: number;     // Voltage step in mV (1-10)
   safety_margin: number;    // Safety margin in mV (0-20)
+  voltage_search?: "binary" | "bayesian"; // Per-frequency search, default "binary"
 }
 
 /**
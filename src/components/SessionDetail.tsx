@@ -81,7 +81,7 @@ export const SessionDetail: FC<SessionDetailProps> = ({ session, onBack }) => {
     return session.samples.map((sample: SessionTelemetrySample) => ({
       timestamp: sample.timestamp,
       temperature_c: sample.temperature_c,
-      power_w: sample.power_w,
+      power_w: sample.power_w ?? 0,
       load_percent: 0, // Not stored in session samples
     }));
   }, [session.samples]);
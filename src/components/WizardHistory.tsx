@@ -36,7 +36,7 @@ interface WizardPreset {
   name: string;
   chip_grade: string;
   offsets: { cpu: number };
-  curve_data: Array<{ offset: number; result: string; temp: number; timestamp: string }>;
+  curve_data: Array<{ offset: number; result: string; temp: number; timestamp: string; source?: string }>;
   duration: number;
   iterations: number;
   timestamp: string;
@@ -38,6 +38,7 @@ export interface CurveDataPoint {
   result: "pass" | "fail" | "crash";
   temp: number;
   timestamp: string;
+  source?: "test" | "knowledge_base";
 }
 
 export interface WizardResult {
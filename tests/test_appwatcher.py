@@ -3,8 +3,8 @@
 Feature: decktune-3.0-automation
 Validates: Requirements 4.1, 4.6
 
-This module tests the AppWatcher's AppID detection methods and
-debouncing logic.
+This module tests the AppWatcher's AppID detection methods,
+change confirmation logic and process event handling.
 """
 
 import asyncio
@@ -15,6 +15,12 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timezone
 
 from backend.platform.appwatcher import AppWatcher
+from backend.platform.procevents import (
+    PROC_EVENT_EXEC,
+    PROC_EVENT_EXIT,
+    ProcEventListener,
+    parse_proc_event,
+)
 
 
 # ==================== Test Fixtures ====================
@@ -236,16 +242,22 @@ def test_detect_from_proc_steam_without_applaunch(app_watcher):
         assert app_id is None, "Should return None when steam has no -applaunch"
 
 
-# ==================== Debouncing Tests ====================
+# ==================== Confirmation Tests ====================
+
+@pytest.fixture(autouse=True)
+def no_proc_connector():
+    """Keep tests on the polling path regardless of host privileges."""
+    with patch.object(ProcEventListener, 'open', return_value=False):
+        yield
+
 
 @pytest.mark.asyncio
-async def test_debouncing_simple(mock_profile_manager):
-    """Simplified test for debouncing behavior."""
+async def test_confirmation_simple(mock_profile_manager):
+    """Simplified test for change confirmation behavior."""
     watcher = AppWatcher(
         profile_manager=mock_profile_manager,
         poll_interval=0.1
     )
-    watcher.DEBOUNCE_DELAY = 0.3
     
     # Manually trigger the polling loop behavior
     # Start with None
@@ -256,28 +268,26 @@ async def test_debouncing_simple(mock_profile_manager):
         # Start the watcher
         await watcher.start()
         
-        # Give it time to poll and detect the change, then debounce
-        # poll (0.1) + detect change + debounce (0.3) + buffer
+        # Give it time to poll and detect the change
         await asyncio.sleep(0.6)
         
         # Check if profile was applied
         calls = [call[0][0] for call in mock_profile_manager.on_app_change.call_args_list]
         
-        # Should have: initial None, then 1091500 after debounce
+        # Should have applied 1091500 on startup
         assert 1091500 in calls, f"Should have applied profile for app 1091500. Calls: {calls}"
         
         await watcher.stop()
 
 
 @pytest.mark.asyncio
-async def test_debouncing_resets_on_app_change(mock_profile_manager):
-    """Test that debouncing resets when app changes again."""
+async def test_confirmation_resets_on_app_change(mock_profile_manager):
+    """Test that confirmation restarts when app changes again."""
     # Create watcher with short intervals for testing
     watcher = AppWatcher(
         profile_manager=mock_profile_manager,
         poll_interval=0.05  # 50ms
     )
-    watcher.DEBOUNCE_DELAY = 0.2  # 200ms debounce
     
     # Mock detection to return different app_ids over time
     app_ids = [1091500, 1245620]  # Two different games
@@ -295,13 +305,12 @@ async def test_debouncing_resets_on_app_change(mock_profile_manager):
         # Start watcher
         await watcher.start()
         
-        # Wait for app to change during debounce period
+        # Wait for app to change
         await asyncio.sleep(0.25)
         
         # Should have detected the second app change
-        # The first app should not have been applied (debounce was reset)
         
-        # Wait for second debounce to complete
+        # Wait for confirmation to complete
         await asyncio.sleep(0.25)
         
         # Should have applied the second app
@@ -311,6 +320,146 @@ async def test_debouncing_resets_on_app_change(mock_profile_manager):
         await watcher.stop()
 
 
+@pytest.mark.asyncio
+async def test_confirmation_commits_after_two_observations(mock_profile_manager):
+    """Test that a change is applied on the second matching observation."""
+    watcher = AppWatcher(
+        profile_manager=mock_profile_manager,
+        poll_interval=0.05
+    )
+    
+    # start, first observation, confirming observation
+    sequence = iter([None, 1091500, 1091500])
+    
+    with patch.object(watcher, '_get_active_app_id', side_effect=lambda: next(sequence, 1091500)):
+        await watcher.start()
+        await asyncio.sleep(0.2)
+        await watcher.stop()
+    
+    calls = [call[0][0] for call in mock_profile_manager.on_app_change.call_args_list]
+    assert calls == [None, 1091500]
+    assert watcher.get_current_app_id() == 1091500
+    assert watcher.get_last_switch_latency() is not None
+
+
+@pytest.mark.asyncio
+async def test_confirmation_ignores_transient_app(mock_profile_manager):
+    """Test that an app seen on a single observation is never applied."""
+    watcher = AppWatcher(
+        profile_manager=mock_profile_manager,
+        poll_interval=0.05
+    )
+    
+    sequence = iter([None, 1091500])
+    
+    with patch.object(watcher, '_get_active_app_id', side_effect=lambda: next(sequence, None)):
+        await watcher.start()
+        await asyncio.sleep(0.25)
+        await watcher.stop()
+    
+    calls = [call[0][0] for call in mock_profile_manager.on_app_change.call_args_list]
+    assert calls == [None], f"Transient app should not be applied. Calls: {calls}"
+
+
+@pytest.mark.asyncio
+async def test_confirmation_applies_game_exit(mock_profile_manager):
+    """Test that returning to no game (None) is committed like any change."""
+    watcher = AppWatcher(
+        profile_manager=mock_profile_manager,
+        poll_interval=0.05
+    )
+    
+    sequence = iter([1091500])
+    
+    with patch.object(watcher, '_get_active_app_id', side_effect=lambda: next(sequence, None)):
+        await watcher.start()
+        await asyncio.sleep(0.25)
+        await watcher.stop()
+    
+    calls = [call[0][0] for call in mock_profile_manager.on_app_change.call_args_list]
+    assert calls == [1091500, None]
+
+
+# ==================== Process Event Tests ====================
+
+def _proc_event_datagram(what, tgid):
+    """Build a proc connector datagram as the kernel would send it."""
+    import struct
+    cn_payload = struct.pack("=IIQII", what, 0, 123456789, tgid, tgid)
+    cn_msg = struct.pack("=IIIIHH", 1, 1, 0, 0, len(cn_payload), 0)
+    nlmsghdr = struct.pack("=IHHII", 16 + len(cn_msg) + len(cn_payload), 3, 0, 0, 0)
+    return nlmsghdr + cn_msg + cn_payload
+
+
+def test_parse_proc_event_exec_and_exit():
+    """Test parsing exec and exit events from raw datagrams."""
+    assert parse_proc_event(_proc_event_datagram(PROC_EVENT_EXEC, 4242)) == (PROC_EVENT_EXEC, 4242)
+    assert parse_proc_event(_proc_event_datagram(PROC_EVENT_EXIT, 4242)) == (PROC_EVENT_EXIT, 4242)
+
+
+def test_parse_proc_event_ignores_other_events():
+    """Test that fork events and truncated messages are ignored."""
+    assert parse_proc_event(_proc_event_datagram(0x00000001, 4242)) is None
+    assert parse_proc_event(_proc_event_datagram(PROC_EVENT_EXEC, 4242)[:40]) is None
+
+
+def test_proc_events_only_wake_for_launch_processes(app_watcher):
+    """Test that only steam -applaunch execs and their exits wake the watcher."""
+    cmdlines = {
+        100: b'/usr/bin/firefox\x00',
+        200: b'/home/user/.steam/steam\x00-applaunch\x001091500\x00',
+    }
+    
+    def fake_open(path, mode='r', *args, **kwargs):
+        pid = int(path.split('/')[2])
+        handle = MagicMock()
+        handle.__enter__.return_value.read.return_value = cmdlines[pid]
+        return handle
+    
+    with patch('builtins.open', side_effect=fake_open):
+        app_watcher._handle_proc_events([(PROC_EVENT_EXEC, 100)])
+        assert app_watcher._wake_time is None
+        
+        app_watcher._handle_proc_events([(PROC_EVENT_EXEC, 200)])
+        assert app_watcher._wake_time is not None
+        assert 200 in app_watcher._launch_pids
+    
+    app_watcher._wake_time = None
+    app_watcher._handle_proc_events([(PROC_EVENT_EXIT, 100)])
+    assert app_watcher._wake_time is None
+    
+    app_watcher._handle_proc_events([(PROC_EVENT_EXIT, 200)])
+    assert app_watcher._wake_time is not None
+    assert 200 not in app_watcher._launch_pids
+
+
+@pytest.mark.asyncio
+async def test_proc_event_shortens_launch_to_apply_latency(mock_profile_manager):
+    """Test that a process event applies the profile well before the next poll."""
+    watcher = AppWatcher(
+        profile_manager=mock_profile_manager,
+        poll_interval=2.0
+    )
+    
+    active = {"app_id": None}
+    
+    with patch.object(watcher, '_get_active_app_id', side_effect=lambda: active["app_id"]):
+        await watcher.start()
+        await asyncio.sleep(0.05)
+        
+        # Game launches; the exec event wakes the watcher immediately
+        active["app_id"] = 1091500
+        watcher._wake()
+        await asyncio.sleep(watcher.CONFIRM_INTERVAL + 0.2)
+        
+        await watcher.stop()
+    
+    calls = [call[0][0] for call in mock_profile_manager.on_app_change.call_args_list]
+    assert calls == [None, 1091500]
+    assert watcher.get_last_switch_latency() < 1.0, \
+        "Event-driven switch should not wait for the 2s poll interval"
+
+
 # ==================== Lifecycle Tests ====================
 
 @pytest.mark.asyncio
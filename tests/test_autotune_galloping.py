@@ -0,0 +1,210 @@
+"""Tests for the galloping, all-cores-first autotune search.
+
+Feature: decktune, Autotune Engine Module
+Validates: Requirements 2.1, 2.3, 2.4
+
+A simulated silicon model with configurable per-core limits and noise
+compares the galloping strategy against the linear two-phase search:
+noiseless runs must find identical values, with fewer tests and less
+simulated wall-clock time.
+"""
+
+import asyncio
+import random
+from typing import List, Optional, Tuple
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.tuning.autotune import AutotuneEngine, AutotuneConfig, AutotuneResult
+from backend.tuning.runner import TestResult
+from backend.platform.detect import PlatformInfo
+
+from tests.test_rpc_error_response import create_test_rpc
+
+
+TEST_DURATIONS = {"cpu_quick": 30, "cpu_long": 120}
+
+
+class SimulatedSilicon:
+    """Per-core stability limits with optional noise near the limit.
+    
+    A test passes if every core's value is at or above its limit. A core
+    within noise_mv above its limit spuriously fails with noise_rate.
+    Acts as both the ryzenadj wrapper and the test runner.
+    """
+    
+    def __init__(self, limits: List[int], noise_mv: int = 0, noise_rate: float = 0.0, seed: int = 0):
+        self.limits = limits
+        self.noise_mv = noise_mv
+        self.noise_rate = noise_rate
+        self.random = random.Random(seed)
+        self.values = [0, 0, 0, 0]
+        self.tests = 0
+        self.simulated_seconds = 0
+    
+    async def apply_values_async(self, cores: List[int]) -> Tuple[bool, Optional[str]]:
+        self.values = list(cores)
+        return True, None
+    
+    async def run_test(self, test_name: str) -> TestResult:
+        self.tests += 1
+        self.simulated_seconds += TEST_DURATIONS[test_name]
+        
+        passed = True
+        for value, limit in zip(self.values, self.limits):
+            if value < limit:
+                passed = False
+            elif value - limit < self.noise_mv and self.random.random() < self.noise_rate:
+                passed = False
+        return TestResult(passed=passed, duration=TEST_DURATIONS[test_name], logs="")
+    
+    async def check_dmesg_errors(self) -> List[str]:
+        return []
+
+
+class MockSafetyManager:
+    """Mock safety manager for testing."""
+    
+    def __init__(self, safe_limit: int = -50):
+        self.platform = PlatformInfo(model="Jupiter", variant="LCD", safe_limit=safe_limit, detected=True)
+        self.lkg_values: List[int] = [0, 0, 0, 0]
+    
+    def clamp_values(self, values: List[int]) -> List[int]:
+        return [max(self.platform.safe_limit, min(0, v)) for v in values]
+    
+    def save_lkg(self, values: List[int]) -> None:
+        self.lkg_values = list(values)
+    
+    def rollback_to_lkg(self) -> Tuple[bool, Optional[str]]:
+        return True, None
+    
+    def create_tuning_flag(self) -> None:
+        pass
+    
+    def remove_tuning_flag(self) -> None:
+        pass
+
+
+class MockEventEmitter:
+    """Mock event emitter that records progress events."""
+    
+    def __init__(self):
+        self.progress_events: List[dict] = []
+    
+    async def emit_tuning_progress(self, phase: str, core: int, value: int, eta: int) -> None:
+        self.progress_events.append({"phase": phase, "core": core, "value": value, "eta": eta})
+    
+    async def emit_tuning_complete(self, result: AutotuneResult) -> None:
+        pass
+
+
+def _run(silicon: SimulatedSilicon, strategy: str, mode: str = "quick", safe_limit: int = -50):
+    emitter = MockEventEmitter()
+    engine = AutotuneEngine(silicon, silicon, MockSafetyManager(safe_limit), emitter)
+    result = asyncio.run(engine.run(AutotuneConfig(mode=mode, strategy=strategy)))
+    return result, emitter
+
+
+limits_strategy = st.lists(st.integers(min_value=-50, max_value=-1), min_size=4, max_size=4)
+
+
+# ==================== Equivalence Tests ====================
+
+@given(limits=limits_strategy, mode=st.sampled_from(["quick", "thorough"]))
+@settings(max_examples=100, deadline=None)
+def test_galloping_matches_linear_without_noise(limits, mode):
+    """Both strategies find the same values on noiseless silicon."""
+    linear, _ = _run(SimulatedSilicon(limits), "linear", mode)
+    galloping, emitter = _run(SimulatedSilicon(limits), "galloping", mode)
+    
+    assert galloping.stable
+    assert galloping.cores == linear.cores
+    assert all(value >= limit for value, limit in zip(galloping.cores, limits))
+    
+    for event in emitter.progress_events:
+        assert event["phase"] in ("A", "B")
+        assert 0 <= event["core"] <= 3
+        assert event["eta"] >= 0
+
+
+def test_failed_test_rolls_back_to_last_good():
+    """Every failure is followed by re-applying known-good values."""
+    silicon = SimulatedSilicon([-20, -35, -25, -40])
+    applied: List[List[int]] = []
+    original_apply = silicon.apply_values_async
+    
+    async def recording_apply(cores):
+        applied.append(list(cores))
+        return await original_apply(cores)
+    silicon.apply_values_async = recording_apply
+    
+    _run(silicon, "galloping")
+    
+    for tested, following in zip(applied, applied[1:]):
+        if any(v < limit for v, limit in zip(tested, silicon.limits)):
+            assert all(v >= limit for v, limit in zip(following, silicon.limits))
+
+
+# ==================== Cost Comparison Tests ====================
+
+def test_galloping_needs_fewer_tests_and_less_time():
+    """Galloping cuts test count and simulated wall-clock time."""
+    limits = [-35, -40, -30, -45]
+    for mode in ("quick", "thorough"):
+        linear_silicon = SimulatedSilicon(limits)
+        galloping_silicon = SimulatedSilicon(limits)
+        linear, _ = _run(linear_silicon, "linear", mode)
+        galloping, _ = _run(galloping_silicon, "galloping", mode)
+        
+        assert galloping.cores == linear.cores
+        assert galloping.tests_run <= 0.7 * linear.tests_run, (
+            f"{mode}: linear={linear.tests_run} tests, galloping={galloping.tests_run} tests"
+        )
+        assert galloping_silicon.simulated_seconds < linear_silicon.simulated_seconds
+
+
+def test_galloping_stays_safe_and_cheaper_with_noise():
+    """With noisy silicon galloping never exceeds a core's limit and stays cheaper."""
+    limits = [-35, -40, -30, -45]
+    linear_tests = galloping_tests = 0
+    
+    for seed in range(20):
+        linear, _ = _run(SimulatedSilicon(limits, noise_mv=6, noise_rate=0.3, seed=seed), "linear")
+        galloping, _ = _run(SimulatedSilicon(limits, noise_mv=6, noise_rate=0.3, seed=seed), "galloping")
+        
+        assert all(value >= limit for value, limit in zip(galloping.cores, limits))
+        linear_tests += linear.tests_run
+        galloping_tests += galloping.tests_run
+    
+    assert galloping_tests < linear_tests
+
+
+def test_cancel_during_galloping_is_not_stable():
+    """Cancelling mid-search returns an unstable result."""
+    silicon = SimulatedSilicon([-20, -20, -20, -20])
+    engine = AutotuneEngine(silicon, silicon, MockSafetyManager(), MockEventEmitter())
+    original_run_test = silicon.run_test
+    
+    async def cancelling_run_test(test_name):
+        if silicon.tests == 2:
+            engine.cancel()
+        return await original_run_test(test_name)
+    silicon.run_test = cancelling_run_test
+    
+    result = asyncio.run(engine.run(AutotuneConfig(strategy="galloping")))
+    
+    assert not result.stable
+    assert silicon.tests == 3
+
+
+def test_unknown_strategy_rejected_by_rpc():
+    """start_autotune refuses a strategy the engine does not implement."""
+    silicon = SimulatedSilicon([-20, -20, -20, -20])
+    rpc = create_test_rpc()
+    rpc.autotune_engine = AutotuneEngine(silicon, silicon, MockSafetyManager(), MockEventEmitter())
+
+    response = asyncio.run(rpc.start_autotune(strategy="gallop"))
+
+    assert response == {"success": False, "error": "Unknown autotune strategy: gallop"}
+    assert rpc._autotune_task is None
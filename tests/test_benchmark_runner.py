@@ -96,7 +96,7 @@ stress-ng: info:  [12345] matrix: 1234567 bogo ops in 10.00s (123456.70 bogo ops
         )
         
         with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('backend.tuning.benchmark._get_binary_path', return_value='/usr/bin/stress-ng'):
+            with patch('backend.tuning.benchmark.get_binary_path', return_value='/usr/bin/stress-ng'):
                 result = await benchmark_runner.run_benchmark([0, 0, 0, 0])
         
         assert isinstance(result, BenchmarkResult)
@@ -117,7 +117,7 @@ stress-ng: info:  [12345] matrix: 1234567 bogo ops in 10.00s (123456.70 bogo ops
         cores = [-25, -25, -25, -25]
         
         with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('backend.tuning.benchmark._get_binary_path', return_value='/usr/bin/stress-ng'):
+            with patch('backend.tuning.benchmark.get_binary_path', return_value='/usr/bin/stress-ng'):
                 result = await benchmark_runner.run_benchmark(cores)
         
         assert result.cores_used == [-25, -25, -25, -25]
@@ -134,7 +134,7 @@ stress-ng: info:  [12345] matrix: 1234567 bogo ops in 10.00s (123456.70 bogo ops
         )
         
         with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('backend.tuning.benchmark._get_binary_path', return_value='/usr/bin/stress-ng'):
+            with patch('backend.tuning.benchmark.get_binary_path', return_value='/usr/bin/stress-ng'):
                 result = await benchmark_runner.run_benchmark(None)
         
         assert result.cores_used == [0, 0, 0, 0]
@@ -149,7 +149,7 @@ stress-ng: info:  [12345] matrix: 1234567 bogo ops in 10.00s (123456.70 bogo ops
         )
         
         with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('backend.tuning.benchmark._get_binary_path', return_value='/usr/bin/stress-ng'):
+            with patch('backend.tuning.benchmark.get_binary_path', return_value='/usr/bin/stress-ng'):
                 with pytest.raises(RuntimeError, match="Failed to parse benchmark score"):
                     await benchmark_runner.run_benchmark([0, 0, 0, 0])
     
@@ -161,7 +161,7 @@ stress-ng: info:  [12345] matrix: 1234567 bogo ops in 10.00s (123456.70 bogo ops
         mock_process.communicate.side_effect = asyncio.TimeoutError()
         
         with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('backend.tuning.benchmark._get_binary_path', return_value='/usr/bin/stress-ng'):
+            with patch('backend.tuning.benchmark.get_binary_path', return_value='/usr/bin/stress-ng'):
                 with pytest.raises(RuntimeError, match="Benchmark timed out"):
                     await benchmark_runner.run_benchmark([0, 0, 0, 0])
     
@@ -169,7 +169,7 @@ stress-ng: info:  [12345] matrix: 1234567 bogo ops in 10.00s (123456.70 bogo ops
     async def test_run_benchmark_execution_error(self, benchmark_runner):
         """Test error handling when subprocess execution fails."""
         with patch('asyncio.create_subprocess_exec', side_effect=OSError("Command not found")):
-            with patch('backend.tuning.benchmark._get_binary_path', return_value='/usr/bin/stress-ng'):
+            with patch('backend.tuning.benchmark.get_binary_path', return_value='/usr/bin/stress-ng'):
                 with pytest.raises(RuntimeError, match="Benchmark execution failed"):
                     await benchmark_runner.run_benchmark([0, 0, 0, 0])
     
@@ -183,7 +183,7 @@ stress-ng: info:  [12345] matrix: 1234567 bogo ops in 10.00s (123456.70 bogo ops
         )
         
         with patch('asyncio.create_subprocess_exec', return_value=mock_process) as mock_exec:
-            with patch('backend.tuning.benchmark._get_binary_path', return_value='/usr/bin/stress-ng'):
+            with patch('backend.tuning.benchmark.get_binary_path', return_value='/usr/bin/stress-ng'):
                 await benchmark_runner.run_benchmark([0, 0, 0, 0])
         
         # Verify command was called with correct arguments
@@ -206,7 +206,7 @@ stress-ng: info:  [12345] matrix: 1234567 bogo ops in 10.00s (123456.70 bogo ops
         )
         
         with patch('asyncio.create_subprocess_exec', return_value=mock_process):
-            with patch('backend.tuning.benchmark._get_binary_path', return_value='/usr/bin/stress-ng'):
+            with patch('backend.tuning.benchmark.get_binary_path', return_value='/usr/bin/stress-ng'):
                 result = await benchmark_runner.run_benchmark([0, 0, 0, 0])
         
         # Should successfully parse from stderr
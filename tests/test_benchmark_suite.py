@@ -0,0 +1,166 @@
+"""Tests for the multi-workload benchmark suite.
+
+Feature: decktune-3.0-automation, Benchmark Module
+Validates: Requirements 7.1, 7.2, 7.3
+
+Covers stress-ng YAML and --metrics-brief parsing, the repeated-trial
+statistics and the Welch comparison between two suite runs.
+"""
+
+import random
+import statistics
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.tuning.benchmark import (
+    WORKLOADS,
+    BenchmarkRunner,
+    BenchmarkSuiteResult,
+    WorkloadStats,
+    compare_workloads,
+    parse_metrics_brief,
+    parse_yaml_metrics,
+)
+from backend.tuning.runner import TestRunner
+
+
+YAML_OUTPUT = """---
+system-info:
+      stress-ng-version: 0.17.06
+      run-by: deck
+metrics:
+    - stressor: matrix
+      bogo-ops: 1234567
+      bogo-ops-per-second-usr-sys-time: 30873.26
+      bogo-ops-per-second-real-time: 123456.70
+      wall-clock-time: 10.00
+    - stressor: cpu
+      bogo-ops: 1000
+      bogo-ops-per-second-usr-sys-time: 25.0
+      bogo-ops-per-second-real-time: 100.30
+...
+"""
+
+METRICS_BRIEF_OUTPUT = """stress-ng: info:  [4242] dispatching hogs: 4 matrix
+stress-ng: metrc: [4242] stressor       bogo ops real time  usr time  sys time   bogo ops/s     bogo ops/s
+stress-ng: metrc: [4242]                           (secs)    (secs)    (secs)   (real time) (usr+sys time)
+stress-ng: metrc: [4242] matrix          1234567     10.00     39.98      0.01    123456.70      30873.26
+stress-ng: info:  [4242] successful run completed in 10.00s
+"""
+
+
+# ==================== Parsing Tests ====================
+
+def test_parse_yaml_metrics_sums_stressors():
+    assert parse_yaml_metrics(YAML_OUTPUT) == pytest.approx(123557.0)
+    assert parse_yaml_metrics("---\nsystem-info:\n      run-by: deck\n...\n") is None
+    assert parse_yaml_metrics("") is None
+
+
+def test_parse_metrics_brief_table():
+    assert parse_metrics_brief(METRICS_BRIEF_OUTPUT) == pytest.approx(123456.70)
+    assert parse_metrics_brief("stress-ng: error: [1] no stressors") is None
+
+
+# ==================== Statistics Tests ====================
+
+@given(scores=st.lists(st.floats(min_value=1000, max_value=1e6), min_size=2, max_size=20))
+@settings(max_examples=100)
+def test_confidence_interval_contains_mean(scores):
+    stats = WorkloadStats.from_scores("float", scores)
+
+    assert stats.mean == pytest.approx(statistics.fmean(scores))
+    assert stats.ci_low <= stats.mean <= stats.ci_high
+    assert stats.stdev == pytest.approx(statistics.stdev(scores), abs=1e-6)
+
+
+def test_interval_covers_true_mean_at_nominal_rate():
+    """About 95% of 5-trial intervals contain the true mean."""
+    rng = random.Random(1)
+    hits = 0
+    for _ in range(2000):
+        stats = WorkloadStats.from_scores("float", [rng.gauss(1000.0, 20.0) for _ in range(5)])
+        hits += stats.ci_low <= 1000.0 <= stats.ci_high
+
+    assert 0.93 <= hits / 2000 <= 0.97
+
+
+def test_welch_comparison_detects_real_difference_only():
+    rng = random.Random(2)
+    baseline = WorkloadStats.from_scores("float", [rng.gauss(1000.0, 10.0) for _ in range(5)])
+    faster = WorkloadStats.from_scores("float", [rng.gauss(1100.0, 10.0) for _ in range(5)])
+    noise = WorkloadStats.from_scores("float", [rng.gauss(1002.0, 10.0) for _ in range(5)])
+
+    gain = compare_workloads(baseline, faster)
+    same = compare_workloads(baseline, noise)
+
+    assert gain["significant"] and gain["improvement"]
+    assert gain["ci_low"] > 0
+    assert not same["significant"] and not same["improvement"]
+    assert same["ci_low"] < 0 < same["ci_high"]
+
+
+def test_false_positive_rate_near_five_percent():
+    rng = random.Random(3)
+    significant = 0
+    for _ in range(1000):
+        a = WorkloadStats.from_scores("int", [rng.gauss(500.0, 15.0) for _ in range(5)])
+        b = WorkloadStats.from_scores("int", [rng.gauss(500.0, 15.0) for _ in range(5)])
+        significant += compare_workloads(a, b)["significant"]
+
+    assert significant / 1000 <= 0.07
+
+
+def test_suite_result_round_trip():
+    result = BenchmarkSuiteResult(
+        workloads={"float": WorkloadStats.from_scores("float", [100.0, 102.0, 98.0])},
+        duration=30.0,
+        cores_used=[-20, -20, -20, -20],
+        timestamp="2026-01-15T10:00:00Z",
+        trials=3
+    )
+
+    assert BenchmarkSuiteResult.from_dict(result.to_dict()) == result
+
+
+# ==================== Runner Tests ====================
+
+@pytest.mark.asyncio
+async def test_run_suite_discards_warmup_and_reads_yaml():
+    runner = Mock(spec=TestRunner)
+    runner.get_missing_binaries.return_value = []
+    scores = iter(range(1, 100))
+    commands = []
+
+    async def fake_exec(*command, **kwargs):
+        commands.append(command)
+        yaml_path = command[command.index("--yaml") + 1]
+        with open(yaml_path, "w") as f:
+            f.write(f"metrics:\n    - stressor: x\n      bogo-ops-per-second-real-time: {next(scores)}\n")
+        process = AsyncMock()
+        process.communicate.return_value = (b"", b"")
+        return process
+
+    with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+        with patch("backend.tuning.benchmark.get_binary_path", return_value="/usr/bin/stress-ng"):
+            result = await BenchmarkRunner(runner).run_suite(
+                [-10, -10, -10, -10], workloads=["integer", "memory"], trials=3, warmup=1
+            )
+
+    assert list(result.workloads) == ["integer", "memory"]
+    assert result.workloads["integer"].scores == [2.0, 3.0, 4.0]
+    assert result.workloads["memory"].scores == [6.0, 7.0, 8.0]
+    assert len(commands) == 8
+    assert all("--metrics-brief" in c for c in commands)
+    assert commands[0][1:1 + len(WORKLOADS["integer"])] == tuple(WORKLOADS["integer"])
+
+
+@pytest.mark.asyncio
+async def test_run_suite_rejects_unknown_workload():
+    runner = Mock(spec=TestRunner)
+    runner.get_missing_binaries.return_value = []
+
+    with pytest.raises(ValueError, match="Unknown workloads"):
+        await BenchmarkRunner(runner).run_suite(workloads=["gpu"])
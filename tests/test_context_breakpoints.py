@@ -0,0 +1,174 @@
+"""Tests for compiled context breakpoints.
+
+**Feature: decktune-3.0-automation, Property 3: Context change triggers re-evaluation**
+**Validates: Requirements 1.3, 1.4**
+
+Two contexts in the same breakpoint region must satisfy exactly the same
+conditions, and context updates inside a region must not re-evaluate.
+"""
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.dynamic.context import (
+    ContextBreakpoints,
+    ContextCondition,
+    SystemContext,
+)
+from backend.dynamic.profile_manager import ProfileManager, ContextualGameProfile
+
+
+threshold_strategy = st.one_of(st.none(), st.integers(min_value=0, max_value=100))
+
+
+@st.composite
+def context_condition_strategy(draw):
+    """Generate a valid ContextCondition."""
+    return ContextCondition(
+        battery_threshold=draw(threshold_strategy),
+        power_mode=draw(st.one_of(st.none(), st.sampled_from(["ac", "battery"]))),
+        temp_threshold=draw(threshold_strategy),
+    )
+
+
+@st.composite
+def system_context_strategy(draw):
+    """Generate a valid SystemContext."""
+    return SystemContext(
+        battery_percent=draw(st.integers(min_value=0, max_value=100)),
+        power_mode=draw(st.sampled_from(["ac", "battery"])),
+        temperature_c=draw(st.integers(min_value=0, max_value=110)),
+    )
+
+
+class TestBreakpointRegions:
+    """Regions partition contexts by condition outcome."""
+
+    @given(
+        conditions=st.lists(context_condition_strategy(), max_size=10),
+        a=system_context_strategy(),
+        b=system_context_strategy(),
+    )
+    @settings(max_examples=300)
+    def test_same_region_implies_same_condition_outcomes(self, conditions, a, b):
+        """Contexts sharing a region match exactly the same conditions."""
+        breakpoints = ContextBreakpoints(conditions)
+
+        if breakpoints.region(a) == breakpoints.region(b):
+            assert [c.matches(a) for c in conditions] == [c.matches(b) for c in conditions]
+
+    @given(
+        threshold=st.integers(min_value=0, max_value=100),
+        value=st.integers(min_value=0, max_value=100),
+    )
+    def test_region_changes_exactly_at_threshold(self, threshold, value):
+        """Single-threshold intervals follow the condition's own boundary."""
+        battery = ContextBreakpoints([ContextCondition(battery_threshold=threshold)])
+        temperature = ContextBreakpoints([ContextCondition(temp_threshold=threshold)])
+
+        assert battery.battery_interval(value) == (0 if value <= threshold else 1)
+        assert temperature.temperature_interval(value) == (1 if value >= threshold else 0)
+
+    def test_power_mode_ignored_when_unused(self):
+        """Power mode is not part of the region unless a condition uses it."""
+        breakpoints = ContextBreakpoints([ContextCondition(battery_threshold=30)])
+        ac = SystemContext(battery_percent=50, power_mode="ac", temperature_c=50)
+        battery = SystemContext(battery_percent=50, power_mode="battery", temperature_c=50)
+
+        assert breakpoints.region(ac) == breakpoints.region(battery)
+
+
+class MockSettingsManager:
+    """Mock settings manager for testing."""
+
+    def __init__(self):
+        self._settings = {}
+
+    def get_setting(self, key, default=None):
+        return self._settings.get(key, default)
+
+    def save_setting(self, key, value):
+        self._settings[key] = value
+
+
+class MockRyzenadj:
+    """Mock RyzenadjWrapper for testing."""
+
+    async def apply_values_async(self, cores):
+        return (True, None)
+
+
+class MockEventEmitter:
+    """Mock EventEmitter for testing."""
+
+    async def emit_profile_changed(self, profile_name, app_id):
+        pass
+
+    async def emit_context_changed(self, context):
+        pass
+
+
+class TestProfileManagerBreakpoints:
+    """ProfileManager re-evaluates only when the region changes."""
+
+    def _create_manager(self, conditions):
+        manager = ProfileManager(MockSettingsManager(), MockRyzenadj(), None, MockEventEmitter())
+        for i, condition in enumerate(conditions):
+            manager._contextual_profiles.append(ContextualGameProfile(
+                app_id=12345,
+                name=f"Profile {i}",
+                cores=[-10, -10, -10, -10],
+                conditions=condition,
+                created_at=f"2026-01-01T00:00:0{i}+00:00",
+            ))
+        manager._current_app_id = 12345
+
+        calls = []
+
+        async def mock_reevaluate():
+            calls.append(manager.get_current_context())
+
+        manager._reevaluate_profile = mock_reevaluate
+        return manager, calls
+
+    @pytest.mark.asyncio
+    async def test_update_context_within_region_skips_reevaluation(self):
+        """Temperature and battery moves inside a region do nothing."""
+        manager, calls = self._create_manager([
+            ContextCondition(temp_threshold=85),
+            ContextCondition(battery_threshold=20),
+        ])
+
+        await manager.update_context(SystemContext(80, "battery", 60))
+        for battery, temperature in ((78, 70), (75, 84), (60, 65), (21, 50)):
+            await manager.update_context(SystemContext(battery, "battery", temperature))
+        assert len(calls) == 1
+
+        await manager.update_context(SystemContext(21, "battery", 85))
+        await manager.update_context(SystemContext(20, "battery", 85))
+        assert len(calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_power_mode_change_without_power_conditions_is_ignored(self):
+        """Plugging in AC does not re-evaluate when no profile uses power mode."""
+        manager, calls = self._create_manager([ContextCondition(battery_threshold=20)])
+        manager._current_context = SystemContext(50, "battery", 50)
+
+        await manager.on_power_mode_change("ac")
+
+        assert manager.get_current_context().power_mode == "ac"
+        assert calls == []
+
+    def test_breakpoints_follow_profile_changes(self):
+        """Breakpoints are recompiled when profiles are added."""
+        manager, _ = self._create_manager([ContextCondition(temp_threshold=80)])
+        assert manager.get_context_breakpoints().temperature == (80,)
+
+        manager._contextual_profiles.append(ContextualGameProfile(
+            app_id=12345,
+            name="Cool",
+            cores=[-20, -20, -20, -20],
+            conditions=ContextCondition(temp_threshold=60),
+        ))
+
+        assert manager.get_context_breakpoints().temperature == (60, 80)
@@ -0,0 +1,254 @@
+"""Tests for the precompiled ContextMatcher index.
+
+**Feature: decktune-3.0-automation, Property 2: Profile specificity ordering**
+**Validates: Requirements 1.2, 1.5**
+
+The index must select exactly the profile the linear filter-and-sort
+algorithm selects, for any profile set and context, while only scanning
+the bucket for the requested app.
+"""
+
+import pytest
+from hypothesis import given, strategies as st, settings
+from datetime import datetime, timezone, timedelta
+
+from backend.dynamic.context import (
+    ContextCondition,
+    SystemContext,
+    ContextualProfile,
+    ContextIndex,
+    ContextMatcher,
+)
+from backend.dynamic.profile_manager import ProfileManager, ContextualGameProfile
+
+
+battery_threshold_strategy = st.one_of(st.none(), st.integers(min_value=0, max_value=100))
+power_mode_strategy = st.one_of(st.none(), st.sampled_from(["ac", "battery"]))
+temp_threshold_strategy = st.one_of(st.none(), st.integers(min_value=0, max_value=100))
+app_id_strategy = st.one_of(st.none(), st.integers(min_value=1, max_value=5))
+
+
+@st.composite
+def system_context_strategy(draw):
+    """Generate a valid SystemContext."""
+    return SystemContext(
+        battery_percent=draw(st.integers(min_value=0, max_value=100)),
+        power_mode=draw(st.sampled_from(["ac", "battery"])),
+        temperature_c=draw(st.integers(min_value=0, max_value=100)),
+    )
+
+
+@st.composite
+def contextual_profile_strategy(draw):
+    """Generate a ContextualProfile from a small app_id/timestamp space to force ties."""
+    base_time = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    offset_seconds = draw(st.integers(min_value=0, max_value=5))
+    return ContextualProfile(
+        app_id=draw(app_id_strategy),
+        name=draw(st.text(min_size=1, max_size=8)),
+        cores=[0, 0, 0, 0],
+        conditions=ContextCondition(
+            battery_threshold=draw(battery_threshold_strategy),
+            power_mode=draw(power_mode_strategy),
+            temp_threshold=draw(temp_threshold_strategy),
+        ),
+        created_at=(base_time + timedelta(seconds=offset_seconds)).isoformat(),
+    )
+
+
+def reference_find_best_match(app_id, context, profiles, global_default):
+    """Linear filter-and-sort selection the index must reproduce."""
+    matching = [p for p in profiles if p.matches_context(app_id, context)]
+    if not matching:
+        if app_id is not None:
+            app_only = [p for p in profiles if p.app_id == app_id and p.conditions.specificity() == 0]
+            if app_only:
+                app_only.sort(key=lambda p: p.created_at, reverse=True)
+                return app_only[0]
+        return global_default
+    matching.sort(key=lambda p: (p.priority(), p.created_at), reverse=True)
+    return matching[0]
+
+
+class TestContextIndexEquivalence:
+    """The index selects the same profile as the linear algorithm."""
+
+    @given(
+        profiles=st.lists(contextual_profile_strategy(), max_size=20),
+        context=system_context_strategy(),
+        app_id=app_id_strategy,
+        with_default=st.booleans(),
+    )
+    @settings(max_examples=300)
+    def test_index_matches_linear_selection(self, profiles, context, app_id, with_default):
+        """Indexed lookup returns the identical profile object."""
+        global_default = ContextualProfile(app_id=None, name="Global Default", cores=[0, 0, 0, 0]) if with_default else None
+
+        expected = reference_find_best_match(app_id, context, profiles, global_default)
+
+        matcher = ContextMatcher()
+        matcher.rebuild_index(profiles, global_default)
+
+        assert matcher.find_best_match(app_id, context) is expected
+        assert matcher.find_best_match(app_id, context, profiles, global_default) is expected
+
+    def test_find_without_index_returns_global_default(self):
+        """Lookup before rebuild_index() falls back to the given global default."""
+        matcher = ContextMatcher()
+        context = SystemContext(battery_percent=50, power_mode="ac", temperature_c=50)
+        assert matcher.find_best_match(1, context) is None
+        assert matcher.get_index() is None
+
+
+class MockSettingsManager:
+    """Mock settings manager for testing."""
+
+    def __init__(self):
+        self._settings = {}
+
+    def get_setting(self, key, default=None):
+        return self._settings.get(key, default)
+
+    def save_setting(self, key, value):
+        self._settings[key] = value
+
+
+class MockRyzenadj:
+    """Mock RyzenadjWrapper for testing."""
+
+    async def apply_values_async(self, cores):
+        return (True, None)
+
+
+class MockEventEmitter:
+    """Mock EventEmitter for testing."""
+
+    async def emit_profile_changed(self, profile_name, app_id):
+        pass
+
+    async def emit_context_changed(self, context):
+        pass
+
+
+def _create_manager():
+    return ProfileManager(MockSettingsManager(), MockRyzenadj(), None, MockEventEmitter())
+
+
+class TestProfileManagerIndexLifecycle:
+    """ProfileManager rebuilds the index only when profiles change."""
+
+    @pytest.mark.asyncio
+    async def test_index_reused_across_reevaluations(self):
+        """Repeated re-evaluations reuse one index."""
+        manager = _create_manager()
+        await manager.create_contextual_profile(
+            app_id=100, name="Battery", cores=[-20, -20, -20, -20],
+            conditions=ContextCondition(power_mode="battery"),
+        )
+        manager._current_app_id = 100
+        manager._current_context = SystemContext(battery_percent=50, power_mode="battery", temperature_c=50)
+
+        await manager._reevaluate_profile()
+        index = manager._context_matcher.get_index()
+        await manager._reevaluate_profile()
+
+        assert manager._context_matcher.get_index() is index
+        assert manager.get_active_profile().name == "Battery"
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_after_profile_changes(self):
+        """Create, update and delete invalidate the index."""
+        manager = _create_manager()
+        context = SystemContext(battery_percent=50, power_mode="ac", temperature_c=50)
+        manager._current_app_id = 100
+        manager._current_context = context
+
+        await manager.create_contextual_profile(
+            app_id=100, name="AC", cores=[-20, -20, -20, -20],
+            conditions=ContextCondition(power_mode="ac"),
+        )
+        await manager._reevaluate_profile()
+        assert manager.get_active_profile().name == "AC"
+
+        await manager.update_contextual_profile(
+            "AC", 100, conditions=ContextCondition(power_mode="battery"),
+        )
+        # Updating the active profile re-evaluates against a rebuilt index
+        assert manager._context_index_valid
+        assert manager._context_matcher.find_best_match(100, context).name == "Global Default"
+
+        await manager.delete_contextual_profile("AC", 100)
+        manager._ensure_context_index()
+        assert manager._context_matcher.get_index().size == 0
+
+    def test_index_follows_global_default_changes(self):
+        """set_global_default() is reflected in the indexed fallback."""
+        manager = _create_manager()
+        context = SystemContext(battery_percent=50, power_mode="ac", temperature_c=50)
+
+        manager._ensure_context_index()
+        manager.set_global_default(cores=[-5, -5, -5, -5])
+        manager._ensure_context_index()
+
+        assert manager._context_matcher.find_best_match(None, context).cores == [-5, -5, -5, -5]
+
+
+class TestContextIndexBenchmark:
+    """500 games x 4 contextual variants."""
+
+    GAMES = 500
+    VARIANTS = [
+        ContextCondition(battery_threshold=30),
+        ContextCondition(power_mode="ac"),
+        ContextCondition(temp_threshold=80),
+        ContextCondition(battery_threshold=20, power_mode="battery"),
+    ]
+
+    def _build_profiles(self):
+        profiles = []
+        for game in range(self.GAMES):
+            for i, conditions in enumerate(self.VARIANTS):
+                profiles.append(ContextualGameProfile(
+                    app_id=1000 + game,
+                    name=f"Game {game} variant {i}",
+                    cores=[-10, -10, -10, -10],
+                    conditions=conditions,
+                    created_at=f"2026-01-01T00:00:{i:02d}+00:00",
+                ))
+        return profiles
+
+    def test_indexed_lookup_outperforms_linear(self, monkeypatch):
+        """Indexed lookups check only the app's bucket, not every profile."""
+        profiles = self._build_profiles()
+        global_default = ContextualProfile(app_id=None, name="Global Default", cores=[0, 0, 0, 0])
+        context = SystemContext(battery_percent=50, power_mode="battery", temperature_c=85)
+
+        checks = {"linear": 0, "indexed": 0}
+        matches_context = ContextualGameProfile.matches_context
+        matches = ContextCondition.matches
+
+        def counted_matches_context(profile, app_id, ctx):
+            checks["linear"] += 1
+            return matches_context(profile, app_id, ctx)
+
+        def counted_matches(conditions, ctx):
+            checks["indexed"] += 1
+            return matches(conditions, ctx)
+
+        monkeypatch.setattr(ContextualGameProfile, "matches_context", counted_matches_context)
+        linear_rounds = 20
+        for i in range(linear_rounds):
+            reference_find_best_match(1000 + i, context, profiles, global_default)
+        linear_per_lookup = checks["linear"] / linear_rounds
+
+        index = ContextIndex(profiles, global_default)
+        monkeypatch.setattr(ContextCondition, "matches", counted_matches)
+        indexed_rounds = 5000
+        for i in range(indexed_rounds):
+            result = index.find_best_match(1000 + i % self.GAMES, context)
+        indexed_per_lookup = checks["indexed"] / indexed_rounds
+
+        assert result.app_id == 1000 + (indexed_rounds - 1) % self.GAMES
+        assert linear_per_lookup == len(profiles)
+        assert indexed_per_lookup <= len(self.VARIANTS), f"{indexed_per_lookup} checks per indexed lookup"
+        assert indexed_per_lookup * 50 < linear_per_lookup
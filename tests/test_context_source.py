@@ -0,0 +1,182 @@
+"""Tests for the event-driven power supply context source.
+
+Feature: decktune-3.0-automation
+Validates: Requirements 1.3, 1.4
+
+Synthetic kernel uevents are injected to verify that AC plug/unplug and
+battery capacity steps reach ProfileManager.update_context() promptly,
+and that the source falls back to sysfs polling without uevents.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import Mock, AsyncMock, patch
+
+from backend.dynamic.context import SystemContext
+from backend.dynamic.context_source import PowerSupplyContextSource
+from backend.platform.uevents import UeventListener, parse_uevent
+
+
+def _uevent(name, **properties):
+    """Build a kernel power_supply uevent datagram."""
+    devpath = f"/devices/LNXSYSTM:00/power_supply/{name}"
+    fields = [
+        f"change@{devpath}",
+        "ACTION=change",
+        f"DEVPATH={devpath}",
+        "SUBSYSTEM=power_supply",
+        f"POWER_SUPPLY_NAME={name}",
+    ]
+    fields += [f"POWER_SUPPLY_{key}={value}" for key, value in properties.items()]
+    fields.append("SEQNUM=1")
+    return "\x00".join(fields).encode() + b"\x00"
+
+
+INITIAL_CONTEXT = SystemContext(battery_percent=80, power_mode="battery", temperature_c=55)
+
+
+@pytest.fixture
+def profile_manager():
+    """Create a mock ProfileManager."""
+    manager = Mock()
+    manager.update_context = AsyncMock()
+    return manager
+
+
+def _published(profile_manager):
+    return [call[0][0] for call in profile_manager.update_context.call_args_list]
+
+
+# ==================== Uevent Parsing Tests ====================
+
+def test_parse_power_supply_uevent():
+    """Test parsing a kernel uevent into properties."""
+    event = parse_uevent(_uevent("ADP1", TYPE="Mains", ONLINE=1))
+
+    assert event["ACTION"] == "change"
+    assert event["SUBSYSTEM"] == "power_supply"
+    assert event["POWER_SUPPLY_NAME"] == "ADP1"
+    assert event["POWER_SUPPLY_ONLINE"] == "1"
+
+
+def test_parse_uevent_ignores_udev_and_malformed():
+    """Test that udev re-broadcasts and garbage are ignored."""
+    assert parse_uevent(b"libudev\x00\xfe\xed\xca\xfe") is None
+    assert parse_uevent(b"garbage") is None
+    assert parse_uevent(b"change@/devices/foo\x00ACTION=change\x00") is None
+
+
+# ==================== Uevent Handling Tests ====================
+
+def test_handle_ac_plug_and_unplug(profile_manager):
+    """Test that adapter online events flip the power mode."""
+    source = PowerSupplyContextSource(profile_manager)
+
+    assert source.handle_uevents([parse_uevent(_uevent("ADP1", TYPE="Mains", ONLINE=1))])
+    assert source.get_context().power_mode == "ac"
+
+    assert source.handle_uevents([parse_uevent(_uevent("ADP1", TYPE="Mains", ONLINE=0))])
+    assert source.get_context().power_mode == "battery"
+
+
+def test_handle_any_adapter_online_means_ac(profile_manager):
+    """Test that power mode stays AC while any adapter is online."""
+    source = PowerSupplyContextSource(profile_manager)
+
+    source.handle_uevents([
+        parse_uevent(_uevent("ADP1", TYPE="Mains", ONLINE=1)),
+        parse_uevent(_uevent("ucsi-source-psy-USBC000:001", TYPE="USB", ONLINE=0)),
+    ])
+
+    assert source.get_context().power_mode == "ac"
+
+
+def test_handle_battery_capacity_steps(profile_manager):
+    """Test that battery capacity uevents update the battery level."""
+    source = PowerSupplyContextSource(profile_manager)
+
+    assert source.handle_uevents([parse_uevent(_uevent("BAT1", TYPE="Battery", CAPACITY=42, STATUS="Discharging"))])
+    assert source.get_context().battery_percent == 42
+
+    # Same capacity (e.g. status-only change) is not a context change
+    assert not source.handle_uevents([parse_uevent(_uevent("BAT1", TYPE="Battery", CAPACITY=42, STATUS="Charging"))])
+
+
+def test_handle_ignores_other_subsystems(profile_manager):
+    """Test that non power_supply uevents are ignored."""
+    source = PowerSupplyContextSource(profile_manager)
+
+    assert not source.handle_uevents([{"ACTION": "add", "DEVPATH": "/devices/usb1", "SUBSYSTEM": "usb"}])
+
+
+# ==================== Lifecycle Tests ====================
+
+@pytest.mark.asyncio
+async def test_charger_plug_switches_within_fraction_of_second(profile_manager):
+    """Test that an AC uevent reaches ProfileManager without waiting for a poll."""
+    source = PowerSupplyContextSource(profile_manager, temperature_interval=5.0)
+
+    with patch.object(UeventListener, 'open', return_value=True), \
+         patch.object(UeventListener, 'is_open', return_value=True), \
+         patch.object(UeventListener, 'close'), \
+         patch.object(SystemContext, 'read_current_sync', return_value=INITIAL_CONTEXT):
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, 'add_reader'), patch.object(loop, 'remove_reader'):
+            await source.start()
+            assert _published(profile_manager) == [INITIAL_CONTEXT]
+
+            plugged_at = time.monotonic()
+            source.handle_uevents([parse_uevent(_uevent("ADP1", TYPE="Mains", ONLINE=1))])
+
+            while len(_published(profile_manager)) < 2 and time.monotonic() - plugged_at < 1.0:
+                await asyncio.sleep(0.005)
+            latency = time.monotonic() - plugged_at
+
+            await source.stop()
+
+    assert _published(profile_manager)[-1].power_mode == "ac"
+    assert latency < 0.2, f"AC switch took {latency:.3f}s"
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_polling_without_uevents(profile_manager):
+    """Test that sysfs is polled when the uevent socket cannot be opened."""
+    source = PowerSupplyContextSource(profile_manager, poll_interval=0.05)
+
+    plugged_in = SystemContext(battery_percent=80, power_mode="ac", temperature_c=55)
+    contexts = iter([INITIAL_CONTEXT])
+
+    with patch.object(UeventListener, 'open', return_value=False), \
+         patch.object(SystemContext, 'read_current_sync', side_effect=lambda: next(contexts, plugged_in)):
+        await source.start()
+        assert not source.is_event_driven()
+        await asyncio.sleep(0.2)
+        await source.stop()
+
+    published = _published(profile_manager)
+    assert published[0] == INITIAL_CONTEXT
+    assert published[-1].power_mode == "ac"
+    assert len(published) == 2, "Unchanged contexts should not be re-published"
+
+
+@pytest.mark.asyncio
+async def test_event_driven_samples_only_temperature(profile_manager):
+    """Test that event-driven mode reads the thermal zone, not battery/AC sysfs."""
+    source = PowerSupplyContextSource(profile_manager, temperature_interval=0.05)
+
+    with patch.object(UeventListener, 'open', return_value=True), \
+         patch.object(UeventListener, 'is_open', return_value=True), \
+         patch.object(UeventListener, 'close'), \
+         patch.object(SystemContext, 'read_current_sync', return_value=INITIAL_CONTEXT) as read_all, \
+         patch.object(SystemContext, '_read_temperature_sync', return_value=90) as read_temp:
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, 'add_reader'), patch.object(loop, 'remove_reader'):
+            await source.start()
+            await asyncio.sleep(0.2)
+            await source.stop()
+
+    assert read_all.call_count == 1
+    assert read_temp.call_count >= 2
+    assert _published(profile_manager)[-1].temperature_c == 90
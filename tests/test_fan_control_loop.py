@@ -0,0 +1,199 @@
+"""Tests for the asyncio fan control loop against a fake hwmon directory.
+
+Feature: fan-control-curves, Fan Control Service
+Validates: Requirements 5.1
+
+The loop runs on a simulated clock. It must poll fast while the
+temperature moves or sits near a curve breakpoint, slow down once the
+temperature is flat inside a segment, keep hwmon files open between
+ticks and skip PWM writes that would not change the PWM byte.
+"""
+
+import asyncio
+import os
+from typing import Callable, List
+
+import pytest
+
+from backend.core import fan_control
+from backend.core.fan_control import (
+    FAST_INTERVAL,
+    FLAT_SECONDS,
+    SLOW_INTERVAL,
+    FanControlService,
+    HwmonInterface,
+    speed_to_pwm,
+)
+
+
+class FakeHwmon:
+    """hwmon0 with a labelled CPU sensor and a PWM file under tmp_path."""
+
+    def __init__(self, tmp_path, temp: float = 50.0):
+        self.device = tmp_path / "hwmon0"
+        self.device.mkdir()
+        (self.device / "temp1_label").write_text("Tctl\n")
+        (self.device / "pwm1").write_text("0\n")
+        self.set_temp(temp)
+
+    def set_temp(self, temp: float) -> None:
+        # write_text truncates in place, keeping the inode like sysfs
+        (self.device / "temp1_input").write_text(f"{int(temp * 1000)}\n")
+
+    def pwm(self) -> int:
+        return int((self.device / "pwm1").read_text().strip())
+
+
+class SimClock:
+    """Simulated clock; sleeping advances it and runs a temperature profile."""
+
+    def __init__(self, hwmon: FakeHwmon, profile: Callable[[float], float]):
+        self.now = 0.0
+        self.hwmon = hwmon
+        self.profile = profile
+        self.intervals: List[float] = []
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.intervals.append(seconds)
+        self.now += seconds
+        self.hwmon.set_temp(self.profile(self.now))
+        await asyncio.sleep(0)
+
+
+async def _run(tmp_path, profile: Callable[[float], float], seconds: float = 120.0, **behavior):
+    fake = FakeHwmon(tmp_path, profile(0.0))
+    sim = SimClock(fake, profile)
+    hwmon = HwmonInterface(hwmon_path=str(tmp_path))
+    service = FanControlService(hwmon, config_path=str(tmp_path / "fan.json"), sleep=sim.sleep, clock=sim.clock)
+    if behavior:
+        service.set_fan_behavior(**behavior)
+
+    service.start_monitoring()
+    while sim.now < seconds:
+        await asyncio.sleep(0)
+    status = service.get_current_status()
+    service.stop_monitoring()
+    return fake, sim, hwmon, status
+
+
+# ==================== Adaptive Rate Tests ====================
+
+@pytest.mark.asyncio
+async def test_flat_temperature_slows_down(tmp_path):
+    fake, sim, hwmon, status = await _run(tmp_path, lambda t: 50.0)
+
+    assert sim.intervals[0] == FAST_INTERVAL
+    assert sim.intervals[-1] == SLOW_INTERVAL
+    assert sum(1 for i in sim.intervals if i == FAST_INTERVAL) <= FLAT_SECONDS / FAST_INTERVAL + 2
+    assert status["wakeups_per_minute"] <= 60 / SLOW_INTERVAL + 1
+    assert status["pwm_writes"] == 1
+    assert fake.pwm() == speed_to_pwm(20)  # Stock curve: 40°C 0%, 60°C 40%
+
+
+@pytest.mark.asyncio
+async def test_moving_temperature_polls_fast(tmp_path):
+    fake, sim, hwmon, status = await _run(tmp_path, lambda t: 42.0 + 0.75 * t, seconds=40.0)
+
+    assert set(sim.intervals) == {FAST_INTERVAL}
+    assert abs(fake.pwm() - speed_to_pwm(status["target_speed"])) <= speed_to_pwm(2)
+
+
+@pytest.mark.asyncio
+async def test_near_breakpoint_stays_fast(tmp_path):
+    fake, sim, hwmon, status = await _run(tmp_path, lambda t: 59.5)
+
+    assert set(sim.intervals) == {FAST_INTERVAL}
+
+
+@pytest.mark.asyncio
+async def test_slow_loop_reacts_to_heat_step(tmp_path):
+    """A jump during a slow tick switches back to fast polling."""
+    fake, sim, hwmon, status = await _run(tmp_path, lambda t: 50.0 if t < 60 else 70.0, seconds=90.0)
+
+    # The tick that first sees the step picks the interval after it
+    step = next(i for i, t in enumerate(_times(sim.intervals)) if t >= 60)
+    assert SLOW_INTERVAL in sim.intervals[:step + 1]
+    assert sim.intervals[step + 1] == FAST_INTERVAL
+    assert fake.pwm() == speed_to_pwm(status["target_speed"])
+
+
+# ==================== Profile Fan Behaviour Tests ====================
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("temp,zero_rpm,speed", [
+    (38.0, None, 0),    # Curve speed as it is
+    (38.0, False, 12),  # Fan keeps spinning
+    (38.0, True, 0),
+    (50.0, True, 20),   # Only a 0% speed is affected
+])
+async def test_zero_rpm_follows_gymdeck3(tmp_path, temp, zero_rpm, speed):
+    fake, sim, hwmon, status = await _run(tmp_path, lambda t: temp, seconds=20.0, zero_rpm=zero_rpm)
+
+    assert status["target_speed"] == speed
+
+
+@pytest.mark.asyncio
+async def test_hysteresis_ignores_small_oscillation(tmp_path):
+    """A 1°C wobble moves the fan without hysteresis, not with 2°C."""
+    def wobble(t):
+        return 50.0 + int(t) % 2
+
+    (tmp_path / "plain").mkdir()
+    (tmp_path / "damped").mkdir()
+    _, _, _, plain = await _run(tmp_path / "plain", wobble, seconds=20.0)
+    _, _, _, damped = await _run(tmp_path / "damped", wobble, seconds=20.0, hysteresis_temp=2)
+
+    assert plain["pwm_writes"] > 1
+    assert damped["pwm_writes"] == 1
+
+
+def _times(intervals: List[float]) -> List[float]:
+    times, now = [], 0.0
+    for interval in intervals:
+        now += interval
+        times.append(now)
+    return times
+
+
+# ==================== hwmon Handle Tests ====================
+
+def test_reads_reuse_one_descriptor(tmp_path, monkeypatch):
+    fake = FakeHwmon(tmp_path, 61.5)
+    hwmon = HwmonInterface(hwmon_path=str(tmp_path))
+    opens = []
+    real_open = os.open
+    monkeypatch.setattr(fan_control.os, "open", lambda *a, **k: opens.append(a[0]) or real_open(*a, **k))
+
+    readings = []
+    for temp in (61.5, 62.0, 63.25):
+        fake.set_temp(temp)
+        readings.append(hwmon.read_temperature())
+
+    assert readings == [61.5, 62.0, 63.25]
+    assert len(opens) == 1
+    hwmon.close()
+
+
+def test_unchanged_pwm_byte_is_not_written(tmp_path):
+    fake = FakeHwmon(tmp_path)
+    hwmon = HwmonInterface(hwmon_path=str(tmp_path))
+
+    assert hwmon.write_pwm(100) and hwmon.write_pwm(100)
+    assert hwmon.write_pwm(50) and fake.pwm() == 128
+    (fake.device / "pwm1").write_text("255\n")  # Changed behind our back
+    hwmon.invalidate_pwm()
+    assert hwmon.write_pwm(50) and fake.pwm() == 128
+
+    assert hwmon.pwm_writes == 3
+    assert hwmon.pwm_writes_skipped == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_closes_descriptors(tmp_path):
+    fake, sim, hwmon, status = await _run(tmp_path, lambda t: 50.0, seconds=5.0)
+
+    assert hwmon._fds == {}
+    assert status["monitoring_active"] is True
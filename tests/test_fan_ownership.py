@@ -0,0 +1,201 @@
+"""Tests for fan owner arbitration between the Python service and gymdeck3.
+
+Feature: fan-control-curves, Fan Control Service
+Validates: Requirements 5.1
+
+A stand-in for gymdeck3 writes the fake hwmon PWM node directly. While
+it owns the fan the Python loop must not write; once it releases the
+fan or its process exits, the loop must take over again. PWM changes by
+another writer while the service owns the fan are counted as foreign.
+"""
+
+import asyncio
+import os
+import subprocess
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from backend.core.fan_control import (
+    OWNER_GYMDECK3,
+    OWNER_PYTHON,
+    PRESET_STOCK,
+    FanControlService,
+    FanOwnerLock,
+    HwmonInterface,
+    calculate_fan_speed,
+    speed_to_pwm,
+)
+from backend.dynamic.config import DynamicConfig, FanConfig
+from backend.dynamic.controller import DynamicController
+
+from tests.test_fan_control_loop import FakeHwmon, SimClock
+
+
+class Harness:
+    """Fan control service on a fake hwmon tree and simulated clock."""
+
+    def __init__(self, tmp_path, temp: float = 50.0):
+        self.fake = FakeHwmon(tmp_path, temp)
+        self.temp = temp
+        self.sim = SimClock(self.fake, lambda t: self.temp)
+        self.hwmon = HwmonInterface(hwmon_path=str(tmp_path))
+        self.service = FanControlService(
+            self.hwmon, config_path=str(tmp_path / "fan.json"), sleep=self.sim.sleep, clock=self.sim.clock
+        )
+
+    async def run_for(self, seconds: float) -> None:
+        end = self.sim.now + seconds
+        while self.sim.now < end:
+            await asyncio.sleep(0)
+
+    def foreign_write(self, pwm: int) -> None:
+        (self.fake.device / "pwm1").write_text(f"{pwm}\n")
+
+
+def _exited_pid() -> int:
+    process = subprocess.Popen(["true"])
+    process.wait()
+    return process.pid
+
+
+# ==================== Lock Tests ====================
+
+def test_lock_defaults_to_python_and_ignores_dead_owner(tmp_path):
+    lock = FanOwnerLock(str(tmp_path / "fan_owner.json"))
+    assert lock.owner() == OWNER_PYTHON
+
+    lock.claim(OWNER_GYMDECK3, os.getpid())
+    assert lock.owner() == OWNER_GYMDECK3
+    assert FanOwnerLock(lock.path).read()["pid"] == os.getpid()
+
+    lock.claim(OWNER_GYMDECK3, _exited_pid())
+    assert lock.owner() == OWNER_PYTHON
+
+
+# ==================== Service Tests ====================
+
+@pytest.mark.asyncio
+async def test_service_stops_writing_while_yielded(tmp_path):
+    h = Harness(tmp_path)
+    h.service.start_monitoring()
+    await h.run_for(5)
+    writes = h.hwmon.pwm_writes
+
+    h.service.yield_to(OWNER_GYMDECK3, os.getpid())
+    h.temp = 70.0
+    h.foreign_write(200)  # gymdeck3 drives the fan
+    await h.run_for(20)
+    status = h.service.get_current_status()
+
+    assert h.hwmon.pwm_writes == writes
+    assert h.fake.pwm() == 200
+    assert status["owner"] == OWNER_GYMDECK3
+    assert status["foreign_writes"] == 0
+    assert status["target_speed"] == calculate_fan_speed(70.0, PRESET_STOCK.points)  # Still tracked
+
+    h.service.resume()
+    await h.run_for(2)
+    h.service.stop_monitoring()
+
+    assert h.fake.pwm() == speed_to_pwm(status["target_speed"])
+    assert h.service.get_current_status()["owner"] == OWNER_PYTHON
+
+
+@pytest.mark.asyncio
+async def test_service_resumes_when_owner_process_exits(tmp_path):
+    h = Harness(tmp_path)
+    gymdeck3 = subprocess.Popen(["sleep", "30"])
+    try:
+        h.service.yield_to(OWNER_GYMDECK3, gymdeck3.pid)
+        h.service.start_monitoring()
+        await h.run_for(5)
+        assert h.hwmon.pwm_writes == 0
+    finally:
+        gymdeck3.kill()
+        gymdeck3.wait()
+
+    await h.run_for(2)
+    h.service.stop_monitoring()
+
+    assert h.service.owner() == OWNER_PYTHON
+    assert h.fake.pwm() == speed_to_pwm(20)
+
+
+@pytest.mark.asyncio
+async def test_foreign_write_detected_and_overridden(tmp_path):
+    h = Harness(tmp_path)
+    h.service.start_monitoring()
+    await h.run_for(5)
+
+    h.foreign_write(255)
+    await h.run_for(2)
+    status = h.service.get_current_status()
+    h.service.stop_monitoring()
+
+    assert status["foreign_writes"] == 1
+    assert status["last_foreign_pwm"] == 255
+    assert h.fake.pwm() == speed_to_pwm(20)
+
+
+# ==================== gymdeck3 Handoff Tests ====================
+
+def _controller(tmp_path):
+    binary = tmp_path / "gymdeck3"
+    binary.write_text("")
+    emitter = Mock()
+    emitter.emit_status = AsyncMock()
+    controller = DynamicController("ryzenadj", str(binary), emitter)
+    service = Mock(spec=FanControlService)
+    controller.set_fan_control_service(service)
+    return controller, service
+
+
+def _process(exit_now: bool = False):
+    process = Mock()
+    process.pid = 4242
+    process.returncode = None
+    process.wait = AsyncMock(return_value=0)
+    if exit_now:
+        process.stdout.readline = AsyncMock(return_value=b"")
+    else:
+        process.stdout.readline = AsyncMock(side_effect=lambda: asyncio.Event().wait())
+    return process
+
+
+@pytest.mark.asyncio
+async def test_gymdeck3_fan_control_takes_and_returns_fan(tmp_path, monkeypatch):
+    controller, service = _controller(tmp_path)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", AsyncMock(return_value=_process()))
+
+    assert await controller.start(DynamicConfig(fan_config=FanConfig(enabled=True)))
+    assert [c.args for c in service.yield_to.call_args_list] == [
+        (OWNER_GYMDECK3, None), (OWNER_GYMDECK3, 4242)
+    ]
+    service.resume.assert_not_called()
+
+    assert await controller.stop()
+    service.resume.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_gymdeck3_crash_returns_fan(tmp_path, monkeypatch):
+    controller, service = _controller(tmp_path)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", AsyncMock(return_value=_process(exit_now=True)))
+
+    await controller.start(DynamicConfig(fan_config=FanConfig(enabled=True)))
+    await controller._reader_task
+
+    service.resume.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_gymdeck3_without_fan_control_keeps_owner(tmp_path, monkeypatch):
+    controller, service = _controller(tmp_path)
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", AsyncMock(return_value=_process()))
+
+    await controller.start(DynamicConfig())
+    await controller.stop()
+
+    service.yield_to.assert_not_called()
+    service.resume.assert_not_called()
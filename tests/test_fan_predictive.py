@@ -0,0 +1,282 @@
+"""Tests for predictive fan control.
+
+Feature: fan-control-curves, Fan Control Service
+Validates: Requirements 5.1
+
+A two-node thermal simulation (die -> heatsink -> air, with the fan
+setting the heatsink's conductance to air) drives the real control loop
+through a simulated hwmon. For a load profile with a shader-compilation
+burst, sustained game load and a loading-screen spike, the harness
+reports peak temperature, time above target and fan speed variance for
+curve-only and predictive control.
+"""
+
+import asyncio
+import statistics
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.core.fan_control import FanControlService, speed_to_pwm
+from backend.core.fan_predictive import PredictiveConfig, PredictiveFanController
+from backend.dynamic.config import DynamicStatus
+from backend.dynamic.controller import DynamicController
+
+
+class ThermalPlant:
+    """Two-node APU model with a fan-dependent heatsink conductance."""
+
+    def __init__(self, load: Callable[[float], float], ambient: float = 30.0):
+        self.load = load
+        self.ambient = ambient
+        self.die = 50.0
+        self.sink = 48.0
+        self.fan = 30.0
+        self.now = 0.0
+        self.samples: List[Tuple[float, float, float]] = []
+
+    def step(self, dt: float) -> None:
+        power = 5.0 + 20.0 * self.load(self.now) / 100.0  # W
+        die_to_sink = 2.0 * (self.die - self.sink)       # W
+        sink_to_air = (0.15 + 0.55 * self.fan / 100.0) * (self.sink - self.ambient)
+        self.die += dt * (power - die_to_sink) / 4.0
+        self.sink += dt * (die_to_sink - sink_to_air) / 60.0
+        self.now += dt
+        self.samples.append((self.now, self.die, self.fan))
+
+
+class SimulatedHwmon:
+    """HwmonInterface stand-in reading and driving a ThermalPlant."""
+
+    def __init__(self, plant: ThermalPlant):
+        self.plant = plant
+        self.last_written_pwm: Optional[int] = None
+        self.pwm_writes = 0
+        self.pwm_writes_skipped = 0
+
+    def read_temperature(self) -> Optional[float]:
+        return round(self.plant.die, 3)
+
+    def write_pwm(self, speed_percent: int) -> bool:
+        self.plant.fan = speed_percent
+        self.last_written_pwm = speed_to_pwm(speed_percent)
+        self.pwm_writes += 1
+        return True
+
+    def read_pwm_value(self) -> Optional[int]:
+        return self.last_written_pwm
+
+    def read_current_pwm(self) -> Optional[int]:
+        return int(self.plant.fan)
+
+    def invalidate_pwm(self) -> None:
+        pass
+
+    def is_available(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+def game_session(t: float) -> float:
+    """Idle, shader compilation burst, game at 55% load, loading spike, idle."""
+    if t < 120:
+        return 15.0
+    if t < 180:
+        return 100.0
+    if t < 300:
+        return 55.0
+    if t < 320:
+        return 100.0
+    return 15.0
+
+
+@dataclass
+class SimulationReport:
+    peak_temp: float
+    time_above_target: float
+    fan_variance: float
+    max_fan_step: float  # Largest fan change within one second, in %
+
+
+def simulate(tmp_path, mode: str, target: float = 70.0, seconds: float = 500.0) -> SimulationReport:
+    plant = ThermalPlant(game_session)
+
+    async def sleep(duration: float) -> None:
+        for _ in range(int(round(duration / 0.1))):
+            plant.step(0.1)
+        await asyncio.sleep(0)
+
+    async def run() -> None:
+        service = FanControlService(
+            SimulatedHwmon(plant), config_path=str(tmp_path / f"{mode}.json"), sleep=sleep, clock=lambda: plant.now
+        )
+        if mode == "predictive":
+            service.set_control_mode("predictive", PredictiveConfig(target_temp=target))
+        service.set_load_source(lambda: game_session(plant.now))
+        service.start_monitoring()
+        while plant.now < seconds:
+            await asyncio.sleep(0)
+        service.stop_monitoring()
+
+    asyncio.run(run())
+    samples = [s for s in plant.samples if s[0] > 60.0]  # After warm-up
+    fans = [fan for _, _, fan in samples]
+    return SimulationReport(
+        peak_temp=max(die for _, die, _ in samples),
+        time_above_target=0.1 * sum(1 for _, die, _ in samples if die > target),
+        fan_variance=statistics.pvariance(fans),
+        max_fan_step=max(abs(b - a) for a, b in zip(fans, fans[10:])),
+    )
+
+
+# ==================== Simulation Harness Tests ====================
+
+def test_predictive_beats_curve_only_in_simulation(tmp_path):
+    curve = simulate(tmp_path, "curve")
+    predictive = simulate(tmp_path, "predictive")
+    reports = f"curve-only: {curve}, predictive: {predictive}"
+
+    assert curve.time_above_target > 150.0, reports  # Curve alone settles above target
+    assert predictive.time_above_target < curve.time_above_target / 2, reports
+    assert predictive.peak_temp < curve.peak_temp - 1.0, reports
+    # More fan work, but no audible jumps
+    assert predictive.fan_variance < curve.fan_variance * 2, reports
+    assert curve.max_fan_step >= 15.0, reports
+    assert predictive.max_fan_step <= PredictiveConfig().max_slew + 2, reports
+
+
+# ==================== Controller Tests ====================
+
+def test_rise_and_load_step_spin_up_before_the_curve():
+    controller = PredictiveFanController()
+    controller.update(55.0, 30, now=0.0, load=15.0)
+
+    speeds = [controller.update(55.0 + 2.0 * t, 30 + 2 * t, now=float(t), load=100.0) for t in range(1, 6)]
+
+    assert all(speed > 30 + 2 * t for t, speed in zip(range(1, 6), speeds))
+    assert controller.state()["feedforward"] > 0
+
+
+def test_load_drop_spins_down_early():
+    controller = PredictiveFanController(PredictiveConfig(target_temp=90.0))
+    for t in range(60):
+        controller.update(70.0, 60, now=float(t), load=100.0)
+
+    speeds = [controller.update(70.0, 60, now=60.0 + t, load=10.0) for t in range(1, 6)]
+
+    assert speeds[-1] < 60
+
+
+def test_load_drop_above_target_stays_on_curve():
+    controller = PredictiveFanController(PredictiveConfig(target_temp=70.0))
+    for t in range(60):
+        controller.update(75.0, 60, now=float(t), load=100.0)
+
+    speeds = [controller.update(75.0, 60, now=60.0 + t, load=10.0) for t in range(1, 30)]
+
+    assert controller.state()["feedforward"] < 0
+    assert min(speeds) >= 60
+
+
+def test_integral_does_not_wind_up_at_full_speed():
+    controller = PredictiveFanController(PredictiveConfig(target_temp=60.0))
+    for t in range(300):
+        controller.update(80.0, 100, now=float(t))
+    assert controller.state()["integral"] == 0.0
+
+    controller.update(58.0, 40, now=300.0)
+    assert controller.state()["correction"] == 0.0
+
+
+@given(
+    temps=st.lists(st.floats(min_value=30, max_value=100), min_size=2, max_size=40),
+    bases=st.lists(st.integers(0, 100), min_size=40, max_size=40),
+    loads=st.lists(st.floats(min_value=0, max_value=100), min_size=40, max_size=40),
+)
+@settings(max_examples=100)
+def test_output_bounded_and_slew_limited(temps, bases, loads):
+    config = PredictiveConfig()
+    controller = PredictiveFanController(config)
+    previous = None
+
+    for t, (temp, base, load) in enumerate(zip(temps, bases, loads)):
+        speed = controller.update(temp, base, now=float(t), load=load)
+        state = controller.state()
+
+        assert 0 <= speed <= 100
+        assert 0.0 <= state["correction"] <= config.correction_limit
+        assert abs(state["feedforward"]) <= config.feedforward_limit
+        if previous is not None:
+            assert abs(speed - previous) <= config.max_slew + 1
+        previous = speed
+
+
+def test_cool_and_steady_follows_curve():
+    controller = PredictiveFanController()
+
+    speeds = [controller.update(60.0, 40, now=float(t), load=30.0) for t in range(20)]
+
+    assert speeds == [40] * 20
+
+
+def test_invalid_config_rejected():
+    with pytest.raises(ValueError):
+        PredictiveConfig(target_temp=120.0)
+    with pytest.raises(ValueError):
+        PredictiveConfig(max_slew=0.0)
+
+
+# ==================== Service Tests ====================
+
+def test_control_mode_persists(tmp_path):
+    config_path = str(tmp_path / "fan.json")
+    service = FanControlService(SimulatedHwmon(ThermalPlant(game_session)), config_path=config_path)
+
+    assert service.set_control_mode("predictive", PredictiveConfig(target_temp=72.0))
+    assert not service.set_control_mode("turbo")
+
+    reloaded = FanControlService(SimulatedHwmon(ThermalPlant(game_session)), config_path=config_path)
+    status = reloaded.get_current_status()
+    assert status["control_mode"] == "predictive"
+    assert status["predictive"]["target_temp"] == 72.0
+
+    assert reloaded.set_control_mode("curve")
+    assert reloaded.get_current_status()["predictive"] is None
+
+
+def test_safety_override_skips_slew_limit(tmp_path):
+    plant = ThermalPlant(lambda t: 100.0)
+    plant.fan = 0.0
+    plant.die = 96.0
+
+    async def sleep(duration: float) -> None:
+        plant.now += duration
+        await asyncio.sleep(0)
+
+    async def run() -> None:
+        service = FanControlService(SimulatedHwmon(plant), config_path=str(tmp_path / "fan.json"),
+                                    sleep=sleep, clock=lambda: plant.now)
+        service.set_control_mode("predictive")
+        service.predictive.update(40.0, 0, now=-1.0)  # Output starts at 0%
+        service.start_monitoring()
+        while plant.now < 1.0:
+            await asyncio.sleep(0)
+        service.stop_monitoring()
+
+    asyncio.run(run())
+
+    assert plant.fan == 100
+
+
+def test_dynamic_controller_reports_average_load():
+    controller = DynamicController("ryzenadj", "gymdeck3", event_emitter=None)
+    assert controller.current_load() is None
+
+    controller._running, controller._process = True, object()
+    controller._status = DynamicStatus(running=True, load=[10.0, 20.0, 30.0, 40.0])
+
+    assert controller.current_load() == 25.0
@@ -0,0 +1,210 @@
+"""Tests for the cursor-based kernel log reader.
+
+Feature: decktune, Test Runner Module
+Validates: Requirements 3.6
+
+The reader is pointed at regular files and FIFOs emitting /dev/kmsg
+records. Only records written after open() may be returned, regardless
+of how many records were in the log before, and errors are classified
+by the shared pattern table.
+"""
+
+import asyncio
+import os
+
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from backend.platform.kmsg import (
+    KmsgReader,
+    classify_kernel_error,
+    parse_kmsg_record,
+)
+from backend.tuning.runner import TestRunner
+from backend.tuning.vdroop import VdroopTester
+
+
+def _record(seq, message, priority=3):
+    return f"{priority},{seq},{seq * 1000},-;{message}\n"
+
+
+def _append(path, *records):
+    with open(path, "a") as f:
+        f.write("".join(records))
+
+
+# ==================== Parsing and Classification Tests ====================
+
+def test_parse_record_fields():
+    record = parse_kmsg_record("4,1234,5678901234,-;mce: [Hardware Error]: CPU 2")
+
+    assert record.seq == 1234
+    assert record.timestamp_us == 5678901234
+    assert record.level == 4
+    assert record.message == "mce: [Hardware Error]: CPU 2"
+    assert record.format() == "[ 5678.901234] mce: [Hardware Error]: CPU 2"
+
+
+def test_parse_record_rejects_malformed_lines():
+    assert parse_kmsg_record("no separator") is None
+    assert parse_kmsg_record("x,y,z,-;message") is None
+    assert parse_kmsg_record("6,1;message") is None
+
+
+@pytest.mark.parametrize("message, category", [
+    ("mce: [Hardware Error]: CPU 2: Machine Check: 0 Bank 5: bea0000000000108", "mce"),
+    ("mce: 3 Machine check events logged", "mce"),
+    ("Machine check exception on CPU 1", "machine_check"),
+    ("[Hardware Error]: Uncorrected, software restartable error.", "mce"),
+    ("uncorrected error in L2 cache", "hardware_error"),
+    ("game[4242]: segfault at 0 ip 000055d0 sp 00007ffc error 4 in game[55d0+1000]", "segfault"),
+    ("amdgpu 0000:04:00.0: amdgpu: ring gfx_0.0.0 timeout, signaled seq=1, emitted seq=3", "gpu_hang"),
+    ("amdgpu 0000:04:00.0: amdgpu: GPU reset begin!", "gpu_hang"),
+    ("watchdog: BUG: soft lockup - CPU#3 stuck for 22s! [stress-ng:1234]", "watchdog"),
+    ("rcu: INFO: rcu_preempt self-detected stall on CPU", "watchdog"),
+])
+def test_error_messages_are_classified(message, category):
+    assert classify_kernel_error(message) == category
+
+
+@pytest.mark.parametrize("message", [
+    "mce: CPU0: Thermal monitoring enabled (TM1)",
+    "NMI watchdog: Enabled. Permanently consumes one hw-PMU counter.",
+    "amdgpu 0000:04:00.0: amdgpu: SMU is initialized successfully!",
+    "usb 1-3: new full-speed USB device number 4 using xhci_hcd",
+])
+def test_informational_messages_are_not_errors(message):
+    assert classify_kernel_error(message) is None
+
+
+# ==================== Cursor Tests ====================
+
+def test_only_records_after_open_are_returned(tmp_path):
+    """Records already in the log are skipped, later ones are returned once."""
+    path = tmp_path / "kmsg"
+    _append(path, _record(1, "mce: [Hardware Error]: old"), _record(2, "boot done", 6))
+
+    reader = KmsgReader(str(path))
+    assert reader.open()
+    assert reader.read_records() == []
+
+    _append(path, _record(3, "usb 1-3: new device", 6),
+            _record(4, "mce: [Hardware Error]: CPU 1: Machine Check"))
+    records = reader.read_records()
+    assert [r.seq for r in records] == [3, 4]
+    assert reader.cursor == 4
+    assert [r.seq for r in KmsgReader(str(path)).read_errors()] == []
+
+    _append(path, _record(5, "game[1]: segfault at 0 ip 0 sp 0 error 4"))
+    errors = reader.read_errors()
+    assert [(r.seq, r.category) for r in errors] == [(5, "segfault")]
+    assert reader.read_records() == []
+    reader.close()
+
+
+@given(
+    old_count=st.integers(min_value=0, max_value=200),
+    new_count=st.integers(min_value=0, max_value=20),
+)
+@settings(max_examples=50)
+def test_cursor_independent_of_log_size(tmp_path_factory, old_count, new_count):
+    """Unlike line-count diffs, the cursor works for any amount of history."""
+    path = tmp_path_factory.mktemp("kmsg") / "kmsg"
+    _append(path, *(_record(i, "mce: [Hardware Error]: old") for i in range(old_count)))
+
+    reader = KmsgReader(str(path))
+    reader.open()
+    _append(path, *(
+        _record(old_count + i, "mce: [Hardware Error]: new") for i in range(new_count)
+    ))
+
+    errors = reader.read_errors()
+    assert len(errors) == new_count
+    assert all(r.message.endswith("new") for r in errors)
+    reader.close()
+
+
+def test_continuation_lines_and_partial_records(tmp_path):
+    """Property lines are skipped and a half-written record waits for its end."""
+    path = tmp_path / "kmsg"
+    path.touch()
+    reader = KmsgReader(str(path))
+    reader.open()
+
+    _append(path, _record(7, "machine check on CPU 0"), " SUBSYSTEM=cpu\n", "3,8,8000,-;segf")
+    assert [r.seq for r in reader.read_records()] == [7]
+
+    _append(path, "ault at 0 ip 0 sp 0 error 4\n")
+    records = reader.read_records()
+    assert [(r.seq, r.category) for r in records] == [(8, "segfault")]
+    reader.close()
+
+
+def test_fifo_records(tmp_path):
+    """A FIFO feeding kmsg records can stand in for /dev/kmsg."""
+    fifo = tmp_path / "kmsg.fifo"
+    os.mkfifo(fifo)
+    reader = KmsgReader(str(fifo))
+    assert reader.open()
+
+    writer = os.open(fifo, os.O_WRONLY)
+    try:
+        assert reader.read_records() == []
+        os.write(writer, _record(10, "watchdog: BUG: soft lockup - CPU#0 stuck for 23s!").encode())
+        errors = reader.read_errors()
+        assert [(r.seq, r.category) for r in errors] == [(10, "watchdog")]
+    finally:
+        os.close(writer)
+        reader.close()
+
+
+def test_unavailable_log_is_reported(tmp_path):
+    reader = KmsgReader(str(tmp_path / "missing"))
+
+    assert reader.open() is False
+    assert reader.is_open() is False
+    assert reader.read_records() == []
+
+
+# ==================== Consumer Tests ====================
+
+@pytest.mark.asyncio
+async def test_runner_error_checks_use_cursor(tmp_path):
+    """check_dmesg_errors and monitor_dmesg_realtime only report new errors."""
+    path = tmp_path / "kmsg"
+    _append(path, _record(1, "mce: [Hardware Error]: old"))
+    runner = TestRunner(kmsg_path=str(path))
+
+    assert await runner.check_dmesg_errors() == []
+    _append(path, _record(2, "amdgpu 0000:04:00.0: amdgpu: GPU reset begin!"))
+    assert await runner.check_dmesg_errors() == ["[    0.002000] amdgpu 0000:04:00.0: amdgpu: GPU reset begin!"]
+    assert await runner.check_dmesg_errors() == []
+
+    async def error_during_test():
+        await asyncio.sleep(0.05)
+        _append(path, _record(3, "mce: [Hardware Error]: CPU 3: Machine Check"))
+
+    task = asyncio.ensure_future(error_during_test())
+    errors = await runner.monitor_dmesg_realtime(0.2)
+    await task
+    assert len(errors) == 1
+    assert "CPU 3" in errors[0]
+
+
+@pytest.mark.asyncio
+async def test_vdroop_mce_check_uses_shared_patterns(tmp_path):
+    """Only MCE-class records logged during the Vdroop test fail it."""
+    path = tmp_path / "kmsg"
+    _append(path, _record(1, "mce: [Hardware Error]: before the test"))
+    tester = VdroopTester(kmsg_path=str(path))
+
+    tester._kernel_log = KmsgReader(str(path))
+    tester._kernel_log.open()
+    assert await tester._check_mce_errors() is False
+
+    _append(path, _record(2, "game[1]: segfault at 0 ip 0 sp 0 error 4"))
+    assert await tester._check_mce_errors() is False
+
+    _append(path, _record(3, "mce: [Hardware Error]: CPU 0: Machine Check: 0 Bank 5"))
+    assert await tester._check_mce_errors() is True
+    tester._kernel_log.close()
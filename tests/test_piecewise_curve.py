@@ -0,0 +1,244 @@
+"""Property tests for the compiled piecewise-linear curve engine.
+
+Feature: fan-control-curves, frequency-based-wizard, manual-dynamic-mode
+Validates: Requirements 2.4, 2.5, 9.3
+
+The fan, frequency and dynamic load curves now evaluate through
+PiecewiseLinearCurve. The reference functions below are the previous
+implementations (and a port of gymdeck3's FanCurve::calculate_speed);
+the compiled curve must reproduce each of them exactly.
+"""
+
+import bisect
+from typing import List, Tuple
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.core.curve import PiecewiseLinearCurve, compile_curve
+from backend.core.fan_control import FanPoint, calculate_fan_speed, compile_fan_points
+from backend.dynamic.config import DynamicConfig, FanConfig, FanCurvePoint
+from backend.dynamic.controller import DynamicController
+from backend.dynamic.manual_manager import DynamicManager
+from backend.tuning.frequency_curve import FrequencyCurve, FrequencyPoint
+
+
+# ==================== Reference Implementations ====================
+
+def reference_fan_speed(current_temp: float, curve_points: List[FanPoint]) -> int:
+    sorted_points = sorted(curve_points, key=lambda p: p.temp)
+    temps = [p.temp for p in sorted_points]
+    if current_temp <= temps[0]:
+        return sorted_points[0].speed
+    if current_temp >= temps[-1]:
+        return sorted_points[-1].speed
+    idx = bisect.bisect_right(temps, current_temp)
+    if idx > 0 and abs(temps[idx - 1] - current_temp) < 1e-9:
+        return sorted_points[idx - 1].speed
+    p1, p2 = sorted_points[idx - 1], sorted_points[idx]
+    ratio = (current_temp - p1.temp) / (p2.temp - p1.temp)
+    return int(round(p1.speed + (p2.speed - p1.speed) * ratio))
+
+
+def reference_frequency_voltage(points: List[Tuple[int, int]], freq_mhz: int) -> int:
+    if len(points) == 1:
+        return points[0][1]
+    if freq_mhz <= points[0][0]:
+        return points[0][1]
+    if freq_mhz >= points[-1][0]:
+        return points[-1][1]
+    for (f1, v1), (f2, v2) in zip(points, points[1:]):
+        if f1 <= freq_mhz <= f2:
+            return v1 + ((v2 - v1) * (freq_mhz - f1)) // (f2 - f1)
+    raise AssertionError("unreachable")
+
+
+def reference_load_voltage(load: float, min_mv: int, max_mv: int, threshold: float) -> int:
+    if load <= threshold:
+        return min_mv
+    if threshold >= 100:
+        return max_mv
+    progress = (load - threshold) / (100 - threshold)
+    return int(round(min_mv + (max_mv - min_mv) * progress))
+
+
+def reference_gymdeck3_speed(temp_c: int, points: List[Tuple[int, int]]) -> int:
+    """Port of gymdeck3 FanCurve::calculate_speed (i32 division truncates)."""
+    if temp_c <= points[0][0]:
+        return points[0][1]
+    if temp_c >= points[-1][0]:
+        return points[-1][1]
+    for (t1, s1), (t2, s2) in zip(points, points[1:]):
+        if t1 <= temp_c <= t2:
+            numerator = (s2 - s1) * (temp_c - t1)
+            return s1 + int(numerator / (t2 - t1))
+    raise AssertionError("unreachable")
+
+
+# ==================== Strategies ====================
+
+fan_points = st.lists(
+    st.builds(FanPoint, temp=st.integers(0, 120), speed=st.integers(0, 100)),
+    min_size=3, max_size=10
+)
+temperatures = st.one_of(
+    st.integers(-10, 130),
+    st.floats(min_value=-10, max_value=130, allow_nan=False),
+    st.integers(-10, 130).map(lambda t: t + 0.5),
+)
+
+
+@st.composite
+def unique_points(draw, x_min, x_max, y_min, y_max, min_size=1, max_size=10):
+    xs = sorted(draw(st.sets(st.integers(x_min, x_max), min_size=min_size, max_size=max_size)))
+    return [(x, draw(st.integers(y_min, y_max))) for x in xs]
+
+
+# ==================== Parity Properties ====================
+
+@given(points=fan_points, temp=temperatures)
+@settings(max_examples=500)
+def test_fan_speed_matches_previous_implementation(points, temp):
+    assert calculate_fan_speed(temp, points) == reference_fan_speed(temp, points)
+
+
+@given(points=unique_points(400, 3500, -100, 0), freq=st.integers(0, 4000))
+@settings(max_examples=300)
+def test_frequency_voltage_matches_previous_implementation(points, freq):
+    curve = FrequencyCurve(
+        core_id=0,
+        points=[FrequencyPoint(f, v, True, 30, 0.0) for f, v in points],
+        created_at=0.0
+    )
+
+    assert curve.get_voltage_for_frequency(freq) == reference_frequency_voltage(points, freq)
+
+
+@given(
+    min_mv=st.integers(-100, 0),
+    max_mv=st.integers(-100, 0),
+    threshold=st.one_of(st.integers(0, 100), st.floats(min_value=0, max_value=100, allow_nan=False)),
+    load=st.floats(min_value=0, max_value=100, allow_nan=False),
+)
+@settings(max_examples=300)
+def test_load_voltage_matches_previous_implementation(min_mv, max_mv, threshold, load):
+    manager = DynamicManager()
+
+    assert manager._calculate_voltage(load, min_mv, max_mv, threshold) == \
+        reference_load_voltage(load, min_mv, max_mv, threshold)
+
+
+@given(
+    min_mv=st.integers(-100, 0),
+    max_mv=st.integers(-100, 0),
+    threshold=st.integers(0, 100),
+)
+@settings(max_examples=100)
+def test_curve_data_matches_previous_implementation(min_mv, max_mv, threshold):
+    manager = DynamicManager()
+    core = manager.config.cores[1]
+    core.min_mv, core.max_mv, core.threshold = min_mv, max_mv, threshold
+
+    data = manager.get_curve_data(1)
+
+    assert [p.load for p in data] == [float(load) for load in range(101)]
+    assert [p.voltage for p in data] == [
+        reference_load_voltage(load, min_mv, max_mv, threshold) for load in range(101)
+    ]
+
+
+@given(points=unique_points(0, 120, 0, 100, min_size=2), temp=st.integers(-10, 130))
+@settings(max_examples=300)
+def test_trunc_matches_gymdeck3(points, temp):
+    curve = PiecewiseLinearCurve(points)
+
+    assert curve.evaluate_int(temp, "trunc") == reference_gymdeck3_speed(temp, points)
+
+
+# ==================== Engine Properties ====================
+
+@given(points=unique_points(0, 120, 0, 100, min_size=2))
+@settings(max_examples=100)
+def test_lut_and_compact_form_round_trip(points):
+    curve = PiecewiseLinearCurve(reversed(points))
+
+    assert curve.points() == points
+    assert PiecewiseLinearCurve.from_compact(curve.to_compact()) == curve
+    assert curve.lut(0, 100) == tuple(curve.evaluate_int(t) for t in range(101))
+    assert curve.lut(0, 100, 0.5, rounding=None)[1::2] == tuple(curve(t + 0.5) for t in range(100))
+
+
+@given(points=unique_points(-50, 50, -100, 100, min_size=2), x=st.floats(min_value=-60, max_value=60))
+@settings(max_examples=200)
+def test_value_stays_within_segment_bounds(points, x):
+    curve = PiecewiseLinearCurve(points)
+    y = curve(x)
+
+    assert min(curve.ys) <= y <= max(curve.ys)
+    for (x1, y1), (x2, y2), slope in zip(points, points[1:], curve.slopes):
+        assert slope == pytest.approx((y2 - y1) / (x2 - x1))
+        if x1 <= x <= x2:
+            assert min(y1, y2) - 1e-9 <= y <= max(y1, y2) + 1e-9
+
+
+def test_vertical_step_takes_later_point():
+    curve = PiecewiseLinearCurve([(40, 0), (60, 20), (60, 80), (80, 100)])
+
+    assert curve(59.999) == pytest.approx(20, abs=0.01)
+    assert curve(60) == 80
+    assert curve.slopes[1] == 0.0
+
+
+def test_invalid_curves_rejected():
+    with pytest.raises(ValueError):
+        PiecewiseLinearCurve([])
+    with pytest.raises(ValueError):
+        PiecewiseLinearCurve([(0, 0), (float("nan"), 1)])
+    with pytest.raises(ValueError):
+        PiecewiseLinearCurve.from_compact("40:20,60")
+    with pytest.raises(ValueError):
+        PiecewiseLinearCurve([(0, 0), (10, 10)]).evaluate_int(5, "ceil")
+
+
+def test_curves_compile_once():
+    points = [FanPoint(70, 50), FanPoint(40, 0), FanPoint(90, 100)]
+    compile_fan_points.cache_clear()
+
+    for temp in range(30, 100):
+        calculate_fan_speed(temp, points)
+
+    info = compile_fan_points.cache_info()
+    assert info.misses == 1 and info.hits == 69
+    assert compile_curve([(0, 1), (2, 3)]) is compile_curve([(0, 1), (2, 3)])
+
+
+def test_frequency_curve_recompiles_only_when_points_are_assigned():
+    curve = FrequencyCurve(
+        core_id=0,
+        points=[FrequencyPoint(400, -30, True, 30, 0.0), FrequencyPoint(800, -10, True, 30, 0.0)],
+        created_at=0.0
+    )
+
+    assert curve.get_voltage_for_frequency(600) == -20
+    compiled = curve._compiled
+    assert curve.get_voltage_for_frequency(700) == -15
+    assert curve._compiled is compiled
+
+    curve.points = [FrequencyPoint(400, -40, True, 30, 0.0), FrequencyPoint(800, -20, True, 30, 0.0)]
+    assert curve.get_voltage_for_frequency(600) == -30
+
+    curve.points = []
+    with pytest.raises(ValueError):
+        curve.get_voltage_for_frequency(600)
+
+
+def test_gymdeck3_receives_sorted_compact_points():
+    controller = DynamicController("ryzenadj", "gymdeck3", event_emitter=None)
+    fan = FanConfig(enabled=True, mode="custom",
+                    curve=[FanCurvePoint(80, 100), FanCurvePoint(40, 20), FanCurvePoint(60, 50)])
+
+    args = controller._build_args(DynamicConfig(fan_config=fan))
+
+    assert [a for a in args if a.startswith("--fan-curve=")] == [
+        "--fan-curve=40:20", "--fan-curve=60:50", "--fan-curve=80:100"
+    ]
@@ -0,0 +1,284 @@
+"""Tests for power telemetry and energy integration.
+
+Feature: decktune-3.1-reliability-ux
+Validates: Requirements 2.1, 8.3
+
+Power is read through a SensorHub from a fake power_supply/hwmon tree on
+a simulated clock. Energy must match the trapezoidal integral of the
+readings, bridge missed samples, leave long gaps out, and be attributed
+to the profile and game active at the start of each interval. Samples
+recorded by the dynamic controller carry the measured power, and
+sessions report Wh per hour and an estimated battery life.
+"""
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.core.blackbox import BlackBox, MetricSample
+from backend.core.power import (
+    SENSOR_SUBSCRIBER,
+    SOURCE_APU,
+    SOURCE_BATTERY,
+    EnergyIntegrator,
+    PowerMonitor,
+    integrate_energy,
+)
+from backend.core.session_manager import SessionManager, SessionMetrics, TelemetrySampleData
+from backend.dynamic.controller import DynamicController
+from backend.platform.sensors import (
+    APU_POWER,
+    BATTERY_FULL,
+    BATTERY_POWER,
+    SensorHub,
+    SensorPaths,
+)
+from tests.test_sensor_hub import SimClock
+
+
+class FakePowerSysfs:
+    """power_supply tree with a battery and an adapter, plus amdgpu hwmon."""
+
+    def __init__(self, tmp_path, power_now: bool = True):
+        self.root = tmp_path / "sys"
+        self.battery = self.root / "class" / "power_supply" / "BAT1"
+        self._write(self.battery / "type", "Battery")
+        self._write(self.battery / "capacity", "80")
+        self._write(self.battery / "voltage_now", "8000000")  # 8 V
+        if power_now:
+            self._write(self.battery / "power_now", "0")
+            self._write(self.battery / "energy_full", "40000000")  # 40 Wh
+        else:
+            self._write(self.battery / "current_now", "0")
+            self._write(self.battery / "charge_full", "5000000")  # 5 Ah
+        adapter = self.root / "class" / "power_supply" / "ADP1"
+        self._write(adapter / "type", "Mains")
+        self._write(adapter / "online", "0")
+        hwmon = self.root / "class" / "hwmon"
+        self._write(hwmon / "hwmon0" / "name", "nvme")
+        self._write(hwmon / "hwmon0" / "power1_input", "3000000")
+        self._write(hwmon / "hwmon3" / "name", "amdgpu")
+        self._write(hwmon / "hwmon3" / "power1_label", "slowPPT")
+        self.set_discharge(0.0)
+        self.set_apu(0.0)
+
+    @staticmethod
+    def _write(path, value) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{value}\n")
+
+    def set_discharge(self, watts: float) -> None:
+        """Battery draw while unplugged (status Discharging)."""
+        self._write(self.battery / "status", "Discharging")
+        if (self.battery / "power_now").exists():
+            self._write(self.battery / "power_now", int(watts * 1e6))
+        else:
+            self._write(self.battery / "current_now", int(watts / 8.0 * 1e6))
+
+    def plug_in(self, charge_watts: float = 30.0) -> None:
+        self._write(self.battery / "status", "Charging")
+        self._write(self.battery / "power_now", int(charge_watts * 1e6))
+        self._write(self.root / "class" / "power_supply" / "ADP1" / "online", "1")
+
+    def set_apu(self, watts: float) -> None:
+        self._write(self.root / "class" / "hwmon" / "hwmon3" / "power1_average", int(watts * 1e6))
+
+
+def _monitor(tmp_path, **kwargs):
+    fake = FakePowerSysfs(tmp_path, **kwargs)
+    sim = SimClock()
+    hub = SensorHub.discover(str(fake.root), sleep=sim.sleep, clock=sim.clock)
+    return fake, sim, hub, PowerMonitor(hub)
+
+
+# ==================== Discovery Tests ====================
+
+def test_discovery_and_unit_conversion(tmp_path):
+    fake, sim, hub, monitor = _monitor(tmp_path)
+    paths = hub.paths
+
+    assert paths.battery_power.endswith("BAT1/power_now")
+    assert paths.apu_power.endswith("hwmon3/power1_average")  # PPT label beats nvme
+    fake.set_discharge(12.5)
+    fake.set_apu(9.0)
+    snapshot = hub.latest((BATTERY_POWER, APU_POWER, BATTERY_FULL))
+    assert (snapshot.battery_power_w, snapshot.apu_power_w) == (12.5, 9.0)
+    assert snapshot.battery_full_wh == 40.0
+
+    # current_now × voltage_now and charge_full × voltage_now
+    legacy = FakePowerSysfs(tmp_path / "legacy", power_now=False)
+    legacy.set_discharge(12.0)
+    hub = SensorHub.discover(str(legacy.root))
+    snapshot = hub.latest((BATTERY_POWER, BATTERY_FULL))
+    assert snapshot.battery_power_w == pytest.approx(12.0)
+    assert snapshot.battery_full_wh == 40.0
+    assert SensorPaths.discover(str(tmp_path / "missing")).battery_power is None
+
+
+# ==================== Integration Tests ====================
+
+@given(
+    steps=st.lists(st.floats(min_value=0.1, max_value=10.0), min_size=1, max_size=50),
+    watts=st.floats(min_value=0.5, max_value=40.0),
+    slope=st.floats(min_value=-0.05, max_value=0.05),
+)
+@settings(max_examples=200)
+def test_trapezoid_exact_for_linear_power_across_gaps(steps, watts, slope):
+    """Uneven sample spacing does not change the energy of a linear ramp."""
+    times = [0.0]
+    for step in steps:
+        times.append(times[-1] + step)
+
+    account = integrate_energy((t, watts + slope * t) for t in times)
+
+    end = times[-1]
+    exact_wh = (watts * end + slope * end * end / 2.0) / 3600.0
+    assert account.energy_wh == pytest.approx(exact_wh, rel=1e-9, abs=1e-12)
+    assert account.seconds == pytest.approx(end)
+
+
+def test_long_gaps_are_not_integrated():
+    integrator = EnergyIntegrator(max_gap=60.0)
+    for t in range(0, 61, 5):
+        integrator.add(float(t), 10.0, ("Battery Saver", "1245620"))
+    integrator.add(3660.0, 10.0)  # Hour-long gap
+    integrator.add(3661.0, None)  # Source lost
+    integrator.add(3700.0, 10.0)
+
+    assert integrator.total.energy_wh == pytest.approx(10.0 * 60 / 3600)
+    assert integrator.total.wh_per_hour == pytest.approx(10.0)
+    assert integrator.unaccounted_sec == 3600.0
+    assert set(integrator.profiles) == {"Battery Saver"} and set(integrator.games) == {"1245620"}
+
+
+@pytest.mark.asyncio
+async def test_monitor_attributes_energy_and_switches_source(tmp_path):
+    fake, sim, hub, monitor = _monitor(tmp_path)
+    attribution = ["Elden Ring", "1245620"]
+    monitor.set_attribution_source(lambda: tuple(attribution))
+    fake.set_discharge(15.0)
+    fake.set_apu(8.0)
+
+    monitor.start()
+    hub.start()
+    await sim.run_until(600.0)  # 10 min of Elden Ring
+    attribution[:] = ["Global Default", None]
+    fake.set_discharge(6.0)
+    await sim.run_until(1200.0)  # 10 min in the Steam UI
+    fake.plug_in()
+    await sim.run_until(1800.0)  # 10 min on AC
+    monitor.stop()
+    hub.stop()
+
+    assert hub.channel_intervals() == {}
+    battery = monitor.get_status()[SOURCE_BATTERY]
+    assert battery["profiles"]["Elden Ring"]["wh_per_hour"] == pytest.approx(15.0, rel=0.01)
+    assert battery["games"]["1245620"]["energy_wh"] == pytest.approx(2.5, rel=0.01)
+    assert battery["profiles"]["Global Default"]["energy_wh"] == pytest.approx(1.0, rel=0.02)
+    assert battery["profiles"]["Elden Ring"]["estimated_battery_life_h"] == pytest.approx(40.0 / 15.0, rel=0.01)
+    assert battery["total"]["hours"] == pytest.approx(1200.0 / 3600, abs=0.001)  # Not while charging
+    assert monitor.apu.total.seconds == pytest.approx(1800.0, abs=1.5)  # APU power on AC too
+    reading = monitor.latest()
+    assert (reading.source, reading.power_w) == (SOURCE_APU, 8.0)
+
+
+def test_latest_samples_when_stale(tmp_path):
+    fake, sim, hub, monitor = _monitor(tmp_path)
+    fake.set_discharge(10.0)
+    assert monitor.latest(max_age=1.0).source == SOURCE_BATTERY
+
+    fake.set_discharge(20.0)
+    sim.now = 0.5
+    assert monitor.latest(max_age=1.0).power_w == 10.0  # Within tolerance
+    sim.now = 4.0
+    assert monitor.latest(max_age=1.0).power_w == 20.0  # Missed samples bridged
+    assert monitor.battery.total.energy_wh == pytest.approx(15.0 * 4.0 / 3600)
+    assert SENSOR_SUBSCRIBER not in hub.get_status()["subscribers"]
+
+
+# ==================== Consumer Tests ====================
+
+class MemorySettings:
+    def __init__(self):
+        self.values = {}
+
+    def get_setting(self, key):
+        return self.values.get(key)
+
+    def save_setting(self, key, value):
+        self.values[key] = value
+
+
+@pytest.mark.asyncio
+async def test_controller_samples_carry_measured_power(tmp_path):
+    fake, sim, hub, monitor = _monitor(tmp_path)
+    fake.set_discharge(14.0)
+    blackbox = BlackBox(storage_path=str(tmp_path / "blackbox"))
+    sessions = SessionManager(MemorySettings(), data_dir=tmp_path)
+    controller = DynamicController("ryzenadj", "gymdeck3", event_emitter=None,
+                                   blackbox=blackbox, session_manager=sessions)
+    controller.set_power_monitor(monitor)
+    controller._current_session_id = sessions.start_session().id
+
+    controller._record_blackbox_sample()
+    await controller._record_telemetry_sample()
+
+    assert blackbox.get_samples()[0].power_w == 14.0
+    sample = sessions.get_active_session().samples[0]
+    assert (sample.power_w, sample.source) == (14.0, SOURCE_BATTERY)
+    assert MetricSample.from_dict({**blackbox.get_samples()[0].to_dict(), "power_w": 1.0}).power_w == 1.0
+
+
+def test_session_reports_energy_and_battery_life(tmp_path):
+    sessions = SessionManager(MemorySettings(), data_dir=tmp_path)
+    sessions.set_battery_capacity(50.0)
+    session = sessions.start_session(game_name="Hades", app_id=1145360)
+    base = 1700000000.0
+    powers = [10.0, 14.0, 12.0, 10.0]
+    for i, power in enumerate(powers):
+        sessions.add_sample(60.0, power, timestamp=base + 30.0 * i, source=SOURCE_BATTERY)
+    sessions.add_sample(60.0, 10.0, timestamp=base + 90.0 + 3600.0, source=SOURCE_BATTERY)  # After a 1 h gap
+
+    metrics = sessions.end_session(session.id)
+
+    assert metrics.energy_wh == pytest.approx((12.0 + 13.0 + 11.0) * 30 / 3600)
+    assert metrics.wh_per_hour == pytest.approx(12.0)
+    assert metrics.estimated_battery_life_h == pytest.approx(50.0 / 12.0)
+    other = sessions.start_session()
+    sessions.add_sample(60.0, 6.0, timestamp=base, source=SOURCE_BATTERY)
+    sessions.add_sample(60.0, 6.0, timestamp=base + 60.0, source=SOURCE_BATTERY)
+    sessions.end_session(other.id)
+    assert sessions.compare_sessions(session.id, other.id)["diff"]["wh_per_hour"] == pytest.approx(6.0)
+
+    # Sessions saved before energy metrics load without them
+    old = {k: v for k, v in metrics.to_dict().items()
+           if k not in ("energy_wh", "wh_per_hour", "estimated_battery_life_h")}
+    restored = SessionMetrics.from_dict(old)
+    assert (restored.energy_wh, restored.wh_per_hour, restored.estimated_battery_life_h) == (None, None, None)
+    restored_sample = TelemetrySampleData.from_dict(session.samples[0].to_dict())
+    assert (restored_sample.power_w, restored_sample.source) == (10.0, SOURCE_BATTERY)
+
+
+def test_session_energy_uses_battery_samples_only(tmp_path):
+    """APU power on AC and missing readings never enter battery estimates."""
+    sessions = SessionManager(MemorySettings(), data_dir=tmp_path)
+    sessions.set_battery_capacity(50.0)
+    base = 1700000000.0
+
+    on_ac = sessions.start_session()
+    for i in range(4):
+        sessions.add_sample(60.0, 8.0, timestamp=base + 30.0 * i, source=SOURCE_APU)
+    sessions.add_sample(60.0, None, timestamp=base + 120.0)
+    metrics = sessions.end_session(on_ac.id)
+    assert (metrics.energy_wh, metrics.wh_per_hour, metrics.estimated_battery_life_h) == (None, None, None)
+    assert metrics.avg_power_w == pytest.approx(8.0)  # Not dragged down by a 0 W sample
+
+    unplugged = sessions.start_session()
+    sessions.add_sample(60.0, 12.0, timestamp=base, source=SOURCE_BATTERY)
+    sessions.add_sample(60.0, 12.0, timestamp=base + 30.0, source=SOURCE_BATTERY)
+    sessions.add_sample(60.0, 5.0, timestamp=base + 60.0, source=SOURCE_APU)  # Plugged in
+    sessions.add_sample(60.0, None, timestamp=base + 90.0)
+    metrics = sessions.end_session(unplugged.id)
+    assert metrics.wh_per_hour == pytest.approx(12.0)
+    assert metrics.energy_wh == pytest.approx(12.0 * 30 / 3600)
+    assert metrics.estimated_battery_life_h == pytest.approx(50.0 / 12.0)
+    assert "wh_per_hour" not in sessions.compare_sessions(on_ac.id, unplugged.id)["diff"]
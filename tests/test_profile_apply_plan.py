@@ -0,0 +1,285 @@
+"""Tests for precompiled apply plans and minimal profile switches.
+
+Feature: decktune-3.0-automation
+Validates: Requirements 4.2, 4.4, 8.2
+
+Switching between profiles must only perform the steps whose compiled
+plan components differ: no ryzenadj call for identical cores, no gymdeck3
+restart when only fan settings differ.
+"""
+
+import pytest
+from hypothesis import given, strategies as st, settings
+from unittest.mock import Mock, AsyncMock
+
+from backend.core.fan_control import FanControlService, PRESET_STOCK
+from backend.dynamic.apply_plan import ApplyPlan
+from backend.dynamic.controller import DynamicController
+from backend.dynamic.profile_manager import ProfileManager
+
+
+DYNAMIC_CONFIG = {"strategy": "balanced", "simple_mode": True, "simple_value": -20}
+
+
+def _fan_config(curve):
+    return {
+        "enabled": True,
+        "mode": "custom",
+        "curve": [{"temp_c": t, "speed_percent": s} for t, s in curve],
+        "zero_rpm_enabled": False,
+        "hysteresis_temp": 2,
+    }
+
+
+QUIET_FAN = _fan_config([(40, 0), (60, 30), (80, 70), (90, 100)])
+LOUD_FAN = _fan_config([(40, 30), (60, 60), (80, 90), (90, 100)])
+
+
+class MockSettingsManager:
+    """Mock settings manager for testing."""
+
+    def __init__(self):
+        self._settings = {}
+
+    def get_setting(self, key, default=None):
+        return self._settings.get(key, default)
+
+    def save_setting(self, key, value):
+        self._settings[key] = value
+
+
+def _create_manager(fan_service=None):
+    ryzenadj = Mock()
+    ryzenadj.apply_values_async = AsyncMock(return_value=(True, None))
+
+    controller = Mock(spec=DynamicController)
+    running = {"value": False}
+
+    async def start(config):
+        running["value"] = True
+        return True
+
+    async def stop():
+        running["value"] = False
+        return True
+
+    controller.start = AsyncMock(side_effect=start)
+    controller.stop = AsyncMock(side_effect=stop)
+    controller.is_running = Mock(side_effect=lambda: running["value"])
+
+    emitter = Mock()
+    emitter.emit_profile_changed = Mock()
+
+    manager = ProfileManager(MockSettingsManager(), ryzenadj, controller, emitter)
+    if fan_service is not None:
+        manager.set_fan_control_service(fan_service)
+    return manager, ryzenadj, controller
+
+
+# ==================== Plan Compilation Tests ====================
+
+cores_strategy = st.lists(st.integers(min_value=-50, max_value=0), min_size=4, max_size=4)
+
+
+class TestApplyPlanCompilation:
+    """Plans are immutable and compare by content."""
+
+    @given(cores=cores_strategy, dynamic_enabled=st.booleans(), strategy=st.sampled_from(["conservative", "balanced", "aggressive"]))
+    @settings(max_examples=100)
+    def test_identical_settings_produce_empty_diff(self, cores, dynamic_enabled, strategy):
+        """Two compilations of the same settings need no steps."""
+        config = {"strategy": strategy, "simple_mode": True, "simple_value": -20, "fan_config": QUIET_FAN}
+        a = ApplyPlan.compile("A", 1, cores, dynamic_enabled, config)
+        b = ApplyPlan.compile("B", 2, list(cores), dynamic_enabled, dict(config))
+
+        assert b.diff(a).is_empty()
+
+    def test_fan_is_separate_from_dynamic_hash(self):
+        """Fan settings do not change the gymdeck3 configuration hash."""
+        quiet = ApplyPlan.compile("Q", 1, [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": QUIET_FAN})
+        loud = ApplyPlan.compile("L", 1, [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": LOUD_FAN})
+
+        diff = loud.diff(quiet)
+        assert diff.steps() == ["fan"]
+        assert loud.get_dynamic_config(include_fan=False).fan_config.enabled is False
+        assert loud.get_dynamic_config().fan_config.curve[0].speed_percent == 30
+
+    def test_plan_is_isolated_from_profile_mutation(self):
+        """Mutating the source dict after compiling does not change the plan."""
+        config = dict(DYNAMIC_CONFIG)
+        cores = [-10, -10, -10, -10]
+        plan = ApplyPlan.compile("P", 1, cores, True, config)
+
+        config["strategy"] = "aggressive"
+        cores[0] = -40
+
+        assert plan.cores == (-10, -10, -10, -10)
+        assert plan.get_dynamic_config().strategy == "balanced"
+        with pytest.raises(Exception):
+            plan.cores = (0, 0, 0, 0)
+
+    def test_unknown_active_plan_needs_everything(self):
+        """Without an active plan every step runs."""
+        plan = ApplyPlan.compile("P", 1, [0] * 4)
+        assert plan.diff(None).steps() == ["cores", "dynamic", "fan"]
+
+
+# ==================== Minimal Switch Tests ====================
+
+class TestMinimalProfileSwitch:
+    """ProfileManager performs only the differing steps."""
+
+    @pytest.mark.asyncio
+    async def test_fan_only_difference_does_not_restart_gymdeck3(self):
+        """Profiles differing only in fan curve keep gymdeck3 running."""
+        fan_service = Mock(spec=FanControlService)
+        fan_service.active_curve = PRESET_STOCK
+        manager, ryzenadj, controller = _create_manager(fan_service)
+
+        await manager.create_profile(1, "Quiet", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": QUIET_FAN})
+        await manager.create_profile(2, "Loud", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": LOUD_FAN})
+
+        assert await manager.apply_profile(1)
+        assert controller.start.call_count == 1
+        assert fan_service.active_curve.points[0].speed == 0
+
+        assert await manager.apply_profile(2)
+
+        assert controller.start.call_count == 1
+        controller.stop.assert_not_called()
+        assert ryzenadj.apply_values_async.call_count == 1
+        assert fan_service.active_curve.points[0].speed == 30
+
+    @pytest.mark.asyncio
+    async def test_fan_difference_restarts_without_fan_service(self):
+        """Without a fan service gymdeck3 owns the fan and must restart."""
+        manager, _, controller = _create_manager()
+
+        await manager.create_profile(1, "Quiet", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": QUIET_FAN})
+        await manager.create_profile(2, "Loud", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": LOUD_FAN})
+
+        await manager.apply_profile(1)
+        await manager.apply_profile(2)
+
+        assert controller.start.call_count == 2
+        assert controller.start.call_args[0][0].fan_config.curve[0].speed_percent == 30
+
+    @pytest.mark.asyncio
+    async def test_fan_modes_map_onto_fan_service(self):
+        """Fixed speed, zero RPM and hysteresis reach the service; default keeps its curve."""
+        fan_service = Mock(spec=FanControlService)
+        fan_service.active_curve = PRESET_STOCK
+        manager, _, controller = _create_manager(fan_service)
+        fixed = {**_fan_config([(0, 45)]), "mode": "fixed", "zero_rpm_enabled": True, "hysteresis_temp": 4}
+        default = {**QUIET_FAN, "mode": "default"}
+
+        await manager.create_profile(1, "Fixed", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": fixed})
+        await manager.create_profile(2, "Default", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": default})
+
+        assert await manager.apply_profile(1)
+        assert {p.speed for p in fan_service.active_curve.points} == {45}
+        fan_service.set_fan_behavior.assert_called_with(True, 4)
+        assert controller.start.call_args[0][0].fan_config.enabled is False
+
+        assert await manager.apply_profile(2)
+        assert fan_service.active_curve is PRESET_STOCK
+        fan_service.set_fan_behavior.assert_called_with()
+        assert controller.start.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_two_point_curve_is_applied_exactly(self):
+        """A two-point curve gets a flat third point for the service."""
+        fan_service = Mock(spec=FanControlService)
+        fan_service.active_curve = PRESET_STOCK
+        manager, _, _ = _create_manager(fan_service)
+        await manager.create_profile(
+            1, "Two", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": _fan_config([(50, 20), (80, 90)])}
+        )
+
+        assert await manager.apply_profile(1)
+
+        points = fan_service.active_curve.points
+        assert [(p.temp, p.speed) for p in points] == [(50, 20), (80, 90), (81, 90)]
+
+    @pytest.mark.asyncio
+    async def test_unrepresentable_fan_curve_stays_on_gymdeck3(self):
+        """A curve the service cannot hold is passed to gymdeck3 instead."""
+        fan_service = Mock(spec=FanControlService)
+        fan_service.active_curve = PRESET_STOCK
+        manager, _, controller = _create_manager(fan_service)
+        dense = _fan_config([(30 + 5 * i, 10 * i) for i in range(11)])  # Service curves hold 10 points
+
+        await manager.create_profile(1, "Dense", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": dense})
+        await manager.create_profile(2, "Quiet", [-20] * 4, True, {**DYNAMIC_CONFIG, "fan_config": QUIET_FAN})
+
+        assert await manager.apply_profile(1)
+        fan_config = controller.start.call_args[0][0].fan_config
+        assert fan_config.enabled is True and len(fan_config.curve) == 11
+        assert fan_service.active_curve is PRESET_STOCK
+
+        # Moving the fan back to the service restarts gymdeck3 without fan arguments
+        assert await manager.apply_profile(2)
+        assert controller.start.call_count == 2
+        assert controller.start.call_args[0][0].fan_config.enabled is False
+        assert fan_service.active_curve.points[0].speed == 0
+
+    @pytest.mark.asyncio
+    async def test_identical_switch_is_a_no_op(self):
+        """Re-applying the active settings touches no hardware."""
+        manager, ryzenadj, controller = _create_manager()
+        manager.set_global_default(cores=[-15] * 4)
+        await manager.create_profile(1, "Same As Default", [-15] * 4)
+
+        await manager.apply_global_default()
+        await manager.apply_profile(1)
+
+        assert ryzenadj.apply_values_async.call_count == 1
+        controller.start.assert_not_called()
+        controller.stop.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stopping_dynamic_reapplies_static_values(self):
+        """gymdeck3 resets values on exit, so static cores are re-applied."""
+        manager, ryzenadj, controller = _create_manager()
+        await manager.create_profile(1, "Dynamic", [-20] * 4, True, DYNAMIC_CONFIG)
+        await manager.create_profile(2, "Static", [-20] * 4)
+
+        await manager.apply_profile(1)
+        await manager.apply_profile(2)
+
+        controller.stop.assert_called_once()
+        assert ryzenadj.apply_values_async.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_crashed_gymdeck3_is_restarted(self):
+        """A dynamic plan starts gymdeck3 again if it is no longer running."""
+        manager, _, controller = _create_manager()
+        await manager.create_profile(1, "Dynamic", [-20] * 4, True, DYNAMIC_CONFIG)
+
+        await manager.apply_profile(1)
+        await controller.stop()
+        await manager.apply_profile(1)
+
+        assert controller.start.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_updated_profile_is_recompiled(self):
+        """Saving a profile recompiles its plan."""
+        manager, ryzenadj, _ = _create_manager()
+        await manager.create_profile(1, "Game", [-10] * 4)
+        await manager.apply_profile(1)
+
+        await manager.update_profile(1, cores=[-25] * 4)
+
+        assert manager.get_active_plan().cores == (-25, -25, -25, -25)
+        assert ryzenadj.apply_values_async.call_args[0][0] == [-25, -25, -25, -25]
+
+    @pytest.mark.asyncio
+    async def test_failed_apply_forgets_active_plan(self):
+        """A failed ryzenadj call leaves the active plan unknown."""
+        manager, ryzenadj, _ = _create_manager()
+        await manager.create_profile(1, "Game", [-10] * 4)
+        ryzenadj.apply_values_async.return_value = (False, "boom")
+
+        assert not await manager.apply_profile(1)
+        assert manager.get_active_plan() is None
@@ -253,9 +253,8 @@ class TestProfileAutoSwitching:
         # Mock on_app_change to track calls
         profile_manager.on_app_change = AsyncMock()
         
-        # Create AppWatcher with short poll interval and no debounce
+        # Create AppWatcher with short poll interval
         watcher = AppWatcher(profile_manager, poll_interval=0.05)
-        watcher.DEBOUNCE_DELAY = 0.0  # Disable debounce for testing
         
         # Simulate app change: None -> 1091500 -> 570
         app_sequence = [None, 1091500, 570]
@@ -326,6 +325,9 @@ class TestProfileAutoSwitching:
         applied_values = mock_ryzenadj.apply_values_async.call_args[0][0]
         assert applied_values == [-25, -25, -25, -25], "Should apply profile's undervolt values"
         
-        # Note: Dynamic mode start is currently a TODO in the implementation
-        # When implemented, this test should verify mock_dynamic.start.assert_called_once()
+        # Verify dynamic mode was started with the profile's config
+        mock_dynamic.start.assert_called_once()
+        started_config = mock_dynamic.start.call_args[0][0]
+        assert started_config.strategy == "balanced"
+        assert started_config.simple_value == -25
 
@@ -484,7 +484,7 @@ class TestProfileSwitchingWorkflow:
         mock_ryzenadj.reset_mock()
         mock_event_emitter.reset_mock()
         
-        # Simulate exiting all games
+        # Simulate exiting all games (global default already in effect)
         await profile_manager.on_app_change(None)
-        assert mock_ryzenadj.apply_values_async.call_args[0][0] == [-15, -15, -15, -15]
+        mock_ryzenadj.apply_values_async.assert_not_called()
         mock_event_emitter.emit_profile_changed.assert_called_with("Global Default", None)
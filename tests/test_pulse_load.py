@@ -0,0 +1,131 @@
+"""Tests for the duty-cycle load pulse generator.
+
+Feature: iron-seeker, VdroopTester Module
+Validates: Requirements 2.1, 2.4
+
+Pulse edges are absolute deadlines from one shared start time, so the
+measured duty cycle must track the target and a run must end on
+schedule however late individual phases start.
+"""
+
+import time
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.tuning import pulse_load
+from backend.tuning.vdroop import VdroopTester
+
+
+# ==================== Schedule Tests ====================
+
+@given(
+    low=st.floats(min_value=0.01, max_value=5000),
+    high=st.floats(min_value=0.01, max_value=5000),
+    steps=st.integers(min_value=1, max_value=20),
+)
+@settings(max_examples=100)
+def test_sweep_stays_in_supported_range(low, high, steps):
+    frequencies = pulse_load.sweep_frequencies(low, high, steps)
+
+    assert 1 <= len(frequencies) <= steps
+    assert all(
+        pulse_load.MIN_FREQUENCY_HZ <= f <= pulse_load.MAX_FREQUENCY_HZ * (1 + 1e-9)
+        for f in frequencies
+    )
+    assert frequencies == sorted(frequencies)
+
+
+def test_full_sweep_is_log_spaced():
+    frequencies = pulse_load.sweep_frequencies(1, 1000, 4)
+
+    assert frequencies == pytest.approx([1, 10, 100, 1000])
+
+
+def test_schedule_covers_duration():
+    schedule = pulse_load.build_schedule(100.0, 8.0, [1, 10, 100, 1000])
+
+    assert [f for f, _ in schedule] == [1, 10, 100, 1000]
+    assert [end for _, end in schedule] == [102.0, 104.0, 106.0, 108.0]
+
+
+def test_phase_offsets():
+    """Aligned cores share edges, staggered cores split the period."""
+    assert {pulse_load.phase_offset(i, 4, 10.0, True) for i in range(4)} == {0.0}
+    assert [pulse_load.phase_offset(i, 4, 10.0, False) for i in range(4)] == pytest.approx(
+        [0.0, 0.025, 0.05, 0.075]
+    )
+
+
+# ==================== Timing Tests ====================
+
+@pytest.mark.parametrize("frequency, duty", [(20.0, 0.5), (10.0, 0.25)])
+def test_measured_duty_tracks_target(frequency, duty):
+    start = time.monotonic() + 0.05
+    schedule = pulse_load.build_schedule(start, 1.0, [frequency])
+
+    stats, ok = pulse_load.run_pulses(schedule, start, duty)
+
+    assert ok
+    assert stats.cycles + stats.missed == int(frequency)
+    assert stats.duty == pytest.approx(duty, abs=0.1)
+    assert stats.elapsed == pytest.approx(1.0)
+
+
+def test_late_phases_do_not_accumulate():
+    """A run ends on its last deadline even when every phase starts late."""
+    start = time.monotonic() + 0.05
+    schedule = pulse_load.build_schedule(start, 0.5, [200.0])
+
+    stats, ok = pulse_load.run_pulses(schedule, start, 0.5)
+    finished = time.monotonic()
+
+    assert ok
+    assert stats.cycles > 50
+    assert finished - (start + 0.5) < 0.05
+
+
+def test_digest_mismatch_is_reported(monkeypatch, capsys):
+    monkeypatch.setattr(pulse_load, "_BLOCK_DIGEST", b"\0" * 32)
+
+    code = pulse_load.run_worker(0, 0, 1, time.monotonic(), 0.2, [20.0], 0.5, True)
+
+    assert code == 1
+    assert "pulse: fail: core=0" in capsys.readouterr().out
+
+
+def test_summarize_worker_lines():
+    output = "\n".join([
+        "pulse: core=0 cycles=100 missed=0 duty=0.5000 lateness_us=40.0 lateness_p99_us=90.0",
+        "pulse: core=1 cycles=98 missed=2 duty=0.4800 lateness_us=55.0 lateness_p99_us=120.0",
+        "pulse: successful run completed",
+    ])
+
+    summary = pulse_load.summarize(output, 0.5)
+
+    assert summary.cores == 2
+    assert summary.cycles == 198
+    assert summary.missed == 2
+    assert summary.duty_cycle == pytest.approx(0.49)
+    assert summary.duty_cycle_error == pytest.approx(0.02)
+    assert summary.phase_skew_us == pytest.approx(15.0)
+    assert pulse_load.summarize("stress-ng: info: done", 0.5) is None
+
+
+# ==================== VdroopTester Tests ====================
+
+@pytest.mark.asyncio
+async def test_vdroop_result_reports_duty_cycle(tmp_path):
+    kmsg = tmp_path / "kmsg"
+    kmsg.touch()
+    tester = VdroopTester(kmsg_path=str(kmsg))
+
+    result = await tester.run_vdroop_test(1, pulse_ms=25)
+
+    assert result.passed is True, result.logs
+    assert result.pulse_cycles > 0
+    assert result.duty_cycle == pytest.approx(0.5, abs=0.2)
+    assert result.duty_cycle_error is not None
+    assert result.phase_skew_us is not None
+    for core in range(4):
+        assert f"pulse: core={core} cycles=" in result.logs
@@ -0,0 +1,314 @@
+"""Tests for streaming stress output and early abort.
+
+Feature: decktune, Test Runner Module
+Validates: Requirements 3.4, 3.5, 3.6
+
+Fake stress scripts emit failure signatures at known times. The runner
+must read their output while they run, kill the whole process group on
+the first failure (or new kernel error), and record time-to-failure
+instead of waiting for the full test duration.
+"""
+
+import asyncio
+import sys
+import time
+import textwrap
+
+import pytest
+
+from backend.tuning import runner as runner_module
+from backend.tuning.runner import (
+    TestCase,
+    TestRunner,
+    _is_failure_line,
+    _parse_memtester_output,
+    _parse_stress_ng_output,
+)
+
+
+def _fake_test(monkeypatch, name, script, parse_fn=_parse_stress_ng_output, timeout=60):
+    """Replace a test definition with a Python script."""
+    monkeypatch.setitem(TestRunner.TESTS, name, TestCase(
+        name=name,
+        command=[sys.executable, "-c", textwrap.dedent(script)],
+        timeout=timeout,
+        parse_fn=parse_fn
+    ))
+
+
+def _create_runner(tmp_path):
+    """Runner watching a kmsg-format file in tmp_path."""
+    kmsg = tmp_path / "kmsg"
+    kmsg.touch()
+    runner = TestRunner(kmsg_path=str(kmsg))
+    runner.KERNEL_POLL_INTERVAL = 0.05
+    return runner
+
+
+def _log_kernel(runner, seq, message):
+    """Append a record to the runner's fake kernel log."""
+    with open(runner._kmsg_path, "a") as f:
+        f.write(f"3,{seq},{seq * 1000},-;{message}\n")
+
+
+def _process_gone(pid):
+    """True if pid no longer exists or is a zombie."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split(")")[-1].split()[0] == "Z"
+    except FileNotFoundError:
+        return True
+
+
+# ==================== Failure Signature Tests ====================
+
+@pytest.mark.parametrize("line", [
+    "stress-ng: fail:  [1234] cpu: verification failed on 4 workers",
+    "stress-ng: info:  [1234] failed: 2: cpu (4)",
+    "stress-ng: info:  [1234] unsuccessful run completed in 3.01s",
+    "FAILURE: 0x00000000 != 0x00010000 at offset 0x0000a3f0.",
+])
+def test_failure_lines_are_detected(line):
+    assert _is_failure_line(line)
+
+
+@pytest.mark.parametrize("line", [
+    "stress-ng: info:  [1234] dispatching hogs: 4 cpu",
+    "stress-ng: info:  [1234] skipped: 0",
+    "stress-ng: info:  [1234] failed: 0",
+    "stress-ng: info:  [1234] successful run completed in 30.00s",
+    "  Stuck Address       : ok",
+])
+def test_normal_lines_are_not_failures(line):
+    assert not _is_failure_line(line)
+
+
+# ==================== Early Abort Tests ====================
+
+@pytest.mark.asyncio
+async def test_stress_failure_aborts_long_test(monkeypatch, tmp_path):
+    """A verification failure ends a 5-minute test within seconds."""
+    _fake_test(monkeypatch, "cpu_long", """
+        import sys, time
+        print("stress-ng: info:  [1] dispatching hogs: 4 cpu", flush=True)
+        time.sleep(0.3)
+        print("stress-ng: fail:  [1] cpu: verification failed", flush=True)
+        time.sleep(300)
+    """, timeout=310)
+    runner = _create_runner(tmp_path)
+
+    result = await runner.run_test("cpu_long")
+
+    assert result.passed is False
+    assert "verification failed" in result.error
+    assert 0.2 <= result.time_to_failure < 5
+    assert result.duration < 10
+    assert "dispatching hogs" in result.logs
+
+
+@pytest.mark.asyncio
+async def test_abort_kills_whole_process_group(monkeypatch, tmp_path):
+    """Workers forked by the stress process are killed as well."""
+    _fake_test(monkeypatch, "cpu_long", """
+        import subprocess, sys, time
+        worker = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(300)"])
+        print(f"worker {worker.pid}", flush=True)
+        print("stress-ng: fail:  [1] cpu: verification failed", flush=True)
+        time.sleep(300)
+    """, timeout=310)
+    runner = _create_runner(tmp_path)
+
+    result = await runner.run_test("cpu_long")
+
+    worker_pid = int(result.logs.split("worker ")[1].split()[0])
+    deadline = time.time() + 3
+    while not _process_gone(worker_pid) and time.time() < deadline:
+        time.sleep(0.05)
+    assert _process_gone(worker_pid)
+    assert runner._active_processes == set()
+
+
+@pytest.mark.asyncio
+async def test_memtester_failure_aborts(monkeypatch, tmp_path):
+    """memtester FAILURE lines abort the RAM test."""
+    _fake_test(monkeypatch, "ram_thorough", """
+        import time
+        print("  Stuck Address       : ok", flush=True)
+        time.sleep(0.2)
+        print("  Random Value        : FAILURE: 0x1 != 0x3 at offset 0x10.", flush=True)
+        time.sleep(300)
+    """, parse_fn=_parse_memtester_output, timeout=900)
+    runner = _create_runner(tmp_path)
+
+    result = await runner.run_test("ram_thorough")
+
+    assert result.passed is False
+    assert "FAILURE" in result.error
+    assert result.time_to_failure < 5
+
+
+@pytest.mark.asyncio
+async def test_new_kernel_error_aborts_test(monkeypatch, tmp_path):
+    """An MCE logged during the test aborts it; older errors are ignored."""
+    _fake_test(monkeypatch, "cpu_long", """
+        import time
+        time.sleep(300)
+    """, timeout=310)
+    runner = _create_runner(tmp_path)
+    _log_kernel(runner, 1, "mce: [Hardware Error]: old error from boot")
+
+    async def machine_check_later():
+        await asyncio.sleep(0.5)
+        _log_kernel(runner, 2, "mce: [Hardware Error]: CPU 2: Machine Check: 0 Bank 5")
+
+    logger_task = asyncio.ensure_future(machine_check_later())
+    result = await runner.run_test("cpu_long")
+    await logger_task
+
+    assert result.passed is False
+    assert "CPU 2: Machine Check" in result.error
+    assert "old error" not in result.error
+    assert 0.4 <= result.time_to_failure < 5
+
+
+@pytest.mark.asyncio
+async def test_clean_run_passes_with_old_kernel_errors(monkeypatch, tmp_path):
+    """A successful run passes and has no time-to-failure."""
+    _fake_test(monkeypatch, "cpu_quick", """
+        print("stress-ng: info:  [1] failed: 0")
+        print("stress-ng: info:  [1] successful run completed in 0.10s")
+    """)
+    runner = _create_runner(tmp_path)
+    _log_kernel(runner, 1, "mce: [Hardware Error]: old error")
+
+    result = await runner.run_test("cpu_quick")
+
+    assert result.passed is True
+    assert result.error is None
+    assert result.time_to_failure is None
+
+
+@pytest.mark.asyncio
+async def test_failed_test_errors_do_not_fail_next_test(monkeypatch, tmp_path):
+    """An MCE from a failed, unchecked test is not reported after the next one."""
+    runner = _create_runner(tmp_path)
+    _fake_test(monkeypatch, "cpu_quick", f"""
+        with open({runner._kmsg_path!r}, "a") as f:
+            f.write("3,1,1000,-;mce: [Hardware Error]: CPU 2: Machine Check\\n")
+        print("stress-ng: fail:  [1] cpu: verification failed on 1 worker")
+    """)
+    failed = await runner.run_test("cpu_quick")
+    assert failed.passed is False  # Caller returns without check_dmesg_errors()
+
+    _fake_test(monkeypatch, "cpu_quick", """
+        print("stress-ng: info:  [1] successful run completed in 0.10s")
+    """)
+    passed = await runner.run_test("cpu_quick")
+
+    assert passed.passed is True
+    assert await runner.check_dmesg_errors() == []
+    _log_kernel(runner, 2, "mce: [Hardware Error]: CPU 3: Machine Check")
+    assert len(await runner.check_dmesg_errors()) == 1
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_process(monkeypatch, tmp_path):
+    """A hung test is killed at its timeout without a time-to-failure."""
+    _fake_test(monkeypatch, "cpu_quick", """
+        import time
+        print("started", flush=True)
+        time.sleep(300)
+    """, timeout=1)
+    runner = _create_runner(tmp_path)
+
+    result = await runner.run_test("cpu_quick")
+
+    assert result.passed is False
+    assert "timed out" in result.error
+    assert result.time_to_failure is None
+    assert "started" in result.logs
+
+
+@pytest.mark.asyncio
+async def test_per_core_failure_time_includes_earlier_phases(monkeypatch, tmp_path):
+    """time_to_failure of a gradual-load test counts from the first phase."""
+    fake = tmp_path / "stress-ng"
+    fake.write_text(textwrap.dedent(f"""\
+        #!{sys.executable}
+        import sys, time
+        load = sys.argv[sys.argv.index("--cpu-load") + 1]
+        time.sleep(0.3)
+        if load == "90":
+            print("stress-ng: fail:  [1] cpu: verification failed", flush=True)
+            time.sleep(300)
+        print("stress-ng: info:  [1] successful run completed")
+    """))
+    fake.chmod(0o755)
+    monkeypatch.setattr(runner_module, "get_binary_path", lambda name: str(fake))
+    runner = _create_runner(tmp_path)
+
+    result = await runner.run_per_core_test(2, 30)
+
+    assert result.passed is False
+    assert result.error.startswith("Phase 2 failed")
+    assert 0.6 <= result.time_to_failure < 5
+    assert "=== Phase 1 (100% load) ===" in result.logs
+
+
+@pytest.mark.asyncio
+async def test_kernel_error_in_last_poll_interval_fails_test(monkeypatch, tmp_path):
+    """An MCE logged just before the test exits is read when it ends."""
+    runner = _create_runner(tmp_path)
+    runner.KERNEL_POLL_INTERVAL = 60  # Only the final read can see it
+    _fake_test(monkeypatch, "cpu_quick", f"""
+        with open({runner._kmsg_path!r}, "a") as f:
+            f.write("3,1,1000,-;mce: [Hardware Error]: CPU 1: Machine Check\\n")
+        print("stress-ng: info:  [1] successful run completed in 0.10s")
+    """)
+
+    result = await runner.run_test("cpu_quick")
+
+    assert result.passed is False
+    assert "CPU 1: Machine Check" in result.error
+
+
+class _LockedCores:
+    """Minimal cpufreq controller and ryzenadj wrapper for locked rounds."""
+
+    def get_current_governor(self, core_id):
+        return "schedutil"
+
+    def lock_frequency(self, core_id, freq_mhz):
+        pass
+
+    def unlock_frequency(self, core_id, governor):
+        pass
+
+    async def apply_values_async(self, cores):
+        return True, None
+
+
+@pytest.mark.asyncio
+async def test_parallel_round_reports_kernel_errors_of_every_phase(monkeypatch, tmp_path):
+    """An MCE logged in phase 1 of a gradual-load round is still reported."""
+    kmsg = tmp_path / "kmsg"
+    fake = tmp_path / "stress-ng"
+    fake.write_text(textwrap.dedent(f"""\
+        #!{sys.executable}
+        import sys
+        if sys.argv[sys.argv.index("--cpu-load") + 1] == "100":
+            with open({str(kmsg)!r}, "a") as f:
+                f.write("3,1,1000,-;mce: [Hardware Error]: CPU 0: Machine Check\\n")
+        print("stress-ng: info:  [1] successful run completed")
+    """))
+    fake.chmod(0o755)
+    monkeypatch.setattr(runner_module, "get_binary_path", lambda name: str(fake))
+    runner = _create_runner(tmp_path)
+    locked = _LockedCores()
+    runner._cpufreq_controller = locked
+    runner._ryzenadj_wrapper = locked
+
+    results, dmesg_errors = await runner.run_parallel_frequency_locked_round({0: (2800, -20)}, 30)
+
+    assert results[0].passed is True  # Not attributable to a core
+    assert len(dmesg_errors) == 1 and "CPU 0: Machine Check" in dmesg_errors[0]
@@ -0,0 +1,153 @@
+"""Tests for the known-answer silent data corruption workload.
+
+Feature: decktune, Test Runner Module
+Validates: Requirements 3.1, 3.4, 3.5
+
+Every kernel must reproduce its precomputed checksum, and a corrupted
+intermediate value must be reported as a failure naming the core and
+kernel, whether the workload runs on its own or alongside a stress test.
+"""
+
+import cmath
+import sys
+import textwrap
+
+import pytest
+
+from backend.tuning import sdc_workload
+from backend.tuning.runner import (
+    SDC_WORKLOAD_PATH,
+    TestCase,
+    TestRunner,
+    _parse_sdc_output,
+    _parse_stress_ng_output,
+)
+
+
+def _create_runner(tmp_path):
+    kmsg = tmp_path / "kmsg"
+    kmsg.touch()
+    return TestRunner(kmsg_path=str(kmsg))
+
+
+def _short_sdc_test(monkeypatch, duration=0.5):
+    monkeypatch.setitem(TestRunner.TESTS, "sdc_verify", TestCase(
+        name="Silent Data Corruption Check",
+        command=["python3", SDC_WORKLOAD_PATH, "--cores", "0,1,2,3", "--duration", str(duration)],
+        timeout=60,
+        parse_fn=_parse_sdc_output
+    ))
+
+
+# ==================== Kernel Tests ====================
+
+@pytest.mark.parametrize("name", sorted(sdc_workload.KERNELS))
+def test_kernel_matches_known_answer(name):
+    """Kernels are deterministic and match the precomputed checksums."""
+    kernel = sdc_workload.KERNELS[name]
+
+    assert kernel() == sdc_workload.KNOWN_ANSWERS[name]
+    assert kernel() == kernel()
+
+
+@pytest.mark.parametrize("name", sorted(sdc_workload.KERNELS))
+def test_injected_fault_changes_result(name):
+    """A single corrupted intermediate value changes the checksum."""
+    assert sdc_workload.KERNELS[name](fault=True) != sdc_workload.KNOWN_ANSWERS[name]
+
+
+def test_fft_twiddles_without_libm_are_accurate():
+    twiddles = sdc_workload._twiddles(1024)
+
+    assert len(twiddles) == 512
+    assert max(
+        abs(w - cmath.exp(-2j * cmath.pi * k / 1024)) for k, w in enumerate(twiddles)
+    ) < 1e-12
+
+
+def test_worker_reports_core_and_kernel(monkeypatch, capsys):
+    monkeypatch.setenv(sdc_workload.FAULT_ENV, "int_matmul@1")
+
+    assert sdc_workload.run_worker(0, 0, ["int_matmul"]) == 0
+    assert sdc_workload.run_worker(1, 0, ["sha256", "int_matmul"]) == 1
+
+    output = capsys.readouterr().out
+    assert "sdc: core=0 iterations=1 passed" in output
+    assert "sdc: fail: core=1 kernel=int_matmul iteration=0" in output
+
+
+# ==================== TestRunner Tests ====================
+
+@pytest.mark.asyncio
+async def test_sdc_verify_passes_on_correct_hardware(monkeypatch, tmp_path):
+    _short_sdc_test(monkeypatch)
+    monkeypatch.delenv(sdc_workload.FAULT_ENV, raising=False)
+
+    result = await _create_runner(tmp_path).run_test("sdc_verify")
+
+    assert result.passed is True, result.logs
+    for core in range(4):
+        assert f"sdc: core={core} iterations=" in result.logs
+
+
+@pytest.mark.asyncio
+async def test_sdc_mismatch_fails_with_core_and_kernel(monkeypatch, tmp_path):
+    """A mismatch on one core aborts the whole run early."""
+    _short_sdc_test(monkeypatch, duration=30)
+    monkeypatch.setenv(sdc_workload.FAULT_ENV, "fp_matmul@2")
+
+    result = await _create_runner(tmp_path).run_test("sdc_verify")
+
+    assert result.passed is False
+    assert "core=2 kernel=fp_matmul" in result.error
+    assert result.duration < 15
+
+
+@pytest.mark.asyncio
+async def test_verification_alongside_stress(monkeypatch, tmp_path):
+    """Alongside a passing stress test, the workload stops with it."""
+    monkeypatch.setitem(TestRunner.TESTS, "cpu_quick", TestCase(
+        name="CPU Quick",
+        command=[sys.executable, "-c", textwrap.dedent("""
+            import time
+            time.sleep(1.5)
+            print("stress-ng: info:  [1] successful run completed")
+        """)],
+        timeout=60,
+        parse_fn=_parse_stress_ng_output
+    ))
+    monkeypatch.delenv(sdc_workload.FAULT_ENV, raising=False)
+    runner = _create_runner(tmp_path)
+
+    result = await runner.run_test("cpu_quick", verify=True)
+
+    assert result.passed is True, result.error
+    assert result.duration < 10
+    assert "--- VERIFICATION ---" in result.logs
+    assert runner._active_processes == set()
+
+
+@pytest.mark.asyncio
+async def test_verification_mismatch_stops_stress(monkeypatch, tmp_path):
+    """A mismatch fails the test even though stress-ng would have passed."""
+    monkeypatch.setitem(TestRunner.TESTS, "cpu_long", TestCase(
+        name="CPU Long",
+        command=[sys.executable, "-c", textwrap.dedent("""
+            import time
+            time.sleep(300)
+            print("stress-ng: info:  [1] successful run completed")
+        """)],
+        timeout=310,
+        parse_fn=_parse_stress_ng_output
+    ))
+    monkeypatch.setenv(sdc_workload.FAULT_ENV, "fft@3")
+    runner = _create_runner(tmp_path)
+    runner.verify_sdc = True
+
+    result = await runner.run_test("cpu_long")
+
+    assert result.passed is False
+    assert result.error.startswith("Verification workload failed")
+    assert "core=3 kernel=fft" in result.error
+    assert result.time_to_failure < 15
+    assert runner._active_processes == set()
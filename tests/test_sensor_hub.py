@@ -0,0 +1,274 @@
+"""Tests for shared sensor sampling.
+
+Feature: fan-control-curves, frequency-based-wizard, decktune-3.0-automation
+Validates: Requirements 1.3, 1.4, 3.6, 5.1, 9.1
+
+SensorHub runs against a fake sysfs tree on a simulated clock. Channels
+must be sampled at the shortest interval any subscriber asks for, reads
+within a consumer's staleness tolerance must be shared, and the consumers
+of a frequency wizard run must together read far fewer sysfs files than
+they did on their own.
+"""
+
+import asyncio
+import dataclasses
+import heapq
+import itertools
+
+import pytest
+
+from backend.core.fan_control import FanControlService, HwmonInterface
+from backend.dynamic.context import ContextReader, SystemContext
+from backend.platform.cpufreq import CPUFreqController
+from backend.platform.sensors import (
+    AC_ONLINE,
+    BATTERY_PERCENT,
+    CONTEXT_CHANNELS,
+    TEMPERATURE,
+    SensorHub,
+    SensorPaths,
+    cpu_freq_channel,
+)
+from backend.tuning.frequency_wizard import FrequencyWizard, FrequencyWizardConfig
+from backend.tuning.runner import TestRunner
+
+
+class FakeSysfs:
+    """sysfs tree with hwmon, power supplies, a thermal zone and 4 cores."""
+
+    def __init__(self, tmp_path, temp: float = 55.0):
+        self.root = tmp_path / "sys"
+        hwmon = self.root / "class" / "hwmon"
+        self._write(hwmon / "hwmon0" / "temp1_input", "40000")  # Unlabelled (e.g. NVMe)
+        self._write(hwmon / "hwmon1" / "temp1_label", "Tctl")
+        self._write(hwmon / "hwmon1" / "pwm1", "0")
+        self.set_temp(temp)
+        self._write(self.root / "class" / "thermal" / "thermal_zone0" / "temp", "50000")
+        supplies = self.root / "class" / "power_supply"
+        self._write(supplies / "BAT1" / "type", "Battery")
+        self._write(supplies / "BAT1" / "capacity", "80")
+        self._write(supplies / "ADP1" / "type", "Mains")
+        self._write(supplies / "ADP1" / "online", "0")
+        for core in range(4):
+            self.set_freq(core, 2800)
+
+    @staticmethod
+    def _write(path, value) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{value}\n")
+
+    def set_temp(self, temp: float) -> None:
+        self._write(self.root / "class" / "hwmon" / "hwmon1" / "temp1_input", int(temp * 1000))
+
+    def set_freq(self, core: int, mhz: int) -> None:
+        path = self.root / "devices" / "system" / "cpu" / f"cpu{core}" / "cpufreq" / "scaling_cur_freq"
+        self._write(path, mhz * 1000)
+
+    def set_online(self, online: bool) -> None:
+        self._write(self.root / "class" / "power_supply" / "ADP1" / "online", int(online))
+
+
+class SimClock:
+    """Discrete-event clock shared by several sleeping tasks."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._sleepers = []
+        self._order = itertools.count()
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        wake = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._sleepers, (self.now + seconds, next(self._order), wake))
+        await wake
+
+    async def settle(self) -> None:
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    async def run_until(self, end: float) -> None:
+        """Advance to each wake-up time in turn, up to end."""
+        await self.settle()
+        while self._sleepers and self._sleepers[0][0] <= end:
+            wake_time, _, wake = heapq.heappop(self._sleepers)
+            if wake.done():
+                continue  # Cancelled sleep
+            self.now = wake_time
+            wake.set_result(None)
+            await self.settle()
+        self.now = end
+
+
+def _hub(tmp_path, **kwargs):
+    fake = FakeSysfs(tmp_path)
+    sim = SimClock()
+    hub = SensorHub.discover(str(fake.root), sleep=sim.sleep, clock=sim.clock, **kwargs)
+    return fake, sim, hub
+
+
+# ==================== Discovery and Snapshot Tests ====================
+
+def test_discovery_finds_each_sensor(tmp_path):
+    fake = FakeSysfs(tmp_path)
+    paths = SensorPaths.discover(str(fake.root))
+
+    assert paths.temperature.endswith("hwmon1/temp1_input")  # Labelled sensor preferred
+    assert paths.battery_capacity.endswith("BAT1/capacity")
+    assert [p.rsplit("/", 2)[-2] for p in paths.ac_online] == ["ADP1"]
+    assert len(paths.cpu_freq) == 4
+
+    override = SensorPaths.discover(str(fake.root), temperature="/custom/temp1_input")
+    assert override.temperature == "/custom/temp1_input"
+
+
+def test_discovery_keeps_core_numbers_across_gaps(tmp_path):
+    fake = FakeSysfs(tmp_path)
+    fake.set_freq(5, 1400)
+    cpu_root = fake.root / "devices" / "system" / "cpu"
+    (cpu_root / "cpu3" / "cpufreq" / "scaling_cur_freq").unlink()  # Offline core
+    hub = SensorHub.discover(str(fake.root))
+
+    assert [p is not None for p in hub.paths.cpu_freq] == [True, True, True, False, False, True]
+    assert cpu_freq_channel(3) not in hub.channels
+    snapshot = hub.latest([cpu_freq_channel(3), cpu_freq_channel(5)])
+    assert snapshot.cpu_freq_mhz[3] is None and snapshot.cpu_freq_mhz[5] == 1400.0
+    cpufreq = CPUFreqController(base_path=str(tmp_path / "missing"))
+    cpufreq.set_sensor_hub(hub)
+    assert cpufreq.get_current_frequency(5) == 1400
+
+
+def test_snapshot_is_immutable_and_shared_within_max_age(tmp_path):
+    fake, sim, hub = _hub(tmp_path)
+
+    snapshot = hub.latest(CONTEXT_CHANNELS + (cpu_freq_channel(2),), max_age=1.0)
+    assert (snapshot.temperature_c, snapshot.battery_percent, snapshot.ac_online) == (55.0, 80, False)
+    assert snapshot.cpu_freq_mhz == (None, None, 2800.0, None)
+    assert SystemContext.from_snapshot(snapshot) == SystemContext(80, "battery", 55)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.temperature_c = 0.0
+    reads = hub.reads
+
+    fake.set_temp(70.0)
+    fake.set_online(True)
+    sim.now = 0.8
+    assert hub.latest(CONTEXT_CHANNELS, max_age=1.0) is snapshot  # Shared, no reads
+    assert hub.reads == reads
+
+    sim.now = 1.5
+    fresh = hub.latest((TEMPERATURE,), max_age=1.0)
+    assert fresh.temperature_c == 70.0
+    assert fresh.ac_online is False  # Not requested, not re-read
+    assert hub.reads == reads + 1
+    assert fresh.age(TEMPERATURE, sim.now) == 0.0 and fresh.age(AC_ONLINE, sim.now) == 1.5
+
+
+# ==================== Demand Tests ====================
+
+@pytest.mark.asyncio
+async def test_channels_sampled_at_max_demand(tmp_path):
+    fake, sim, hub = _hub(tmp_path)
+    pushed = []
+    hub.subscribe("fan", [TEMPERATURE], interval=1.0)
+    hub.subscribe("context", [TEMPERATURE, BATTERY_PERCENT, AC_ONLINE], interval=5.0, callback=pushed.append)
+
+    hub.start()
+    await sim.run_until(60.0)
+    hub.stop()
+
+    assert hub.channel_intervals() == {TEMPERATURE: 1.0, BATTERY_PERCENT: 5.0, AC_ONLINE: 5.0}
+    # 61 temperature passes (t=0..60); battery and AC ride along every fifth
+    assert hub.passes == 61
+    assert hub.reads == 61 + 2 * 13
+    assert len(pushed) == 13
+    assert all(s.battery_percent == 80 for s in pushed)
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_hub_goes_idle(tmp_path):
+    fake, sim, hub = _hub(tmp_path)
+    hub.subscribe("fan", [TEMPERATURE], interval=1.0)
+    hub.start()
+    await sim.run_until(5.0)
+    reads = hub.reads
+
+    hub.unsubscribe("fan")
+    await sim.run_until(60.0)
+    hub.stop()
+
+    assert hub.reads <= reads + 1
+    assert hub.get_status()["subscribers"] == {}
+
+
+# ==================== Consumer Tests ====================
+
+@pytest.mark.asyncio
+async def test_frequency_wizard_consumers_share_reads(tmp_path):
+    """Fan loop, context source, wizard temperature monitor and thermal pacer."""
+    fake = FakeSysfs(tmp_path, temp=50.0)
+    (fake.root / "class" / "hwmon" / "hwmon0" / "temp1_input").unlink()
+    sim = SimClock()
+    hwmon = HwmonInterface(hwmon_path=str(fake.root / "class" / "hwmon"))
+    hub = SensorHub.discover(str(fake.root), temperature=hwmon.temp_sensor_path, sleep=sim.sleep, clock=sim.clock)
+
+    fan = FanControlService(hwmon, config_path=str(tmp_path / "fan.json"), sleep=sim.sleep, clock=sim.clock)
+    fan.set_sensor_hub(hub)
+    runner = TestRunner()
+    runner.set_sensor_hub(hub)
+    wizard = FrequencyWizard(FrequencyWizardConfig(thermal_pacing=True), CPUFreqController(), runner)
+    pacer = wizard._active_pacer()
+    assert pacer.sensor is hub
+    legacy_reads = 0
+
+    async def consumers():
+        nonlocal legacy_reads
+        t = 0
+        while True:
+            fake.set_temp(50.0 + 0.5 * t)  # Warming under stress keeps the fan at 1 Hz
+            if t % 5 == 0:
+                hub.latest((TEMPERATURE,), max_age=5.0)  # Context source temperature
+                legacy_reads += 1
+            # Wizard temperature monitor: get_system_metrics() read temperature
+            # and cpu0 frequency; with a hub it reads only the temperature
+            assert wizard._sensor_hub().read_temperature() is not None
+            assert pacer.read() is not None  # Previously its own HwmonInterface
+            legacy_reads += 2 + 1
+            t += 1
+            await sim.sleep(1.0)
+
+    hub.start()
+    fan.start_monitoring()
+    task = asyncio.create_task(consumers())
+    await sim.run_until(120.0)
+    task.cancel()
+    fan.stop_monitoring()
+    hub.stop()
+
+    legacy_reads += len(fan._wakeups)  # The fan loop read hwmon once per tick
+    hub_rate = hub.reads / sim.now
+    legacy_rate = legacy_reads / sim.now
+
+    assert fan.get_current_status()["current_temp"] > 50.0
+    assert hub_rate <= legacy_rate / 3, f"sysfs reads/s: legacy {legacy_rate:.2f}, hub {hub_rate:.2f}"
+    assert hub.get_status()["reads_per_second"] == pytest.approx(hub_rate, rel=0.05)
+
+
+def test_context_reader_and_cpufreq_use_hub(tmp_path):
+    fake, sim, hub = _hub(tmp_path)
+    reader = ContextReader(sensor_hub=hub)
+    cpufreq = CPUFreqController(base_path=str(tmp_path / "missing"))
+    cpufreq.set_sensor_hub(hub)
+
+    fake.set_online(True)
+    assert reader.read_current() == SystemContext(80, "ac", 55)
+
+    fake.set_freq(3, 1600)
+    assert cpufreq.get_current_frequency(3) == 1600
+    assert hub.reads == 4  # battery, AC, temperature, cpu3
+
+    runner = TestRunner()
+    runner.set_sensor_hub(hub)
+    fake.set_freq(0, 2400)
+    assert runner.get_system_metrics() == {"temperature": 55.0, "frequency": 2400.0}
+    assert hub.reads == 5  # Temperature shared, cpu0 read
@@ -0,0 +1,205 @@
+"""Tests for the sequential-probability stopping rule for test durations.
+
+Feature: decktune, Autotune Engine Module
+Validates: Requirements 2.3, 8.1
+
+Offsets deep in the known-good region must get short tests and offsets
+near the estimated limit long ones. A stochastic-failure simulator, in
+which an unstable offset fails after an exponentially distributed time,
+compares adaptive durations against the fixed ones.
+"""
+
+import asyncio
+import random
+from typing import List, Optional, Tuple
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.tuning.autotune import AutotuneEngine, AutotuneConfig
+from backend.tuning.runner import TestRunner, TestResult, _with_duration
+from backend.tuning.sequential_test import SequentialDurationPolicy, unstable_after_pass
+
+from tests.test_autotune_galloping import MockEventEmitter, MockSafetyManager, TEST_DURATIONS
+
+
+class StochasticSilicon:
+    """Per-core limits where an unstable core fails after a random time.
+    
+    A core below its limit fails at rate rate_per_mv * (limit - value)
+    per second, so offsets just past the limit often survive a short test.
+    Acts as both the ryzenadj wrapper and the test runner.
+    """
+    
+    def __init__(self, limits: List[int], seed: int = 0, rate_per_mv: float = 0.01):
+        self.limits = limits
+        self.random = random.Random(seed)
+        self.rate_per_mv = rate_per_mv
+        self.values = [0, 0, 0, 0]
+        self.simulated_seconds = 0.0
+    
+    async def apply_values_async(self, cores: List[int]) -> Tuple[bool, Optional[str]]:
+        self.values = list(cores)
+        return True, None
+    
+    async def run_test(self, test_name: str, duration: Optional[float] = None) -> TestResult:
+        duration = duration or TEST_DURATIONS[test_name]
+        failures = [
+            self.random.expovariate(self.rate_per_mv * (limit - value))
+            for value, limit in zip(self.values, self.limits)
+            if value < limit
+        ]
+        if failures and min(failures) < duration:
+            self.simulated_seconds += min(failures)
+            return TestResult(passed=False, duration=min(failures), logs="", time_to_failure=min(failures))
+        self.simulated_seconds += duration
+        return TestResult(passed=True, duration=duration, logs="")
+    
+    async def check_dmesg_errors(self) -> List[str]:
+        return []
+
+
+def _simulate(seed: int, adaptive: bool, false_pass_rate: float = 0.01, mode: str = "thorough") -> Tuple[float, int]:
+    """Run a linear autotune; returns (seconds, unsafe cores)."""
+    rng = random.Random(seed)
+    limits = [rng.randint(-45, -20) for _ in range(4)]
+    silicon = StochasticSilicon(limits, seed)
+    engine = AutotuneEngine(silicon, silicon, MockSafetyManager(-50), MockEventEmitter())
+    
+    result = asyncio.run(engine.run(AutotuneConfig(
+        mode=mode, adaptive_duration=adaptive, false_pass_rate=false_pass_rate
+    )))
+    
+    unsafe = sum(value < limit for value, limit in zip(result.cores, limits))
+    return silicon.simulated_seconds, unsafe
+
+
+# ==================== Policy Tests ====================
+
+def test_known_regions():
+    """Known-good offsets get the shortest test, known-bad the longest."""
+    policy = SequentialDurationPolicy(30, offset_min=-55)
+    policy.record(0, -20, True)
+    policy.record(0, -40, False)
+    
+    assert policy.prior_unstable(0, -10) == pytest.approx(0.01)
+    assert policy.duration_for(0, -10) == policy.min_duration
+    assert policy.prior_unstable(0, -45) == pytest.approx(0.99)
+    assert policy.duration_for(0, -45) == policy.max_duration
+    assert policy.prior_unstable(0, -30) == pytest.approx(0.5)
+    assert policy.prior_unstable(1, 0) == pytest.approx(0.01)
+
+
+def test_unknown_offset_gets_base_duration_at_calibration_rate():
+    policy = SequentialDurationPolicy(30, false_pass_rate=0.05)
+    
+    assert policy.duration_for(0, -20, p_unstable=0.5) == 30
+
+
+@given(
+    p_low=st.floats(min_value=0.01, max_value=0.99),
+    p_high=st.floats(min_value=0.01, max_value=0.99),
+    rate=st.floats(min_value=0.001, max_value=0.2),
+)
+@settings(max_examples=100)
+def test_duration_monotonic_and_clamped(p_low, p_high, rate):
+    """Less certain offsets and stricter rates never get shorter tests."""
+    p_low, p_high = sorted((p_low, p_high))
+    policy = SequentialDurationPolicy(60, false_pass_rate=rate)
+    strict = SequentialDurationPolicy(60, false_pass_rate=rate / 2)
+    
+    short = policy.duration_for(0, -20, p_low)
+    long = policy.duration_for(0, -20, p_high)
+    
+    assert policy.min_duration <= short <= long <= policy.max_duration
+    assert strict.duration_for(0, -20, p_high) >= long
+
+
+@given(p=st.floats(min_value=0.02, max_value=0.98))
+@settings(max_examples=100)
+def test_pass_meets_false_pass_rate(p):
+    """Surviving the chosen duration leaves at most the accepted risk."""
+    policy = SequentialDurationPolicy(30, false_pass_rate=0.01, max_duration=10_000)
+    duration = policy.duration_for(0, -20, p)
+    
+    assert unstable_after_pass(p, policy.failure_rate, duration) <= 0.01 + 1e-9
+
+
+def test_slow_failures_extend_tests():
+    """Marginal offsets that fail late lower the rate and lengthen tests."""
+    quick = SequentialDurationPolicy(30)
+    slow = SequentialDurationPolicy(30)
+    for offset in (-20, -25, -30):
+        quick.record(offset, offset, True)
+        slow.record(offset, offset, True)
+        quick.record(offset, offset - 5, False, time_to_failure=2, duration=30)
+        slow.record(offset, offset - 5, False, time_to_failure=25, duration=30)
+    
+    assert slow.failure_rate < quick.failure_rate
+    assert slow.duration_for(9, -20, 0.5) > quick.duration_for(9, -20, 0.5)
+
+
+def test_truncation_keeps_short_tests_from_shrinking():
+    """Failures seen inside a short window count as truncated draws."""
+    truncated = SequentialDurationPolicy(30)
+    untruncated = SequentialDurationPolicy(30)
+    for policy, window in ((truncated, 10), (untruncated, None)):
+        for _ in range(5):
+            policy.record(0, 0, True)
+            policy.record(0, -5, False, time_to_failure=5, duration=window)
+    
+    assert truncated.failure_rate < untruncated.failure_rate
+
+
+def test_only_marginal_failures_update_rate():
+    policy = SequentialDurationPolicy(30)
+    rate = policy.failure_rate
+    
+    policy.record(0, -40, False, time_to_failure=1)  # No pass known yet
+    policy.record(1, 0, True)
+    policy.record(1, -50, False, time_to_failure=1)  # Far past the pass
+    
+    assert policy.failure_rate == rate
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"base_duration": 0},
+    {"base_duration": 30, "false_pass_rate": 0.0},
+    {"base_duration": 30, "false_pass_rate": 0.5},
+])
+def test_invalid_parameters_rejected(kwargs):
+    with pytest.raises(ValueError):
+        SequentialDurationPolicy(**kwargs)
+
+
+# ==================== Runner Tests ====================
+
+def test_with_duration_rewrites_duration_argument():
+    cpu_quick = TestRunner.TESTS["cpu_quick"]
+    command, timeout = _with_duration(cpu_quick, 12.2)
+    
+    assert command[command.index("--timeout") + 1] == "13s"
+    assert timeout == cpu_quick.timeout - 30 + 13
+    assert cpu_quick.command[cpu_quick.command.index("--timeout") + 1] == "30s"
+    
+    combo = TestRunner.TESTS["combo"]
+    command, timeout = _with_duration(combo, 60)
+    assert command[command.index("--timeout") + 1] == "60s"
+    assert timeout == combo.timeout - 300 + 60
+
+
+# ==================== Simulation Tests ====================
+
+def test_adaptive_durations_reduce_tuning_time():
+    """Adaptive durations tune faster without more unsafe results."""
+    fixed = [_simulate(seed, adaptive=False) for seed in range(40)]
+    adaptive = [_simulate(seed, adaptive=True) for seed in range(40)]
+    
+    assert sum(s for s, _ in adaptive) < 0.9 * sum(s for s, _ in fixed)
+    assert sum(u for _, u in adaptive) <= sum(u for _, u in fixed)
+
+
+def test_quick_mode_keeps_fixed_durations():
+    """Quick mode ignores adaptive_duration, so it is never slower."""
+    for seed in range(5):
+        assert _simulate(seed, adaptive=True, mode="quick") == _simulate(seed, adaptive=False, mode="quick")
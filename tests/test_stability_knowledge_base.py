@@ -0,0 +1,212 @@
+"""Tests for the persistent stability knowledge base.
+
+Feature: decktune, Stability Knowledge Base
+Validates: Requirements 2.1, 2.3
+
+Observations settle later queries only when they are at least as strong
+as the test that would be run, are invalidated by platform or BIOS
+changes, and let a rerun of any engine skip already-settled offsets.
+"""
+
+import asyncio
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.platform.detect import PlatformInfo, detect_platform
+from backend.tuning.autotune import AutotuneEngine, AutotuneConfig
+from backend.tuning.knowledge_base import ALL_CORES, StabilityKnowledgeBase
+from backend.tuning.wizard_session import WizardConfig, WizardSession
+
+from tests.test_autotune_galloping import MockEventEmitter, MockSafetyManager, SimulatedSilicon
+from tests.test_wizard_warm_start import SimulatedSilicon as SimulatedWizardSilicon
+from tests.test_wizard_warm_start import _create_wizard
+
+
+def _platform(bios_version="F7A0119"):
+    return PlatformInfo(model="Jupiter", variant="LCD", safe_limit=-50, detected=True, bios_version=bios_version)
+
+
+@pytest.fixture
+def kb(tmp_path):
+    return StabilityKnowledgeBase(tmp_path / "stability_knowledge.json", _platform())
+
+
+# ==================== Lookup Tests ====================
+
+def test_failure_settles_more_aggressive_offsets(kb):
+    """A failure at F settles every offset <= F as unstable."""
+    kb.record(0, -30, "cpu_quick", 30, passed=False)
+    kb.record(0, -20, "cpu_quick", 30, passed=True)
+
+    assert kb.lookup(0, -35, "cpu_quick", 30) is False
+    assert kb.lookup(0, -30, "cpu_quick", 30) is False
+    assert kb.lookup(0, -25, "cpu_quick", 30) is None
+    assert kb.lookup(0, -20, "cpu_quick", 30) is True
+    assert kb.lookup(0, -10, "cpu_quick", 30) is True
+    assert kb.bracket(0, "cpu_quick", 30) == (-20, -30)
+
+
+def test_context_must_match(kb):
+    """Other cores, test types and frequency locks are not settled."""
+    kb.record(0, -20, "cpu_quick", 30, passed=True, freq_mhz=1600)
+
+    assert kb.lookup(0, -20, "cpu_quick", 30, freq_mhz=1600) is True
+    assert kb.lookup(0, -20, "cpu_quick", 30) is None
+    assert kb.lookup(1, -20, "cpu_quick", 30, freq_mhz=1600) is None
+    assert kb.lookup(0, -20, "combo", 30, freq_mhz=1600) is None
+
+
+def test_longer_and_hotter_passes_dominate(kb):
+    """Passes settle shorter/cooler tests; failures settle longer/hotter ones."""
+    kb.record(0, -20, "cpu_quick", 60, passed=True, temperature=75.0)
+    kb.record(0, -40, "cpu_quick", 30, passed=False, temperature=55.0)
+
+    assert kb.lookup(0, -20, "cpu_quick", 30, temperature=62.0) is True
+    assert kb.lookup(0, -20, "cpu_quick", 120, temperature=62.0) is None
+    assert kb.lookup(0, -20, "cpu_quick", 30, temperature=81.0) is None
+
+    assert kb.lookup(0, -40, "cpu_quick", 120, temperature=62.0) is False
+    assert kb.lookup(0, -40, "cpu_quick", 30, temperature=48.0) is None
+
+
+def test_lockstep_and_per_core_evidence(kb):
+    """Lockstep passes settle cores; single-core failures settle lockstep."""
+    kb.record(ALL_CORES, -20, "combo", 60, passed=True)
+    kb.record(2, -30, "combo", 60, passed=False)
+
+    assert kb.lookup(1, -20, "combo", 60) is True
+    assert kb.lookup(ALL_CORES, -30, "combo", 60) is False
+    assert kb.lookup(1, -30, "combo", 60) is None
+
+
+def test_contradicting_observations_are_unsettled(kb):
+    """A re-tested spurious failure no longer settles its offset."""
+    kb.record(0, -24, "frequency_locked", 10, passed=False, freq_mhz=1000)
+    kb.record(0, -24, "frequency_locked", 10, passed=True, freq_mhz=1000)
+
+    assert kb.lookup(0, -24, "frequency_locked", 10, freq_mhz=1000) is None
+    assert kb.lookup(0, -20, "frequency_locked", 10, freq_mhz=1000) is True
+
+
+@given(
+    limit=st.integers(min_value=-50, max_value=0),
+    tested=st.lists(st.integers(min_value=-50, max_value=0), max_size=15),
+    query=st.integers(min_value=-50, max_value=0),
+)
+@settings(max_examples=100)
+def test_lookup_never_contradicts_consistent_evidence(tmp_path_factory, limit, tested, query):
+    """With noiseless evidence every settled answer is correct."""
+    kb = StabilityKnowledgeBase(tmp_path_factory.mktemp("kb") / "kb.json", _platform())
+    for offset in tested:
+        kb.record(0, offset, "cpu_quick", 30, passed=offset >= limit)
+
+    known = kb.lookup(0, query, "cpu_quick", 30)
+    assert known is None or known == (query >= limit)
+    if query in tested:
+        assert known == (query >= limit)
+
+
+# ==================== Persistence Tests ====================
+
+def test_observations_survive_reload(tmp_path):
+    """A new instance sees observations of the same platform."""
+    path = tmp_path / "stability_knowledge.json"
+    StabilityKnowledgeBase(path, _platform()).record(0, -20, "cpu_quick", 30, passed=True)
+
+    reloaded = StabilityKnowledgeBase(path, _platform())
+
+    assert len(reloaded.observations) == 1
+    assert reloaded.lookup(0, -20, "cpu_quick", 30) is True
+
+
+def test_bios_update_invalidates_observations(tmp_path):
+    """Observations are discarded when the BIOS version changes."""
+    path = tmp_path / "stability_knowledge.json"
+    StabilityKnowledgeBase(path, _platform("F7A0119")).record(0, -20, "cpu_quick", 30, passed=True)
+
+    updated = StabilityKnowledgeBase(path, _platform("F7A0131"))
+
+    assert updated.observations == []
+    assert StabilityKnowledgeBase(path, _platform("F7A0131")).observations == []
+
+
+def test_platform_redetection_invalidates_observations(kb):
+    """Switching to a different platform identity clears the store."""
+    kb.record(0, -20, "cpu_quick", 30, passed=True)
+
+    kb.set_platform(_platform())
+    assert len(kb.observations) == 1
+
+    kb.set_platform(PlatformInfo(model="Galileo", variant="OLED", safe_limit=-60, detected=True))
+    assert kb.observations == []
+
+
+def test_detect_platform_reads_bios_version(tmp_path):
+    """detect_platform reports the BIOS version from DMI."""
+    product = tmp_path / "product_name"
+    bios = tmp_path / "bios_version"
+    product.write_text("Jupiter\n")
+    bios.write_text("F7A0131\n")
+
+    platform = detect_platform(str(product), use_cache=False, bios_path=str(bios))
+
+    assert platform.bios_version == "F7A0131"
+    assert detect_platform(str(product), use_cache=False, bios_path=str(tmp_path / "missing")).bios_version == ""
+
+
+# ==================== Engine Tests ====================
+
+@pytest.mark.parametrize("strategy", ["linear", "galloping"])
+def test_autotune_rerun_skips_settled_offsets(tmp_path, strategy):
+    """A second autotune run reuses every result of the first."""
+    kb = StabilityKnowledgeBase(tmp_path / "kb.json", _platform())
+    results = []
+    for _ in range(2):
+        silicon = SimulatedSilicon([-35, -40, -30, -45])
+        engine = AutotuneEngine(silicon, silicon, MockSafetyManager(-50), MockEventEmitter())
+        engine.set_knowledge_base(kb)
+        results.append(asyncio.run(engine.run(AutotuneConfig(strategy=strategy))))
+
+    first, second = results
+    assert first.tests_run > 0
+    assert second.tests_run == 0
+    assert second.cores == first.cores
+
+
+@pytest.mark.asyncio
+async def test_frequency_wizard_rerun_skips_settled_points(tmp_path):
+    """A second frequency sweep reuses every result of the first."""
+    kb = StabilityKnowledgeBase(tmp_path / "kb.json", _platform())
+    curves = []
+    wizards = []
+    for _ in range(2):
+        wizard = _create_wizard(SimulatedWizardSilicon())
+        wizard.set_knowledge_base(kb)
+        curves.append(await wizard.run(0))
+        wizards.append(wizard)
+
+    assert wizards[0].stress_test_count > 0
+    assert wizards[1].stress_test_count == 0
+    assert [p.voltage_mv for p in curves[1].points] == [p.voltage_mv for p in curves[0].points]
+
+
+@pytest.mark.asyncio
+async def test_wizard_session_records_known_results_on_curve(tmp_path):
+    """Skipped wizard tests still appear on the curve, marked as known."""
+    kb = StabilityKnowledgeBase(tmp_path / "kb.json", _platform())
+    config = WizardConfig()
+    duration = config.get_test_duration_seconds()
+    kb.record(ALL_CORES, -20, "cpu_quick" if duration == 30 else "cpu_long", duration, True)
+    kb.record(2, -30, "per_core", duration, False)
+    wizard = WizardSession(None, None, None, None, str(tmp_path / "settings"))
+    wizard.set_knowledge_base(kb)
+    wizard._config = config
+
+    assert await wizard._test_offset(-15) is True
+    assert await wizard._test_offset_per_core(-35, 2) is False
+
+    assert [(p.offset, p.result, p.source) for p in wizard._curve_data] == [
+        (-15, "pass", "knowledge_base"),
+        (-35, "fail", "knowledge_base"),
+    ]
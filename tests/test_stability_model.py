@@ -0,0 +1,261 @@
+"""Tests for the probabilistic stability model and model-guided searches.
+
+Feature: decktune, Autotune Engine Module
+Validates: Requirements 2.1, 2.3, 2.5
+
+Failures of the simulated silicon are stochastic: the failure probability
+rises logistically past each core's threshold. The model-guided searches
+of autotune, binning and the frequency wizard must set unsafe values
+(P(fail) above the risk level) far less often than the pass/fail searches
+and report their confidence.
+"""
+
+import asyncio
+import math
+import random
+from typing import List
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.core.safety import SafetyManager
+from backend.tuning.autotune import AutotuneEngine, AutotuneConfig
+from backend.tuning.binning import BinningConfig, BinningEngine
+from backend.tuning.frequency_wizard import (
+    BayesianVoltageSearch,
+    ConfigurationError,
+    FrequencyWizardConfig,
+    _create_voltage_search,
+)
+from backend.tuning.runner import TestResult
+from backend.tuning.stability_model import StabilityModel
+
+from tests.test_autotune_galloping import (
+    MockEventEmitter,
+    MockSafetyManager,
+    SimulatedSilicon,
+)
+from tests.test_binning_algorithm import (
+    MockEventEmitter as MockBinningEventEmitter,
+    MockRyzenadjWrapper,
+    create_default_platform,
+)
+from tests.test_wizard_warm_start import SimulatedSilicon as SimulatedWizardSilicon
+from tests.test_wizard_warm_start import _create_wizard, _silicon_limit
+
+
+RISK = 0.05
+
+
+class StochasticSilicon(SimulatedSilicon):
+    """Silicon whose per-core failure probability is logistic in the offset."""
+    
+    def __init__(self, thresholds: List[int], scale: float = 1.5, seed: int = 0):
+        super().__init__(thresholds, seed=seed)
+        self.scale = scale
+    
+    def p_fail(self, core: int, value: int) -> float:
+        return 1.0 / (1.0 + math.exp((value - self.limits[core]) / self.scale))
+    
+    async def run_test(self, test_name: str) -> TestResult:
+        self.tests += 1
+        passed = all(
+            self.random.random() >= self.p_fail(core, value)
+            for core, value in enumerate(self.values)
+        )
+        return TestResult(passed=passed, duration=30.0, logs="")
+
+
+def _run(silicon: StochasticSilicon, strategy: str):
+    engine = AutotuneEngine(silicon, silicon, MockSafetyManager(-50), MockEventEmitter())
+    config = AutotuneConfig(strategy=strategy, risk_level=RISK, max_tests_per_core=8)
+    return asyncio.run(engine.run(config))
+
+
+# ==================== Model Tests ====================
+
+@given(tests=st.lists(
+    st.tuples(st.integers(min_value=-50, max_value=0), st.booleans()),
+    max_size=10
+))
+@settings(max_examples=50, deadline=None)
+def test_confidence_is_monotone_in_offset(tests):
+    """Less aggressive offsets are never less likely to meet the risk level."""
+    model = StabilityModel(-50, 0)
+    for offset, passed in tests:
+        model.update(offset, passed)
+    
+    confidences = [model.confidence(offset, RISK) for offset in range(-50, 1)]
+    assert all(a <= b + 1e-9 for a, b in zip(confidences, confidences[1:]))
+    assert all(0.0 <= c <= 1.0 + 1e-9 for c in confidences)
+    
+    estimate = model.recommend(RISK, confidence=0.9)
+    assert -50 <= estimate.offset <= 0
+    assert estimate.tests == len(tests)
+
+
+def test_failure_makes_more_aggressive_offsets_less_trusted():
+    """A failure lowers confidence in offsets below it more than above it."""
+    model = StabilityModel(-50, 0)
+    model.update(-20, passed=True)
+    before = model.confidence(-25, RISK)
+    
+    model.update(-30, passed=False)
+    
+    assert model.confidence(-25, RISK) < before
+    assert model.predictive_p_fail(-35) > model.predictive_p_fail(-15)
+
+
+def test_next_offset_targets_the_uncertain_region():
+    """After bracketing the limit, the selector tests inside the bracket."""
+    model = StabilityModel(-50, 0)
+    for _ in range(3):
+        model.update(-10, passed=True)
+        model.update(-40, passed=False)
+    
+    assert -40 < model.next_offset(RISK) < -10
+    assert model.information_gain(-45, RISK) < model.information_gain(model.next_offset(RISK), RISK)
+
+
+def test_single_lucky_pass_is_not_trusted():
+    """One pass at an offset does not make it the recommendation."""
+    model = StabilityModel(-50, 0)
+    model.update(-30, passed=True)
+    
+    estimate = model.recommend(RISK, confidence=0.9)
+    
+    assert estimate.offset > -30
+    assert estimate.confidence >= 0.9
+
+
+# ==================== Autotune Tests ====================
+
+def test_bayesian_autotune_sets_fewer_unsafe_values():
+    """On stochastic silicon the model-guided search rarely exceeds the risk level."""
+    thresholds = [-30, -38, -25, -42]
+    unsafe = {"linear": 0, "bayesian": 0}
+    
+    for seed in range(6):
+        for strategy in unsafe:
+            silicon = StochasticSilicon(thresholds, seed=seed)
+            result = _run(silicon, strategy)
+            unsafe[strategy] += sum(
+                silicon.p_fail(core, value) > RISK
+                for core, value in enumerate(result.cores)
+            )
+            
+            if strategy == "bayesian":
+                assert result.stable
+                assert len(result.confidence) == 4
+                assert all(c >= 0.9 for c in result.confidence)
+                assert result.tests_run <= 4 * 8
+    
+    assert unsafe["bayesian"] <= 2
+    assert unsafe["bayesian"] < unsafe["linear"]
+
+
+# ==================== Binning Tests ====================
+
+class MemorySettings:
+    def __init__(self):
+        self.values = {}
+    
+    def get_setting(self, key):
+        return self.values.get(key)
+    
+    def save_setting(self, key, value):
+        self.values[key] = value
+
+
+class StochasticBinningRunner:
+    """Combo tests whose failure probability is logistic in the applied value."""
+    
+    def __init__(self, ryzenadj: MockRyzenadjWrapper, threshold: int, scale: float = 1.5, seed: int = 0):
+        self.ryzenadj = ryzenadj
+        self.threshold = threshold
+        self.scale = scale
+        self.random = random.Random(seed)
+        self.tests = 0
+    
+    def p_fail(self, value: int) -> float:
+        return 1.0 / (1.0 + math.exp((value - self.threshold) / self.scale))
+    
+    async def run_test(self, test_name: str, duration=None) -> TestResult:
+        self.tests += 1
+        passed = self.random.random() >= self.p_fail(self.ryzenadj.applied_values[-1][0])
+        return TestResult(passed=passed, duration=1.0, logs="")
+
+
+def _bin(threshold: int, strategy: str, seed: int):
+    ryzenadj = MockRyzenadjWrapper()
+    runner = StochasticBinningRunner(ryzenadj, threshold, seed=seed)
+    safety = SafetyManager(MemorySettings(), create_default_platform(safe_limit=-50))
+    engine = BinningEngine(ryzenadj, runner, safety, MockBinningEventEmitter())
+    config = BinningConfig(start_value=-10, step_size=2, test_duration=30, strategy=strategy)
+    return asyncio.run(engine.start(config)), runner
+
+
+def test_bayesian_binning_sets_fewer_unsafe_values():
+    """The model-guided binning search rarely exceeds the risk level."""
+    unsafe = {"linear": 0, "bayesian": 0}
+    
+    for seed in range(8):
+        for strategy in unsafe:
+            result, runner = _bin(-30, strategy, seed)
+            unsafe[strategy] += runner.p_fail(result.max_stable) > RISK
+            
+            if strategy == "bayesian":
+                assert not result.aborted
+                assert result.iterations == runner.tests <= BinningConfig().max_iterations
+                assert -30 < result.max_stable <= -16  # Useful, not just the 0 mV fallback
+    
+    assert unsafe["bayesian"] <= 2
+    assert unsafe["bayesian"] < unsafe["linear"]
+
+
+# ==================== Frequency Wizard Tests ====================
+
+def test_bayesian_voltage_search_sets_fewer_unsafe_voltages():
+    """Per frequency, the model-guided search rarely exceeds the risk level."""
+    unsafe = {"binary": 0, "bayesian": 0}
+    
+    for seed in range(10):
+        rng = random.Random(seed)
+        limit = rng.randint(-26, -12)
+        
+        def verdict(voltage):
+            return rng.random() >= 1.0 / (1.0 + math.exp((voltage - limit) / 1.5))
+        
+        for method in unsafe:
+            config = FrequencyWizardConfig(voltage_search=method, warm_start=False)
+            search = _create_voltage_search(config, 1000)
+            while (voltage := search.next_voltage()) is not None:
+                search.record(voltage, verdict(voltage))
+            if not search.failed:
+                unsafe[method] += 1.0 / (1.0 + math.exp((search.last_stable_voltage - limit) / 1.5)) > RISK
+            if method == "bayesian":
+                assert search.test_count <= config.max_tests_per_point
+    
+    assert unsafe["bayesian"] <= 2
+    assert unsafe["bayesian"] < unsafe["binary"]
+
+
+@pytest.mark.asyncio
+async def test_bayesian_wizard_sweep_stays_at_or_above_limit():
+    """A full sweep with the model-guided search never undercuts the silicon."""
+    silicon = SimulatedWizardSilicon()
+    wizard = _create_wizard(silicon, voltage_search="bayesian")
+    wizard.config.freq_step = 500
+    
+    curve = await wizard.run(0)
+    
+    assert all(p.stable for p in curve.points)
+    for point in curve.points:
+        stable_voltage = point.voltage_mv - wizard.config.safety_margin
+        assert _silicon_limit(point.frequency_mhz) <= stable_voltage <= _silicon_limit(point.frequency_mhz) + 8
+    assert isinstance(_create_voltage_search(wizard.config, 1000), BayesianVoltageSearch)
+
+
+def test_unknown_voltage_search_rejected():
+    with pytest.raises(ConfigurationError):
+        FrequencyWizardConfig(voltage_search="ternary").validate()
@@ -0,0 +1,240 @@
+"""Tests for temperature-compensated stability margins.
+
+Feature: decktune, Stability Knowledge Base
+Validates: Requirements 2.5, 6.1, 6.2
+
+Simulated silicon whose limit rises linearly with die temperature is
+tested at a spread of temperatures. The fitted model must recover the
+trend, size larger margins for hotter design temperatures, and the
+engines must apply it instead of a fixed margin when enabled.
+"""
+
+import asyncio
+import random
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.core.session_manager import Session, SessionManager, SessionMetrics
+from backend.platform.detect import PlatformInfo
+from backend.tuning.autotune import AutotuneEngine, AutotuneConfig
+from backend.tuning.iron_seeker import IronSeekerConfig, IronSeekerEngine
+from backend.tuning.knowledge_base import ALL_CORES, StabilityKnowledgeBase, StabilityObservation
+from backend.tuning.runner import TestResult
+from backend.tuning.thermal_margin import (
+    MAX_MARGIN,
+    TemperatureLimitModel,
+    recommended_margin,
+)
+from backend.tuning.vdroop import VdroopTestResult
+
+from tests.test_autotune_galloping import MockEventEmitter, MockSafetyManager, SimulatedSilicon
+
+
+def true_limit(limit_60: int, temperature: float, coefficient: float = 0.4) -> float:
+    return limit_60 + coefficient * (temperature - 60.0)
+
+
+def _observations(limit_60: int = -30, tests: int = 40, seed: int = 0) -> List[StabilityObservation]:
+    """Tests of core 0 at random offsets and temperatures between 48 and 72°C."""
+    rng = random.Random(seed)
+    observations = []
+    for _ in range(tests):
+        temperature = rng.uniform(48.0, 72.0)
+        offset = rng.randint(limit_60 - 12, limit_60 + 12)
+        passed = offset >= true_limit(limit_60, temperature)
+        observations.append(
+            StabilityObservation(0, offset, 0, "vdroop", 60, None, passed, 0.0, temperature, temperature)
+        )
+    return observations
+
+
+def _knowledge_base(tmp_path) -> StabilityKnowledgeBase:
+    return StabilityKnowledgeBase(
+        tmp_path / "stability_knowledge.json",
+        PlatformInfo(model="Jupiter", variant="LCD", safe_limit=-50, detected=True)
+    )
+
+
+FITTED = TemperatureLimitModel.from_observations(_observations(), core=0)
+
+
+# ==================== Model Tests ====================
+
+def test_model_recovers_temperature_trend():
+    bands = FITTED.limit_by_band(85.0)
+
+    assert 0.2 <= FITTED.coefficient() <= 0.75
+    assert FITTED.limit_at(60.0) == pytest.approx(-30, abs=3)
+    assert list(bands)[-2:] == [70, 80]
+    assert list(bands.values()) == sorted(bands.values())
+
+
+@given(
+    cool=st.floats(min_value=40, max_value=90),
+    hot=st.floats(min_value=40, max_value=90),
+)
+@settings(max_examples=50, deadline=None)
+def test_margin_grows_with_design_temperature(cool, hot):
+    cool, hot = sorted((cool, hot))
+
+    assert recommended_margin(FITTED, -30, cool) <= recommended_margin(FITTED, -30, hot)
+
+
+def test_margin_covers_hot_limit():
+    """The recommended value stays above the true limit at the design temperature."""
+    for temperature in (60.0, 70.0, 80.0):
+        margin = recommended_margin(FITTED, -30, temperature)
+
+        assert 0 <= margin <= MAX_MARGIN
+        assert -30 + margin >= true_limit(-30, temperature)
+
+
+def test_lockstep_failures_are_ignored():
+    observations = [
+        StabilityObservation(ALL_CORES, -20, 0, "vdroop", 60, None, True, 0.0, 60.0, 65.0),
+        StabilityObservation(ALL_CORES, -25, 0, "vdroop", 60, None, False, 0.0, 60.0, 65.0),
+    ]
+
+    model = TemperatureLimitModel.from_observations(observations, core=1)
+
+    assert model.tests == 1
+    assert recommended_margin(TemperatureLimitModel(), -30) is None
+
+
+# ==================== Iron Seeker Tests ====================
+
+class WarmingSensor:
+    """Die temperature: each test starts between 50 and 74°C and heats by 5°C."""
+
+    def __init__(self):
+        self.temperature = 50.0
+        self.tests = 0
+
+    def read_temperature(self) -> Optional[float]:
+        return self.temperature
+
+
+def _iron_seeker(sensor: WarmingSensor, limit_60: int = -30) -> IronSeekerEngine:
+    values = [0, 0, 0, 0]
+
+    async def apply(cores):
+        values[:] = cores
+        sensor.temperature = 50.0 + (sensor.tests * 7) % 25
+        return True, None
+
+    async def run_vdroop_test(duration, pulse_ms=100):
+        sensor.tests += 1
+        sensor.temperature += 5.0
+        passed = all(v >= true_limit(limit_60, sensor.temperature) for v in values)
+        return VdroopTestResult(passed=passed, duration=duration, exit_code=0 if passed else 1, mce_detected=False)
+
+    ryzenadj = MagicMock()
+    ryzenadj.apply_values_async = apply
+    vdroop = MagicMock()
+    vdroop.run_vdroop_test = run_vdroop_test
+    safety = MagicMock()
+    safety.load_iron_seeker_state.return_value = None
+    return IronSeekerEngine(ryzenadj, vdroop, safety, safe_limit=-50)
+
+
+@pytest.mark.asyncio
+async def test_iron_seeker_uses_temperature_margin(tmp_path):
+    sensor = WarmingSensor()
+    kb = _knowledge_base(tmp_path)
+    engine = _iron_seeker(sensor)
+    engine.set_knowledge_base(kb)
+    engine.set_temperature_sensor(sensor)
+
+    result = await engine.start(IronSeekerConfig(step_size=2, test_duration=10, temperature_margin=True,
+                                                 design_temperature=80.0))
+
+    assert all(observation.start_temp is not None for observation in kb.observations)
+    for core in result.cores:
+        assert core.margin is not None
+        assert core.recommended == min(0, core.max_stable + core.margin)
+        assert core.recommended >= true_limit(-30, 80.0)
+        assert 80 in core.limit_by_band
+        assert core.to_dict()["limit_by_band"] == core.limit_by_band
+
+
+@pytest.mark.asyncio
+async def test_iron_seeker_without_temperatures_keeps_safety_margin(tmp_path):
+    class NoSensor:
+        def read_temperature(self):
+            return None
+
+    engine = _iron_seeker(WarmingSensor())
+    engine.set_knowledge_base(_knowledge_base(tmp_path))
+    engine.set_temperature_sensor(NoSensor())
+
+    result = await engine.start(IronSeekerConfig(step_size=5, test_duration=10, safety_margin=5,
+                                                 temperature_margin=True))
+
+    for core in result.cores:
+        assert core.margin is None and core.limit_by_band == {}
+        assert core.recommended == min(0, core.max_stable + 5)
+
+
+# ==================== Autotune Tests ====================
+
+class WarmSilicon(SimulatedSilicon):
+    """SimulatedSilicon whose limits rise with die temperature, as WarmingSensor."""
+
+    def __init__(self, limits: List[int]):
+        super().__init__(limits)
+        self.limits_60 = list(limits)
+        self.temperature = 50.0
+
+    def get_system_metrics(self):
+        return {"temperature": self.temperature}
+
+    async def apply_values_async(self, cores: List[int]):
+        self.temperature = 50.0 + (self.tests * 7) % 25
+        return await super().apply_values_async(cores)
+
+    async def run_test(self, test_name: str) -> TestResult:
+        self.temperature += 5.0
+        self.limits = [true_limit(limit, self.temperature) for limit in self.limits_60]
+        return await super().run_test(test_name)
+
+
+def test_autotune_applies_temperature_margin(tmp_path):
+    silicon = WarmSilicon([-25, -30, -20, -35])
+    engine = AutotuneEngine(silicon, silicon, MockSafetyManager(-50), MockEventEmitter())
+    engine.set_knowledge_base(_knowledge_base(tmp_path))
+
+    result = asyncio.run(engine.run(AutotuneConfig(mode="quick", temperature_margin=True, design_temperature=80.0)))
+
+    assert len(result.margins) == 4 and len(result.limit_by_band) == 4
+    for value, margin, limit_60 in zip(result.cores, result.margins, silicon.limits_60):
+        assert 0 <= margin <= MAX_MARGIN
+        assert value >= true_limit(limit_60, 80.0)
+
+
+def test_autotune_without_margin_reports_none(tmp_path):
+    silicon = SimulatedSilicon([-25, -30, -20, -35])
+    engine = AutotuneEngine(silicon, silicon, MockSafetyManager(-50), MockEventEmitter())
+
+    result = asyncio.run(engine.run(AutotuneConfig(mode="quick")))
+
+    assert result.cores == [-25, -30, -20, -35]
+    assert result.margins == [] and result.limit_by_band == []
+
+
+# ==================== Session History Tests ====================
+
+def test_hottest_session_temperature():
+    settings_manager = MagicMock()
+    settings_manager.get_setting.return_value = None
+    manager = SessionManager(settings_manager)
+    assert manager.hottest_temperature() is None
+
+    for max_temp in (71.0, 0.0, 86.5):
+        metrics = SessionMetrics(600.0, 60.0, 45.0, max_temp, 9.0, 0.1, [0, 0, 0, 0])
+        manager._sessions.append(Session(Session.generate_id(), "2026-01-01T00:00:00", "2026-01-01T00:10:00",
+                                         metrics=metrics))
+
+    assert manager.hottest_temperature() == 86.5
@@ -0,0 +1,324 @@
+"""Tests for thermal-aware pacing of stress tests.
+
+Feature: decktune, Test Runner Module
+Validates: Requirements 3.6, 9.1, 9.2
+
+A first-order thermal simulator with configurable heat-up and cool-down
+constants stands in for the APU. Unpaced back-to-back tests heat-soak it;
+paced tests must each start at or just below the target temperature,
+keep the predicted peak under the limit, and record start and peak
+temperatures with every knowledge base observation.
+"""
+
+import asyncio
+import math
+from typing import Callable, List, Optional
+
+import pytest
+from hypothesis import given, strategies as st, settings
+
+from backend.core.safety import SafetyManager
+from backend.platform.detect import PlatformInfo
+from backend.tuning.autotune import AutotuneEngine, AutotuneConfig
+from backend.tuning.binning import BinningConfig, BinningEngine
+from backend.tuning.knowledge_base import StabilityKnowledgeBase, StabilityObservation
+from backend.tuning.runner import TestResult
+from backend.tuning.thermal_pacing import ThermalModel, ThermalPacer
+
+from tests.test_autotune_galloping import MockEventEmitter, MockSafetyManager, SimulatedSilicon
+from tests.test_binning_algorithm import (
+    MockEventEmitter as MockBinningEventEmitter,
+    MockRyzenadjWrapper,
+    create_default_platform,
+)
+from tests.test_stability_model import MemorySettings
+
+
+class ThermalSimulator:
+    """First-order APU temperature on a simulated clock.
+
+    Under load the temperature rises towards load_temp with heat_tau,
+    otherwise it decays towards idle_temp with cool_tau. Acts as the
+    pacer's sensor, sleep and clock.
+    """
+
+    def __init__(
+        self,
+        idle_temp: float = 40.0,
+        load_temp: float = 92.0,
+        heat_tau: float = 45.0,
+        cool_tau: float = 90.0
+    ):
+        self.idle_temp = idle_temp
+        self.load_temp = load_temp
+        self.heat_tau = heat_tau
+        self.cool_tau = cool_tau
+        self.temperature = idle_temp
+        self.now = 0.0
+
+    def advance(self, seconds: float, loaded: bool) -> None:
+        target, tau = (self.load_temp, self.heat_tau) if loaded else (self.idle_temp, self.cool_tau)
+        self.temperature = target + (self.temperature - target) * math.exp(-seconds / tau)
+        self.now += seconds
+
+    def read_temperature(self) -> Optional[float]:
+        return self.temperature
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.advance(seconds, loaded=False)
+
+    async def run_load(self, seconds: float) -> bool:
+        self.advance(seconds, loaded=True)
+        return True
+
+
+def _pacer(sim: ThermalSimulator, **kwargs) -> ThermalPacer:
+    return ThermalPacer(sim, sleep=sim.sleep, clock=sim.clock, **kwargs)
+
+
+async def _back_to_back(sim: ThermalSimulator, pacer: Optional[ThermalPacer], tests: int = 10) -> List[tuple]:
+    """Run tests with 5 s of overhead in between; returns (start, peak) pairs."""
+    runs = []
+    for _ in range(tests):
+        if pacer is None:
+            start = sim.temperature
+            await sim.run_load(60)
+            runs.append((start, sim.temperature))
+        else:
+            _, run = await pacer.paced(60, sim.run_load(60))
+            runs.append((run.start_temp, run.peak_temp))
+        sim.advance(5, loaded=False)
+    return runs
+
+
+# ==================== Model Tests ====================
+
+@given(
+    start=st.floats(min_value=30, max_value=80),
+    duration=st.floats(min_value=1, max_value=600),
+)
+@settings(max_examples=100)
+def test_max_start_inverts_peak(start, duration):
+    model = ThermalModel(idle_temp=40, load_temp=90, heat_tau=60)
+    limit = model.peak(start, duration)
+
+    assert model.max_start(duration, limit) == pytest.approx(start, abs=1e-6)
+
+
+@given(
+    current=st.floats(min_value=50, max_value=95),
+    target=st.floats(min_value=41, max_value=95),
+)
+@settings(max_examples=100)
+def test_cooldown_reaches_target(current, target):
+    model = ThermalModel(idle_temp=40, cool_tau=80)
+    sim = ThermalSimulator(idle_temp=40, cool_tau=80)
+    sim.temperature = current
+
+    sim.advance(model.cooldown(current, target), loaded=False)
+
+    assert sim.temperature == pytest.approx(min(current, target), abs=1e-6)
+
+
+# ==================== Pacing Tests ====================
+
+@pytest.mark.parametrize("heat_tau, cool_tau", [(45.0, 90.0), (30.0, 40.0), (90.0, 150.0)])
+def test_paced_tests_start_in_target_band(heat_tau, cool_tau):
+    """Every paced test starts at or just below the target temperature."""
+    unpaced = asyncio.run(_back_to_back(ThermalSimulator(heat_tau=heat_tau, cool_tau=cool_tau), None))
+    sim = ThermalSimulator(heat_tau=heat_tau, cool_tau=cool_tau)
+    pacer = _pacer(sim, start_temp=60.0, peak_limit=88.0)
+
+    runs = asyncio.run(_back_to_back(sim, pacer))
+
+    assert max(start for start, _ in unpaced) > 75.0  # Heat soak without pacing
+    assert all(start <= 60.0 + 1e-6 for start, _ in runs)
+    cooled = [start for (start, _), run in zip(runs, pacer.runs) if run.cooldown > 0]
+    assert cooled and all(start > 55.0 for start in cooled)  # Just enough cool-down
+
+
+@pytest.mark.parametrize("heat_tau, cool_tau", [(45.0, 90.0), (60.0, 60.0)])
+def test_peak_limit_lowers_start_target(heat_tau, cool_tau):
+    """Tests start cooler when a start at the target would overshoot."""
+    sim = ThermalSimulator(heat_tau=heat_tau, cool_tau=cool_tau)
+    pacer = _pacer(sim, start_temp=70.0, peak_limit=82.0)
+
+    runs = asyncio.run(_back_to_back(sim, pacer))
+
+    assert all(peak <= 82.5 for _, peak in runs[2:])  # Once load_temp is learned
+    assert min(start for start, _ in runs[2:]) < 70.0 - 5.0
+
+
+def test_peak_prediction_converges():
+    sim = ThermalSimulator()
+    pacer = _pacer(sim, start_temp=60.0, peak_limit=85.0)
+
+    asyncio.run(_back_to_back(sim, pacer))
+
+    last = pacer.runs[-1]
+    assert last.predicted_peak == pytest.approx(last.peak_temp, abs=1.0)
+
+
+def test_unreachable_target_settles_instead_of_waiting_forever():
+    """A target below idle waits once, then tests run at idle."""
+    sim = ThermalSimulator(idle_temp=58.0)
+    pacer = _pacer(sim, start_temp=50.0, peak_limit=85.0, max_cooldown=300.0)
+
+    asyncio.run(_back_to_back(sim, pacer, tests=5))
+
+    assert pacer.runs[-1].cooldown < 300.0
+    assert pacer.model.idle_temp > 55.0
+
+
+def test_missing_sensor_runs_unpaced():
+    class NoSensor:
+        def read_temperature(self):
+            return None
+
+    sim = ThermalSimulator()
+    sim.temperature = 90.0
+    pacer = ThermalPacer(NoSensor(), sleep=sim.sleep, clock=sim.clock)
+
+    result, run = asyncio.run(pacer.paced(60, sim.run_load(60)))
+
+    assert result is True
+    assert run.start_temp is None and run.peak_temp is None
+    assert pacer.total_cooldown == 0.0
+
+
+def test_invalid_limits_rejected():
+    with pytest.raises(ValueError):
+        ThermalPacer(ThermalSimulator(), start_temp=70.0, peak_limit=60.0)
+
+
+# ==================== Engine Tests ====================
+
+class HeatedSilicon(SimulatedSilicon):
+    """SimulatedSilicon whose tests heat a ThermalSimulator."""
+
+    def __init__(self, limits: List[int], thermal: ThermalSimulator):
+        super().__init__(limits)
+        self.thermal = thermal
+
+    async def run_test(self, test_name: str) -> TestResult:
+        result = await super().run_test(test_name)
+        self.thermal.advance(result.duration, loaded=True)
+        return result
+
+
+def test_autotune_records_start_and_peak(tmp_path):
+    thermal = ThermalSimulator()
+    silicon = HeatedSilicon([-25, -30, -20, -35], thermal)
+    kb = StabilityKnowledgeBase(
+        tmp_path / "stability_knowledge.json",
+        PlatformInfo(model="Jupiter", variant="LCD", safe_limit=-50, detected=True)
+    )
+    engine = AutotuneEngine(silicon, silicon, MockSafetyManager(-50), MockEventEmitter())
+    engine.set_knowledge_base(kb)
+    pacer = _pacer(thermal, start_temp=60.0, peak_limit=85.0)
+    engine.set_thermal_pacer(pacer)
+
+    result = asyncio.run(engine.run(AutotuneConfig(mode="quick", thermal_pacing=True)))
+
+    assert result.cores == [-25, -30, -20, -35]
+    assert kb.observations and len(pacer.runs) == len(kb.observations)
+    for observation in kb.observations:
+        assert observation.start_temp is not None and observation.start_temp <= 60.0 + 1e-6
+        assert observation.peak_temp >= observation.start_temp
+    assert pacer.total_cooldown > 0
+
+
+class CooldownWitness:
+    """Counts cool-downs spent at values that have not passed a test.
+
+    Acts as the pacer's sleep; reads the applied values through values().
+    """
+
+    def __init__(self, thermal: ThermalSimulator, values: Callable[[], List[int]]):
+        self.thermal = thermal
+        self.values = values
+        self.passed_values = [[0, 0, 0, 0]]
+        self.untested_cooldowns = 0
+
+    async def sleep(self, seconds: float) -> None:
+        self.untested_cooldowns += list(self.values()) not in self.passed_values
+        await self.thermal.sleep(seconds)
+
+    def record(self, result: TestResult) -> TestResult:
+        if result.passed:
+            self.passed_values.append(list(self.values()))
+        return result
+
+    def pacer(self) -> ThermalPacer:
+        return ThermalPacer(
+            self.thermal, sleep=self.sleep, clock=self.thermal.clock, start_temp=60.0, peak_limit=85.0
+        )
+
+
+class WitnessedSilicon(HeatedSilicon):
+    """HeatedSilicon reporting its results to a CooldownWitness."""
+
+    def __init__(self, limits: List[int], thermal: ThermalSimulator):
+        super().__init__(limits, thermal)
+        self.witness = CooldownWitness(thermal, lambda: self.values)
+
+    async def run_test(self, test_name: str) -> TestResult:
+        return self.witness.record(await super().run_test(test_name))
+
+
+class HeatedComboRunner:
+    """Combo tests on a MockRyzenadjWrapper that heat a ThermalSimulator."""
+
+    def __init__(self, ryzenadj: MockRyzenadjWrapper, limit: int, thermal: ThermalSimulator):
+        self.ryzenadj = ryzenadj
+        self.limit = limit
+        self.thermal = thermal
+        self.witness = CooldownWitness(thermal, self.values)
+
+    def values(self) -> List[int]:
+        return self.ryzenadj.applied_values[-1] if self.ryzenadj.applied_values else [0, 0, 0, 0]
+
+    async def run_test(self, test_name: str) -> TestResult:
+        self.thermal.advance(30, loaded=True)
+        passed = self.values()[0] >= self.limit
+        return self.witness.record(TestResult(passed=passed, duration=30, logs=""))
+
+
+def test_autotune_cools_down_before_applying_candidates():
+    silicon = WitnessedSilicon([-25, -30, -20, -35], ThermalSimulator())
+    engine = AutotuneEngine(silicon, silicon, MockSafetyManager(-50), MockEventEmitter())
+    pacer = silicon.witness.pacer()
+    engine.set_thermal_pacer(pacer)
+
+    result = asyncio.run(engine.run(AutotuneConfig(mode="quick", thermal_pacing=True)))
+
+    assert result.cores == [-25, -30, -20, -35]
+    assert pacer.total_cooldown > 0
+    assert silicon.witness.untested_cooldowns == 0
+
+
+def test_binning_cools_down_before_applying_candidates():
+    ryzenadj = MockRyzenadjWrapper()
+    runner = HeatedComboRunner(ryzenadj, -20, ThermalSimulator())
+    safety = SafetyManager(MemorySettings(), create_default_platform(safe_limit=-50))
+    engine = BinningEngine(ryzenadj, runner, safety, MockBinningEventEmitter())
+    pacer = runner.witness.pacer()
+    engine.set_thermal_pacer(pacer)
+
+    result = asyncio.run(engine.start(BinningConfig(start_value=-10, step_size=5, thermal_pacing=True)))
+
+    assert result.max_stable == -20
+    assert pacer.total_cooldown > 0
+    assert runner.witness.untested_cooldowns == 0
+
+
+def test_observation_temperatures_round_trip():
+    observation = StabilityObservation(0, -20, 0, "cpu_quick", 30, 60, True, 1.0, 61.5, 80.25)
+    legacy = observation.to_dict()
+    del legacy["start_temp"], legacy["peak_temp"]
+
+    assert StabilityObservation.from_dict(observation.to_dict()) == observation
+    assert StabilityObservation.from_dict(legacy).peak_temp is None
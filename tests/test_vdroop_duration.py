@@ -14,7 +14,7 @@ from backend.tuning.vdroop import VdroopTester
 # For any IronSeekerConfig with test_duration T, the actual stress test
 # execution time SHALL be within [T, T+5] seconds (allowing for startup overhead).
 #
-# Note: We cannot actually run stress-ng in unit tests, so we verify that
+# Note: Full-length runs are too slow for unit tests, so we verify that
 # the command is configured correctly with the specified duration, and that
 # the timeout allows for the expected overhead.
 @given(
@@ -24,8 +24,8 @@ from backend.tuning.vdroop import VdroopTester
 def test_property_6_test_duration_configuration(test_duration):
     """**Feature: iron-seeker, Property 6: Test duration configuration**
     
-    For any test_duration T, the generated stress command SHALL be configured
-    with timeout T, and the process timeout SHALL allow for startup overhead
+    For any test_duration T, the generated pulse command SHALL be configured
+    with duration T, and the process timeout SHALL allow for startup overhead
     (T + 10 seconds maximum).
     
     **Validates: Requirements 2.4**
@@ -33,14 +33,10 @@ def test_property_6_test_duration_configuration(test_duration):
     tester = VdroopTester()
     command = tester.generate_vdroop_command(test_duration, pulse_ms=100)
     
-    # Extract timeout from command
-    assert "--timeout" in command
-    timeout_idx = command.index("--timeout")
-    timeout_str = command[timeout_idx + 1]
-    
-    # Timeout should be in "{duration}s" format
-    assert timeout_str.endswith("s")
-    configured_duration = int(timeout_str[:-1])
+    # Extract duration from command
+    assert "--duration" in command
+    duration_idx = command.index("--duration")
+    configured_duration = int(command[duration_idx + 1])
     
     # Configured duration should exactly match requested duration
     assert configured_duration == test_duration
@@ -67,10 +63,9 @@ def test_duration_independent_of_pulse(test_duration, pulse_ms):
     tester = VdroopTester()
     command = tester.generate_vdroop_command(test_duration, pulse_ms)
     
-    # Extract timeout
-    timeout_idx = command.index("--timeout")
-    timeout_str = command[timeout_idx + 1]
-    configured_duration = int(timeout_str[:-1])
+    # Extract duration
+    duration_idx = command.index("--duration")
+    configured_duration = int(command[duration_idx + 1])
     
     # Duration should match regardless of pulse_ms
     assert configured_duration == test_duration
@@ -81,9 +76,8 @@ def test_minimum_duration_boundary():
     tester = VdroopTester()
     command = tester.generate_vdroop_command(10, 100)
     
-    timeout_idx = command.index("--timeout")
-    timeout_str = command[timeout_idx + 1]
-    assert timeout_str == "10s"
+    duration_idx = command.index("--duration")
+    assert command[duration_idx + 1] == "10"
 
 
 def test_maximum_duration_boundary():
@@ -91,6 +85,5 @@ def test_maximum_duration_boundary():
     tester = VdroopTester()
     command = tester.generate_vdroop_command(300, 100)
     
-    timeout_idx = command.index("--timeout")
-    timeout_str = command[timeout_idx + 1]
-    assert timeout_str == "300s"
+    duration_idx = command.index("--duration")
+    assert command[duration_idx + 1] == "300"
@@ -0,0 +1,223 @@
+"""Tests for parallel cross-core frequency sweeps.
+
+Feature: frequency-based-wizard
+Validates: Requirements 1.1, 1.2, 1.4, 6.1
+
+A simulated hardware backend (per-core stability limits, a ryzenadj
+offset vector, locked frequencies and a dmesg buffer) drives the real
+TestRunner coordinator. Parallel sweeps must produce the same curves as
+sequential sweeps in about a quarter of the wall-clock time, and MCE
+errors must only cause the ambiguous cores to be re-tested in isolation.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import Mock
+
+from backend.tuning.frequency_wizard import (
+    CoreSweepState,
+    FrequencyWizard,
+    FrequencyWizardConfig,
+)
+from backend.tuning.runner import TestRunner, TestResult
+
+
+# Simulated seconds -> real seconds
+TIME_SCALE = 0.002
+
+
+def _true_limit(core_id, freq_mhz):
+    """Most aggressive stable offset of the simulated chip (mV)."""
+    if core_id == 3 and freq_mhz >= 1400:
+        return 5  # Never stable
+    return -30 + (freq_mhz - 400) // 150 + 2 * core_id
+
+
+class SimulatedHardware:
+    """Simulated cpufreq, ryzenadj and per-core stress behaviour."""
+
+    def __init__(self, mce_cores=()):
+        self.mce_cores = set(mce_cores)
+        self.offsets = [0, 0, 0, 0]
+        self.locked = {}
+        self.applied_vectors = []
+        self.stress_runs = []
+        self.dmesg = []
+
+    # cpufreq controller
+    def get_current_governor(self, core_id):
+        return "schedutil"
+
+    def lock_frequency(self, core_id, freq_mhz):
+        self.locked[core_id] = freq_mhz
+
+    def unlock_frequency(self, core_id, governor):
+        self.locked.pop(core_id, None)
+
+    # ryzenadj wrapper
+    async def apply_values_async(self, values):
+        self.offsets = list(values)
+        self.applied_vectors.append(list(values))
+        return True, None
+
+    # stress-ng on a pinned core
+    async def run_per_core_test(self, core_id, duration, watch_kernel=True):
+        freq_mhz = self.locked[core_id]
+        voltage_mv = self.offsets[core_id]
+        self.stress_runs.append(core_id)
+        await asyncio.sleep(duration * TIME_SCALE)
+
+        stable = voltage_mv >= _true_limit(core_id, freq_mhz)
+        if not stable and core_id in self.mce_cores:
+            # Silent corruption: stress-ng passes, the kernel logs an MCE
+            self.dmesg.append(f"mce: [Hardware Error]: CPU {core_id}: Machine Check")
+            return TestResult(passed=True, duration=duration, logs="")
+        return TestResult(passed=stable, duration=duration, logs="")
+
+    async def check_dmesg_errors(self):
+        errors, self.dmesg = self.dmesg, []
+        return errors
+
+
+def _create_wizard(hardware, config):
+    runner = TestRunner(cpufreq_controller=hardware, ryzenadj_wrapper=hardware)
+    runner.run_per_core_test = hardware.run_per_core_test
+    runner.check_dmesg_errors = hardware.check_dmesg_errors
+    runner.get_system_metrics = Mock(return_value={"temperature": 50.0})
+    return FrequencyWizard(config, hardware, runner)
+
+
+def _config(adaptive_step=True):
+    return FrequencyWizardConfig(
+        freq_start=400,
+        freq_end=1400,
+        freq_step=200,
+        test_duration=10,
+        voltage_start=-30,
+        voltage_step=2,
+        safety_margin=5,
+        adaptive_step=adaptive_step,
+    )
+
+
+def _summary(curve):
+    return [(p.frequency_mhz, p.voltage_mv, p.stable) for p in curve.points]
+
+
+async def _run_sequential(config, mce_cores=()):
+    curves = {}
+    for core_id in range(4):
+        wizard = _create_wizard(SimulatedHardware(mce_cores), config)
+        curves[core_id] = await wizard.run(core_id)
+    return curves
+
+
+# ==================== Core State Machine Tests ====================
+
+def test_core_sweep_state_matches_binary_search():
+    """The state machine hands out the same voltages as the binary search."""
+    config = _config(adaptive_step=False)
+    state = CoreSweepState(0, [400], config)
+    tested = []
+
+    while (voltage := state.next_voltage()) is not None:
+        tested.append(voltage)
+        state.record(voltage, voltage >= -21)
+
+    assert tested == [-16, -24, -20, -22]
+    assert state.is_done()
+    assert state.points[0].voltage_mv == -15
+    assert state.points[0].stable is True
+
+
+def test_core_sweep_state_skips_after_consecutive_failures():
+    """Three failures in a row record an unstable point and move on."""
+    state = CoreSweepState(0, [400, 600], _config(adaptive_step=False))
+
+    for _ in range(3):
+        state.record(state.next_voltage(), False)
+
+    assert state.points[0].stable is False
+    assert state.points[0].voltage_mv == 0
+    assert state.current_frequency == 600
+
+
+# ==================== Parallel Sweep Tests ====================
+
+@pytest.mark.asyncio
+async def test_parallel_sweep_matches_sequential_and_is_faster():
+    """Parallel curves equal sequential curves at close to 4x less wall time."""
+    config = _config()
+
+    started = time.monotonic()
+    sequential = await _run_sequential(config)
+    sequential_time = time.monotonic() - started
+
+    hardware = SimulatedHardware()
+    wizard = _create_wizard(hardware, config)
+    started = time.monotonic()
+    parallel = await wizard.run_parallel()
+    parallel_time = time.monotonic() - started
+
+    for core_id in range(4):
+        assert _summary(parallel[core_id]) == _summary(sequential[core_id])
+    assert parallel[3].points[-1].stable is False
+
+    speedup = sequential_time / parallel_time
+    assert speedup >= 3.0, f"Parallel sweep only {speedup:.2f}x faster"
+
+    # One combined vector per round, followed by the restore
+    combined = [v for v in hardware.applied_vectors if all(v)]
+    assert combined, "Cores should be tested together"
+    assert len(hardware.applied_vectors) >= 2 * wizard.parallel_rounds
+    assert wizard.isolation_retests == 0
+    assert hardware.offsets == [0, 0, 0, 0]
+    assert hardware.locked == {}
+
+
+@pytest.mark.asyncio
+async def test_mce_errors_retest_only_ambiguous_cores():
+    """MCE rounds re-test cores in isolation and still find the true limits."""
+    config = _config()
+    sequential = await _run_sequential(config, mce_cores={1})
+
+    hardware = SimulatedHardware(mce_cores={1})
+    wizard = _create_wizard(hardware, config)
+    parallel = await wizard.run_parallel()
+
+    for core_id in range(4):
+        assert _summary(parallel[core_id]) == _summary(sequential[core_id])
+    assert wizard.isolation_retests > 0
+
+
+@pytest.mark.asyncio
+async def test_round_attributes_mce_by_isolation():
+    """A failing stress test is not re-tested; passing cores are."""
+    hardware = SimulatedHardware(mce_cores={2})
+    wizard = _create_wizard(hardware, _config())
+
+    assignments = {
+        0: (1000, -30),  # Fails its own stress test
+        1: (1000, -20),  # Stable
+        2: (1000, -30),  # Unstable, only visible as MCE
+        3: (1000, -20),  # Stable
+    }
+    verdicts = await wizard._run_parallel_round(assignments)
+
+    assert verdicts == {0: False, 1: True, 2: False, 3: True}
+    assert wizard.isolation_retests == 3
+    assert sorted(hardware.stress_runs[4:]) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_single_core_round_fails_on_mce():
+    """With one core under test the MCE is attributed without re-testing."""
+    hardware = SimulatedHardware(mce_cores={0})
+    wizard = _create_wizard(hardware, _config())
+
+    verdicts = await wizard._run_parallel_round({0: (1000, -30)})
+
+    assert verdicts == {0: False}
+    assert wizard.isolation_retests == 0
@@ -0,0 +1,201 @@
+"""Tests for sparse frequency sampling with monotone curve fitting.
+
+Feature: frequency-based-wizard
+Validates: Requirements 1.1, 1.4, 12.1
+
+A synthetic silicon simulator compares sparse sweeps against full-grid
+sweeps: the sparse curve must match the full grid within the configured
+tolerance while running a fraction of the stress tests.
+"""
+
+import pytest
+from hypothesis import given, settings, strategies as st
+from unittest.mock import Mock, AsyncMock
+
+from backend.platform.cpufreq import CPUFreqController
+from backend.tuning.frequency_sampler import (
+    SampledPoint,
+    SparseFrequencySampler,
+    isotonic_fit,
+)
+from backend.tuning.frequency_wizard import FrequencyWizard, FrequencyWizardConfig
+from backend.tuning.runner import TestRunner, TestResult
+
+
+GRID = list(range(400, 3501, 100))
+
+
+def _curved_limit(freq_mhz):
+    """Convex stable-offset curve of the simulated silicon (mV)."""
+    x = (freq_mhz - 400) / 3100
+    return -28 + int(20 * x * x)
+
+
+def _unstable_top_limit(freq_mhz):
+    """Silicon that is unstable at any offset above 3200 MHz."""
+    if freq_mhz > 3200:
+        return 5
+    return _curved_limit(freq_mhz)
+
+
+class SimulatedSilicon:
+    """Frequency-locked stress tests against a threshold model."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.tests = []
+
+    async def run_frequency_locked_test(self, core_id, freq_mhz, voltage_mv, duration):
+        self.tests.append((freq_mhz, voltage_mv))
+        passed = voltage_mv >= self.limit(freq_mhz)
+        return TestResult(passed=passed, duration=float(duration), logs="")
+
+
+def _create_wizard(silicon, **overrides):
+    cpufreq = Mock(spec=CPUFreqController)
+    cpufreq.get_current_governor.return_value = "schedutil"
+
+    runner = Mock(spec=TestRunner)
+    runner.run_frequency_locked_test = silicon.run_frequency_locked_test
+    runner.get_system_metrics.return_value = {"temperature": 50.0}
+    runner._ryzenadj_wrapper = AsyncMock()
+    runner._ryzenadj_wrapper.apply_values_async.return_value = (True, None)
+
+    config = FrequencyWizardConfig(
+        freq_start=400,
+        freq_end=3500,
+        freq_step=100,
+        test_duration=10,
+        voltage_start=-30,
+        voltage_step=2,
+        safety_margin=5,
+        adaptive_step=False,
+        **overrides
+    )
+    wizard = FrequencyWizard(config, cpufreq, runner)
+    wizard._verify_curve = AsyncMock(return_value=True)
+    return wizard
+
+
+# ==================== Isotonic Fit Tests ====================
+
+@given(values=st.lists(st.integers(min_value=-50, max_value=0), min_size=1, max_size=30))
+@settings(max_examples=200)
+def test_isotonic_fit_is_monotone_and_preserves_mean(values):
+    """The fit is non-decreasing and keeps the overall mean."""
+    fitted = isotonic_fit(values)
+
+    assert len(fitted) == len(values)
+    assert all(a <= b + 1e-9 for a, b in zip(fitted, fitted[1:]))
+    assert sum(fitted) == pytest.approx(sum(values))
+
+
+def test_isotonic_fit_keeps_monotone_input():
+    """Already monotone data is not changed."""
+    assert isotonic_fit([-20, -18, -18, -10]) == [-20, -18, -18, -10]
+
+
+def test_isotonic_fit_pools_violators():
+    """A dip is pooled with its neighbour."""
+    assert isotonic_fit([-20, -14, -18, -10]) == [-20, -16, -16, -10]
+
+
+# ==================== Sampler Tests ====================
+
+def test_flat_curve_needs_only_anchors():
+    """Segments without a rise are within tolerance immediately."""
+    sampler = SparseFrequencySampler(GRID, tolerance_mv=4)
+
+    while (freq := sampler.next_frequency()) is not None:
+        sampler.add(SampledPoint(freq, -20, -22))
+
+    assert sorted(sampler.samples) == [400, 1400, 2500, 3500]
+    points = sampler.build_points(safety_margin=5, voltage_step=2, test_duration=10)
+    assert [p.frequency_mhz for p in points] == GRID
+    assert all(p.voltage_mv == -15 and p.stable for p in points)
+
+
+def test_interpolation_rounds_towards_zero():
+    """Interpolated offsets are rounded to the conservative step."""
+    sampler = SparseFrequencySampler([400, 500, 600], tolerance_mv=20, anchor_count=2)
+    sampler.add(SampledPoint(400, -20, -22))
+    sampler.add(SampledPoint(600, -15, -17))
+
+    points = sampler.build_points(safety_margin=0, voltage_step=2, test_duration=10)
+
+    # Midpoint -17.5 is rounded up to -16, not down to -18
+    assert points[1].voltage_mv == -16
+    assert points[1].test_duration == 0
+
+
+# ==================== Sweep Tests ====================
+
+@pytest.mark.asyncio
+async def test_sparse_sweep_matches_full_grid_within_tolerance():
+    """Sparse curve is within tolerance of the full grid at far fewer runs."""
+    grid_silicon = SimulatedSilicon(_curved_limit)
+    grid_curve = await _create_wizard(grid_silicon).run(0)
+
+    sparse_silicon = SimulatedSilicon(_curved_limit)
+    sparse_curve = await _create_wizard(sparse_silicon, sparse_sampling=True, sparse_tolerance=4).run(0)
+
+    assert [p.frequency_mhz for p in sparse_curve.points] == GRID
+    for sparse_point, grid_point in zip(sparse_curve.points, grid_curve.points):
+        assert sparse_point.stable
+        assert abs(sparse_point.voltage_mv - grid_point.voltage_mv) <= 4
+        # Interpolation never produces a value the silicon cannot hold
+        assert sparse_point.voltage_mv - 5 >= _curved_limit(sparse_point.frequency_mhz) - 4
+
+    assert len(sparse_silicon.tests) <= 0.5 * len(grid_silicon.tests), (
+        f"Stress runs: grid={len(grid_silicon.tests)}, sparse={len(sparse_silicon.tests)}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_sparse_sweep_localizes_unstable_region():
+    """Unstable frequencies are found at grid resolution."""
+    grid_curve = await _create_wizard(SimulatedSilicon(_unstable_top_limit)).run(0)
+    sparse_curve = await _create_wizard(
+        SimulatedSilicon(_unstable_top_limit), sparse_sampling=True
+    ).run(0)
+
+    assert [p.stable for p in sparse_curve.points] == [p.stable for p in grid_curve.points]
+    assert [p.frequency_mhz for p in sparse_curve.points if not p.stable] == [3300, 3400, 3500]
+
+
+@pytest.mark.asyncio
+async def test_sparse_sweep_with_bayesian_search():
+    """Bayesian searches report a model bracket around the stable limit."""
+    grid_silicon = SimulatedSilicon(_curved_limit)
+    grid_curve = await _create_wizard(grid_silicon, voltage_search="bayesian").run(0)
+
+    sparse_silicon = SimulatedSilicon(_curved_limit)
+    wizard = _create_wizard(
+        sparse_silicon, voltage_search="bayesian", sparse_sampling=True, sparse_tolerance=4
+    )
+    samples = []
+    sample_frequency = wizard._sample_frequency
+
+    async def record_sample(*args):
+        sample = await sample_frequency(*args)
+        samples.append(sample)
+        return sample
+
+    wizard._sample_frequency = record_sample
+    sparse_curve = await wizard.run(0)
+
+    # The bracket ends within two steps of the limit, not at the search floor
+    for sample in samples:
+        limit = _curved_limit(sample.frequency_mhz)
+        assert limit <= sample.voltage_mv
+        assert abs(sample.voltage_low - limit) <= 4, sample
+
+    assert [p.frequency_mhz for p in sparse_curve.points] == GRID
+    for sparse_point, grid_point in zip(sparse_curve.points, grid_curve.points):
+        assert sparse_point.stable
+        assert abs(sparse_point.voltage_mv - grid_point.voltage_mv) <= 4
+
+    assert len(samples) < len(GRID)
+    assert len(sparse_silicon.tests) <= 0.75 * len(grid_silicon.tests), (
+        f"Stress runs: grid={len(grid_silicon.tests)}, sparse={len(sparse_silicon.tests)}"
+    )
@@ -0,0 +1,163 @@
+"""Tests for warm-started, monotone-constrained voltage search.
+
+Feature: frequency-based-wizard
+Validates: Requirements 1.3, 9.4
+
+Each frequency point's search is seeded from the previous point's result
+and bounded by the monotone constraint (a higher clock cannot tolerate a
+more negative offset than a lower one, modulo a noise band). A simulated
+silicon model compares stress runs per point against the cold binary
+search and checks that violations are re-tested.
+"""
+
+import pytest
+from hypothesis import given, settings, strategies as st
+from unittest.mock import Mock, AsyncMock
+
+from backend.platform.cpufreq import CPUFreqController
+from backend.tuning.frequency_wizard import (
+    FrequencyWizard,
+    FrequencyWizardConfig,
+    VoltageSearch,
+)
+from backend.tuning.runner import TestRunner, TestResult
+
+
+def _silicon_limit(freq_mhz):
+    """Most aggressive stable offset of the simulated silicon (mV)."""
+    return -28 + (freq_mhz - 400) * 18 // 3100
+
+
+class SimulatedSilicon:
+    """Frequency-locked stress tests against a threshold model.
+
+    Args:
+        flaky: Mapping freq_mhz -> number of initial tests at that frequency
+            that spuriously fail unless the voltage has 8 mV of headroom
+    """
+
+    def __init__(self, flaky=None):
+        self.flaky = dict(flaky or {})
+        self.tests = []
+
+    async def run_frequency_locked_test(self, core_id, freq_mhz, voltage_mv, duration):
+        self.tests.append((freq_mhz, voltage_mv))
+        limit = _silicon_limit(freq_mhz)
+        if self.flaky.get(freq_mhz, 0) > 0:
+            self.flaky[freq_mhz] -= 1
+            limit += 8
+        return TestResult(passed=voltage_mv >= limit, duration=float(duration), logs="")
+
+
+def _create_wizard(silicon, **overrides):
+    cpufreq = Mock(spec=CPUFreqController)
+    cpufreq.get_current_governor.return_value = "schedutil"
+
+    runner = Mock(spec=TestRunner)
+    runner.run_frequency_locked_test = silicon.run_frequency_locked_test
+    runner.get_system_metrics.return_value = {"temperature": 50.0}
+    runner._ryzenadj_wrapper = AsyncMock()
+    runner._ryzenadj_wrapper.apply_values_async.return_value = (True, None)
+
+    config = FrequencyWizardConfig(
+        freq_start=400,
+        freq_end=3500,
+        freq_step=100,
+        test_duration=10,
+        voltage_start=-30,
+        voltage_step=2,
+        safety_margin=5,
+        adaptive_step=False,
+        **overrides
+    )
+    wizard = FrequencyWizard(config, cpufreq, runner)
+    wizard._verify_curve = AsyncMock(return_value=True)
+    return wizard
+
+
+def _drive(search, limit):
+    """Run a search against a threshold model."""
+    while (voltage := search.next_voltage()) is not None:
+        search.record(voltage, voltage >= limit)
+    return search
+
+
+# ==================== Search State Tests ====================
+
+@given(
+    limit=st.integers(min_value=-28, max_value=-6),
+    predicted=st.integers(min_value=-14, max_value=-1).map(lambda v: v * 2),
+)
+@settings(max_examples=200)
+def test_warm_search_finds_most_aggressive_stable_voltage(limit, predicted):
+    """For any prediction, the warm search converges to the true limit."""
+    warm = _drive(VoltageSearch(-30, 2, predicted), limit)
+
+    assert not warm.failed
+    assert warm.last_stable_voltage == limit + (limit % 2)
+
+
+def test_accurate_prediction_needs_two_tests():
+    """A correct prediction is confirmed by itself and the step below."""
+    search = _drive(VoltageSearch(-30, 2, predicted=-18), -18)
+
+    assert search.last_stable_voltage == -18
+    assert search.test_count == 2
+
+
+def test_galloping_up_to_zero_without_pass_fails():
+    """A warm search that never passes marks the frequency unstable."""
+    search = _drive(VoltageSearch(-30, 2, predicted=-20), 5)
+
+    assert search.failed
+
+
+def test_search_pinned_at_monotone_floor_is_flagged():
+    """Passing all the way down to a monotone floor is a violation."""
+    search = _drive(VoltageSearch(-20, 2, predicted=-18, monotone_bounded=True), -30)
+
+    assert search.last_stable_voltage == -18
+    assert search.violates_monotone()
+
+
+# ==================== Sweep Tests ====================
+
+@pytest.mark.asyncio
+async def test_warm_start_reduces_stress_runs_per_point():
+    """Warm start finds the same curve with far fewer stress runs."""
+    cold_silicon = SimulatedSilicon()
+    cold = _create_wizard(cold_silicon, warm_start=False)
+    cold_curve = await cold.run(0)
+
+    warm_silicon = SimulatedSilicon()
+    warm = _create_wizard(warm_silicon)
+    warm_curve = await warm.run(0)
+
+    assert warm.monotone_violations == []
+    for warm_point, cold_point in zip(warm_curve.points, cold_curve.points):
+        limit = _silicon_limit(warm_point.frequency_mhz)
+        assert warm_point.voltage_mv == limit + (limit % 2) + 5
+        if cold_point.stable:
+            assert warm_point.voltage_mv == cold_point.voltage_mv
+
+    cold_runs = len(cold_silicon.tests) / len(cold_curve.points)
+    warm_runs = len(warm_silicon.tests) / len(warm_curve.points)
+    assert warm_runs <= 0.6 * cold_runs, (
+        f"Stress runs per point: cold={cold_runs:.2f}, warm={warm_runs:.2f}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_monotone_violation_is_retested():
+    """A spuriously conservative point is caught and re-tested."""
+    silicon = SimulatedSilicon(flaky={1000: 2})
+    wizard = _create_wizard(silicon)
+    curve = await wizard.run(0)
+
+    assert 1100 in wizard.monotone_violations
+    assert [f for f, _ in silicon.tests].count(1000) > 2
+
+    # After re-testing, the curve matches the true silicon limits
+    for point in curve.points:
+        limit = _silicon_limit(point.frequency_mhz)
+        assert point.voltage_mv == limit + (limit % 2) + 5